@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 from typing import Optional
+import logging
 import re
 from axis1.schema import Axis1Card, Axis1Face, Axis1ActivatedAbility, Axis1TriggeredAbility
 from axis2.schema import (
@@ -28,6 +29,7 @@ from axis2.parsing.replacement_effects import parse_replacement_effects
 from axis2.parsing.continuous_effects import parse_continuous_effects
 from axis2.parsing.special_actions import parse_ninjutsu, parse_repeatable_payment
 from axis2.parsing.costs import parse_escape_cost
+from axis2.parsing import trace
 from axis2.parsing.casting_costs import parse_all_casting_costs
 from axis2.parsing.keywords import extract_keywords
 from axis2.parsing.sentences import split_into_sentences
@@ -39,6 +41,8 @@ from axis2.parsing.ability_boundaries import detect_ability_boundaries, AbilityC
 from axis2.parsing.ability_sentences import split_ability_into_sentences
 from axis2.parsing.effect_chains import reconstruct_effect_chain
 
+logger = logging.getLogger(__name__)
+
 
 def _extract_characteristics(axis1_card: Axis1Card, face1: Axis1Face) -> Axis2Characteristics:
     return Axis2Characteristics(
@@ -241,26 +245,28 @@ def _parse_reminder_text_etb_effects(reminder_texts: list[str], ctx: ParseContex
 
 
 def _parse_reminder_text_replacement_effects(reminder_texts: list[str], ctx: ParseContext) -> list[ReplacementEffect]:
+    active = trace.current()
     from axis2.parsing.replacement_effects import parse_replacement_effects
     from axis2.parsing.sentences import split_into_sentences
-    import logging
-    
-    logger = logging.getLogger(__name__)
     replacement_effects = []
     combined_reminder = _normalize_reminder_text(reminder_texts)
     
-    logger.debug(f"[REPLACEMENT] Parsing reminder text replacement effects: {combined_reminder[:200]}")
+    if active:
+        active.record("builder", "replacement", f"Parsing reminder text replacement effects: {combined_reminder[:200]}")
     
     if not combined_reminder:
         return replacement_effects
     
     for sentence in split_into_sentences(combined_reminder):
-        logger.debug(f"[REPLACEMENT] Processing reminder sentence: {sentence[:100]}")
+        if active:
+            active.record("builder", "replacement", f"Processing reminder sentence: {sentence[:100]}")
         parsed_effects = parse_replacement_effects(sentence)
-        logger.debug(f"[REPLACEMENT] Parsed {len(parsed_effects)} effects from reminder sentence")
+        if active:
+            active.record("builder", "replacement", f"Parsed {len(parsed_effects)} effects from reminder sentence")
         replacement_effects.extend(parsed_effects)
     
-    logger.debug(f"[REPLACEMENT] Total reminder replacement effects: {len(replacement_effects)}")
+    if active:
+        active.record("builder", "replacement", f"Total reminder replacement effects: {len(replacement_effects)}")
     return replacement_effects
 
 
@@ -334,10 +340,8 @@ def _detect_triggered_abilities_from_text(oracle_text: str, ctx: ParseContext) -
 
 
 def _extract_effect_text_from_oracle(face: Axis1Face, condition: str, ctx: ParseContext) -> str:
+    active = trace.current()
     from axis2.parsing.sentences import split_into_sentences
-    import logging
-    
-    logger = logging.getLogger(__name__)
     cond = condition.lower().rstrip(".").rstrip(",")
     cond_variants = [cond]
     
@@ -351,8 +355,8 @@ def _extract_effect_text_from_oracle(face: Axis1Face, condition: str, ctx: Parse
     elif "enters the battlefield" in cond:
         cond_variants.append(cond.replace("enters the battlefield", "enters"))
     
-    logger.debug(f"[LTB] Trying to extract effect for condition: {condition}")
-    logger.debug(f"[LTB] Condition variants: {cond_variants}")
+    if active:
+        active.record("builder", "ltb", f"Trying to extract effect for condition: {condition}", variants=cond_variants)
     
     for sentence in split_into_sentences(face.oracle_text or ""):
         s = sentence.lower().lstrip().rstrip()
@@ -362,17 +366,21 @@ def _extract_effect_text_from_oracle(face: Axis1Face, condition: str, ctx: Parse
                 parts = sentence.split(",", 1)
                 if len(parts) == 2:
                     effect_text = parts[1].strip()
-                    logger.debug(f"[LTB] Extracted effect from sentence: {sentence} -> {effect_text}")
+                    if active:
+                        active.record("builder", "ltb", f"Extracted effect from sentence: {sentence} -> {effect_text}")
                     return effect_text
     return ""
 
 
 def _find_return_effect_in_text(face: Axis1Face, ctx: ParseContext) -> str:
+    active = trace.current()
     from axis2.parsing.sentences import split_into_sentences
     
-    print(f"[DEBUG LTB] Effect text empty, searching oracle text for return pattern")
+    if active:
+        active.record("builder", "ltb", "Effect text empty, searching oracle text for return pattern")
     for sentence in split_into_sentences(face.oracle_text or ""):
-        print(f"[DEBUG LTB] Checking sentence: '{sentence}'")
+        if active:
+            active.record("builder", "ltb", f"Checking sentence: '{sentence}'")
         if "return" in sentence.lower() and ("exiled" in sentence.lower() or "that card" in sentence.lower()):
             if "leaves" in sentence.lower() or any(variant in sentence.lower() for variant in ["when " + ctx.card_name.lower(), "when this"]):
                 effect_text = sentence
@@ -382,7 +390,8 @@ def _find_return_effect_in_text(face: Axis1Face, ctx: ParseContext) -> str:
                         if "return" in part.lower():
                             effect_text = part.strip()
                             break
-                print(f"[DEBUG LTB] Found return pattern in sentence: '{sentence}' -> extracted: '{effect_text}'")
+                if active:
+                    active.record("builder", "ltb", f"Found return pattern in sentence: '{sentence}' -> extracted: '{effect_text}'")
                 return effect_text
     return ""
 
@@ -421,6 +430,7 @@ def _split_trigger_condition(condition: str, ctx: ParseContext) -> tuple[Optiona
 
 
 def _parse_axis1_triggered(face: Axis1Face, ctx: ParseContext) -> list[TriggeredAbility]:
+    active = trace.current()
     from axis2.parsing.conditional_effects import parse_conditional
     from axis2.parsing.effects.dispatcher import parse_effect_text
     from axis2.parsing.targeting import parse_targeting
@@ -491,19 +501,23 @@ def _parse_axis1_triggered(face: Axis1Face, ctx: ParseContext) -> list[Triggered
         triggered_ctx = ctx.with_flag("is_triggered_ability", True)
         
         if "leaves the battlefield" in t.condition.lower():
-            print(f"[DEBUG LTB] Condition: '{t.condition}'")
-            print(f"[DEBUG LTB] Initial effect_text from Axis1: '{effect_text}'")
-            print(f"[DEBUG LTB] Full oracle text: '{face.oracle_text}'")
+            if active:
+                active.record(
+                    "builder", "ltb", t.condition,
+                    effect_text=effect_text, oracle_text=face.oracle_text,
+                )
         
         if not effect_text and "leaves the battlefield" in t.condition.lower():
             effect_text = _find_return_effect_in_text(face, ctx)
         
-        print(f"[DEBUG LTB] Final effect_text being parsed: '{effect_text}'")
+        if active:
+            active.record("builder", "ltb_effect_text", effect_text)
         
         conditional_effect = parse_conditional(effect_text, triggered_ctx)
         effects = [conditional_effect] if conditional_effect else parse_effect_text(effect_text, triggered_ctx)
         
-        print(f"[DEBUG LTB] Parsed {len(effects)} effects: {effects}")
+        if active:
+            active.record("builder", "ltb_effects", effect_text, effects=[type(e).__name__ for e in effects])
         targeting = parse_targeting(t.effect)
         trigger_filter = parse_trigger_filter(t.condition)
 
@@ -545,13 +559,13 @@ def _parse_static_abilities(face: Axis1Face, ctx: ParseContext) -> list[StaticEf
 
 
 def _parse_replacement_effects_from_text(text: str, ctx: ParseContext, skip_duration_effects: bool = False) -> list[ReplacementEffect]:
+    active = trace.current()
     import re
-    import logging
-    logger = logging.getLogger(__name__)
     
     replacement_effects = []
     
-    logger.debug(f"[REPLACEMENT] Parsing replacement effects from text (skip_duration={skip_duration_effects}): {text[:200]}")
+    if active:
+        active.record("builder", "replacement", f"Parsing replacement effects from text (skip_duration={skip_duration_effects}): {text[:200]}")
     
     duration_prefix_pattern = re.compile(
         r"^(until\s+end\s+of\s+turn|this\s+turn|until\s+your\s+next\s+turn)[,\s]+",
@@ -567,41 +581,51 @@ def _parse_replacement_effects_from_text(text: str, ctx: ParseContext, skip_dura
     
     for sentence in split_into_sentences(text):
         sentence_stripped = sentence.strip()
-        logger.debug(f"[REPLACEMENT] Processing sentence: {sentence_stripped[:100]}")
+        if active:
+            active.record("builder", "replacement", f"Processing sentence: {sentence_stripped[:100]}")
         
         if skip_duration_effects:
             if duration_prefix_pattern.match(sentence_stripped):
-                logger.debug(f"[REPLACEMENT] Skipping sentence with duration prefix: {sentence_stripped[:50]}")
+                if active:
+                    active.record("builder", "replacement", f"Skipping sentence with duration prefix: {sentence_stripped[:50]}")
                 continue
             
             if duration_anywhere_pattern.search(sentence_stripped):
-                logger.debug(f"[REPLACEMENT] Skipping sentence with duration: {sentence_stripped[:50]}")
+                if active:
+                    active.record("builder", "replacement", f"Skipping sentence with duration: {sentence_stripped[:50]}")
                 continue
             
             if full_text_has_duration and not duration_anywhere_pattern.search(sentence_stripped):
                 if "would" in sentence_stripped.lower() and "instead" in sentence_stripped.lower():
-                    logger.debug(f"[REPLACEMENT] Skipping 'would...instead' sentence in duration context: {sentence_stripped[:50]}")
+                    if active:
+                        active.record("builder", "replacement", f"Skipping 'would...instead' sentence in duration context: {sentence_stripped[:50]}")
                     continue
         
         parsed_effects = parse_replacement_effects(sentence_stripped)
-        logger.debug(f"[REPLACEMENT] Parsed {len(parsed_effects)} effects from sentence: {sentence_stripped[:50]}")
+        if active:
+            active.record("builder", "replacement", f"Parsed {len(parsed_effects)} effects from sentence: {sentence_stripped[:50]}")
         
         if skip_duration_effects and parsed_effects:
             has_duration_prefix = duration_anywhere_pattern.search(sentence_stripped)
             for effect in parsed_effects:
                 if has_duration_prefix and not effect.duration:
-                    logger.debug(f"[REPLACEMENT] Skipping effect without duration: {effect.kind}")
+                    if active:
+                        active.record("builder", "replacement", f"Skipping effect without duration: {effect.kind}")
                     continue
                 if full_text_has_duration and not effect.duration:
-                    logger.debug(f"[REPLACEMENT] Skipping effect without duration (full text has duration): {effect.kind}")
+                    if active:
+                        active.record("builder", "replacement", f"Skipping effect without duration (full text has duration): {effect.kind}")
                     continue
                 replacement_effects.append(effect)
-                logger.debug(f"[REPLACEMENT] Added effect: {effect.kind}")
+                if active:
+                    active.record("builder", "replacement", f"Added effect: {effect.kind}")
         else:
             replacement_effects.extend(parsed_effects)
-            logger.debug(f"[REPLACEMENT] Added {len(parsed_effects)} effects")
+            if active:
+                active.record("builder", "replacement", f"Added {len(parsed_effects)} effects")
     
-    logger.debug(f"[REPLACEMENT] Total replacement effects parsed: {len(replacement_effects)}")
+    if active:
+        active.record("builder", "replacement", f"Total replacement effects parsed: {len(replacement_effects)}")
     return replacement_effects
 
 
@@ -755,17 +779,20 @@ def _merge_triggered_abilities(axis1: list[TriggeredAbility], detected: list[Tri
 
 
 def _parse_continuous_effects(text: str, ctx: ParseContext, is_permanent: bool) -> list[ContinuousEffect]:
-    import logging
-    logger = logging.getLogger(__name__)
+    active = trace.current()
     continuous_effects = []
-    logger.debug(f"[BUILDER] _parse_continuous_effects: is_permanent={is_permanent}, text length={len(text)}")
+    if active:
+        active.record("builder", "face", f"_parse_continuous_effects: is_permanent={is_permanent}, text length={len(text)}")
     if is_permanent:
         sentences = split_into_sentences(text)
-        logger.debug(f"[BUILDER] Split into {len(sentences)} sentences: {sentences}")
+        if active:
+            active.record("builder", "face", f"Split into {len(sentences)} sentences: {sentences}")
         for sentence in sentences:
-            logger.debug(f"[BUILDER] Parsing continuous effect sentence: {sentence[:100]}")
+            if active:
+                active.record("builder", "face", f"Parsing continuous effect sentence: {sentence[:100]}")
             parsed = parse_continuous_effects(sentence, ctx)
-            logger.debug(f"[BUILDER] Parsed {len(parsed)} continuous effects from sentence")
+            if active:
+                active.record("builder", "face", f"Parsed {len(parsed)} continuous effects from sentence")
             continuous_effects.extend(parsed)
     return continuous_effects
 
@@ -799,22 +826,22 @@ def _parse_face(face: Axis1Face, ctx: ParseContext) -> Axis2Face:
     4. Reconstruct effect chains using semantic heuristics
     5. Emit Axis2 nodes (continuous effects, replacement effects, etc.)
     """
-    import logging
-    logger = logging.getLogger(__name__)
     
     # Step 0: Handle keywords FIRST (already implemented)
     # Keywords are detected and removed by keyword registry
     # We start with empty activated/triggered lists since we'll parse from text
+    active = trace.current()
     remaining_text, keyword_names, keyword_effects = get_remaining_text_for_parsing(
         face, [], [], ctx
     )
     
-    logger.debug(f"[BUILDER] Remaining text after keyword extraction: {remaining_text[:300]}")
-    logger.debug(f"[BUILDER] Keyword effects: {len(keyword_effects)}")
+    if active:
+        active.record("builder", "keywords", remaining_text[:300], keyword_effects=len(keyword_effects))
     
     # Step 1: Detect ability boundaries
     chunks = detect_ability_boundaries(remaining_text, ctx)
-    logger.debug(f"[BUILDER] Detected {len(chunks)} ability chunks")
+    if active:
+        active.record("builder", "face", f"Detected {len(chunks)} ability chunks")
     
     # Step 2-4: Parse each ability chunk
     detected_activated = []
@@ -826,15 +853,18 @@ def _parse_face(face: Axis1Face, ctx: ParseContext) -> Axis2Face:
     spell_targeting = None
     
     for chunk in chunks:
-        logger.debug(f"[BUILDER] Processing chunk type={chunk.type}, text={chunk.text[:100]}")
+        if active:
+            active.record("builder", "face", f"Processing chunk type={chunk.type}, text={chunk.text[:100]}")
         
         # Step 2: Split into sentences within this ability
         sentences = split_ability_into_sentences(chunk)
-        logger.debug(f"[BUILDER] Split into {len(sentences)} sentences")
+        if active:
+            active.record("builder", "face", f"Split into {len(sentences)} sentences")
         
         # Step 3: Reconstruct effect chain
         effects = reconstruct_effect_chain(sentences, ctx)
-        logger.debug(f"[BUILDER] Reconstructed {len(effects)} effects")
+        if active:
+            active.record("builder", "face", f"Reconstructed {len(effects)} effects")
         
         # Step 4: Emit Axis2 nodes based on ability type
         if chunk.type == "triggered":
@@ -886,7 +916,8 @@ def _parse_face(face: Axis1Face, ctx: ParseContext) -> Axis2Face:
             # These are handled separately by parse_enchant_restriction
             chunk_lower = chunk.text.strip().lower()
             if re.match(r"^enchant\s+(creature|artifact|land|planeswalker|enchantment|permanent|player|battle)(?:\s+with\s+.*)?\.?$", chunk_lower):
-                logger.debug(f"[BUILDER] Skipping targeting restriction chunk: {chunk.text}")
+                if active:
+                    active.record("builder", "face", f"Skipping targeting restriction chunk: {chunk.text}")
                 continue
             
             # Try to parse as various effect types
@@ -1012,8 +1043,10 @@ class Axis2Builder:
 
     @staticmethod
     def build(axis1_card: Axis1Card) -> Axis2Card:
+        active = trace.current()
         face1: Axis1Face = axis1_card.faces[0]
-        print(f"Building Axis2Card: {axis1_card.names[0]}")
+        if active:
+            active.record("builder", "card", axis1_card.names[0])
         
         characteristics = _extract_characteristics(axis1_card, face1)
 
@@ -1041,8 +1074,6 @@ class Axis2Builder:
         from axis2.validation import validate_axis2_card
         validation_errors = validate_axis2_card(card)
         if validation_errors:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Validation errors for card {card.card_id}: {validation_errors}")
+            logger.warning("Validation errors for card %s: %s", card.card_id, validation_errors)
         
         return card
@@ -0,0 +1,239 @@
+"""
+Compilation cache in front of Axis2Builder.
+
+Every printing of a card (and every copy of it in a deck) compiles to the
+same Axis2 rules objects, so builds are cached by the card's rules content
+instead of its card_id:
+
+    key = sha256(PARSER_VERSION, names, layout, characteristics and the
+                 rules fields of every face)
+
+Lookup order:
+    1. in-process LRU
+    2. on-disk store (optional)
+    3. axis2_cards table (optional), filled ahead of time by
+       scripts/compile_axis2_cards.py
+    4. Axis2Builder.build
+
+Every tier holds the pickled Axis2Card. Each hit unpickles a fresh object,
+so runtime code can mutate what it gets back, and then stamps the
+printing's own card_id / oracle_id / set / collector_number onto it.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from axis1.schema import Axis1Card
+from axis2.builder import Axis2Builder
+from axis2.schema import Axis2Card
+from db.repository import Axis2CardRepository
+from scryfall.cache import CacheStats
+
+
+DEFAULT_MAX_ENTRIES = 4096
+
+
+def _parser_fingerprint() -> str:
+    root = Path(__file__).parent
+    digest = hashlib.sha256()
+    for path in sorted(root.rglob("*.py")):
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+# Changes whenever any Axis2 source file changes, so entries compiled by
+# an older parser are never served.
+PARSER_VERSION = _parser_fingerprint()
+
+# Axis1 face fields that differ between printings but never reach Axis2
+_PRINTING_FACE_FIELDS = {"printed_text", "flavor_text"}
+
+
+def compile_key(axis1_card: Axis1Card) -> str:
+    """Cache key shared by every printing with the same rules content."""
+    rules = axis1_card.model_dump_json(
+        include={"names", "layout", "characteristics", "faces"},
+        exclude={"faces": {"__all__": _PRINTING_FACE_FIELDS}},
+    )
+    digest = hashlib.sha256(PARSER_VERSION.encode())
+    digest.update(rules.encode())
+    return digest.hexdigest()
+
+
+class DiskCompileStore:
+    """One pickle per compiled card: <root>/<key[:2]>/<key>.pkl"""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], f"{key}.pkl")
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._path(key), "rb") as fh:
+                return fh.read()
+        except OSError:
+            return None
+
+    def put(self, key: str, blob: bytes):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write-then-rename so readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(blob)
+        os.replace(tmp, path)
+
+
+class DbCompileStore:
+    """axis2_cards rows; `session_factory` is a sessionmaker."""
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self.session_factory() as session:
+            return Axis2CardRepository(session).get_blob(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, bytes]:
+        with self.session_factory() as session:
+            return Axis2CardRepository(session).get_blobs(list(keys))
+
+    def put(self, key: str, blob: bytes, axis1_card: Optional[Axis1Card] = None):
+        with self.session_factory() as session:
+            if axis1_card is None:
+                row = axis2_row(key, blob)
+            else:
+                row = axis2_row(key, blob, axis1_card.oracle_id, axis1_card.names[0])
+            Axis2CardRepository(session).save_many([row])
+
+
+def axis2_row(key: str, blob: bytes, oracle_id: Optional[str] = None, name: Optional[str] = None) -> Dict[str, Any]:
+    """axis2_cards row for a compiled card."""
+    return {
+        "compile_key": key,
+        "parser_version": PARSER_VERSION,
+        "oracle_id": oracle_id,
+        "name": name,
+        "axis2_blob": blob,
+    }
+
+
+def dump_axis2(card: Axis2Card) -> bytes:
+    return pickle.dumps(card, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class CachingAxis2Builder:
+    """Drop-in for Axis2Builder; only cache misses are parsed."""
+
+    def __init__(
+        self,
+        builder=Axis2Builder,
+        store_dir: Optional[str] = None,
+        session_factory=None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        stats: Optional[CacheStats] = None,
+    ):
+        self.builder = builder
+        self.store = DiskCompileStore(store_dir) if store_dir else None
+        self.db_store = DbCompileStore(session_factory) if session_factory else None
+        self.max_entries = max_entries
+        self.stats = stats or CacheStats()
+        self._lru: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def build(self, axis1_card: Axis1Card, **kwargs) -> Axis2Card:
+        if kwargs:
+            # Build options are not part of the compile key: such builds
+            # are neither served from nor stored in the cache
+            return self.builder.build(axis1_card, **kwargs)
+
+        key = compile_key(axis1_card)
+
+        blob = self._lookup(key)
+        if blob is None:
+            self.stats.miss()
+            card = self.builder.build(axis1_card)
+            self._remember(key, dump_axis2(card), axis1_card)
+            return card
+
+        card = pickle.loads(blob)
+        card.card_id = axis1_card.card_id
+        card.oracle_id = axis1_card.oracle_id
+        card.set = axis1_card.set
+        card.collector_number = axis1_card.collector_number
+        return card
+
+    def prefetch(self, axis1_cards: Iterable[Axis1Card]) -> int:
+        """
+        Load a whole deck's precompiled cards from the DB in one query,
+        so the following build() calls are memory hits. Returns the
+        number of cards found.
+        """
+        if self.db_store is None:
+            return 0
+        with self._lock:
+            keys = {compile_key(card) for card in axis1_cards} - self._lru.keys()
+        found = self.db_store.get_many(keys)
+        for key, blob in found.items():
+            self._remember(key, blob, persist=False)
+        return len(found)
+
+    def clear(self):
+        """Drop the in-process tier (the disk store is left alone)."""
+        with self._lock:
+            self._lru.clear()
+
+    # ---------------------------------------------------------
+    # Tiers
+    # ---------------------------------------------------------
+    def _lookup(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            blob = self._lru.get(key)
+            if blob is not None:
+                self._lru.move_to_end(key)
+        if blob is not None:
+            self.stats.hit("memory")
+            return blob
+
+        if self.store is not None:
+            blob = self.store.get(key)
+            if blob is not None:
+                self.stats.hit("disk")
+                self._remember(key, blob, persist=False)
+                return blob
+
+        if self.db_store is not None:
+            blob = self.db_store.get(key)
+            if blob is not None:
+                self.stats.hit("db")
+                self._remember(key, blob, persist=False)
+                if self.store is not None:
+                    self.store.put(key, blob)
+        return blob
+
+    def _remember(
+        self,
+        key: str,
+        blob: bytes,
+        axis1_card: Optional[Axis1Card] = None,
+        persist: bool = True,
+    ):
+        with self._lock:
+            self._lru[key] = blob
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+        if persist:
+            if self.store is not None:
+                self.store.put(key, blob)
+            if self.db_store is not None:
+                self.db_store.put(key, blob, axis1_card)
@@ -0,0 +1,152 @@
+"""
+Process-pool Axis2 compilation for the batch compiler.
+
+    axis1_json rows ──(bounded chunk queue)──> process pool ──(in-order window)──> caller
+
+Same pipeline as scryfall/mappers/parallel.py (map_chunks_ordered): a
+reader thread chunks the input, workers compile chunks, results come
+back in input order.
+
+Workers validate the Axis1 dump, compute its compile key and skip keys
+that are already stored or that the same worker compiled before. Rows
+arrive in name order, so printings of one card usually share a chunk
+and are parsed once. The caller drops the remaining cross-worker
+duplicates by key.
+
+Each result carries the pickled Axis2Card, the wall time of the build and
+the axis2 warnings the build logged. With trace=True the build also runs
+under a parse trace (see axis2/parsing/trace.py): its records are added
+to the diagnostics and its per-parser seconds are returned.
+"""
+
+import contextlib
+import logging
+import time
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Set
+
+from axis1.schema import Axis1Card
+from axis2.builder import Axis2Builder
+from axis2.cache import compile_key, dump_axis2
+from axis2.parsing import trace as parse_trace
+from scryfall.mappers.parallel import map_chunks_ordered
+
+
+DEFAULT_CHUNK_SIZE = 50
+
+
+class CompileResult(NamedTuple):
+    card_id: Optional[str]
+    name: Optional[str]
+    oracle_id: Optional[str]
+    compile_key: Optional[str]
+    blob: Optional[bytes]           # pickled Axis2Card
+    error: Optional[str]
+    diagnostics: List[str]
+    seconds: float
+    parser_seconds: Optional[Dict[str, float]] = None   # only when traced
+
+    @property
+    def skipped(self) -> bool:
+        """Key already stored or already compiled; nothing was parsed."""
+        return self.blob is None and self.error is None
+
+
+# ---------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.INFO)
+        self.messages: List[str] = []
+
+    def emit(self, record):
+        self.messages.append(f"{record.levelname}: {record.getMessage()}")
+
+
+_worker_skip: FrozenSet[str] = frozenset()
+_worker_seen: Set[str] = set()
+_worker_trace = False
+
+
+def _init_worker(skip_keys: FrozenSet[str] = frozenset(), trace: bool = False):
+    global _worker_skip, _worker_seen, _worker_trace
+    _worker_skip = skip_keys
+    _worker_seen = set()
+    _worker_trace = trace
+
+
+def compile_one(
+    data: Dict[str, Any],
+    skip: FrozenSet[str] = frozenset(),
+    seen: Optional[Set[str]] = None,
+    trace: bool = False,
+) -> CompileResult:
+    """Compile one stored axis1_json dump, capturing its diagnostics."""
+    card_id, name, oracle_id = data.get("card_id"), (data.get("names") or [None])[0], data.get("oracle_id")
+    try:
+        axis1_card = Axis1Card.model_validate(data)
+    except Exception as e:
+        return CompileResult(card_id, name, oracle_id, None, None, f"{type(e).__name__}: {e}", [], 0.0)
+
+    key = compile_key(axis1_card)
+    if key in skip or (seen is not None and key in seen):
+        return CompileResult(card_id, name, oracle_id, key, None, None, [], 0.0)
+    if seen is not None:
+        seen.add(key)
+
+    capture = _Capture()
+    axis2_logger = logging.getLogger("axis2")
+    axis2_logger.addHandler(capture)
+    tracing = parse_trace.tracing() if trace else contextlib.nullcontext()
+    started = time.perf_counter()
+    try:
+        with tracing as t:
+            blob, error = dump_axis2(Axis2Builder.build(axis1_card)), None
+    except Exception as e:
+        blob, error = None, f"{type(e).__name__}: {e}"
+    finally:
+        seconds = time.perf_counter() - started
+        axis2_logger.removeHandler(capture)
+
+    if not trace:
+        return CompileResult(card_id, name, oracle_id, key, blob, error, capture.messages, seconds)
+
+    diagnostics = capture.messages + t.lines()
+    parser_seconds = {parser: timing.seconds for parser, timing in t.timings.items()}
+    return CompileResult(card_id, name, oracle_id, key, blob, error, diagnostics, seconds, parser_seconds)
+
+
+def _compile_chunk(chunk: List[Dict[str, Any]]) -> List[CompileResult]:
+    return [compile_one(data, _worker_skip, _worker_seen, _worker_trace) for data in chunk]
+
+
+def compile_cards_parallel(
+    rows: Iterable[Dict[str, Any]],
+    workers: int,
+    skip_keys: Iterable[str] = (),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_pending: Optional[int] = None,
+    trace: bool = False,
+) -> Iterator[CompileResult]:
+    """
+    Compile axis1_json dumps to Axis2 across `workers` processes.
+
+    Memory stays bounded like map_cards_parallel: at most `max_pending`
+    chunks are read ahead and in flight. With workers=1 everything runs
+    in-process. trace=True records a parse trace per card.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+
+    skip = frozenset(skip_keys)
+
+    if workers == 1:
+        seen: Set[str] = set()
+        for data in rows:
+            yield compile_one(data, skip, seen, trace)
+        return
+
+    yield from map_chunks_ordered(
+        rows, _compile_chunk, workers, chunk_size, max_pending,
+        initializer=_init_worker, initargs=(skip, trace),
+    )
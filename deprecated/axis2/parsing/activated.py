@@ -1,5 +1,6 @@
 # axis2/parsing/activated.py
 
+import logging
 import re
 from axis1.schema import Axis1Face
 from axis2.schema import ActivatedAbility, ParseContext
@@ -7,6 +8,8 @@ from axis2.parsing.costs import parse_cost_string
 from axis2.parsing.effects import parse_effect_text
 from axis2.parsing.targeting import parse_targeting
 
+logger = logging.getLogger(__name__)
+
 def strip_parenthetical(text: str) -> str:
     out = []
     depth = 0
@@ -45,9 +48,7 @@ def parse_activated_abilities(axis1_face: Axis1Face, ctx: ParseContext) -> list[
     activated = []
     activated_abilities_list = getattr(axis1_face, "activated_abilities", [])
     
-    import logging
-    logger = logging.getLogger(__name__)
-    logger.debug(f"Parsing {len(activated_abilities_list)} activated abilities from Axis1")
+    logger.debug("Parsing %s activated abilities from Axis1", len(activated_abilities_list))
 
     for a in activated_abilities_list:
         raw_cost = getattr(a, "cost", "") or ""
@@ -55,7 +56,7 @@ def parse_activated_abilities(axis1_face: Axis1Face, ctx: ParseContext) -> list[
         raw_text = getattr(a, "text", "") or ""
         raw_effect = strip_parenthetical(raw_effect)
         
-        logger.debug(f"Processing activated ability: cost='{raw_cost}', effect='{raw_effect}', text='{raw_text}'")
+        logger.debug("Processing activated ability: cost='%s', effect='%s', text='%s'", raw_cost, raw_effect, raw_text)
         # ------------------------------------------------------------
         # 1. Parse costs using the new multi-part cost parser
         # ------------------------------------------------------------
@@ -81,9 +82,9 @@ def parse_activated_abilities(axis1_face: Axis1Face, ctx: ParseContext) -> list[
         # Debug: log effect parsing results
         if raw_effect:
             regular_effects = [e for e in effects if not isinstance(e, ReplacementEffect)]
-            logger.debug(f"Effect parsing: text='{raw_effect}', parsed {len(effects)} effects ({len(regular_effects)} regular, {len(replacement_effects)} replacement)")
+            logger.debug("Effect parsing: text='%s', parsed %s effects (%s regular, %s replacement)", raw_effect, len(effects), len(regular_effects), len(replacement_effects))
             if not effects:
-                logger.debug(f"WARNING: Effect text '{raw_effect}' did not parse into any effects")
+                logger.debug("WARNING: Effect text '%s' did not parse into any effects", raw_effect)
 
         # ------------------------------------------------------------
         # 3. Fallback: Axis1 failed to split cost/effect
@@ -122,9 +123,9 @@ def parse_activated_abilities(axis1_face: Axis1Face, ctx: ParseContext) -> list[
                 targeting=targeting,
                 timing=timing,
             )
-            logger.debug(f"Created ActivatedAbility: costs={len(costs)}, effects={len(effects)}, timing={timing}")
+            logger.debug("Created ActivatedAbility: costs=%s, effects=%s, timing=%s", len(costs), len(effects), timing)
             activated.append(ability)
         else:
-            logger.debug(f"Skipping activated ability with no costs or effects. cost={raw_cost}, effect={raw_effect}, text={raw_text}")
+            logger.debug("Skipping activated ability with no costs or effects. cost=%s, effect=%s, text=%s", raw_cost, raw_effect, raw_text)
 
     return activated
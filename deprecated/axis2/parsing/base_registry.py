@@ -5,7 +5,13 @@ This module provides a base class that eliminates duplication across
 different parser registry implementations.
 """
 
-from typing import List, Optional, Any, Callable
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from axis2.parsing import trace
+
+logger = logging.getLogger(__name__)
 
 class BaseParserRegistry:
     """
@@ -13,14 +19,22 @@ class BaseParserRegistry:
     
     Provides common functionality:
     - Parser registration with priority sorting
-    - Candidate filtering via can_parse
+    - Candidate filtering via a cue index and can_parse
     - Common parsing loop logic
     
     Subclasses should call _try_parsers() in their parse() method.
+    
+    Parsers may declare `cues`: lower-case substrings of which at least one
+    must appear in the lower-cased text for can_parse to be True. The
+    registry keeps a cue -> parser bit mask index, so each text only
+    reaches the can_parse of parsers whose cues it contains. Parsers
+    without cues are always asked.
     """
     
     def __init__(self):
         self._parsers: List[Any] = []
+        self._index: Optional[Tuple[int, Tuple[Tuple[str, int], ...]]] = None
+        self._by_mask: Dict[int, List[Any]] = {}  # candidate lists by cue mask
     
     def register(self, parser: Any):
         """
@@ -31,6 +45,33 @@ class BaseParserRegistry:
         """
         self._parsers.append(parser)
         self._parsers.sort(key=lambda p: p.priority, reverse=True)
+        self._index = None
+    
+    def _build_index(self) -> Tuple[int, Tuple[Tuple[str, int], ...]]:
+        uncued = 0
+        by_cue: Dict[str, int] = {}
+        for bit, p in enumerate(self._parsers):
+            cues = getattr(p, "cues", None)
+            if not cues:
+                uncued |= 1 << bit
+                continue
+            for cue in cues:
+                by_cue[cue] = by_cue.get(cue, 0) | 1 << bit
+        self._index = (uncued, tuple(by_cue.items()))
+        self._by_mask = {}
+        return self._index
+    
+    def _cued_parsers(self, text: str) -> List[Any]:
+        """Parsers, in priority order, whose cues appear in `text`."""
+        uncued, by_cue = self._index or self._build_index()
+        lower = text.lower()
+        mask = uncued
+        for bits in [bits for cue, bits in by_cue if cue in lower]:
+            mask |= bits
+        parsers = self._by_mask.get(mask)
+        if parsers is None:
+            parsers = self._by_mask[mask] = [p for bit, p in enumerate(self._parsers) if mask >> bit & 1]
+        return parsers
     
     def _find_candidates(self, text: str, ctx: Optional[Any] = None) -> List[Any]:
         """
@@ -50,24 +91,23 @@ class BaseParserRegistry:
         # Quick filter: only try parsers that might match
         # Different parser types have different can_parse signatures
         candidates = []
+        parsers = self._cued_parsers(text)
         if ctx is not None:
-            for p in self._parsers:
+            for p in parsers:
                 try:
                     if p.can_parse(text, ctx):
                         candidates.append(p)
                 except Exception as e:
                     # Log but don't fail - some parsers might have bugs in can_parse
-                    import logging
-                    logging.getLogger(__name__).debug(f"Exception in {type(p).__name__}.can_parse: {e}")
+                    logger.debug("Exception in %s.can_parse: %s", type(p).__name__, e)
         else:
-            for p in self._parsers:
+            for p in parsers:
                 try:
                     if p.can_parse(text):
                         candidates.append(p)
                 except Exception as e:
                     # Log but don't fail - some parsers might have bugs in can_parse
-                    import logging
-                    logging.getLogger(__name__).debug(f"Exception in {type(p).__name__}.can_parse: {e}")
+                    logger.debug("Exception in %s.can_parse: %s", type(p).__name__, e)
         
         return candidates
     
@@ -87,8 +127,23 @@ class BaseParserRegistry:
         Returns:
             ParseResult if successful, None otherwise
         """
+        active = trace.current()
+        if active:
+            return self._try_parsers_timed(candidates, parse_func, active)
+        for parser in candidates:
+            result = parse_func(parser)
+            if result.is_success:
+                return result
+        return None
+
+    def _try_parsers_timed(
+        self, candidates: List[Any], parse_func: Callable[[Any], Any], active: trace.ParseTrace
+    ) -> Optional[Any]:
+        """_try_parsers with per-parser timing into the active trace."""
         for parser in candidates:
+            started = time.perf_counter()
             result = parse_func(parser)
+            active.timing(parser, time.perf_counter() - started, result.is_success)
             if result.is_success:
                 return result
         return None
@@ -10,6 +10,7 @@ import re
 class AbilitiesParser(ContinuousEffectParser):
     """Parses ability granting effects: 'has flying', 'gains haste'"""
     priority = 50  # Medium priority
+    cues = ("has ", "gains ", "gain ")
 
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -22,44 +23,44 @@ class AbilitiesParser(ContinuousEffectParser):
         logger = logging.getLogger(__name__)
         
         lower = text.lower()
-        logger.debug(f"[AbilitiesParser] Parsing: {text[:100]}, applies_to={applies_to}")
+        logger.debug("[AbilitiesParser] Parsing: %s, applies_to=%s", text[:100], applies_to)
 
         # Extract the part after "has ..." or "gains ..."
         if "has " in lower:
             m = HAS_ABILITY_RE.search(lower)
             if not m:
-                logger.debug(f"[AbilitiesParser] HAS_ABILITY_RE did not match")
+                logger.debug("[AbilitiesParser] HAS_ABILITY_RE did not match")
                 return ParseResult(matched=False)
             ability_part = m.group(1)
-            logger.debug(f"[AbilitiesParser] Extracted ability_part from 'has': {ability_part}")
+            logger.debug("[AbilitiesParser] Extracted ability_part from 'has': %s", ability_part)
         elif "gains " in lower or "gain " in lower:
             m = GAINS_ABILITY_RE.search(lower)
             if not m:
-                logger.debug(f"[AbilitiesParser] GAINS_ABILITY_RE did not match")
+                logger.debug("[AbilitiesParser] GAINS_ABILITY_RE did not match")
                 return ParseResult(matched=False)
             ability_part = m.group(1)
-            logger.debug(f"[AbilitiesParser] Extracted ability_part from 'gains': {ability_part}")
+            logger.debug("[AbilitiesParser] Extracted ability_part from 'gains': %s", ability_part)
         else:
-            logger.debug(f"[AbilitiesParser] No 'has' or 'gains' found")
+            logger.debug("[AbilitiesParser] No 'has' or 'gains' found")
             return ParseResult(matched=False)
 
         # Normalize separators
         ability_part = ability_part.replace(", and ", ", ")
         ability_part = ability_part.replace(" and ", ", ")
         raw = [a.strip().rstrip(".") for a in ability_part.split(",")]
-        logger.debug(f"[AbilitiesParser] Split into raw abilities: {raw}")
+        logger.debug("[AbilitiesParser] Split into raw abilities: %s", raw)
 
         abilities: list[GrantedAbility] = []
 
         for a in raw:
             a_clean = re.sub(r"\s+until.*$", "", a).strip().lower()
-            logger.debug(f"[AbilitiesParser] Processing ability: '{a}' -> cleaned: '{a_clean}'")
+            logger.debug("[AbilitiesParser] Processing ability: '%s' -> cleaned: '%s'", a, a_clean)
 
             # Ward {N} - match anywhere in the string, not just at start
             m = re.search(r"ward\s*\{(\d+)\}", a_clean)
             if m:
                 value = int(m.group(1))
-                logger.debug(f"[AbilitiesParser] Found ward {value}")
+                logger.debug("[AbilitiesParser] Found ward %s", value)
                 abilities.append(GrantedAbility(kind="ward", value=value))
                 continue
 
@@ -30,6 +30,7 @@ LAND_TYPES = {
 class AbilityGrantParser(ContinuousEffectParser):
     """Comprehensive parser for ability granting effects: 'has flying', 'gains haste', 'has ward {2}', etc."""
     priority = 50  # Same priority as AbilitiesParser, but more comprehensive
+    cues = ("has ", "gains ", "gain ", "have ")
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         """Quick check if this parser might match. Must be CHEAP."""
@@ -40,7 +41,7 @@ class AbilityGrantParser(ContinuousEffectParser):
               condition=None, duration: Optional[str] = None) -> ParseResult:
         """Parse ability granting text into ContinuousEffect with GrantedAbility list"""
         lower = text.lower()
-        logger.warning(f"[AbilityGrantParser] Parsing: {text[:100]}, applies_to={applies_to}")
+        logger.debug("[AbilityGrantParser] Parsing: %s, applies_to=%s", text[:100], applies_to)
         
         # Extract the part after "has ...", "gains ...", "gain ...", or "have ..."
         ability_part = None
@@ -48,34 +49,34 @@ class AbilityGrantParser(ContinuousEffectParser):
             m = HAS_ABILITY_RE.search(lower)
             if m:
                 ability_part = m.group(1)
-                logger.debug(f"[AbilityGrantParser] Extracted from 'has': {ability_part}")
+                logger.debug("[AbilityGrantParser] Extracted from 'has': %s", ability_part)
         elif "gains " in lower or "gain " in lower:
             m = GAINS_ABILITY_RE.search(lower)
             if m:
                 ability_part = m.group(1)
-                logger.debug(f"[AbilityGrantParser] Extracted from 'gains': {ability_part}")
+                logger.debug("[AbilityGrantParser] Extracted from 'gains': %s", ability_part)
         elif "have " in lower:
             # Handle "have" (plural form)
             m = re.search(r"have\s+(.+)", lower, re.IGNORECASE)
             if m:
                 ability_part = m.group(1)
-                logger.debug(f"[AbilityGrantParser] Extracted from 'have': {ability_part}")
+                logger.debug("[AbilityGrantParser] Extracted from 'have': %s", ability_part)
         
         if not ability_part:
-            logger.warning(f"[AbilityGrantParser] No ability part extracted from: {text[:100]}")
+            logger.debug("[AbilityGrantParser] No ability part extracted from: %s", text[:100])
             return ParseResult(matched=False)
         
         # Normalize separators
         ability_part = ability_part.replace(", and ", ", ")
         ability_part = ability_part.replace(" and ", ", ")
         raw = [a.strip().rstrip(".") for a in ability_part.split(",")]
-        logger.debug(f"[AbilityGrantParser] Split into raw abilities: {raw}")
+        logger.debug("[AbilityGrantParser] Split into raw abilities: %s", raw)
         
         abilities: list[GrantedAbility] = []
         
         for a in raw:
             a_clean = re.sub(r"\s+until.*$", "", a).strip().lower()
-            logger.warning(f"[AbilityGrantParser] Processing ability: '{a}' -> cleaned: '{a_clean}'")
+            logger.debug("[AbilityGrantParser] Processing ability: '%s' -> cleaned: '%s'", a, a_clean)
             
             # Try parameterized abilities first (more specific patterns)
             
@@ -83,7 +84,7 @@ class AbilityGrantParser(ContinuousEffectParser):
             ward_match = WARD_PATTERN.search(a_clean)
             if ward_match:
                 value = int(ward_match.group(1))
-                logger.warning(f"[AbilityGrantParser] Found ward {value}")
+                logger.debug("[AbilityGrantParser] Found ward %s", value)
                 abilities.append(GrantedAbility(kind="ward", value=value))
                 continue
             
@@ -95,11 +96,11 @@ class AbilityGrantParser(ContinuousEffectParser):
                 numeric_match = re.search(r"\{(\d+)\}", cost_text)
                 if numeric_match:
                     value = int(numeric_match.group(1))
-                    logger.debug(f"[AbilityGrantParser] Found ward with cost {value}")
+                    logger.debug("[AbilityGrantParser] Found ward with cost %s", value)
                     abilities.append(GrantedAbility(kind="ward", value=value))
                 else:
                     # For complex costs, store as string in value (will need schema update)
-                    logger.debug(f"[AbilityGrantParser] Found ward with complex cost: {cost_text}")
+                    logger.debug("[AbilityGrantParser] Found ward with complex cost: %s", cost_text)
                     abilities.append(GrantedAbility(kind="ward", value=None))  # Axis3 will parse cost_text
                 continue
             
@@ -107,7 +108,7 @@ class AbilityGrantParser(ContinuousEffectParser):
             prot_match = PROTECTION_PATTERN.search(a_clean)
             if prot_match:
                 protection_value = prot_match.group(1).strip()
-                logger.debug(f"[AbilityGrantParser] Found protection from: {protection_value}")
+                logger.debug("[AbilityGrantParser] Found protection from: %s", protection_value)
                 # Protection is handled by ProtectionParser, but we can also grant it as an ability
                 # For now, we'll let ProtectionParser handle it, but we could create GrantedAbility here
                 # Note: ProtectionParser uses grant_protection kind, not grant_ability
@@ -118,7 +119,7 @@ class AbilityGrantParser(ContinuousEffectParser):
             annihilator_match = ANNIHILATOR_PATTERN.search(a_clean)
             if annihilator_match:
                 value = int(annihilator_match.group(1))
-                logger.debug(f"[AbilityGrantParser] Found annihilator {value}")
+                logger.debug("[AbilityGrantParser] Found annihilator %s", value)
                 abilities.append(GrantedAbility(kind="annihilator", value=value))
                 continue
             
@@ -126,29 +127,29 @@ class AbilityGrantParser(ContinuousEffectParser):
             landwalk_match = LANDWALK_PATTERN.search(a_clean)
             if landwalk_match:
                 land_type = landwalk_match.group(1).lower()
-                logger.debug(f"[AbilityGrantParser] Found {land_type}walk")
+                logger.debug("[AbilityGrantParser] Found %swalk", land_type)
                 # Store land type in value as string
                 abilities.append(GrantedAbility(kind="landwalk", value=land_type))
                 continue
             
             # Simple keyword abilities - check exact match
             if a_clean in ABILITY_KEYWORDS:
-                logger.debug(f"[AbilityGrantParser] Found simple ability: {a_clean}")
+                logger.debug("[AbilityGrantParser] Found simple ability: %s", a_clean)
                 abilities.append(GrantedAbility(kind=a_clean))
                 continue
             
             # Try matching against keywords - check if ability text contains or matches keyword
             for keyword in ABILITY_KEYWORDS:
                 if a_clean == keyword or a_clean.strip() == keyword:
-                    logger.debug(f"[AbilityGrantParser] Matched keyword: {keyword}")
+                    logger.debug("[AbilityGrantParser] Matched keyword: %s", keyword)
                     abilities.append(GrantedAbility(kind=keyword))
                     break
         
         if not abilities:
-            logger.debug(f"[AbilityGrantParser] No abilities found")
+            logger.debug("[AbilityGrantParser] No abilities found")
             return ParseResult(matched=False)
         
-        logger.debug(f"[AbilityGrantParser] Created {len(abilities)} granted abilities")
+        logger.debug("[AbilityGrantParser] Created %s granted abilities", len(abilities))
         
         effect = ContinuousEffect(
             kind="grant_ability",
@@ -9,6 +9,7 @@ import re
 
 class ActivationRestrictionParser(ContinuousEffectParser):
     priority = 35
+    cues = ("activated abilities",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         lower = text.lower()
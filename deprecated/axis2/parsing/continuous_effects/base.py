@@ -40,6 +40,7 @@ class ParseResult:
 class ContinuousEffectParser(Protocol):
     """Interface all continuous effect parsers must implement"""
     priority: int  # Higher = tried first
+    cues: tuple[str, ...] = ()  # lower-case substrings can_parse needs; see BaseParserRegistry
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         """
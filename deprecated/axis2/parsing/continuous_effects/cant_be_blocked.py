@@ -9,6 +9,7 @@ import re
 class CantBeBlockedParser(ContinuousEffectParser):
     """Parses 'can't be blocked by X creatures' effects"""
     priority = 20  # Lower priority
+    cues = ("can't be blocked", "cannot be blocked")
 
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
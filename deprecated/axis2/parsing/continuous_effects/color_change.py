@@ -9,6 +9,7 @@ from axis2.parsing.layers import assign_layer_to_effect
 class ColorChangeParser(ContinuousEffectParser):
     """Parses color change effects: 'is red', 'is all colors'"""
     priority = 45  # Medium priority
+    cues = ("is ",)
 
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
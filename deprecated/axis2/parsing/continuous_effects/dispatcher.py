@@ -7,6 +7,7 @@ from .utils import split_continuous_clauses, guess_applies_to, detect_duration
 from axis2.schema import ContinuousEffect, ParseContext
 from axis2.parsing.conditions import parse_condition, extract_condition_text
 from axis2.parsing.layers import assign_layer_to_effect
+from axis2.parsing import trace
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,23 +21,23 @@ def parse_continuous_effects(text: str, ctx: ParseContext) -> List[ContinuousEff
     Text starting with "when", "whenever", or "at" should be rejected
     as it's likely a triggered ability, not a continuous effect.
     """
+    active = trace.current()
     effects = []
     if not text:
-        logger.debug(f"[CONTINUOUS_DISPATCHER] Empty text, returning empty list")
         return effects
 
-    logger.warning(f"[CONTINUOUS_DISPATCHER] Parsing continuous effects from: {text[:200]}")
-
     # Reject text that starts with trigger words - this is a triggered ability, not a continuous effect
     text_lower = text.strip().lower()
     trigger_starters = ("when ", "whenever ", "at the beginning", "at the end")
     if any(text_lower.startswith(starter) for starter in trigger_starters):
-        logger.debug(f"Skipping continuous effect parsing for trigger text: {text[:50]}...")
+        if active:
+            active.record("continuous", "skip_trigger", text)
         return effects
 
     # Split into semantic clauses
     clauses = split_continuous_clauses(text)
-    logger.debug(f"[CONTINUOUS_DISPATCHER] Split text into {len(clauses)} clauses: {clauses}")
+    if active:
+        active.record("continuous", "clauses", text, clauses=clauses)
     current_subject = None
 
     registry = get_registry()
@@ -45,7 +46,8 @@ def parse_continuous_effects(text: str, ctx: ParseContext) -> List[ContinuousEff
         # Also check each clause for trigger starters
         clause_lower = clause.strip().lower()
         if any(clause_lower.startswith(starter) for starter in trigger_starters):
-            logger.debug(f"Skipping clause that looks like a trigger: {clause[:50]}...")
+            if active:
+                active.record("continuous", "skip_trigger", clause)
             continue
         # 1. Conditional wrapper
         condition = None
@@ -56,7 +58,6 @@ def parse_continuous_effects(text: str, ctx: ParseContext) -> List[ContinuousEff
             condition = structured
 
         applies_to = guess_applies_to(clause)
-        logger.debug(f"[CONTINUOUS_DISPATCHER] Clause: '{clause}', applies_to={applies_to}")
 
         if applies_to is None:
             applies_to = current_subject
@@ -67,9 +68,12 @@ def parse_continuous_effects(text: str, ctx: ParseContext) -> List[ContinuousEff
         duration = detect_duration(clause)
 
         # Use registry to find matching parser
-        logger.debug(f"[CONTINUOUS_DISPATCHER] Calling registry.parse for clause: '{clause[:100]}'")
         result = registry.parse(clause, ctx, applies_to, condition, duration)
-        logger.debug(f"[CONTINUOUS_DISPATCHER] Registry result: matched={result.matched}, is_success={result.is_success}, effects={len(result.all_effects)}")
+        if active:
+            active.record(
+                "continuous", "match" if result.is_success else "no_match", clause,
+                applies_to=applies_to, effects=len(result.all_effects), errors=result.errors,
+            )
         if result.is_success:
             for effect in result.all_effects:
                 if isinstance(effect, ContinuousEffect):
@@ -77,9 +81,7 @@ def parse_continuous_effects(text: str, ctx: ParseContext) -> List[ContinuousEff
                     assign_layer_to_effect(effect)
                 effects.append(effect)
         else:
-            logger.warning(f"Failed to parse continuous effect: {clause[:50]}...")
-            if result.errors:
-                logger.debug(f"Errors: {result.errors}")
+            logger.debug("Failed to parse continuous effect: %s...", clause[:50])
 
     return effects
 
@@ -9,6 +9,7 @@ from axis2.parsing.layers import assign_layer_to_effect
 class LossEffectsParser(ContinuousEffectParser):
     """Parses ability/type loss effects: 'loses all abilities'"""
     priority = 25  # Lower priority
+    cues = ("loses",)
 
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -10,6 +10,7 @@ import re
 class ProtectionParser(ContinuousEffectParser):
     """Parses protection effects: 'protection from red'"""
     priority = 35  # Medium priority
+    cues = ("protection from",)
 
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
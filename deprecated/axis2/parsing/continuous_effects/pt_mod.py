@@ -28,6 +28,7 @@ def parse_dynamic_counter_clause(text: str, ctx: ParseContext):
 class PTParser(ContinuousEffectParser):
     """Parses P/T modification effects: 'gets +3/+3'"""
     priority = 60  # High priority - P/T mods are common
+    cues = ("gets",)
 
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY - no regex, no parsing
@@ -82,6 +83,7 @@ class PTParser(ContinuousEffectParser):
 class BasePTParser(ContinuousEffectParser):
     """Parses base P/T setting effects: 'with base power and toughness 3/3'"""
     priority = 55  # Slightly lower than P/T mod
+    cues = ("base power",)
 
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -9,6 +9,7 @@ import re
 class RuleChangeParser(ContinuousEffectParser):
     """Parses rule-changing continuous effects: 'must choose at least one flagbearer'"""
     priority = 30  # Lower priority - rule changes are less common
+    cues = ("must choose", "flagbearer")
 
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -8,6 +8,7 @@ from axis2.parsing.layers import assign_layer_to_effect
 class TypeChangeParser(ContinuousEffectParser):
     """Parses type change effects: 'is a creature', 'is an artifact creature'"""
     priority = 40  # Medium priority
+    cues = ("is ",)
 
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -89,6 +90,7 @@ class TypeChangeParser(ContinuousEffectParser):
 class TypeRemovalParser(ContinuousEffectParser):
     """Parses type removal effects: 'isn't a creature until...' (Impending)"""
     priority = 45  # Higher than TypeChangeParser to catch "isn't" before "is"
+    cues = ("creature",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
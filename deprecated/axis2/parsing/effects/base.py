@@ -52,6 +52,10 @@ class ParseResult:
 class EffectParser(Protocol):
     """Interface all effect parsers must implement"""
     priority: int  # Higher = tried first
+    cues: tuple[str, ...] = ()  # lower-case substrings can_parse needs; see BaseParserRegistry
+    # True for parsers whose pattern spans several sentences. The dispatcher
+    # only runs a full-text pass when one of these can parse the text.
+    spans_sentences: bool = False
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         """
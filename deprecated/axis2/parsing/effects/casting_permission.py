@@ -42,6 +42,7 @@ class CastingPermissionParser(EffectParser):
     """
     
     priority = 60  # High priority - specific pattern
+    cues = ("you may cast",)
     
     def can_parse(self, text: str, ctx: Optional[ParseContext] = None) -> bool:
         """Check if text contains casting permission pattern."""
@@ -27,6 +27,8 @@ class ConditionalManaParser(EffectParser):
     - "Add {C}. If you control an Urza's Power-Plant and an Urza's Tower, add {C}{C} instead"
     """
     priority = 70  # High priority - very specific pattern
+    spans_sentences = True  # "Add {C}. If ..., add {C}{C} instead"
+    cues = ("instead",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -9,6 +9,7 @@ import re
 
 class ContinuousEffectWrapperParser(EffectParser):
     priority = 45
+    cues = ("gains ", "gain ", "has ", "have ", "gets ", "get ", "loses ", "lose ", "is ", "are ", "becomes ", "become ")
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         lower = text.lower()
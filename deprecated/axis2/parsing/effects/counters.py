@@ -19,6 +19,7 @@ COUNTER_THIS_RE = re.compile(
 class CounterParser(EffectParser):
     """Parses counter effects: 'put a +1/+1 counter on target creature' or 'put a +1/+1 counter on this creature'"""
     priority = 50  # Common effect
+    cues = ("counter",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -69,6 +70,7 @@ REMOVE_COUNTER_SIMPLE_RE = re.compile(
 class RemoveCounterParser(EffectParser):
     """Parses counter removal effects: 'remove a time counter from it'"""
     priority = 50  # Common effect
+    cues = ("remove",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -13,6 +13,7 @@ DAMAGE_RE = re.compile(
 class DamageParser(EffectParser):
     """Parses damage effects: 'deals N damage to target creature'"""
     priority = 50  # Medium priority
+    cues = ("damage",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY - no regex, no parsing
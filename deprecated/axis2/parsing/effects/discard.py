@@ -23,6 +23,7 @@ class DiscardParser(EffectParser):
     Parser for discard effects: "target player discards a card"
     """
     priority = 50  # Medium-high priority
+    cues = ("discard",)
     
     def can_parse(self, text: str, ctx: Optional[ParseContext] = None) -> bool:
         """Check if text contains discard pattern."""
@@ -1,12 +1,13 @@
 # axis2/parsing/effects/dispatcher.py
 
+import copy
 from typing import List
-from .base import ParseResult
 from .registry import get_registry
 from .utils import split_effect_sentences
 from axis2.schema import Effect, ParseContext, AddManaEffect
 from axis2.parsing.conditional_effects import parse_conditional
 from axis2.parsing.spell_continuous_effects import parse_spell_continuous_effect
+from axis2.parsing import trace
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,6 +21,7 @@ def parse_effect_text(text: str, ctx: ParseContext) -> List[Effect]:
     If recursion is needed (e.g., parsing remainder after partial match),
     it belongs inside a specific parser with bounded depth.
     """
+    active = trace.current()
     if not text:
         return []
     
@@ -40,27 +42,25 @@ def parse_effect_text(text: str, ctx: ParseContext) -> List[Effect]:
     # Get registry once
     registry = get_registry()
     
-    # Check for conditional mana replacement before splitting
-    # This handles patterns like "Add {C}. If condition, add {C}{C} instead"
-    conditional_mana_result = registry.parse(text, ctx)
-    if conditional_mana_result.is_success:
-        effects = conditional_mana_result.all_effects
-        if effects:
-            effect = effects[0]
-            # Check if it's a conditional mana effect with both base and replacement
-            if isinstance(effect, AddManaEffect) and effect.condition and effect.replacement_mana and effect.mana:
-                return [effect]  # Return the combined effect
+    # Full-text pass for effects that span sentences, only when a parser
+    # that declares spans_sentences might match:
+    # - conditional mana: "Add {C}. If condition, add {C}{C} instead"
+    # - look-and-pick: "Look at the top N cards... Put the rest..."
+    text = text.strip()
+    full = registry.parse(text, ctx) if registry.spanning_candidates(text, ctx) else None
+    
+    if full is not None and full.is_success:
+        effect = full.all_effects[0]
+        # Check if it's a conditional mana effect with both base and replacement
+        if isinstance(effect, AddManaEffect) and effect.condition and effect.replacement_mana and effect.mana:
+            return [effect]  # Return the combined effect
     
     # Split into sentences
     sentences = split_effect_sentences(text)
     
-    # Special-case global effects that span sentences.
-    # TODO: This should eventually become a parser-level concern.
-    # For now, we handle look-and-pick effects that need the full text
-    # before sentence splitting. This is technical debt, not architecture.
-    look_pick_result = registry.parse(text, ctx)
-    if look_pick_result.is_success and "look at" in text.lower():
-        effects = look_pick_result.all_effects
+    if full is not None and full.is_success and "look at" in text.lower():
+        # Copied: the same sentence's result may be appended again below
+        effects = copy.deepcopy(full.all_effects)
     else:
         effects = []
     
@@ -77,6 +77,8 @@ def parse_effect_text(text: str, ctx: ParseContext) -> List[Effect]:
         cond = parse_conditional(s, ctx)
         if cond:
             effects.append(cond)
+            if active:
+                active.record("dispatcher", "conditional", s)
             continue
         
         # Try spell continuous effects (special case with context flag)
@@ -84,22 +86,22 @@ def parse_effect_text(text: str, ctx: ParseContext) -> List[Effect]:
             spell_continuous = parse_spell_continuous_effect(s, ctx)
             if spell_continuous:
                 effects.append(spell_continuous)
+                if active:
+                    active.record("dispatcher", "spell_continuous", s)
                 continue
         
-        # Use registry to find matching parser
-        print(f"[DEBUG Dispatcher] Parsing sentence: '{s}'")
-        candidates = registry._find_candidates(s, ctx)
-        print(f"[DEBUG Dispatcher] Found {len(candidates)} candidate parsers: {[type(p).__name__ for p in candidates[:5]]}")
-        result = registry.parse(s, ctx)
-        print(f"[DEBUG Dispatcher] Parse result: matched={result.matched}, is_success={result.is_success}, errors={result.errors}, effects={result.all_effects}")
+        # Use registry to find matching parser. Only the full-text result is
+        # reused (for a sentence that is the whole text): parser effects are
+        # mutable, so repeated sentences each get their own
+        result = full if full is not None and s == text else registry.parse(s, ctx)
         if result.is_success:
-            print(f"[DEBUG Dispatcher] Successfully parsed '{s}' -> {len(result.all_effects)} effects")
             effects.extend(result.all_effects)
-        else:
-            print(f"[DEBUG Dispatcher] Failed to parse: {s[:50]}... matched={result.matched}, errors={result.errors}")
-            if result.errors:
-                print(f"[DEBUG Dispatcher] Errors: {result.errors}")
-            print(f"[DEBUG Dispatcher] Tried parsers: {[type(p).__name__ for p in candidates[:3]]}")
+        if active:
+            active.record(
+                "dispatcher", "match" if result.is_success else "no_match", s,
+                effects=[type(e).__name__ for e in result.all_effects],
+                errors=result.errors,
+            )
     
     return effects
 
@@ -6,6 +6,7 @@ from axis2.schema import DrawCardsEffect, ParseContext
 class DrawParser(EffectParser):
     """Parses draw effects: 'draw N cards'"""
     priority = 30  # Generic effect
+    cues = ("draw",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
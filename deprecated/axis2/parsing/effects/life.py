@@ -12,6 +12,7 @@ GAIN_LIFE_EQUAL_RE = re.compile(
 class LifeParser(EffectParser):
     """Parses life gain effects"""
     priority = 50  # Common effect
+    cues = ("life",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
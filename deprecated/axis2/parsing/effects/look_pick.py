@@ -63,6 +63,8 @@ PUT_REST_TOP_RE = re.compile(
 class LookAndPickParser(EffectParser):
     """Parses look-and-pick effects: 'look at top N, reveal up to X, put rest...'"""
     priority = 90  # High priority (specific pattern)
+    spans_sentences = True  # "Look at the top N... Put the rest..."
+    cues = ("look at",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
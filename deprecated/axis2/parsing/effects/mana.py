@@ -26,6 +26,7 @@ ADD_MANA_COMBO_RE = re.compile(
 class ManaParser(EffectParser):
     """Parses mana effects: 'Add {R}', 'Add one mana of any color', etc."""
     priority = 30  # Generic effect
+    cues = ("add",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -50,6 +50,7 @@ SHUFFLE_RE = re.compile(r"shuffle", re.IGNORECASE)
 class ScryParser(EffectParser):
     """Parses scry effects"""
     priority = 30
+    cues = ("scry",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         return "scry" in text.lower()
@@ -67,6 +68,7 @@ class ScryParser(EffectParser):
 class SurveilParser(EffectParser):
     """Parses surveil effects"""
     priority = 30
+    cues = ("surveil",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         return "surveil" in text.lower()
@@ -84,6 +86,7 @@ class SurveilParser(EffectParser):
 class RevealThoseParser(EffectParser):
     """Parses 'reveal those cards' effects"""
     priority = 30
+    cues = ("reveal those",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         return "reveal those" in text.lower()
@@ -100,6 +103,7 @@ class RevealThoseParser(EffectParser):
 class CounterSpellParser(EffectParser):
     """Parses counter spell effects"""
     priority = 50
+    cues = ("counter",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         return "counter" in text.lower() and "spell" in text.lower()
@@ -116,6 +120,7 @@ class CounterSpellParser(EffectParser):
 class ReturnCardParser(EffectParser):
     """Parses return card from graveyard effects"""
     priority = 40
+    cues = ("graveyard",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         return "return" in text.lower() and "graveyard" in text.lower()
@@ -150,6 +155,7 @@ class ReturnCardParser(EffectParser):
 class SpellbookParser(EffectParser):
     """Parses spellbook draft effects"""
     priority = 30
+    cues = ("spellbook",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         return "spellbook" in text.lower() and "draft" in text.lower()
@@ -171,6 +177,7 @@ class PTBoostParser(EffectParser):
     - 'target creature an opponent controls gets -X/-X until end of turn, where X is...'
     """
     priority = 50
+    cues = ("/",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         text_lower = text.lower()
@@ -265,6 +272,7 @@ class PTBoostParser(EffectParser):
 class ShuffleParser(EffectParser):
     """Parses shuffle effects"""
     priority = 20  # Low priority, very generic
+    cues = ("shuffle",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         return "shuffle" in text.lower()
@@ -281,6 +289,7 @@ class ShuffleParser(EffectParser):
 class EquipParser(EffectParser):
     """Parses Equip keyword ability"""
     priority = 30
+    cues = ("equip",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         return text.strip().lower().startswith("equip")
@@ -18,6 +18,7 @@ PROT_CHOICE_RE = re.compile(
 class ProtectionParser(EffectParser):
     """Parses protection and blocking effects"""
     priority = 30  # Generic effect
+    cues = ("protection", "can't be blocked", "cannot be blocked")
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
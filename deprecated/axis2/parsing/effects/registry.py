@@ -4,6 +4,7 @@ from typing import List
 from .base import EffectParser, ParseResult
 from axis2.schema import ParseContext
 from axis2.parsing.base_registry import BaseParserRegistry
+from axis2.parsing import trace
 
 class ParserRegistry(BaseParserRegistry):
     """Manages all effect parsers with priority ordering"""
@@ -18,6 +19,7 @@ class ParserRegistry(BaseParserRegistry):
         - Partial consumption (parser consumes part, remainder parsed separately)
         - Better diagnostics (track all attempts, not just first success)
         """
+        active = trace.current()
         text = text.strip()
         if not text:
             return ParseResult()
@@ -29,22 +31,21 @@ class ParserRegistry(BaseParserRegistry):
         best = self._try_parsers(candidates, lambda p: p.parse(text, ctx))
         
         if best:
-            print(f"[DEBUG Registry] Parser matched, got {len(best.all_effects)} effects")
             # Validate the parsed effect(s) before returning
             from axis2.validation import validate_effect
             validation_errors = []
             for effect in best.all_effects:
-                errors = validate_effect(effect)
-                validation_errors.extend(errors)
-                if errors:
-                    print(f"[DEBUG Registry] Validation errors for effect {type(effect).__name__}: {errors}")
+                validation_errors.extend(validate_effect(effect))
             if validation_errors:
-                print(f"[DEBUG Registry] Validation failed, marking as not matched. Errors: {validation_errors}")
                 best.errors.extend(validation_errors)
                 # Don't mark as success if validation fails
                 best.matched = False
-            else:
-                print(f"[DEBUG Registry] Validation passed, returning {len(best.all_effects)} effects. matched={best.matched}, is_success={best.is_success}")
+            if active:
+                active.record(
+                    "registry", "invalid" if validation_errors else "match", text,
+                    effects=[type(e).__name__ for e in best.all_effects],
+                    errors=validation_errors,
+                )
             return best
         
         # No parser matched - include parser names in error for better diagnostics
@@ -58,6 +59,14 @@ class ParserRegistry(BaseParserRegistry):
             errors=[error_msg]
         )
     
+    def spanning_candidates(self, text: str, ctx: ParseContext) -> List[EffectParser]:
+        """Multi-sentence parsers that might match the whole of `text`."""
+        text = text.strip()
+        return [
+            p for p in self._cued_parsers(text)
+            if getattr(p, "spans_sentences", False) and p.can_parse(text, ctx)
+        ]
+    
     def parse_all(self, texts: List[str], ctx: ParseContext) -> List[ParseResult]:
         """Parse multiple texts"""
         return [self.parse(text, ctx) for text in texts]
@@ -31,6 +31,7 @@ AURA_SEARCH_RE = re.compile(
 class SearchParser(EffectParser):
     """Parses search effects"""
     priority = 80  # High priority (search is specific)
+    cues = ("search",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -133,22 +134,17 @@ class SearchParser(EffectParser):
 class LightpawsSearchParser(EffectParser):
     """Parses Lightpaws-specific aura search effect"""
     priority = 100  # Very specific pattern
+    cues = ("mana value",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
         t = text.lower()
-        result = "search" in t and "aura" in t and "mana value" in t
-        if result:
-            print(f"[DEBUG LightpawsSearchParser] can_parse=True for: {text[:80]}...")
-        return result
+        return "search" in t and "aura" in t and "mana value" in t
     
     def parse(self, text: str, ctx: ParseContext) -> ParseResult:
-        print(f"[DEBUG LightpawsSearchParser] parse called with: {text[:100]}...")
         m = AURA_SEARCH_RE.search(text)
         if not m:
-            print(f"[DEBUG LightpawsSearchParser] Regex did not match")
             return ParseResult(matched=False)
-        print(f"[DEBUG LightpawsSearchParser] Regex matched!")
         
         t = text.lower()
         
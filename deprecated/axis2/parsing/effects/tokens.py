@@ -33,6 +33,7 @@ def parse_amount(word: str):
 class TokenParser(EffectParser):
     """Parses token creation effects"""
     priority = 60  # Common effect
+    cues = ("token",)
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
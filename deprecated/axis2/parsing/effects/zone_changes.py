@@ -7,6 +7,7 @@ from axis2.schema import (
     Subject, SymbolicValue, ParseContext
 )
 from axis2.parsing.subject import subject_from_text
+from axis2.parsing import trace
 
 # Zone change patterns
 RETURN_FROM_GRAVEYARD_TO_HAND_RE = re.compile(
@@ -132,6 +133,7 @@ def _extract_restrictions(subject_text: str):
 class ZoneChangeParser(EffectParser):
     """Parses zone change effects: return, exile, put onto battlefield, etc."""
     priority = 40  # Generic effect
+    cues = ("return", "exile", "put", "destroy", "transform", "attach")
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -143,6 +145,7 @@ class ZoneChangeParser(EffectParser):
     def parse(self, text: str, ctx: ParseContext) -> ParseResult:
         # Do not parse "put it onto the battlefield" generically
         # when the sentence contains a search effect.
+        active = trace.current()
         if "put it onto the battlefield" in text.lower():
             return ParseResult(matched=False)
 
@@ -243,12 +246,11 @@ class ZoneChangeParser(EffectParser):
         # Check this BEFORE the generic return pattern to ensure it matches first
         # Match variations: "return the exiled card", "return the exiled card to the battlefield", etc.
         if "exiled card" in t.lower() and "return" in t.lower():
-            print(f"[DEBUG ZoneChange] Checking 'return exiled card' pattern for text: '{t}'")
             # Try the specific pattern first
             m = RETURN_EXILED_CARD_RE.search(t)
-            print(f"[DEBUG ZoneChange] Pattern search result: {m}")
+            if active:
+                active.record("zone_change", "return_exiled_card", t, matched=m is not None)
             if m:
-                print(f"[DEBUG ZoneChange] Pattern matched! Creating linked_exiled_card effect")
                 return ParseResult(
                     matched=True,
                     effect=ChangeZoneEffect(
@@ -260,9 +262,6 @@ class ZoneChangeParser(EffectParser):
                     ),
                     consumed_text=text
                 )
-            else:
-                print(f"[DEBUG ZoneChange] Pattern did NOT match text: '{t}'")
-                print(f"[DEBUG ZoneChange] Pattern regex: {RETURN_EXILED_CARD_RE.pattern}")
 
         # 3b. Return → battlefield (generic)
         m = RETURN_BATTLEFIELD_RE.search(t)
@@ -27,7 +27,7 @@ class AbsorbParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Absorb reminder text into ContinuousEffect"""
-        logger.debug(f"[AbsorbParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[AbsorbParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "source would deal damage" not in lower or "prevent" not in lower:
@@ -35,7 +35,7 @@ class AbsorbParser:
         
         m = ABSORB_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[AbsorbParser] No absorb value found in reminder text")
+            logger.debug("[AbsorbParser] No absorb value found in reminder text")
             return []
         
         absorb_value = int(m.group(1))
@@ -49,17 +49,17 @@ class AbsorbParser:
             source_kind="static_ability"
         )
         
-        logger.debug(f"[AbsorbParser] Created ContinuousEffect for Absorb {absorb_value}")
+        logger.debug("[AbsorbParser] Created ContinuousEffect for Absorb %s", absorb_value)
         
         return [continuous_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Absorb keyword without reminder text (e.g., 'Absorb 1')"""
-        logger.debug(f"[AbsorbParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[AbsorbParser] Parsing keyword only: %s", keyword_text)
         
         m = ABSORB_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[AbsorbParser] No absorb value found in keyword text")
+            logger.debug("[AbsorbParser] No absorb value found in keyword text")
             return []
         
         absorb_value = int(m.group(1))
@@ -73,7 +73,7 @@ class AbsorbParser:
             source_kind="static_ability"
         )
         
-        logger.debug(f"[AbsorbParser] Created ContinuousEffect for Absorb {absorb_value}")
+        logger.debug("[AbsorbParser] Created ContinuousEffect for Absorb %s", absorb_value)
         
         return [continuous_effect]
 
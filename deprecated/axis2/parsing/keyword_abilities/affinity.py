@@ -27,7 +27,7 @@ class AffinityParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Affinity reminder text"""
-        logger.debug(f"[AffinityParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[AffinityParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "costs" not in lower or "less to cast" not in lower:
@@ -39,22 +39,22 @@ class AffinityParser:
         
         affinity_type = m.group(1).strip()
         
-        logger.debug(f"[AffinityParser] Detected Affinity for: {affinity_type}")
+        logger.debug("[AffinityParser] Detected Affinity for: %s", affinity_type)
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Affinity keyword without reminder text (e.g., 'Affinity for artifacts')"""
-        logger.debug(f"[AffinityParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[AffinityParser] Parsing keyword only: %s", keyword_text)
         
         m = AFFINITY_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[AffinityParser] No affinity type found in keyword text")
+            logger.debug("[AffinityParser] No affinity type found in keyword text")
             return []
         
         affinity_type = m.group(1).strip()
         
-        logger.debug(f"[AffinityParser] Detected Affinity for: {affinity_type}")
+        logger.debug("[AffinityParser] Detected Affinity for: %s", affinity_type)
         
         return []
 
@@ -27,7 +27,7 @@ class AfflictParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Afflict reminder text into TriggeredAbility"""
-        logger.debug(f"[AfflictParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[AfflictParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "becomes blocked" not in lower or "defending player loses" not in lower:
@@ -35,7 +35,7 @@ class AfflictParser:
         
         m = AFFLICT_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[AfflictParser] No afflict value found in reminder text")
+            logger.debug("[AfflictParser] No afflict value found in reminder text")
             return []
         
         afflict_value = int(m.group(1))
@@ -53,17 +53,17 @@ class AfflictParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[AfflictParser] Created TriggeredAbility for Afflict {afflict_value}")
+        logger.debug("[AfflictParser] Created TriggeredAbility for Afflict %s", afflict_value)
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Afflict keyword without reminder text (e.g., 'Afflict 1')"""
-        logger.debug(f"[AfflictParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[AfflictParser] Parsing keyword only: %s", keyword_text)
         
         m = AFFLICT_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[AfflictParser] No afflict value found in keyword text")
+            logger.debug("[AfflictParser] No afflict value found in keyword text")
             return []
         
         afflict_value = int(m.group(1))
@@ -81,7 +81,7 @@ class AfflictParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[AfflictParser] Created TriggeredAbility for Afflict {afflict_value}")
+        logger.debug("[AfflictParser] Created TriggeredAbility for Afflict %s", afflict_value)
         
         return [triggered_ability]
 
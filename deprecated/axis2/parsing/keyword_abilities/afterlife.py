@@ -27,7 +27,7 @@ class AfterlifeParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Afterlife reminder text into TriggeredAbility"""
-        logger.debug(f"[AfterlifeParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[AfterlifeParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "dies" not in lower or "spirit" not in lower or "token" not in lower:
@@ -35,7 +35,7 @@ class AfterlifeParser:
         
         m = AFTERLIFE_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[AfterlifeParser] No afterlife value found in reminder text")
+            logger.debug("[AfterlifeParser] No afterlife value found in reminder text")
             return []
         
         afterlife_value = int(m.group(1))
@@ -62,17 +62,17 @@ class AfterlifeParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[AfterlifeParser] Created TriggeredAbility for Afterlife {afterlife_value}")
+        logger.debug("[AfterlifeParser] Created TriggeredAbility for Afterlife %s", afterlife_value)
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Afterlife keyword without reminder text (e.g., 'Afterlife 1')"""
-        logger.debug(f"[AfterlifeParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[AfterlifeParser] Parsing keyword only: %s", keyword_text)
         
         m = AFTERLIFE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[AfterlifeParser] No afterlife value found in keyword text")
+            logger.debug("[AfterlifeParser] No afterlife value found in keyword text")
             return []
         
         afterlife_value = int(m.group(1))
@@ -99,7 +99,7 @@ class AfterlifeParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[AfterlifeParser] Created TriggeredAbility for Afterlife {afterlife_value}")
+        logger.debug("[AfterlifeParser] Created TriggeredAbility for Afterlife %s", afterlife_value)
         
         return [triggered_ability]
 
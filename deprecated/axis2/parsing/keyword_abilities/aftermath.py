@@ -21,21 +21,21 @@ class AftermathParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Aftermath reminder text"""
-        logger.debug(f"[AftermathParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[AftermathParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "graveyard" not in lower:
             return []
         
-        logger.debug(f"[AftermathParser] Detected Aftermath")
+        logger.debug("[AftermathParser] Detected Aftermath")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Aftermath keyword without reminder text"""
-        logger.debug(f"[AftermathParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[AftermathParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[AftermathParser] Detected Aftermath")
+        logger.debug("[AftermathParser] Detected Aftermath")
         
         return []
 
@@ -27,7 +27,7 @@ class AmplifyParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Amplify reminder text into ReplacementEffect"""
-        logger.debug(f"[AmplifyParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[AmplifyParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "reveal" not in lower or "enters" not in lower or "+1/+1 counter" not in lower:
@@ -35,7 +35,7 @@ class AmplifyParser:
         
         m = AMPLIFY_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[AmplifyParser] No amplify value found in reminder text")
+            logger.debug("[AmplifyParser] No amplify value found in reminder text")
             return []
         
         amplify_value = int(m.group(1))
@@ -52,17 +52,17 @@ class AmplifyParser:
             zones=["battlefield"]
         )
         
-        logger.debug(f"[AmplifyParser] Created ReplacementEffect for Amplify {amplify_value}")
+        logger.debug("[AmplifyParser] Created ReplacementEffect for Amplify %s", amplify_value)
         
         return [replacement_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Amplify keyword without reminder text (e.g., 'Amplify 1')"""
-        logger.debug(f"[AmplifyParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[AmplifyParser] Parsing keyword only: %s", keyword_text)
         
         m = AMPLIFY_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[AmplifyParser] No amplify value found in keyword text")
+            logger.debug("[AmplifyParser] No amplify value found in keyword text")
             return []
         
         amplify_value = int(m.group(1))
@@ -79,7 +79,7 @@ class AmplifyParser:
             zones=["battlefield"]
         )
         
-        logger.debug(f"[AmplifyParser] Created ReplacementEffect for Amplify {amplify_value}")
+        logger.debug("[AmplifyParser] Created ReplacementEffect for Amplify %s", amplify_value)
         
         return [replacement_effect]
 
@@ -27,7 +27,7 @@ class AnnihilatorParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Annihilator reminder text into TriggeredAbility"""
-        logger.debug(f"[AnnihilatorParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[AnnihilatorParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "attacks" not in lower or "defending player sacrifices" not in lower:
@@ -35,7 +35,7 @@ class AnnihilatorParser:
         
         m = ANNIHILATOR_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[AnnihilatorParser] No annihilator value found in reminder text")
+            logger.debug("[AnnihilatorParser] No annihilator value found in reminder text")
             return []
         
         annihilator_value = int(m.group(1))
@@ -55,17 +55,17 @@ class AnnihilatorParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[AnnihilatorParser] Created TriggeredAbility for Annihilator {annihilator_value}")
+        logger.debug("[AnnihilatorParser] Created TriggeredAbility for Annihilator %s", annihilator_value)
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Annihilator keyword without reminder text (e.g., 'Annihilator 2')"""
-        logger.debug(f"[AnnihilatorParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[AnnihilatorParser] Parsing keyword only: %s", keyword_text)
         
         m = ANNIHILATOR_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[AnnihilatorParser] No annihilator value found in keyword text")
+            logger.debug("[AnnihilatorParser] No annihilator value found in keyword text")
             return []
         
         annihilator_value = int(m.group(1))
@@ -85,7 +85,7 @@ class AnnihilatorParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[AnnihilatorParser] Created TriggeredAbility for Annihilator {annihilator_value}")
+        logger.debug("[AnnihilatorParser] Created TriggeredAbility for Annihilator %s", annihilator_value)
         
         return [triggered_ability]
 
@@ -21,7 +21,7 @@ class AscendParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Ascend reminder text into StaticEffect"""
-        logger.debug(f"[AscendParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[AscendParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "control ten or more permanents" not in lower or "city's blessing" not in lower:
@@ -35,13 +35,13 @@ class AscendParser:
             zones=["battlefield"]
         )
         
-        logger.debug(f"[AscendParser] Created StaticEffect for Ascend")
+        logger.debug("[AscendParser] Created StaticEffect for Ascend")
         
         return [static_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Ascend keyword without reminder text"""
-        logger.debug(f"[AscendParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[AscendParser] Parsing keyword only: %s", keyword_text)
         
         static_effect = StaticEffect(
             kind="grant_designation",
@@ -51,7 +51,7 @@ class AscendParser:
             zones=["battlefield"]
         )
         
-        logger.debug(f"[AscendParser] Created StaticEffect for Ascend")
+        logger.debug("[AscendParser] Created StaticEffect for Ascend")
         
         return [static_effect]
 
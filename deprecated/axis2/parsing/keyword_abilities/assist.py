@@ -21,21 +21,21 @@ class AssistParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Assist reminder text"""
-        logger.debug(f"[AssistParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[AssistParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "another player" not in lower or "pay" not in lower:
             return []
         
-        logger.debug(f"[AssistParser] Detected Assist")
+        logger.debug("[AssistParser] Detected Assist")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Assist keyword without reminder text"""
-        logger.debug(f"[AssistParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[AssistParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[AssistParser] Detected Assist")
+        logger.debug("[AssistParser] Detected Assist")
         
         return []
 
@@ -28,7 +28,7 @@ class AuraSwapParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Aura Swap reminder text into ActivatedAbility"""
-        logger.debug(f"[AuraSwapParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[AuraSwapParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "exchange" not in lower or "aura" not in lower:
@@ -75,17 +75,17 @@ class AuraSwapParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[AuraSwapParser] Created ActivatedAbility for Aura Swap")
+        logger.debug("[AuraSwapParser] Created ActivatedAbility for Aura Swap")
         
         return [activated_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Aura Swap keyword without reminder text (e.g., 'Aura swap {2}{U}')"""
-        logger.debug(f"[AuraSwapParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[AuraSwapParser] Parsing keyword only: %s", keyword_text)
         
         m = AURA_SWAP_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[AuraSwapParser] No cost found in keyword text")
+            logger.debug("[AuraSwapParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -125,7 +125,7 @@ class AuraSwapParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[AuraSwapParser] Created ActivatedAbility for Aura Swap {cost_text}")
+        logger.debug("[AuraSwapParser] Created ActivatedAbility for Aura Swap %s", cost_text)
         
         return [activated_ability]
 
@@ -27,7 +27,7 @@ class AwakenParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Awaken reminder text"""
-        logger.debug(f"[AwakenParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[AwakenParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this card" not in lower or "awaken cost" not in lower:
@@ -37,23 +37,23 @@ class AwakenParser:
         if m:
             awaken_value = m.group(1)
             cost_text = m.group(2).strip()
-            logger.debug(f"[AwakenParser] Detected Awaken {awaken_value} with cost: {cost_text}")
+            logger.debug("[AwakenParser] Detected Awaken %s with cost: %s", awaken_value, cost_text)
         
-        logger.debug(f"[AwakenParser] Detected Awaken")
+        logger.debug("[AwakenParser] Detected Awaken")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Awaken keyword without reminder text (e.g., 'Awaken 3—{5}{W}')"""
-        logger.debug(f"[AwakenParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[AwakenParser] Parsing keyword only: %s", keyword_text)
         
         m = AWAKEN_RE.search(keyword_text)
         if m:
             awaken_value = m.group(1)
             cost_text = m.group(2).strip()
-            logger.debug(f"[AwakenParser] Detected Awaken {awaken_value} with cost: {cost_text}")
+            logger.debug("[AwakenParser] Detected Awaken %s with cost: %s", awaken_value, cost_text)
         
-        logger.debug(f"[AwakenParser] Detected Awaken")
+        logger.debug("[AwakenParser] Detected Awaken")
         
         return []
 
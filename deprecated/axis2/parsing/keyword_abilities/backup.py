@@ -27,7 +27,7 @@ class BackupParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Backup reminder text into TriggeredAbility"""
-        logger.debug(f"[BackupParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[BackupParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "enters" not in lower or "+1/+1 counter" not in lower or "target creature" not in lower:
@@ -35,7 +35,7 @@ class BackupParser:
         
         m = BACKUP_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[BackupParser] No backup value found in reminder text")
+            logger.debug("[BackupParser] No backup value found in reminder text")
             return []
         
         backup_value = int(m.group(1))
@@ -71,17 +71,17 @@ class BackupParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[BackupParser] Created TriggeredAbility for Backup {backup_value}")
+        logger.debug("[BackupParser] Created TriggeredAbility for Backup %s", backup_value)
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Backup keyword without reminder text (e.g., 'Backup 1')"""
-        logger.debug(f"[BackupParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[BackupParser] Parsing keyword only: %s", keyword_text)
         
         m = BACKUP_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[BackupParser] No backup value found in keyword text")
+            logger.debug("[BackupParser] No backup value found in keyword text")
             return []
         
         backup_value = int(m.group(1))
@@ -117,7 +117,7 @@ class BackupParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[BackupParser] Created TriggeredAbility for Backup {backup_value}")
+        logger.debug("[BackupParser] Created TriggeredAbility for Backup %s", backup_value)
         
         return [triggered_ability]
 
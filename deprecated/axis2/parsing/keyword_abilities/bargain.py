@@ -21,21 +21,21 @@ class BargainParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Bargain reminder text"""
-        logger.debug(f"[BargainParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[BargainParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "sacrifice" not in lower or "cast this spell" not in lower:
             return []
         
-        logger.debug(f"[BargainParser] Detected Bargain (spell modifier, handled by Axis3)")
+        logger.debug("[BargainParser] Detected Bargain (spell modifier, handled by Axis3)")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Bargain keyword without reminder text"""
-        logger.debug(f"[BargainParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[BargainParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[BargainParser] Detected Bargain (spell modifier, handled by Axis3)")
+        logger.debug("[BargainParser] Detected Bargain (spell modifier, handled by Axis3)")
         
         return []
 
@@ -21,7 +21,7 @@ class BattleCryParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Battle Cry reminder text into TriggeredAbility"""
-        logger.debug(f"[BattleCryParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[BattleCryParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "attacks" not in lower or "each other attacking creature gets +1/+0" not in lower:
@@ -46,13 +46,13 @@ class BattleCryParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[BattleCryParser] Created TriggeredAbility for Battle Cry")
+        logger.debug("[BattleCryParser] Created TriggeredAbility for Battle Cry")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Battle Cry keyword without reminder text"""
-        logger.debug(f"[BattleCryParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[BattleCryParser] Parsing keyword only: %s", keyword_text)
         
         pt_effect = ContinuousEffect(
             kind="pt_mod",
@@ -73,7 +73,7 @@ class BattleCryParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[BattleCryParser] Created TriggeredAbility for Battle Cry")
+        logger.debug("[BattleCryParser] Created TriggeredAbility for Battle Cry")
         
         return [triggered_ability]
 
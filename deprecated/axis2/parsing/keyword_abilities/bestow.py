@@ -27,7 +27,7 @@ class BestowParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Bestow reminder text"""
-        logger.debug(f"[BestowParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[BestowParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this card" not in lower or "bestow cost" not in lower:
@@ -36,22 +36,22 @@ class BestowParser:
         m = BESTOW_RE.search(reminder_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[BestowParser] Detected Bestow cost: {cost_text}")
+            logger.debug("[BestowParser] Detected Bestow cost: %s", cost_text)
         
-        logger.debug(f"[BestowParser] Detected Bestow")
+        logger.debug("[BestowParser] Detected Bestow")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Bestow keyword without reminder text (e.g., 'Bestow {5}{U}')"""
-        logger.debug(f"[BestowParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[BestowParser] Parsing keyword only: %s", keyword_text)
         
         m = BESTOW_RE.search(keyword_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[BestowParser] Detected Bestow cost: {cost_text}")
+            logger.debug("[BestowParser] Detected Bestow cost: %s", cost_text)
         
-        logger.debug(f"[BestowParser] Detected Bestow")
+        logger.debug("[BestowParser] Detected Bestow")
         
         return []
 
@@ -27,7 +27,7 @@ class BlitzParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Blitz reminder text"""
-        logger.debug(f"[BlitzParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[BlitzParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "blitz cost" not in lower:
@@ -36,7 +36,7 @@ class BlitzParser:
         m = BLITZ_RE.search(reminder_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[BlitzParser] Detected Blitz cost: {cost_text}")
+            logger.debug("[BlitzParser] Detected Blitz cost: %s", cost_text)
         
         haste_effect = ContinuousEffect(
             kind="grant_ability",
@@ -73,18 +73,18 @@ class BlitzParser:
             condition="blitz_cost_was_paid"
         )
         
-        logger.debug(f"[BlitzParser] Created ContinuousEffect and TriggeredAbilities for Blitz")
+        logger.debug("[BlitzParser] Created ContinuousEffect and TriggeredAbilities for Blitz")
         
         return [haste_effect, draw_trigger, end_step_trigger]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Blitz keyword without reminder text (e.g., 'Blitz {1}{R}')"""
-        logger.debug(f"[BlitzParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[BlitzParser] Parsing keyword only: %s", keyword_text)
         
         m = BLITZ_RE.search(keyword_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[BlitzParser] Detected Blitz cost: {cost_text}")
+            logger.debug("[BlitzParser] Detected Blitz cost: %s", cost_text)
         
         haste_effect = ContinuousEffect(
             kind="grant_ability",
@@ -121,7 +121,7 @@ class BlitzParser:
             condition="blitz_cost_was_paid"
         )
         
-        logger.debug(f"[BlitzParser] Created ContinuousEffect and TriggeredAbilities for Blitz")
+        logger.debug("[BlitzParser] Created ContinuousEffect and TriggeredAbilities for Blitz")
         
         return [haste_effect, draw_trigger, end_step_trigger]
 
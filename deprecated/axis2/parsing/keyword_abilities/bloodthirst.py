@@ -27,7 +27,7 @@ class BloodthirstParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Bloodthirst reminder text into ReplacementEffect"""
-        logger.debug(f"[BloodthirstParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[BloodthirstParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "opponent was dealt damage" not in lower or "enters the battlefield" not in lower:
@@ -35,7 +35,7 @@ class BloodthirstParser:
         
         m = BLOODTHIRST_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[BloodthirstParser] No bloodthirst value found in reminder text")
+            logger.debug("[BloodthirstParser] No bloodthirst value found in reminder text")
             return []
         
         bloodthirst_value = m.group(1)
@@ -59,17 +59,17 @@ class BloodthirstParser:
                 condition="opponent_was_dealt_damage_this_turn"
             )
         
-        logger.debug(f"[BloodthirstParser] Created ReplacementEffect for Bloodthirst {bloodthirst_value}")
+        logger.debug("[BloodthirstParser] Created ReplacementEffect for Bloodthirst %s", bloodthirst_value)
         
         return [replacement_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Bloodthirst keyword without reminder text (e.g., 'Bloodthirst 1')"""
-        logger.debug(f"[BloodthirstParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[BloodthirstParser] Parsing keyword only: %s", keyword_text)
         
         m = BLOODTHIRST_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[BloodthirstParser] No bloodthirst value found in keyword text")
+            logger.debug("[BloodthirstParser] No bloodthirst value found in keyword text")
             return []
         
         bloodthirst_value = m.group(1)
@@ -93,7 +93,7 @@ class BloodthirstParser:
                 condition="opponent_was_dealt_damage_this_turn"
             )
         
-        logger.debug(f"[BloodthirstParser] Created ReplacementEffect for Bloodthirst {bloodthirst_value}")
+        logger.debug("[BloodthirstParser] Created ReplacementEffect for Bloodthirst %s", bloodthirst_value)
         
         return [replacement_effect]
 
@@ -28,27 +28,27 @@ class BoastParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Boast reminder text"""
-        logger.debug(f"[BoastParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[BoastParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "activate this ability" not in lower or "attacked this turn" not in lower:
             return []
         
-        logger.debug(f"[BoastParser] Detected Boast")
+        logger.debug("[BoastParser] Detected Boast")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Boast keyword without reminder text (e.g., 'Boast — {1}: ...')"""
-        logger.debug(f"[BoastParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[BoastParser] Parsing keyword only: %s", keyword_text)
         
         m = BOAST_RE.search(keyword_text)
         if m:
             cost_text = m.group(1).strip()
             effect_text = m.group(2).strip()
-            logger.debug(f"[BoastParser] Detected Boast cost: {cost_text}, effect: {effect_text[:50]}")
+            logger.debug("[BoastParser] Detected Boast cost: %s, effect: %s", cost_text, effect_text[:50])
         
-        logger.debug(f"[BoastParser] Detected Boast")
+        logger.debug("[BoastParser] Detected Boast")
         
         return []
 
@@ -27,7 +27,7 @@ class BushidoParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Bushido reminder text into TriggeredAbility"""
-        logger.debug(f"[BushidoParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[BushidoParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if ("blocks" not in lower and "becomes blocked" not in lower) or "gets +" not in lower:
@@ -35,7 +35,7 @@ class BushidoParser:
         
         m = BUSHIDO_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[BushidoParser] No bushido value found in reminder text")
+            logger.debug("[BushidoParser] No bushido value found in reminder text")
             return []
         
         bushido_value = int(m.group(1))
@@ -64,17 +64,17 @@ class BushidoParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[BushidoParser] Created TriggeredAbility for Bushido {bushido_value}")
+        logger.debug("[BushidoParser] Created TriggeredAbility for Bushido %s", bushido_value)
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Bushido keyword without reminder text (e.g., 'Bushido 1')"""
-        logger.debug(f"[BushidoParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[BushidoParser] Parsing keyword only: %s", keyword_text)
         
         m = BUSHIDO_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[BushidoParser] No bushido value found in keyword text")
+            logger.debug("[BushidoParser] No bushido value found in keyword text")
             return []
         
         bushido_value = int(m.group(1))
@@ -103,7 +103,7 @@ class BushidoParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[BushidoParser] Created TriggeredAbility for Bushido {bushido_value}")
+        logger.debug("[BushidoParser] Created TriggeredAbility for Bushido %s", bushido_value)
         
         return [triggered_ability]
 
@@ -27,7 +27,7 @@ class BuybackParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Buyback reminder text"""
-        logger.debug(f"[BuybackParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[BuybackParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "pay an additional" not in lower or "put this spell" not in lower:
@@ -39,22 +39,22 @@ class BuybackParser:
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[BuybackParser] Detected Buyback with cost: {cost_text}")
+        logger.debug("[BuybackParser] Detected Buyback with cost: %s", cost_text)
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Buyback keyword without reminder text (e.g., 'Buyback {3}')"""
-        logger.debug(f"[BuybackParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[BuybackParser] Parsing keyword only: %s", keyword_text)
         
         m = BUYBACK_COST_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[BuybackParser] No cost found in keyword text")
+            logger.debug("[BuybackParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[BuybackParser] Detected Buyback with cost: {cost_text}")
+        logger.debug("[BuybackParser] Detected Buyback with cost: %s", cost_text)
         
         return []
 
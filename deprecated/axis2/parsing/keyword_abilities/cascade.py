@@ -21,7 +21,7 @@ class CascadeParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Cascade reminder text into TriggeredAbility"""
-        logger.debug(f"[CascadeParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[CascadeParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "exile cards" not in lower:
@@ -46,13 +46,13 @@ class CascadeParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[CascadeParser] Created TriggeredAbility for Cascade")
+        logger.debug("[CascadeParser] Created TriggeredAbility for Cascade")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Cascade keyword without reminder text"""
-        logger.debug(f"[CascadeParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[CascadeParser] Parsing keyword only: %s", keyword_text)
         
         look_and_pick_effect = LookAndPickEffect(
             look_at=999,  # Exile until we find a nonland card
@@ -73,7 +73,7 @@ class CascadeParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[CascadeParser] Created TriggeredAbility for Cascade")
+        logger.debug("[CascadeParser] Created TriggeredAbility for Cascade")
         
         return [triggered_ability]
 
@@ -27,7 +27,7 @@ class CasualtyParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Casualty reminder text"""
-        logger.debug(f"[CasualtyParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[CasualtyParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "sacrifice a creature" not in lower or "copy" not in lower:
@@ -35,7 +35,7 @@ class CasualtyParser:
         
         m = CASUALTY_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[CasualtyParser] No casualty value found in reminder text")
+            logger.debug("[CasualtyParser] No casualty value found in reminder text")
             return []
         
         casualty_value = int(m.group(1))
@@ -49,17 +49,17 @@ class CasualtyParser:
             condition=f"casualty_{casualty_value}_cost_was_paid"
         )
         
-        logger.debug(f"[CasualtyParser] Created TriggeredAbility for Casualty {casualty_value}")
+        logger.debug("[CasualtyParser] Created TriggeredAbility for Casualty %s", casualty_value)
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Casualty keyword without reminder text (e.g., 'Casualty 1')"""
-        logger.debug(f"[CasualtyParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[CasualtyParser] Parsing keyword only: %s", keyword_text)
         
         m = CASUALTY_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[CasualtyParser] No casualty value found in keyword text")
+            logger.debug("[CasualtyParser] No casualty value found in keyword text")
             return []
         
         casualty_value = int(m.group(1))
@@ -73,7 +73,7 @@ class CasualtyParser:
             condition=f"casualty_{casualty_value}_cost_was_paid"
         )
         
-        logger.debug(f"[CasualtyParser] Created TriggeredAbility for Casualty {casualty_value}")
+        logger.debug("[CasualtyParser] Created TriggeredAbility for Casualty %s", casualty_value)
         
         return [triggered_ability]
 
@@ -27,7 +27,7 @@ class ChampionParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Champion reminder text into two TriggeredAbilities"""
-        logger.debug(f"[ChampionParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ChampionParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "enters the battlefield" not in lower or "exile" not in lower:
@@ -81,17 +81,17 @@ class ChampionParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[ChampionParser] Created two TriggeredAbilities for Champion {champion_type}")
+        logger.debug("[ChampionParser] Created two TriggeredAbilities for Champion %s", champion_type)
         
         return [etb_trigger, leaves_trigger]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Champion keyword without reminder text (e.g., 'Champion a creature')"""
-        logger.debug(f"[ChampionParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ChampionParser] Parsing keyword only: %s", keyword_text)
         
         m = CHAMPION_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[ChampionParser] No champion type found in keyword text")
+            logger.debug("[ChampionParser] No champion type found in keyword text")
             return []
         
         champion_type = m.group(1).strip()
@@ -138,7 +138,7 @@ class ChampionParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[ChampionParser] Created two TriggeredAbilities for Champion {champion_type}")
+        logger.debug("[ChampionParser] Created two TriggeredAbilities for Champion %s", champion_type)
         
         return [etb_trigger, leaves_trigger]
 
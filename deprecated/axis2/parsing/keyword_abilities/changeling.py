@@ -21,21 +21,21 @@ class ChangelingParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Changeling reminder text"""
-        logger.debug(f"[ChangelingParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ChangelingParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "every creature type" not in lower and "all creature types" not in lower:
             return []
         
-        logger.debug(f"[ChangelingParser] Detected Changeling (characteristic-defining, no effects needed)")
+        logger.debug("[ChangelingParser] Detected Changeling (characteristic-defining, no effects needed)")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Changeling keyword without reminder text"""
-        logger.debug(f"[ChangelingParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ChangelingParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[ChangelingParser] Detected Changeling (characteristic-defining, no effects needed)")
+        logger.debug("[ChangelingParser] Detected Changeling (characteristic-defining, no effects needed)")
         
         return []
 
@@ -21,7 +21,7 @@ class CipherParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Cipher reminder text into ChangeZoneEffect and TriggeredAbility"""
-        logger.debug(f"[CipherParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[CipherParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "exile this spell" not in lower or "encoded" not in lower:
@@ -58,13 +58,13 @@ class CipherParser:
             source_kind="static_ability"
         )
         
-        logger.debug(f"[CipherParser] Created ChangeZoneEffect and ContinuousEffect for Cipher")
+        logger.debug("[CipherParser] Created ChangeZoneEffect and ContinuousEffect for Cipher")
         
         return [encode_effect, continuous_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Cipher keyword without reminder text"""
-        logger.debug(f"[CipherParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[CipherParser] Parsing keyword only: %s", keyword_text)
         
         encode_effect = ChangeZoneEffect(
             subject=Subject(scope="self"),
@@ -97,7 +97,7 @@ class CipherParser:
             source_kind="static_ability"
         )
         
-        logger.debug(f"[CipherParser] Created ChangeZoneEffect and ContinuousEffect for Cipher")
+        logger.debug("[CipherParser] Created ChangeZoneEffect and ContinuousEffect for Cipher")
         
         return [encode_effect, continuous_effect]
 
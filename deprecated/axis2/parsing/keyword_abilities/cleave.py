@@ -27,7 +27,7 @@ class CleaveParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Cleave reminder text"""
-        logger.debug(f"[CleaveParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[CleaveParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "cleave cost" not in lower:
@@ -36,22 +36,22 @@ class CleaveParser:
         m = CLEAVE_RE.search(reminder_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[CleaveParser] Detected Cleave cost: {cost_text}")
+            logger.debug("[CleaveParser] Detected Cleave cost: %s", cost_text)
         
-        logger.debug(f"[CleaveParser] Detected Cleave")
+        logger.debug("[CleaveParser] Detected Cleave")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Cleave keyword without reminder text (e.g., 'Cleave {1}{B}{B}{G}')"""
-        logger.debug(f"[CleaveParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[CleaveParser] Parsing keyword only: %s", keyword_text)
         
         m = CLEAVE_RE.search(keyword_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[CleaveParser] Detected Cleave cost: {cost_text}")
+            logger.debug("[CleaveParser] Detected Cleave cost: %s", cost_text)
         
-        logger.debug(f"[CleaveParser] Detected Cleave")
+        logger.debug("[CleaveParser] Detected Cleave")
         
         return []
 
@@ -21,21 +21,21 @@ class CompanionParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Companion reminder text"""
-        logger.debug(f"[CompanionParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[CompanionParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "companion" not in lower:
             return []
         
-        logger.debug(f"[CompanionParser] Detected Companion (deck construction only)")
+        logger.debug("[CompanionParser] Detected Companion (deck construction only)")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Companion keyword without reminder text (e.g., 'Companion — Your starting deck contains only cards with mana value 3 or greater and land cards.')"""
-        logger.debug(f"[CompanionParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[CompanionParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[CompanionParser] Detected Companion (deck construction only)")
+        logger.debug("[CompanionParser] Detected Companion (deck construction only)")
         
         return []
 
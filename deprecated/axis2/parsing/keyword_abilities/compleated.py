@@ -21,7 +21,7 @@ class CompleatedParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Compleated reminder text into ReplacementEffect"""
-        logger.debug(f"[CompleatedParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[CompleatedParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "enters" not in lower or "loyalty counter" not in lower:
@@ -38,13 +38,13 @@ class CompleatedParser:
             zones=["battlefield"]
         )
         
-        logger.debug(f"[CompleatedParser] Created ReplacementEffect for Compleated")
+        logger.debug("[CompleatedParser] Created ReplacementEffect for Compleated")
         
         return [replacement_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Compleated keyword without reminder text"""
-        logger.debug(f"[CompleatedParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[CompleatedParser] Parsing keyword only: %s", keyword_text)
         
         replacement_effect = ReplacementEffect(
             kind="enters_with_counters",
@@ -57,7 +57,7 @@ class CompleatedParser:
             zones=["battlefield"]
         )
         
-        logger.debug(f"[CompleatedParser] Created ReplacementEffect for Compleated")
+        logger.debug("[CompleatedParser] Created ReplacementEffect for Compleated")
         
         return [replacement_effect]
 
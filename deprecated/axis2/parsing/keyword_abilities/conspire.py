@@ -21,21 +21,21 @@ class ConspireParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Conspire reminder text"""
-        logger.debug(f"[ConspireParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ConspireParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "tap two" not in lower:
             return []
         
-        logger.debug(f"[ConspireParser] Detected Conspire")
+        logger.debug("[ConspireParser] Detected Conspire")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Conspire keyword without reminder text"""
-        logger.debug(f"[ConspireParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ConspireParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[ConspireParser] Detected Conspire")
+        logger.debug("[ConspireParser] Detected Conspire")
         
         return []
 
@@ -21,21 +21,21 @@ class ConvokeParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Convoke reminder text"""
-        logger.debug(f"[ConvokeParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ConvokeParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "tap" not in lower or "creature" not in lower:
             return []
         
-        logger.debug(f"[ConvokeParser] Detected Convoke")
+        logger.debug("[ConvokeParser] Detected Convoke")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Convoke keyword without reminder text"""
-        logger.debug(f"[ConvokeParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ConvokeParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[ConvokeParser] Detected Convoke")
+        logger.debug("[ConvokeParser] Detected Convoke")
         
         return []
 
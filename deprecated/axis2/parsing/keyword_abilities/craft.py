@@ -28,7 +28,7 @@ class CraftParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Craft reminder text into ActivatedAbility"""
-        logger.debug(f"[CraftParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[CraftParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "exile this" not in lower or "return this card" not in lower or "transformed" not in lower:
@@ -36,7 +36,7 @@ class CraftParser:
         
         m = CRAFT_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[CraftParser] No craft cost found in reminder text")
+            logger.debug("[CraftParser] No craft cost found in reminder text")
             return []
         
         materials_text = m.group(1).strip()
@@ -71,17 +71,17 @@ class CraftParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[CraftParser] Created ActivatedAbility for Craft")
+        logger.debug("[CraftParser] Created ActivatedAbility for Craft")
         
         return [activated_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Craft keyword without reminder text (e.g., 'Craft with artifact {3}{W}')"""
-        logger.debug(f"[CraftParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[CraftParser] Parsing keyword only: %s", keyword_text)
         
         m = CRAFT_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[CraftParser] No craft cost found in keyword text")
+            logger.debug("[CraftParser] No craft cost found in keyword text")
             return []
         
         materials_text = m.group(1).strip()
@@ -116,7 +116,7 @@ class CraftParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[CraftParser] Created ActivatedAbility for Craft")
+        logger.debug("[CraftParser] Created ActivatedAbility for Craft")
         
         return [activated_ability]
 
@@ -28,7 +28,7 @@ class CrewParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Crew reminder text into ActivatedAbility"""
-        logger.debug(f"[CrewParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[CrewParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "tap" not in lower or "creatures" not in lower or "becomes an artifact creature" not in lower:
@@ -36,7 +36,7 @@ class CrewParser:
         
         m = CREW_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[CrewParser] No crew value found in reminder text")
+            logger.debug("[CrewParser] No crew value found in reminder text")
             return []
         
         crew_value = int(m.group(1))
@@ -62,17 +62,17 @@ class CrewParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[CrewParser] Created ActivatedAbility for Crew {crew_value}")
+        logger.debug("[CrewParser] Created ActivatedAbility for Crew %s", crew_value)
         
         return [activated_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Crew keyword without reminder text (e.g., 'Crew 3')"""
-        logger.debug(f"[CrewParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[CrewParser] Parsing keyword only: %s", keyword_text)
         
         m = CREW_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[CrewParser] No crew value found in keyword text")
+            logger.debug("[CrewParser] No crew value found in keyword text")
             return []
         
         crew_value = int(m.group(1))
@@ -98,7 +98,7 @@ class CrewParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[CrewParser] Created ActivatedAbility for Crew {crew_value}")
+        logger.debug("[CrewParser] Created ActivatedAbility for Crew %s", crew_value)
         
         return [activated_ability]
 
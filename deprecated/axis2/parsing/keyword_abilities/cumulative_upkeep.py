@@ -28,7 +28,7 @@ class CumulativeUpkeepParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Cumulative upkeep reminder text into TriggeredAbility"""
-        logger.debug(f"[CumulativeUpkeepParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[CumulativeUpkeepParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "age counter" not in lower or "upkeep" not in lower:
@@ -54,17 +54,17 @@ class CumulativeUpkeepParser:
         )
         
         
-        logger.debug(f"[CumulativeUpkeepParser] Created TriggeredAbility for Cumulative upkeep")
+        logger.debug("[CumulativeUpkeepParser] Created TriggeredAbility for Cumulative upkeep")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Cumulative upkeep keyword without reminder text (e.g., 'Cumulative upkeep {G}')"""
-        logger.debug(f"[CumulativeUpkeepParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[CumulativeUpkeepParser] Parsing keyword only: %s", keyword_text)
         
         m = CUMULATIVE_UPKEEP_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[CumulativeUpkeepParser] No cost found in keyword text")
+            logger.debug("[CumulativeUpkeepParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -84,7 +84,7 @@ class CumulativeUpkeepParser:
         )
         
         
-        logger.debug(f"[CumulativeUpkeepParser] Created TriggeredAbility for Cumulative upkeep {cost_text}")
+        logger.debug("[CumulativeUpkeepParser] Created TriggeredAbility for Cumulative upkeep %s", cost_text)
         
         return [triggered_ability]
 
@@ -35,7 +35,7 @@ class CyclingParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Cycling reminder text into ActivatedAbility"""
-        logger.debug(f"[CyclingParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[CyclingParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         
@@ -83,17 +83,17 @@ class CyclingParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[CyclingParser] Created ActivatedAbility for {type_prefix or ''}cycling")
+        logger.debug("[CyclingParser] Created ActivatedAbility for %scycling", type_prefix or '')
         
         return [activated_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Cycling keyword without reminder text (e.g., 'Cycling {2}')"""
-        logger.debug(f"[CyclingParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[CyclingParser] Parsing keyword only: %s", keyword_text)
         
         m = CYCLING_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[CyclingParser] No cost found in keyword text")
+            logger.debug("[CyclingParser] No cost found in keyword text")
             return []
         
         type_prefix = (m.group(1) or "").strip()
@@ -135,7 +135,7 @@ class CyclingParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[CyclingParser] Created ActivatedAbility for {type_prefix or ''}cycling {cost_text}")
+        logger.debug("[CyclingParser] Created ActivatedAbility for %scycling %s", type_prefix or '', cost_text)
         
         return [activated_ability]
 
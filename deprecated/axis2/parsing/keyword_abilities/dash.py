@@ -27,7 +27,7 @@ class DashParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Dash reminder text"""
-        logger.debug(f"[DashParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[DashParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "dash cost" not in lower:
@@ -36,7 +36,7 @@ class DashParser:
         m = DASH_RE.search(reminder_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[DashParser] Detected Dash cost: {cost_text}")
+            logger.debug("[DashParser] Detected Dash cost: %s", cost_text)
         
         return_effect = ChangeZoneEffect(
             subject=Subject(scope="self"),
@@ -64,18 +64,18 @@ class DashParser:
             condition="dash_cost_was_paid"
         )
         
-        logger.debug(f"[DashParser] Created TriggeredAbility and ContinuousEffect for Dash")
+        logger.debug("[DashParser] Created TriggeredAbility and ContinuousEffect for Dash")
         
         return [end_step_trigger, haste_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Dash keyword without reminder text (e.g., 'Dash {2}{R}')"""
-        logger.debug(f"[DashParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[DashParser] Parsing keyword only: %s", keyword_text)
         
         m = DASH_RE.search(keyword_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[DashParser] Detected Dash cost: {cost_text}")
+            logger.debug("[DashParser] Detected Dash cost: %s", cost_text)
         
         return_effect = ChangeZoneEffect(
             subject=Subject(scope="self"),
@@ -103,7 +103,7 @@ class DashParser:
             condition="dash_cost_was_paid"
         )
         
-        logger.debug(f"[DashParser] Created TriggeredAbility and ContinuousEffect for Dash")
+        logger.debug("[DashParser] Created TriggeredAbility and ContinuousEffect for Dash")
         
         return [end_step_trigger, haste_effect]
 
@@ -21,7 +21,7 @@ class DayboundParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Daybound reminder text"""
-        logger.debug(f"[DayboundParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[DayboundParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "day" not in lower and "night" not in lower:
@@ -29,17 +29,17 @@ class DayboundParser:
         
         daybound_effect = DayboundEffect()
         
-        logger.debug(f"[DayboundParser] Created DayboundEffect for Daybound")
+        logger.debug("[DayboundParser] Created DayboundEffect for Daybound")
         
         return [daybound_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Daybound keyword without reminder text"""
-        logger.debug(f"[DayboundParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[DayboundParser] Parsing keyword only: %s", keyword_text)
         
         daybound_effect = DayboundEffect()
         
-        logger.debug(f"[DayboundParser] Created DayboundEffect for Daybound")
+        logger.debug("[DayboundParser] Created DayboundEffect for Daybound")
         
         return [daybound_effect]
 
@@ -57,7 +57,7 @@ class NightboundParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Nightbound reminder text"""
-        logger.debug(f"[NightboundParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[NightboundParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "day" not in lower and "night" not in lower:
@@ -65,17 +65,17 @@ class NightboundParser:
         
         nightbound_effect = NightboundEffect()
         
-        logger.debug(f"[NightboundParser] Created DayboundEffect for Nightbound")
+        logger.debug("[NightboundParser] Created DayboundEffect for Nightbound")
         
         return [nightbound_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Nightbound keyword without reminder text"""
-        logger.debug(f"[NightboundParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[NightboundParser] Parsing keyword only: %s", keyword_text)
         
         nightbound_effect = DayboundEffect()
         
-        logger.debug(f"[NightboundParser] Created DayboundEffect for Nightbound")
+        logger.debug("[NightboundParser] Created DayboundEffect for Nightbound")
         
         return [nightbound_effect]
 
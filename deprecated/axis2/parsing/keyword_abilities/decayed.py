@@ -21,7 +21,7 @@ class DecayedParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Decayed reminder text into ContinuousEffect and TriggeredAbility"""
-        logger.debug(f"[DecayedParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[DecayedParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "can't block" not in lower or "attacks" not in lower or "sacrifice" not in lower:
@@ -52,13 +52,13 @@ class DecayedParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[DecayedParser] Created ContinuousEffect and TriggeredAbility for Decayed")
+        logger.debug("[DecayedParser] Created ContinuousEffect and TriggeredAbility for Decayed")
         
         return [blocking_restriction, triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Decayed keyword without reminder text"""
-        logger.debug(f"[DecayedParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[DecayedParser] Parsing keyword only: %s", keyword_text)
         
         blocking_restriction = ContinuousEffect(
             kind="blocking_restriction",
@@ -85,7 +85,7 @@ class DecayedParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[DecayedParser] Created ContinuousEffect and TriggeredAbility for Decayed")
+        logger.debug("[DecayedParser] Created ContinuousEffect and TriggeredAbility for Decayed")
         
         return [blocking_restriction, triggered_ability]
 
@@ -21,21 +21,21 @@ class DelveParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Delve reminder text"""
-        logger.debug(f"[DelveParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[DelveParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "exile" not in lower or "graveyard" not in lower:
             return []
         
-        logger.debug(f"[DelveParser] Detected Delve")
+        logger.debug("[DelveParser] Detected Delve")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Delve keyword without reminder text"""
-        logger.debug(f"[DelveParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[DelveParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[DelveParser] Detected Delve")
+        logger.debug("[DelveParser] Detected Delve")
         
         return []
 
@@ -21,7 +21,7 @@ class DemonstrateParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Demonstrate reminder text into TriggeredAbility"""
-        logger.debug(f"[DemonstrateParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[DemonstrateParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "copy" not in lower:
@@ -36,13 +36,13 @@ class DemonstrateParser:
             condition="may_choose"
         )
         
-        logger.debug(f"[DemonstrateParser] Created TriggeredAbility for Demonstrate")
+        logger.debug("[DemonstrateParser] Created TriggeredAbility for Demonstrate")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Demonstrate keyword without reminder text"""
-        logger.debug(f"[DemonstrateParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[DemonstrateParser] Parsing keyword only: %s", keyword_text)
         
         triggered_ability = TriggeredAbility(
             condition_text="When you cast this spell, you may copy it and you may choose new targets for the copy. If you copy the spell, choose an opponent. That player copies the spell and may choose new targets for that copy.",
@@ -53,7 +53,7 @@ class DemonstrateParser:
             condition="may_choose"
         )
         
-        logger.debug(f"[DemonstrateParser] Created TriggeredAbility for Demonstrate")
+        logger.debug("[DemonstrateParser] Created TriggeredAbility for Demonstrate")
         
         return [triggered_ability]
 
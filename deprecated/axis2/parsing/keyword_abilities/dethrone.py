@@ -21,7 +21,7 @@ class DethroneParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Dethrone reminder text into TriggeredAbility"""
-        logger.debug(f"[DethroneParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[DethroneParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "attacks" not in lower or "most life" not in lower or "+1/+1 counter" not in lower:
@@ -42,13 +42,13 @@ class DethroneParser:
             condition="attacking_player_with_most_life"
         )
         
-        logger.debug(f"[DethroneParser] Created TriggeredAbility for Dethrone")
+        logger.debug("[DethroneParser] Created TriggeredAbility for Dethrone")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Dethrone keyword without reminder text"""
-        logger.debug(f"[DethroneParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[DethroneParser] Parsing keyword only: %s", keyword_text)
         
         put_counter_effect = PutCounterEffect(
             counter_type="+1/+1",
@@ -65,7 +65,7 @@ class DethroneParser:
             condition="attacking_player_with_most_life"
         )
         
-        logger.debug(f"[DethroneParser] Created TriggeredAbility for Dethrone")
+        logger.debug("[DethroneParser] Created TriggeredAbility for Dethrone")
         
         return [triggered_ability]
 
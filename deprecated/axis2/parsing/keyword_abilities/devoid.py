@@ -21,21 +21,21 @@ class DevoidParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Devoid reminder text"""
-        logger.debug(f"[DevoidParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[DevoidParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "no color" not in lower and "colorless" not in lower:
             return []
         
-        logger.debug(f"[DevoidParser] Detected Devoid")
+        logger.debug("[DevoidParser] Detected Devoid")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Devoid keyword without reminder text"""
-        logger.debug(f"[DevoidParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[DevoidParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[DevoidParser] Detected Devoid")
+        logger.debug("[DevoidParser] Detected Devoid")
         
         return []
 
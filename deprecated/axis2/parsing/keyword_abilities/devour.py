@@ -27,7 +27,7 @@ class DevourParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Devour reminder text into ReplacementEffect"""
-        logger.debug(f"[DevourParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[DevourParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "enters" not in lower or "sacrifice" not in lower or "+1/+1 counter" not in lower:
@@ -35,7 +35,7 @@ class DevourParser:
         
         m = DEVOUR_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[DevourParser] No devour value found in reminder text")
+            logger.debug("[DevourParser] No devour value found in reminder text")
             return []
         
         devour_value = m.group(1)
@@ -57,17 +57,17 @@ class DevourParser:
                 zones=["battlefield"]
             )
         
-        logger.debug(f"[DevourParser] Created ReplacementEffect for Devour {devour_value}")
+        logger.debug("[DevourParser] Created ReplacementEffect for Devour %s", devour_value)
         
         return [replacement_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Devour keyword without reminder text (e.g., 'Devour 1')"""
-        logger.debug(f"[DevourParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[DevourParser] Parsing keyword only: %s", keyword_text)
         
         m = DEVOUR_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[DevourParser] No devour value found in keyword text")
+            logger.debug("[DevourParser] No devour value found in keyword text")
             return []
         
         devour_value = m.group(1)
@@ -89,7 +89,7 @@ class DevourParser:
                 zones=["battlefield"]
             )
         
-        logger.debug(f"[DevourParser] Created ReplacementEffect for Devour {devour_value}")
+        logger.debug("[DevourParser] Created ReplacementEffect for Devour %s", devour_value)
         
         return [replacement_effect]
 
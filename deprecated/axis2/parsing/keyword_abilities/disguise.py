@@ -27,7 +27,7 @@ class DisguiseParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Disguise reminder text"""
-        logger.debug(f"[DisguiseParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[DisguiseParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this card face down" not in lower or "2/2 creature" not in lower:
@@ -35,27 +35,27 @@ class DisguiseParser:
         
         m = DISGUISE_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[DisguiseParser] No disguise cost found in reminder text")
+            logger.debug("[DisguiseParser] No disguise cost found in reminder text")
             return []
         
         disguise_cost = m.group(1).strip()
         
-        logger.debug(f"[DisguiseParser] Detected Disguise (spell modifier + special action, handled by Axis3)")
+        logger.debug("[DisguiseParser] Detected Disguise (spell modifier + special action, handled by Axis3)")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Disguise keyword without reminder text (e.g., 'Disguise {R/W}{R/W}')"""
-        logger.debug(f"[DisguiseParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[DisguiseParser] Parsing keyword only: %s", keyword_text)
         
         m = DISGUISE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[DisguiseParser] No disguise cost found in keyword text")
+            logger.debug("[DisguiseParser] No disguise cost found in keyword text")
             return []
         
         disguise_cost = m.group(1).strip()
         
-        logger.debug(f"[DisguiseParser] Detected Disguise (spell modifier + special action, handled by Axis3)")
+        logger.debug("[DisguiseParser] Detected Disguise (spell modifier + special action, handled by Axis3)")
         
         return []
 
@@ -27,7 +27,7 @@ class DisturbParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Disturb reminder text"""
-        logger.debug(f"[DisturbParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[DisturbParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this card" not in lower or "transformed" not in lower or "graveyard" not in lower:
@@ -36,22 +36,22 @@ class DisturbParser:
         m = DISTURB_RE.search(reminder_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[DisturbParser] Detected Disturb cost: {cost_text}")
+            logger.debug("[DisturbParser] Detected Disturb cost: %s", cost_text)
         
-        logger.debug(f"[DisturbParser] Detected Disturb")
+        logger.debug("[DisturbParser] Detected Disturb")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Disturb keyword without reminder text (e.g., 'Disturb — {1}{U}')"""
-        logger.debug(f"[DisturbParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[DisturbParser] Parsing keyword only: %s", keyword_text)
         
         m = DISTURB_RE.search(keyword_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[DisturbParser] Detected Disturb cost: {cost_text}")
+            logger.debug("[DisturbParser] Detected Disturb cost: %s", cost_text)
         
-        logger.debug(f"[DisturbParser] Detected Disturb")
+        logger.debug("[DisturbParser] Detected Disturb")
         
         return []
 
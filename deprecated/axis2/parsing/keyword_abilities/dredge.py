@@ -27,7 +27,7 @@ class DredgeParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Dredge reminder text into ReplacementEffect"""
-        logger.debug(f"[DredgeParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[DredgeParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "draw a card" not in lower or "mill" not in lower or "return this card" not in lower:
@@ -35,7 +35,7 @@ class DredgeParser:
         
         m = DREDGE_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[DredgeParser] No dredge value found in reminder text")
+            logger.debug("[DredgeParser] No dredge value found in reminder text")
             return []
         
         dredge_value = int(m.group(1))
@@ -62,17 +62,17 @@ class DredgeParser:
             condition=f"library_has_at_least_{dredge_value}_cards"
         )
         
-        logger.debug(f"[DredgeParser] Created ReplacementEffect for Dredge {dredge_value}")
+        logger.debug("[DredgeParser] Created ReplacementEffect for Dredge %s", dredge_value)
         
         return [replacement_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Dredge keyword without reminder text (e.g., 'Dredge 3')"""
-        logger.debug(f"[DredgeParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[DredgeParser] Parsing keyword only: %s", keyword_text)
         
         m = DREDGE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[DredgeParser] No dredge value found in keyword text")
+            logger.debug("[DredgeParser] No dredge value found in keyword text")
             return []
         
         dredge_value = int(m.group(1))
@@ -99,7 +99,7 @@ class DredgeParser:
             condition=f"library_has_at_least_{dredge_value}_cards"
         )
         
-        logger.debug(f"[DredgeParser] Created ReplacementEffect for Dredge {dredge_value}")
+        logger.debug("[DredgeParser] Created ReplacementEffect for Dredge %s", dredge_value)
         
         return [replacement_effect]
 
@@ -28,7 +28,7 @@ class EchoParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Echo reminder text into TriggeredAbility"""
-        logger.debug(f"[EchoParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[EchoParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "beginning of your upkeep" not in lower or "sacrifice it unless" not in lower:
@@ -57,17 +57,17 @@ class EchoParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[EchoParser] Created TriggeredAbility for Echo")
+        logger.debug("[EchoParser] Created TriggeredAbility for Echo")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Echo keyword without reminder text (e.g., 'Echo {2}{R}')"""
-        logger.debug(f"[EchoParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[EchoParser] Parsing keyword only: %s", keyword_text)
         
         m = ECHO_COST_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[EchoParser] No cost found in keyword text")
+            logger.debug("[EchoParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -90,7 +90,7 @@ class EchoParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[EchoParser] Created TriggeredAbility for Echo {cost_text}")
+        logger.debug("[EchoParser] Created TriggeredAbility for Echo %s", cost_text)
         
         return [triggered_ability]
 
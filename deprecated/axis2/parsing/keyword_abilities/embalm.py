@@ -28,7 +28,7 @@ class EmbalmParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Embalm reminder text into ActivatedAbility"""
-        logger.debug(f"[EmbalmParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[EmbalmParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "exile this card" not in lower or "create a token" not in lower or "copy" not in lower:
@@ -36,7 +36,7 @@ class EmbalmParser:
         
         m = EMBALM_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[EmbalmParser] No embalm cost found in reminder text")
+            logger.debug("[EmbalmParser] No embalm cost found in reminder text")
             return []
         
         cost_text = m.group(1).strip()
@@ -71,17 +71,17 @@ class EmbalmParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[EmbalmParser] Created ActivatedAbility for Embalm")
+        logger.debug("[EmbalmParser] Created ActivatedAbility for Embalm")
         
         return [activated_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Embalm keyword without reminder text (e.g., 'Embalm {W}')"""
-        logger.debug(f"[EmbalmParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[EmbalmParser] Parsing keyword only: %s", keyword_text)
         
         m = EMBALM_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[EmbalmParser] No embalm cost found in keyword text")
+            logger.debug("[EmbalmParser] No embalm cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -116,7 +116,7 @@ class EmbalmParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[EmbalmParser] Created ActivatedAbility for Embalm")
+        logger.debug("[EmbalmParser] Created ActivatedAbility for Embalm")
         
         return [activated_ability]
 
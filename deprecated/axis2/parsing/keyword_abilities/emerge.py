@@ -27,7 +27,7 @@ class EmergeParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Emerge reminder text"""
-        logger.debug(f"[EmergeParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[EmergeParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "sacrificing" not in lower:
@@ -36,22 +36,22 @@ class EmergeParser:
         m = EMERGE_RE.search(reminder_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[EmergeParser] Detected Emerge cost: {cost_text}")
+            logger.debug("[EmergeParser] Detected Emerge cost: %s", cost_text)
         
-        logger.debug(f"[EmergeParser] Detected Emerge")
+        logger.debug("[EmergeParser] Detected Emerge")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Emerge keyword without reminder text (e.g., 'Emerge {6}{G}{G}{G}')"""
-        logger.debug(f"[EmergeParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[EmergeParser] Parsing keyword only: %s", keyword_text)
         
         m = EMERGE_RE.search(keyword_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[EmergeParser] Detected Emerge cost: {cost_text}")
+            logger.debug("[EmergeParser] Detected Emerge cost: %s", cost_text)
         
-        logger.debug(f"[EmergeParser] Detected Emerge")
+        logger.debug("[EmergeParser] Detected Emerge")
         
         return []
 
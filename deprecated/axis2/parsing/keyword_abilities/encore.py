@@ -28,7 +28,7 @@ class EncoreParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Encore reminder text into ActivatedAbility"""
-        logger.debug(f"[EncoreParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[EncoreParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "exile this card" not in lower or "create a token copy" not in lower:
@@ -36,7 +36,7 @@ class EncoreParser:
         
         m = ENCORE_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[EncoreParser] No encore cost found in reminder text")
+            logger.debug("[EncoreParser] No encore cost found in reminder text")
             return []
         
         cost_text = m.group(1).strip()
@@ -84,17 +84,17 @@ class EncoreParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[EncoreParser] Created ActivatedAbility and TriggeredAbility for Encore")
+        logger.debug("[EncoreParser] Created ActivatedAbility and TriggeredAbility for Encore")
         
         return [activated_ability, end_step_trigger]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Encore keyword without reminder text (e.g., 'Encore {3}{B}')"""
-        logger.debug(f"[EncoreParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[EncoreParser] Parsing keyword only: %s", keyword_text)
         
         m = ENCORE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[EncoreParser] No encore cost found in keyword text")
+            logger.debug("[EncoreParser] No encore cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -142,7 +142,7 @@ class EncoreParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[EncoreParser] Created ActivatedAbility and TriggeredAbility for Encore")
+        logger.debug("[EncoreParser] Created ActivatedAbility and TriggeredAbility for Encore")
         
         return [activated_ability, end_step_trigger]
 
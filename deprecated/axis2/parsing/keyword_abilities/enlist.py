@@ -21,7 +21,7 @@ class EnlistParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Enlist reminder text into TriggeredAbility"""
-        logger.debug(f"[EnlistParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[EnlistParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "attacks" not in lower or "tap" not in lower or "creature" not in lower:
@@ -48,13 +48,13 @@ class EnlistParser:
             condition="may_tap_creature_for_enlist"
         )
         
-        logger.debug(f"[EnlistParser] Created TriggeredAbility for Enlist")
+        logger.debug("[EnlistParser] Created TriggeredAbility for Enlist")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Enlist keyword without reminder text"""
-        logger.debug(f"[EnlistParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[EnlistParser] Parsing keyword only: %s", keyword_text)
         
         pt_effect = ContinuousEffect(
             kind="pt_mod",
@@ -77,7 +77,7 @@ class EnlistParser:
             condition="may_tap_creature_for_enlist"
         )
         
-        logger.debug(f"[EnlistParser] Created TriggeredAbility for Enlist")
+        logger.debug("[EnlistParser] Created TriggeredAbility for Enlist")
         
         return [triggered_ability]
 
@@ -27,7 +27,7 @@ class EntwineParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Entwine reminder text"""
-        logger.debug(f"[EntwineParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[EntwineParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "choose all" not in lower and "choose both" not in lower:
@@ -39,22 +39,22 @@ class EntwineParser:
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[EntwineParser] Detected Entwine with cost: {cost_text}")
+        logger.debug("[EntwineParser] Detected Entwine with cost: %s", cost_text)
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Entwine keyword without reminder text (e.g., 'Entwine — Sacrifice three lands.')"""
-        logger.debug(f"[EntwineParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[EntwineParser] Parsing keyword only: %s", keyword_text)
         
         m = ENTWINE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[EntwineParser] No cost found in keyword text")
+            logger.debug("[EntwineParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[EntwineParser] Detected Entwine with cost: {cost_text}")
+        logger.debug("[EntwineParser] Detected Entwine with cost: %s", cost_text)
         
         return []
 
@@ -21,21 +21,21 @@ class EpicParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Epic reminder text"""
-        logger.debug(f"[EpicParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[EpicParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "can't cast spells" not in lower or "beginning of each of your upkeeps" not in lower:
             return []
         
-        logger.debug(f"[EpicParser] Detected Epic")
+        logger.debug("[EpicParser] Detected Epic")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Epic keyword without reminder text"""
-        logger.debug(f"[EpicParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[EpicParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[EpicParser] Detected Epic")
+        logger.debug("[EpicParser] Detected Epic")
         
         return []
 
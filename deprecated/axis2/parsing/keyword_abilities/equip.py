@@ -30,7 +30,7 @@ class EquipParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Equip reminder text into ActivatedAbility"""
-        logger.debug(f"[EquipParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[EquipParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "attach" not in lower or "creature" not in lower:
@@ -56,17 +56,17 @@ class EquipParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[EquipParser] Created ActivatedAbility for Equip")
+        logger.debug("[EquipParser] Created ActivatedAbility for Equip")
         
         return [activated_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Equip keyword without reminder text (e.g., 'Equip {2}')"""
-        logger.debug(f"[EquipParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[EquipParser] Parsing keyword only: %s", keyword_text)
         
         m = EQUIP_COST_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[EquipParser] No cost found in keyword text")
+            logger.debug("[EquipParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -85,7 +85,7 @@ class EquipParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[EquipParser] Created ActivatedAbility for Equip {cost_text}")
+        logger.debug("[EquipParser] Created ActivatedAbility for Equip %s", cost_text)
         
         return [activated_ability]
 
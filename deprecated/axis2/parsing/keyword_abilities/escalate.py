@@ -27,7 +27,7 @@ class EscalateParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Escalate reminder text"""
-        logger.debug(f"[EscalateParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[EscalateParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "mode" not in lower or "beyond the first" not in lower:
@@ -36,22 +36,22 @@ class EscalateParser:
         m = ESCALATE_RE.search(reminder_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[EscalateParser] Detected Escalate cost: {cost_text}")
+            logger.debug("[EscalateParser] Detected Escalate cost: %s", cost_text)
         
-        logger.debug(f"[EscalateParser] Detected Escalate")
+        logger.debug("[EscalateParser] Detected Escalate")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Escalate keyword without reminder text (e.g., 'Escalate {2}')"""
-        logger.debug(f"[EscalateParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[EscalateParser] Parsing keyword only: %s", keyword_text)
         
         m = ESCALATE_RE.search(keyword_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[EscalateParser] Detected Escalate cost: {cost_text}")
+            logger.debug("[EscalateParser] Detected Escalate cost: %s", cost_text)
         
-        logger.debug(f"[EscalateParser] Detected Escalate")
+        logger.debug("[EscalateParser] Detected Escalate")
         
         return []
 
@@ -32,7 +32,7 @@ class EscapeParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Escape reminder text"""
-        logger.debug(f"[EscapeParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[EscapeParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this card" not in lower or "graveyard" not in lower:
@@ -41,14 +41,14 @@ class EscapeParser:
         m = ESCAPE_RE.search(reminder_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[EscapeParser] Detected Escape cost: {cost_text}")
+            logger.debug("[EscapeParser] Detected Escape cost: %s", cost_text)
         
         effects = []
         
         m_counters = ESCAPE_WITH_COUNTERS_RE.search(reminder_text)
         if m_counters:
             counter_amount = int(m_counters.group(1))
-            logger.debug(f"[EscapeParser] Detected 'escapes with {counter_amount} +1/+1 counters'")
+            logger.debug("[EscapeParser] Detected 'escapes with %s +1/+1 counters'", counter_amount)
             
             replacement_effect = ReplacementEffect(
                 kind="enters_with_counters",
@@ -59,20 +59,20 @@ class EscapeParser:
             )
             effects.append(replacement_effect)
         
-        logger.debug(f"[EscapeParser] Detected Escape")
+        logger.debug("[EscapeParser] Detected Escape")
         
         return effects
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Escape keyword without reminder text (e.g., 'Escape — {3}{G}{G}, Exile four other cards from your graveyard')"""
-        logger.debug(f"[EscapeParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[EscapeParser] Parsing keyword only: %s", keyword_text)
         
         m = ESCAPE_RE.search(keyword_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[EscapeParser] Detected Escape cost: {cost_text}")
+            logger.debug("[EscapeParser] Detected Escape cost: %s", cost_text)
         
-        logger.debug(f"[EscapeParser] Detected Escape")
+        logger.debug("[EscapeParser] Detected Escape")
         
         return []
 
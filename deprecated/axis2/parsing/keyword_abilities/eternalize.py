@@ -28,7 +28,7 @@ class EternalizeParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Eternalize reminder text into ActivatedAbility"""
-        logger.debug(f"[EternalizeParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[EternalizeParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "exile this card" not in lower or "create a token" not in lower or "copy" not in lower:
@@ -36,7 +36,7 @@ class EternalizeParser:
         
         m = ETERNALIZE_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[EternalizeParser] No eternalize cost found in reminder text")
+            logger.debug("[EternalizeParser] No eternalize cost found in reminder text")
             return []
         
         cost_text = m.group(1).strip()
@@ -73,17 +73,17 @@ class EternalizeParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[EternalizeParser] Created ActivatedAbility for Eternalize")
+        logger.debug("[EternalizeParser] Created ActivatedAbility for Eternalize")
         
         return [activated_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Eternalize keyword without reminder text (e.g., 'Eternalize {3}{W}{W}')"""
-        logger.debug(f"[EternalizeParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[EternalizeParser] Parsing keyword only: %s", keyword_text)
         
         m = ETERNALIZE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[EternalizeParser] No eternalize cost found in keyword text")
+            logger.debug("[EternalizeParser] No eternalize cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -120,7 +120,7 @@ class EternalizeParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[EternalizeParser] Created ActivatedAbility for Eternalize")
+        logger.debug("[EternalizeParser] Created ActivatedAbility for Eternalize")
         
         return [activated_ability]
 
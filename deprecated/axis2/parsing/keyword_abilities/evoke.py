@@ -28,7 +28,7 @@ class EvokeParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Evoke reminder text into ReplacementEffect and TriggeredAbility"""
-        logger.debug(f"[EvokeParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[EvokeParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "evoke cost" not in lower:
@@ -65,17 +65,17 @@ class EvokeParser:
             trigger_filter=None,
         )
         
-        logger.debug(f"[EvokeParser] Created ReplacementEffect and TriggeredAbility for Evoke")
+        logger.debug("[EvokeParser] Created ReplacementEffect and TriggeredAbility for Evoke")
         
         return [replacement_effect, triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Evoke keyword without reminder text (e.g., 'Evoke {W}')"""
-        logger.debug(f"[EvokeParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[EvokeParser] Parsing keyword only: %s", keyword_text)
         
         m = EVOKE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[EvokeParser] No cost found in keyword text")
+            logger.debug("[EvokeParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -105,7 +105,7 @@ class EvokeParser:
             trigger_filter=None,
         )
         
-        logger.debug(f"[EvokeParser] Created ReplacementEffect and TriggeredAbility for Evoke {cost_text}")
+        logger.debug("[EvokeParser] Created ReplacementEffect and TriggeredAbility for Evoke %s", cost_text)
         
         return [replacement_effect, triggered_ability]
 
@@ -21,7 +21,7 @@ class EvolveParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Evolve reminder text into TriggeredAbility"""
-        logger.debug(f"[EvolveParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[EvolveParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "creature enters" not in lower or "greater power or toughness" not in lower:
@@ -42,13 +42,13 @@ class EvolveParser:
             condition="entering_creature_has_greater_power_or_toughness"
         )
         
-        logger.debug(f"[EvolveParser] Created TriggeredAbility for Evolve")
+        logger.debug("[EvolveParser] Created TriggeredAbility for Evolve")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Evolve keyword without reminder text"""
-        logger.debug(f"[EvolveParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[EvolveParser] Parsing keyword only: %s", keyword_text)
         
         put_counter_effect = PutCounterEffect(
             counter_type="+1/+1",
@@ -65,7 +65,7 @@ class EvolveParser:
             condition="entering_creature_has_greater_power_or_toughness"
         )
         
-        logger.debug(f"[EvolveParser] Created TriggeredAbility for Evolve")
+        logger.debug("[EvolveParser] Created TriggeredAbility for Evolve")
         
         return [triggered_ability]
 
@@ -21,7 +21,7 @@ class ExaltedParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Exalted reminder text into TriggeredAbility"""
-        logger.debug(f"[ExaltedParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ExaltedParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "attacks alone" not in lower or "gets +1/+1" not in lower:
@@ -46,13 +46,13 @@ class ExaltedParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[ExaltedParser] Created TriggeredAbility for Exalted")
+        logger.debug("[ExaltedParser] Created TriggeredAbility for Exalted")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Exalted keyword without reminder text"""
-        logger.debug(f"[ExaltedParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ExaltedParser] Parsing keyword only: %s", keyword_text)
         
         pt_effect = ContinuousEffect(
             kind="pt_mod",
@@ -73,7 +73,7 @@ class ExaltedParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[ExaltedParser] Created TriggeredAbility for Exalted")
+        logger.debug("[ExaltedParser] Created TriggeredAbility for Exalted")
         
         return [triggered_ability]
 
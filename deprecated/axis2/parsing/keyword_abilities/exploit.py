@@ -21,7 +21,7 @@ class ExploitParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Exploit reminder text into TriggeredAbility"""
-        logger.debug(f"[ExploitParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ExploitParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "enters" not in lower or "may sacrifice a creature" not in lower:
@@ -42,13 +42,13 @@ class ExploitParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[ExploitParser] Created TriggeredAbility for Exploit")
+        logger.debug("[ExploitParser] Created TriggeredAbility for Exploit")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Exploit keyword without reminder text"""
-        logger.debug(f"[ExploitParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ExploitParser] Parsing keyword only: %s", keyword_text)
         
         sacrifice_effect = ChangeZoneEffect(
             subject=Subject(scope="any_number", max_targets=1, types=["creature"]),
@@ -65,7 +65,7 @@ class ExploitParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[ExploitParser] Created TriggeredAbility for Exploit")
+        logger.debug("[ExploitParser] Created TriggeredAbility for Exploit")
         
         return [triggered_ability]
 
@@ -22,7 +22,7 @@ class ExtortParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Extort reminder text into TriggeredAbility"""
-        logger.debug(f"[ExtortParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ExtortParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast a spell" not in lower or "opponent loses" not in lower:
@@ -42,13 +42,13 @@ class ExtortParser:
             condition="may_pay_W/B"
         )
         
-        logger.debug(f"[ExtortParser] Created TriggeredAbility for Extort")
+        logger.debug("[ExtortParser] Created TriggeredAbility for Extort")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Extort keyword without reminder text"""
-        logger.debug(f"[ExtortParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ExtortParser] Parsing keyword only: %s", keyword_text)
         
         gain_life_effect = GainLifeEffect(
             amount="total_life_lost_by_opponents",
@@ -64,7 +64,7 @@ class ExtortParser:
             condition="may_pay_W/B"
         )
         
-        logger.debug(f"[ExtortParser] Created TriggeredAbility for Extort")
+        logger.debug("[ExtortParser] Created TriggeredAbility for Extort")
         
         return [triggered_ability]
 
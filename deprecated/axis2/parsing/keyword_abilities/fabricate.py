@@ -27,7 +27,7 @@ class FabricateParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Fabricate reminder text into TriggeredAbility"""
-        logger.debug(f"[FabricateParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[FabricateParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "enters" not in lower:
@@ -35,7 +35,7 @@ class FabricateParser:
         
         m = FABRICATE_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[FabricateParser] No fabricate value found in reminder text")
+            logger.debug("[FabricateParser] No fabricate value found in reminder text")
             return []
         
         fabricate_value = int(m.group(1))
@@ -67,17 +67,17 @@ class FabricateParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[FabricateParser] Created TriggeredAbility for Fabricate {fabricate_value}")
+        logger.debug("[FabricateParser] Created TriggeredAbility for Fabricate %s", fabricate_value)
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Fabricate keyword without reminder text (e.g., 'Fabricate 1')"""
-        logger.debug(f"[FabricateParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[FabricateParser] Parsing keyword only: %s", keyword_text)
         
         m = FABRICATE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[FabricateParser] No fabricate value found in keyword text")
+            logger.debug("[FabricateParser] No fabricate value found in keyword text")
             return []
         
         fabricate_value = int(m.group(1))
@@ -109,7 +109,7 @@ class FabricateParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[FabricateParser] Created TriggeredAbility for Fabricate {fabricate_value}")
+        logger.debug("[FabricateParser] Created TriggeredAbility for Fabricate %s", fabricate_value)
         
         return [triggered_ability]
 
@@ -27,7 +27,7 @@ class FadingParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Fading reminder text into ReplacementEffect and TriggeredAbility"""
-        logger.debug(f"[FadingParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[FadingParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "fade counter" not in lower:
@@ -35,7 +35,7 @@ class FadingParser:
         
         m = FADING_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[FadingParser] No fading value found in reminder text")
+            logger.debug("[FadingParser] No fading value found in reminder text")
             return []
         
         fade_value = int(m.group(1))
@@ -71,17 +71,17 @@ class FadingParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[FadingParser] Created ReplacementEffect and TriggeredAbility for Fading {fade_value}")
+        logger.debug("[FadingParser] Created ReplacementEffect and TriggeredAbility for Fading %s", fade_value)
         
         return [replacement_effect, triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Fading keyword without reminder text (e.g., 'Fading 3')"""
-        logger.debug(f"[FadingParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[FadingParser] Parsing keyword only: %s", keyword_text)
         
         m = FADING_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[FadingParser] No fading value found in keyword text")
+            logger.debug("[FadingParser] No fading value found in keyword text")
             return []
         
         fade_value = int(m.group(1))
@@ -117,7 +117,7 @@ class FadingParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[FadingParser] Created ReplacementEffect and TriggeredAbility for Fading {fade_value}")
+        logger.debug("[FadingParser] Created ReplacementEffect and TriggeredAbility for Fading %s", fade_value)
         
         return [replacement_effect, triggered_ability]
 
@@ -21,7 +21,7 @@ class FlankingParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Flanking reminder text into TriggeredAbility"""
-        logger.debug(f"[FlankingParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[FlankingParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "becomes blocked" not in lower or "blocking creature gets" not in lower:
@@ -51,13 +51,13 @@ class FlankingParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[FlankingParser] Created TriggeredAbility for Flanking")
+        logger.debug("[FlankingParser] Created TriggeredAbility for Flanking")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Flanking keyword without reminder text"""
-        logger.debug(f"[FlankingParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[FlankingParser] Parsing keyword only: %s", keyword_text)
         
         condition_text = "Whenever this creature becomes blocked by a creature without flanking"
         
@@ -83,7 +83,7 @@ class FlankingParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[FlankingParser] Created TriggeredAbility for Flanking")
+        logger.debug("[FlankingParser] Created TriggeredAbility for Flanking")
         
         return [triggered_ability]
 
@@ -27,7 +27,7 @@ class FlashbackParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Flashback reminder text"""
-        logger.debug(f"[FlashbackParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[FlashbackParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this card from your graveyard" not in lower and "flashback cost" not in lower:
@@ -39,22 +39,22 @@ class FlashbackParser:
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[FlashbackParser] Detected Flashback with cost: {cost_text}")
+        logger.debug("[FlashbackParser] Detected Flashback with cost: %s", cost_text)
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Flashback keyword without reminder text (e.g., 'Flashback {G}')"""
-        logger.debug(f"[FlashbackParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[FlashbackParser] Parsing keyword only: %s", keyword_text)
         
         m = FLASHBACK_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[FlashbackParser] No cost found in keyword text")
+            logger.debug("[FlashbackParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[FlashbackParser] Detected Flashback with cost: {cost_text}")
+        logger.debug("[FlashbackParser] Detected Flashback with cost: %s", cost_text)
         
         return []
 
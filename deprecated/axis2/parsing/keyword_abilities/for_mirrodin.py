@@ -21,7 +21,7 @@ class ForMirrodinParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse For Mirrodin! reminder text into TriggeredAbility"""
-        logger.debug(f"[ForMirrodinParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ForMirrodinParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "enters" not in lower or "create" not in lower or "rebel" not in lower or "attach" not in lower:
@@ -55,13 +55,13 @@ class ForMirrodinParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[ForMirrodinParser] Created TriggeredAbility for For Mirrodin!")
+        logger.debug("[ForMirrodinParser] Created TriggeredAbility for For Mirrodin!")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse For Mirrodin! keyword without reminder text"""
-        logger.debug(f"[ForMirrodinParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ForMirrodinParser] Parsing keyword only: %s", keyword_text)
         
         create_token_effect = CreateTokenEffect(
             amount=1,
@@ -91,7 +91,7 @@ class ForMirrodinParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[ForMirrodinParser] Created TriggeredAbility for For Mirrodin!")
+        logger.debug("[ForMirrodinParser] Created TriggeredAbility for For Mirrodin!")
         
         return [triggered_ability]
 
@@ -29,7 +29,7 @@ class ForecastParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Forecast reminder text into ActivatedAbility"""
-        logger.debug(f"[ForecastParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ForecastParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "reveal" not in lower or "hand" not in lower:
@@ -43,7 +43,7 @@ class ForecastParser:
         
         colon_idx = ability_text.find(":")
         if colon_idx == -1:
-            logger.debug(f"[ForecastParser] No colon found in forecast ability text")
+            logger.debug("[ForecastParser] No colon found in forecast ability text")
             return []
         
         cost_text = ability_text[:colon_idx].strip()
@@ -62,24 +62,24 @@ class ForecastParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[ForecastParser] Created ActivatedAbility for Forecast")
+        logger.debug("[ForecastParser] Created ActivatedAbility for Forecast")
         
         return [activated_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Forecast keyword without reminder text (e.g., 'Forecast — {2}{W}{U}, Reveal...')"""
-        logger.debug(f"[ForecastParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ForecastParser] Parsing keyword only: %s", keyword_text)
         
         m = FORECAST_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[ForecastParser] No forecast ability found in keyword text")
+            logger.debug("[ForecastParser] No forecast ability found in keyword text")
             return []
         
         ability_text = m.group(1).strip()
         
         colon_idx = ability_text.find(":")
         if colon_idx == -1:
-            logger.debug(f"[ForecastParser] No colon found in forecast ability text")
+            logger.debug("[ForecastParser] No colon found in forecast ability text")
             return []
         
         cost_text = ability_text[:colon_idx].strip()
@@ -98,7 +98,7 @@ class ForecastParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[ForecastParser] Created ActivatedAbility for Forecast")
+        logger.debug("[ForecastParser] Created ActivatedAbility for Forecast")
         
         return [activated_ability]
 
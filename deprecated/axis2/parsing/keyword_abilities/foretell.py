@@ -27,7 +27,7 @@ class ForetellParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Foretell reminder text"""
-        logger.debug(f"[ForetellParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ForetellParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "exile this card" not in lower or "hand" not in lower or "face down" not in lower:
@@ -36,22 +36,22 @@ class ForetellParser:
         m = FORETELL_RE.search(reminder_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[ForetellParser] Detected Foretell cost: {cost_text}")
+            logger.debug("[ForetellParser] Detected Foretell cost: %s", cost_text)
         
-        logger.debug(f"[ForetellParser] Detected Foretell")
+        logger.debug("[ForetellParser] Detected Foretell")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Foretell keyword without reminder text (e.g., 'Foretell {2}{G}{G}')"""
-        logger.debug(f"[ForetellParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ForetellParser] Parsing keyword only: %s", keyword_text)
         
         m = FORETELL_RE.search(keyword_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[ForetellParser] Detected Foretell cost: {cost_text}")
+            logger.debug("[ForetellParser] Detected Foretell cost: %s", cost_text)
         
-        logger.debug(f"[ForetellParser] Detected Foretell")
+        logger.debug("[ForetellParser] Detected Foretell")
         
         return []
 
@@ -28,7 +28,7 @@ class FortifyParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Fortify reminder text into ActivatedAbility"""
-        logger.debug(f"[FortifyParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[FortifyParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "attach" not in lower or "target land" not in lower:
@@ -67,17 +67,17 @@ class FortifyParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[FortifyParser] Created ActivatedAbility for Fortify")
+        logger.debug("[FortifyParser] Created ActivatedAbility for Fortify")
         
         return [activated_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Fortify keyword without reminder text (e.g., 'Fortify {3}')"""
-        logger.debug(f"[FortifyParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[FortifyParser] Parsing keyword only: %s", keyword_text)
         
         m = FORTIFY_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[FortifyParser] No cost found in keyword text")
+            logger.debug("[FortifyParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -109,7 +109,7 @@ class FortifyParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[FortifyParser] Created ActivatedAbility for Fortify {cost_text}")
+        logger.debug("[FortifyParser] Created ActivatedAbility for Fortify %s", cost_text)
         
         return [activated_ability]
 
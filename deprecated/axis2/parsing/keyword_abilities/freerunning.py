@@ -27,7 +27,7 @@ class FreerunningParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Freerunning reminder text"""
-        logger.debug(f"[FreerunningParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[FreerunningParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "freerunning cost" not in lower:
@@ -35,27 +35,27 @@ class FreerunningParser:
         
         m = FREERUNNING_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[FreerunningParser] No freerunning cost found in reminder text")
+            logger.debug("[FreerunningParser] No freerunning cost found in reminder text")
             return []
         
         freerunning_cost = m.group(1).strip()
         
-        logger.debug(f"[FreerunningParser] Detected Freerunning (spell modifier, handled by Axis3)")
+        logger.debug("[FreerunningParser] Detected Freerunning (spell modifier, handled by Axis3)")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Freerunning keyword without reminder text (e.g., 'Freerunning {1}{B}')"""
-        logger.debug(f"[FreerunningParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[FreerunningParser] Parsing keyword only: %s", keyword_text)
         
         m = FREERUNNING_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[FreerunningParser] No freerunning cost found in keyword text")
+            logger.debug("[FreerunningParser] No freerunning cost found in keyword text")
             return []
         
         freerunning_cost = m.group(1).strip()
         
-        logger.debug(f"[FreerunningParser] Detected Freerunning (spell modifier, handled by Axis3)")
+        logger.debug("[FreerunningParser] Detected Freerunning (spell modifier, handled by Axis3)")
         
         return []
 
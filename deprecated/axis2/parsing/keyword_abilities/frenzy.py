@@ -27,7 +27,7 @@ class FrenzyParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Frenzy reminder text into TriggeredAbility"""
-        logger.debug(f"[FrenzyParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[FrenzyParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "attacks" not in lower or "isn't blocked" not in lower or "gets +" not in lower:
@@ -35,7 +35,7 @@ class FrenzyParser:
         
         m = FRENZY_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[FrenzyParser] No frenzy value found in reminder text")
+            logger.debug("[FrenzyParser] No frenzy value found in reminder text")
             return []
         
         frenzy_value = int(m.group(1))
@@ -59,17 +59,17 @@ class FrenzyParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[FrenzyParser] Created TriggeredAbility for Frenzy {frenzy_value}")
+        logger.debug("[FrenzyParser] Created TriggeredAbility for Frenzy %s", frenzy_value)
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Frenzy keyword without reminder text (e.g., 'Frenzy 1')"""
-        logger.debug(f"[FrenzyParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[FrenzyParser] Parsing keyword only: %s", keyword_text)
         
         m = FRENZY_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[FrenzyParser] No frenzy value found in keyword text")
+            logger.debug("[FrenzyParser] No frenzy value found in keyword text")
             return []
         
         frenzy_value = int(m.group(1))
@@ -93,7 +93,7 @@ class FrenzyParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[FrenzyParser] Created TriggeredAbility for Frenzy {frenzy_value}")
+        logger.debug("[FrenzyParser] Created TriggeredAbility for Frenzy %s", frenzy_value)
         
         return [triggered_ability]
 
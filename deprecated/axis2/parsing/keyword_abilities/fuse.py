@@ -21,21 +21,21 @@ class FuseParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Fuse reminder text"""
-        logger.debug(f"[FuseParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[FuseParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast both halves" not in lower and "split card" not in lower:
             return []
         
-        logger.debug(f"[FuseParser] Detected Fuse")
+        logger.debug("[FuseParser] Detected Fuse")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Fuse keyword without reminder text"""
-        logger.debug(f"[FuseParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[FuseParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[FuseParser] Detected Fuse")
+        logger.debug("[FuseParser] Detected Fuse")
         
         return []
 
@@ -27,7 +27,7 @@ class GiftParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Gift reminder text"""
-        logger.debug(f"[GiftParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[GiftParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "promise" not in lower or "opponent" not in lower or "gift" not in lower:
@@ -35,27 +35,27 @@ class GiftParser:
         
         m = GIFT_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[GiftParser] No gift type found in reminder text")
+            logger.debug("[GiftParser] No gift type found in reminder text")
             return []
         
         gift_type = m.group(1).strip()
         
-        logger.debug(f"[GiftParser] Detected Gift (spell modifier, handled by Axis3)")
+        logger.debug("[GiftParser] Detected Gift (spell modifier, handled by Axis3)")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Gift keyword without reminder text (e.g., 'Gift a Food', 'Gift a card')"""
-        logger.debug(f"[GiftParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[GiftParser] Parsing keyword only: %s", keyword_text)
         
         m = GIFT_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[GiftParser] No gift type found in keyword text")
+            logger.debug("[GiftParser] No gift type found in keyword text")
             return []
         
         gift_type = m.group(1).strip()
         
-        logger.debug(f"[GiftParser] Detected Gift (spell modifier, handled by Axis3)")
+        logger.debug("[GiftParser] Detected Gift (spell modifier, handled by Axis3)")
         
         return []
 
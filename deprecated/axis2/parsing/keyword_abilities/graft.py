@@ -27,7 +27,7 @@ class GraftParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Graft reminder text into ReplacementEffect and TriggeredAbility"""
-        logger.debug(f"[GraftParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[GraftParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "enters the battlefield" not in lower or "+1/+1 counter" not in lower:
@@ -35,7 +35,7 @@ class GraftParser:
         
         m = GRAFT_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[GraftParser] No graft value found in reminder text")
+            logger.debug("[GraftParser] No graft value found in reminder text")
             return []
         
         graft_value = int(m.group(1))
@@ -67,17 +67,17 @@ class GraftParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[GraftParser] Created ReplacementEffect and TriggeredAbility for Graft {graft_value}")
+        logger.debug("[GraftParser] Created ReplacementEffect and TriggeredAbility for Graft %s", graft_value)
         
         return [replacement_effect, triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Graft keyword without reminder text (e.g., 'Graft 3')"""
-        logger.debug(f"[GraftParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[GraftParser] Parsing keyword only: %s", keyword_text)
         
         m = GRAFT_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[GraftParser] No graft value found in keyword text")
+            logger.debug("[GraftParser] No graft value found in keyword text")
             return []
         
         graft_value = int(m.group(1))
@@ -109,7 +109,7 @@ class GraftParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[GraftParser] Created ReplacementEffect and TriggeredAbility for Graft {graft_value}")
+        logger.debug("[GraftParser] Created ReplacementEffect and TriggeredAbility for Graft %s", graft_value)
         
         return [replacement_effect, triggered_ability]
 
@@ -21,7 +21,7 @@ class GravestormParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Gravestorm reminder text into TriggeredAbility"""
-        logger.debug(f"[GravestormParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[GravestormParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "copy it" not in lower:
@@ -35,13 +35,13 @@ class GravestormParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[GravestormParser] Created TriggeredAbility for Gravestorm")
+        logger.debug("[GravestormParser] Created TriggeredAbility for Gravestorm")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Gravestorm keyword without reminder text"""
-        logger.debug(f"[GravestormParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[GravestormParser] Parsing keyword only: %s", keyword_text)
         
         triggered_ability = TriggeredAbility(
             condition_text="When you cast this spell, copy it for each permanent that was put into a graveyard from the battlefield this turn. If the spell has any targets, you may choose new targets for any of the copies.",
@@ -51,7 +51,7 @@ class GravestormParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[GravestormParser] Created TriggeredAbility for Gravestorm")
+        logger.debug("[GravestormParser] Created TriggeredAbility for Gravestorm")
         
         return [triggered_ability]
 
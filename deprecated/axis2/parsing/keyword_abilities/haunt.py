@@ -21,7 +21,7 @@ class HauntParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Haunt reminder text into TriggeredAbility"""
-        logger.debug(f"[HauntParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[HauntParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "dies" not in lower or "exile it" not in lower or "haunting" not in lower:
@@ -50,13 +50,13 @@ class HauntParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[HauntParser] Created TriggeredAbility for Haunt")
+        logger.debug("[HauntParser] Created TriggeredAbility for Haunt")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Haunt keyword without reminder text"""
-        logger.debug(f"[HauntParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[HauntParser] Parsing keyword only: %s", keyword_text)
         
         exile_effect = ChangeZoneEffect(
             subject=Subject(scope="self"),
@@ -81,7 +81,7 @@ class HauntParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[HauntParser] Created TriggeredAbility for Haunt")
+        logger.debug("[HauntParser] Created TriggeredAbility for Haunt")
         
         return [triggered_ability]
 
@@ -21,21 +21,21 @@ class HiddenAgendaParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Hidden Agenda reminder text"""
-        logger.debug(f"[HiddenAgendaParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[HiddenAgendaParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "command zone" not in lower or "face down" not in lower:
             return []
         
-        logger.debug(f"[HiddenAgendaParser] Detected Hidden Agenda")
+        logger.debug("[HiddenAgendaParser] Detected Hidden Agenda")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Hidden Agenda keyword without reminder text"""
-        logger.debug(f"[HiddenAgendaParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[HiddenAgendaParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[HiddenAgendaParser] Detected Hidden Agenda")
+        logger.debug("[HiddenAgendaParser] Detected Hidden Agenda")
         
         return []
 
@@ -27,7 +27,7 @@ class HideawayParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Hideaway reminder text into TriggeredAbility"""
-        logger.debug(f"[HideawayParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[HideawayParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "enters" not in lower or "look at" not in lower or "exile" not in lower:
@@ -35,7 +35,7 @@ class HideawayParser:
         
         m = HIDEAWAY_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[HideawayParser] No hideaway value found in reminder text")
+            logger.debug("[HideawayParser] No hideaway value found in reminder text")
             return []
         
         hideaway_value = int(m.group(1))
@@ -59,17 +59,17 @@ class HideawayParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[HideawayParser] Created TriggeredAbility for Hideaway {hideaway_value}")
+        logger.debug("[HideawayParser] Created TriggeredAbility for Hideaway %s", hideaway_value)
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Hideaway keyword without reminder text (e.g., 'Hideaway 4')"""
-        logger.debug(f"[HideawayParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[HideawayParser] Parsing keyword only: %s", keyword_text)
         
         m = HIDEAWAY_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[HideawayParser] No hideaway value found in keyword text")
+            logger.debug("[HideawayParser] No hideaway value found in keyword text")
             return []
         
         hideaway_value = int(m.group(1))
@@ -93,7 +93,7 @@ class HideawayParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[HideawayParser] Created TriggeredAbility for Hideaway {hideaway_value}")
+        logger.debug("[HideawayParser] Created TriggeredAbility for Hideaway %s", hideaway_value)
         
         return [triggered_ability]
 
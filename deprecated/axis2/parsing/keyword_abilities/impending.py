@@ -27,7 +27,7 @@ class ImpendingParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Impending reminder text into ReplacementEffect, ContinuousEffect, and TriggeredAbility"""
-        logger.debug(f"[ImpendingParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ImpendingParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "time counter" not in lower or "isn't a creature" not in lower:
@@ -35,7 +35,7 @@ class ImpendingParser:
         
         m = IMPENDING_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[ImpendingParser] No impending value or cost found in reminder text")
+            logger.debug("[ImpendingParser] No impending value or cost found in reminder text")
             return []
         
         impending_value = int(m.group(1))
@@ -79,17 +79,17 @@ class ImpendingParser:
             condition="impending_cost_was_paid_and_has_time_counters"
         )
         
-        logger.debug(f"[ImpendingParser] Created ReplacementEffect, ContinuousEffect, and TriggeredAbility for Impending {impending_value}")
+        logger.debug("[ImpendingParser] Created ReplacementEffect, ContinuousEffect, and TriggeredAbility for Impending %s", impending_value)
         
         return [replacement_effect, continuous_effect, triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Impending keyword without reminder text (e.g., 'Impending 4 — {1}{G}{G}')"""
-        logger.debug(f"[ImpendingParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ImpendingParser] Parsing keyword only: %s", keyword_text)
         
         m = IMPENDING_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[ImpendingParser] No impending value or cost found in keyword text")
+            logger.debug("[ImpendingParser] No impending value or cost found in keyword text")
             return []
         
         impending_value = int(m.group(1))
@@ -133,7 +133,7 @@ class ImpendingParser:
             condition="impending_cost_was_paid_and_has_time_counters"
         )
         
-        logger.debug(f"[ImpendingParser] Created ReplacementEffect, ContinuousEffect, and TriggeredAbility for Impending {impending_value}")
+        logger.debug("[ImpendingParser] Created ReplacementEffect, ContinuousEffect, and TriggeredAbility for Impending %s", impending_value)
         
         return [replacement_effect, continuous_effect, triggered_ability]
 
@@ -21,21 +21,21 @@ class ImproviseParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Improvise reminder text"""
-        logger.debug(f"[ImproviseParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ImproviseParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "artifacts" not in lower or "cast this spell" not in lower:
             return []
         
-        logger.debug(f"[ImproviseParser] Detected Improvise")
+        logger.debug("[ImproviseParser] Detected Improvise")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Improvise keyword without reminder text"""
-        logger.debug(f"[ImproviseParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ImproviseParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[ImproviseParser] Detected Improvise")
+        logger.debug("[ImproviseParser] Detected Improvise")
         
         return []
 
@@ -21,7 +21,7 @@ class InfectParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Infect reminder text into ContinuousEffect"""
-        logger.debug(f"[InfectParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[InfectParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "deals damage" not in lower:
@@ -36,13 +36,13 @@ class InfectParser:
             source_kind="static_ability"
         )
         
-        logger.debug(f"[InfectParser] Created ContinuousEffect for Infect")
+        logger.debug("[InfectParser] Created ContinuousEffect for Infect")
         
         return [continuous_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Infect keyword without reminder text"""
-        logger.debug(f"[InfectParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[InfectParser] Parsing keyword only: %s", keyword_text)
         
         continuous_effect = ContinuousEffect(
             kind="damage_modification",
@@ -53,7 +53,7 @@ class InfectParser:
             source_kind="static_ability"
         )
         
-        logger.debug(f"[InfectParser] Created ContinuousEffect for Infect")
+        logger.debug("[InfectParser] Created ContinuousEffect for Infect")
         
         return [continuous_effect]
 
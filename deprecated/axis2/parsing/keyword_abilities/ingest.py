@@ -21,7 +21,7 @@ class IngestParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Ingest reminder text into TriggeredAbility"""
-        logger.debug(f"[IngestParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[IngestParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "deals combat damage to a player" not in lower or "exiles the top card" not in lower:
@@ -42,13 +42,13 @@ class IngestParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[IngestParser] Created TriggeredAbility for Ingest")
+        logger.debug("[IngestParser] Created TriggeredAbility for Ingest")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Ingest keyword without reminder text"""
-        logger.debug(f"[IngestParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[IngestParser] Parsing keyword only: %s", keyword_text)
         
         exile_effect = ChangeZoneEffect(
             subject=Subject(scope="top_card", controller="damaged_player", filters={"zone": "library"}),
@@ -65,7 +65,7 @@ class IngestParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[IngestParser] Created TriggeredAbility for Ingest")
+        logger.debug("[IngestParser] Created TriggeredAbility for Ingest")
         
         return [triggered_ability]
 
@@ -21,21 +21,21 @@ class JumpStartParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Jump-Start reminder text"""
-        logger.debug(f"[JumpStartParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[JumpStartParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this card" not in lower or "graveyard" not in lower or "discarding a card" not in lower:
             return []
         
-        logger.debug(f"[JumpStartParser] Detected Jump-Start")
+        logger.debug("[JumpStartParser] Detected Jump-Start")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Jump-Start keyword without reminder text"""
-        logger.debug(f"[JumpStartParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[JumpStartParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[JumpStartParser] Detected Jump-Start")
+        logger.debug("[JumpStartParser] Detected Jump-Start")
         
         return []
 
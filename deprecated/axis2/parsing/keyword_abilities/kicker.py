@@ -27,7 +27,7 @@ class KickerParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Kicker reminder text"""
-        logger.debug(f"[KickerParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[KickerParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "pay an additional" not in lower or "cast this spell" not in lower:
@@ -39,22 +39,22 @@ class KickerParser:
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[KickerParser] Detected Kicker with cost: {cost_text}")
+        logger.debug("[KickerParser] Detected Kicker with cost: %s", cost_text)
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Kicker keyword without reminder text (e.g., 'Kicker {2}{B}')"""
-        logger.debug(f"[KickerParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[KickerParser] Parsing keyword only: %s", keyword_text)
         
         m = KICKER_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[KickerParser] No cost found in keyword text")
+            logger.debug("[KickerParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[KickerParser] Detected Kicker with cost: {cost_text}")
+        logger.debug("[KickerParser] Detected Kicker with cost: %s", cost_text)
         
         return []
 
@@ -72,7 +72,7 @@ class MultikickerParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Multikicker reminder text"""
-        logger.debug(f"[MultikickerParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[MultikickerParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "pay an additional" not in lower or "any number of times" not in lower:
@@ -84,22 +84,22 @@ class MultikickerParser:
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[MultikickerParser] Detected Multikicker with cost: {cost_text}")
+        logger.debug("[MultikickerParser] Detected Multikicker with cost: %s", cost_text)
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Multikicker keyword without reminder text (e.g., 'Multikicker {1}{R}')"""
-        logger.debug(f"[MultikickerParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[MultikickerParser] Parsing keyword only: %s", keyword_text)
         
         m = KICKER_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[MultikickerParser] No cost found in keyword text")
+            logger.debug("[MultikickerParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[MultikickerParser] Detected Multikicker with cost: {cost_text}")
+        logger.debug("[MultikickerParser] Detected Multikicker with cost: %s", cost_text)
         
         return []
 
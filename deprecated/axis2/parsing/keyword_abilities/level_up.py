@@ -28,7 +28,7 @@ class LevelUpParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Level Up reminder text into ActivatedAbility"""
-        logger.debug(f"[LevelUpParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[LevelUpParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "put a level counter" not in lower:
@@ -56,17 +56,17 @@ class LevelUpParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[LevelUpParser] Created ActivatedAbility for Level Up")
+        logger.debug("[LevelUpParser] Created ActivatedAbility for Level Up")
         
         return [activated_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Level Up keyword without reminder text (e.g., 'Level up {2}{G}')"""
-        logger.debug(f"[LevelUpParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[LevelUpParser] Parsing keyword only: %s", keyword_text)
         
         m = LEVEL_UP_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[LevelUpParser] No cost found in keyword text")
+            logger.debug("[LevelUpParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -87,7 +87,7 @@ class LevelUpParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[LevelUpParser] Created ActivatedAbility for Level Up {cost_text}")
+        logger.debug("[LevelUpParser] Created ActivatedAbility for Level Up %s", cost_text)
         
         return [activated_ability]
 
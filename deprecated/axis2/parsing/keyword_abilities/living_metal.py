@@ -21,7 +21,7 @@ class LivingMetalParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Living Metal reminder text into ContinuousEffect"""
-        logger.debug(f"[LivingMetalParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[LivingMetalParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "your turn" not in lower or "creature" not in lower:
@@ -38,13 +38,13 @@ class LivingMetalParser:
             source_kind="static_ability"
         )
         
-        logger.debug(f"[LivingMetalParser] Created ContinuousEffect for Living Metal")
+        logger.debug("[LivingMetalParser] Created ContinuousEffect for Living Metal")
         
         return [continuous_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Living Metal keyword without reminder text"""
-        logger.debug(f"[LivingMetalParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[LivingMetalParser] Parsing keyword only: %s", keyword_text)
         
         continuous_effect = ContinuousEffect(
             kind="type_add",
@@ -57,7 +57,7 @@ class LivingMetalParser:
             source_kind="static_ability"
         )
         
-        logger.debug(f"[LivingMetalParser] Created ContinuousEffect for Living Metal")
+        logger.debug("[LivingMetalParser] Created ContinuousEffect for Living Metal")
         
         return [continuous_effect]
 
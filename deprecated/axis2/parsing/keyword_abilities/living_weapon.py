@@ -21,7 +21,7 @@ class LivingWeaponParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Living Weapon reminder text into TriggeredAbility"""
-        logger.debug(f"[LivingWeaponParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[LivingWeaponParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "enters" not in lower or "germ" not in lower or "token" not in lower:
@@ -55,13 +55,13 @@ class LivingWeaponParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[LivingWeaponParser] Created TriggeredAbility for Living Weapon")
+        logger.debug("[LivingWeaponParser] Created TriggeredAbility for Living Weapon")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Living Weapon keyword without reminder text"""
-        logger.debug(f"[LivingWeaponParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[LivingWeaponParser] Parsing keyword only: %s", keyword_text)
         
         create_token_effect = CreateTokenEffect(
             amount=1,
@@ -91,7 +91,7 @@ class LivingWeaponParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[LivingWeaponParser] Created TriggeredAbility for Living Weapon")
+        logger.debug("[LivingWeaponParser] Created TriggeredAbility for Living Weapon")
         
         return [triggered_ability]
 
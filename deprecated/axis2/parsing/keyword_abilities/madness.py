@@ -27,7 +27,7 @@ class MadnessParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Madness reminder text"""
-        logger.debug(f"[MadnessParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[MadnessParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "discard this card" not in lower or "madness cost" not in lower:
@@ -39,22 +39,22 @@ class MadnessParser:
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[MadnessParser] Detected Madness with cost: {cost_text}")
+        logger.debug("[MadnessParser] Detected Madness with cost: %s", cost_text)
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Madness keyword without reminder text (e.g., 'Madness {1}{B}')"""
-        logger.debug(f"[MadnessParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[MadnessParser] Parsing keyword only: %s", keyword_text)
         
         m = MADNESS_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[MadnessParser] No cost found in keyword text")
+            logger.debug("[MadnessParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[MadnessParser] Detected Madness with cost: {cost_text}")
+        logger.debug("[MadnessParser] Detected Madness with cost: %s", cost_text)
         
         return []
 
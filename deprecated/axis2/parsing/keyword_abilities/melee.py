@@ -21,7 +21,7 @@ class MeleeParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Melee reminder text into TriggeredAbility"""
-        logger.debug(f"[MeleeParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[MeleeParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "attacks" not in lower or "gets +1/+1" not in lower or "opponent" not in lower:
@@ -47,13 +47,13 @@ class MeleeParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[MeleeParser] Created TriggeredAbility for Melee")
+        logger.debug("[MeleeParser] Created TriggeredAbility for Melee")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Melee keyword without reminder text"""
-        logger.debug(f"[MeleeParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[MeleeParser] Parsing keyword only: %s", keyword_text)
         
         pt_effect = ContinuousEffect(
             kind="pt_mod",
@@ -75,7 +75,7 @@ class MeleeParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[MeleeParser] Created TriggeredAbility for Melee")
+        logger.debug("[MeleeParser] Created TriggeredAbility for Melee")
         
         return [triggered_ability]
 
@@ -21,21 +21,21 @@ class MenaceParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Menace reminder text"""
-        logger.debug(f"[MenaceParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[MenaceParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "can't be blocked" not in lower or "two or more creatures" not in lower:
             return []
         
-        logger.debug(f"[MenaceParser] Detected Menace")
+        logger.debug("[MenaceParser] Detected Menace")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Menace keyword without reminder text"""
-        logger.debug(f"[MenaceParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[MenaceParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[MenaceParser] Detected Menace")
+        logger.debug("[MenaceParser] Detected Menace")
         
         return []
 
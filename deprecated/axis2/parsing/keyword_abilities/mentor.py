@@ -21,7 +21,7 @@ class MentorParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Mentor reminder text into TriggeredAbility"""
-        logger.debug(f"[MentorParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[MentorParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "attacks" not in lower or "+1/+1 counter" not in lower or "attacking creature" not in lower:
@@ -49,13 +49,13 @@ class MentorParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[MentorParser] Created TriggeredAbility for Mentor")
+        logger.debug("[MentorParser] Created TriggeredAbility for Mentor")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Mentor keyword without reminder text"""
-        logger.debug(f"[MentorParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[MentorParser] Parsing keyword only: %s", keyword_text)
         
         put_counter_effect = PutCounterEffect(
             counter_type="+1/+1",
@@ -79,7 +79,7 @@ class MentorParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[MentorParser] Created TriggeredAbility for Mentor")
+        logger.debug("[MentorParser] Created TriggeredAbility for Mentor")
         
         return [triggered_ability]
 
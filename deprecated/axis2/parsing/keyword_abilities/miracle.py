@@ -27,7 +27,7 @@ class MiracleParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Miracle reminder text into TriggeredAbility"""
-        logger.debug(f"[MiracleParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[MiracleParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this card" not in lower or "draw it" not in lower:
@@ -48,17 +48,17 @@ class MiracleParser:
             condition="first_card_drawn_this_turn"
         )
         
-        logger.debug(f"[MiracleParser] Created TriggeredAbility for Miracle")
+        logger.debug("[MiracleParser] Created TriggeredAbility for Miracle")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Miracle keyword without reminder text (e.g., 'Miracle {W}')"""
-        logger.debug(f"[MiracleParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[MiracleParser] Parsing keyword only: %s", keyword_text)
         
         m = MIRACLE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[MiracleParser] No cost found in keyword text")
+            logger.debug("[MiracleParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -72,7 +72,7 @@ class MiracleParser:
             condition="first_card_drawn_this_turn"
         )
         
-        logger.debug(f"[MiracleParser] Created TriggeredAbility for Miracle {cost_text}")
+        logger.debug("[MiracleParser] Created TriggeredAbility for Miracle %s", cost_text)
         
         return [triggered_ability]
 
@@ -28,7 +28,7 @@ class ModularParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Modular reminder text into ReplacementEffect and TriggeredAbility"""
-        logger.debug(f"[ModularParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ModularParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "enters" not in lower or "+1/+1 counter" not in lower:
@@ -36,7 +36,7 @@ class ModularParser:
         
         m = MODULAR_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[ModularParser] No modular value found in reminder text")
+            logger.debug("[ModularParser] No modular value found in reminder text")
             return []
         
         modular_value = int(m.group(1))
@@ -74,17 +74,17 @@ class ModularParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[ModularParser] Created ReplacementEffect and TriggeredAbility for Modular {modular_value}")
+        logger.debug("[ModularParser] Created ReplacementEffect and TriggeredAbility for Modular %s", modular_value)
         
         return [replacement_effect, triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Modular keyword without reminder text (e.g., 'Modular 3')"""
-        logger.debug(f"[ModularParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ModularParser] Parsing keyword only: %s", keyword_text)
         
         m = MODULAR_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[ModularParser] No modular value found in keyword text")
+            logger.debug("[ModularParser] No modular value found in keyword text")
             return []
         
         modular_value = int(m.group(1))
@@ -122,7 +122,7 @@ class ModularParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[ModularParser] Created ReplacementEffect and TriggeredAbility for Modular {modular_value}")
+        logger.debug("[ModularParser] Created ReplacementEffect and TriggeredAbility for Modular %s", modular_value)
         
         return [replacement_effect, triggered_ability]
 
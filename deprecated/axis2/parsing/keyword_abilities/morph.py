@@ -27,7 +27,7 @@ class MorphParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Morph reminder text"""
-        logger.debug(f"[MorphParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[MorphParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this face down" not in lower and "cast this card face down" not in lower:
@@ -39,22 +39,22 @@ class MorphParser:
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[MorphParser] Detected Morph with cost: {cost_text}")
+        logger.debug("[MorphParser] Detected Morph with cost: %s", cost_text)
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Morph keyword without reminder text (e.g., 'Morph {U}')"""
-        logger.debug(f"[MorphParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[MorphParser] Parsing keyword only: %s", keyword_text)
         
         m = MORPH_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[MorphParser] No cost found in keyword text")
+            logger.debug("[MorphParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[MorphParser] Detected Morph with cost: {cost_text}")
+        logger.debug("[MorphParser] Detected Morph with cost: %s", cost_text)
         
         return []
 
@@ -72,7 +72,7 @@ class MegamorphParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Megamorph reminder text"""
-        logger.debug(f"[MegamorphParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[MegamorphParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this face down" not in lower or "+1/+1 counter" not in lower:
@@ -84,22 +84,22 @@ class MegamorphParser:
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[MegamorphParser] Detected Megamorph with cost: {cost_text}")
+        logger.debug("[MegamorphParser] Detected Megamorph with cost: %s", cost_text)
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Megamorph keyword without reminder text (e.g., 'Megamorph {5}{W}{W}')"""
-        logger.debug(f"[MegamorphParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[MegamorphParser] Parsing keyword only: %s", keyword_text)
         
         m = MORPH_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[MegamorphParser] No cost found in keyword text")
+            logger.debug("[MegamorphParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[MegamorphParser] Detected Megamorph with cost: {cost_text}")
+        logger.debug("[MegamorphParser] Detected Megamorph with cost: %s", cost_text)
         
         return []
 
@@ -27,7 +27,7 @@ class MutateParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Mutate reminder text"""
-        logger.debug(f"[MutateParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[MutateParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "mutate cost" not in lower:
@@ -36,22 +36,22 @@ class MutateParser:
         m = MUTATE_RE.search(reminder_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[MutateParser] Detected Mutate cost: {cost_text}")
+            logger.debug("[MutateParser] Detected Mutate cost: %s", cost_text)
         
-        logger.debug(f"[MutateParser] Detected Mutate")
+        logger.debug("[MutateParser] Detected Mutate")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Mutate keyword without reminder text (e.g., 'Mutate {2}{W}')"""
-        logger.debug(f"[MutateParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[MutateParser] Parsing keyword only: %s", keyword_text)
         
         m = MUTATE_RE.search(keyword_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[MutateParser] Detected Mutate cost: {cost_text}")
+            logger.debug("[MutateParser] Detected Mutate cost: %s", cost_text)
         
-        logger.debug(f"[MutateParser] Detected Mutate")
+        logger.debug("[MutateParser] Detected Mutate")
         
         return []
 
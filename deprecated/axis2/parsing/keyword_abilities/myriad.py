@@ -21,7 +21,7 @@ class MyriadParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Myriad reminder text into TriggeredAbility"""
-        logger.debug(f"[MyriadParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[MyriadParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "attacks" not in lower or "token" not in lower or "copy" not in lower:
@@ -61,13 +61,13 @@ class MyriadParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[MyriadParser] Created TriggeredAbility and delayed TriggeredAbility for Myriad")
+        logger.debug("[MyriadParser] Created TriggeredAbility and delayed TriggeredAbility for Myriad")
         
         return [triggered_ability, end_combat_trigger]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Myriad keyword without reminder text"""
-        logger.debug(f"[MyriadParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[MyriadParser] Parsing keyword only: %s", keyword_text)
         
         create_token_effect = CreateTokenEffect(
             amount=1,
@@ -103,7 +103,7 @@ class MyriadParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[MyriadParser] Created TriggeredAbility and delayed TriggeredAbility for Myriad")
+        logger.debug("[MyriadParser] Created TriggeredAbility and delayed TriggeredAbility for Myriad")
         
         return [triggered_ability, end_combat_trigger]
 
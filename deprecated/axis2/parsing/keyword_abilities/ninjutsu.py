@@ -29,7 +29,7 @@ class NinjutsuParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Ninjutsu reminder text into ActivatedAbility"""
-        logger.debug(f"[NinjutsuParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[NinjutsuParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "return an unblocked" not in lower or "put this card onto the battlefield" not in lower:
@@ -77,17 +77,17 @@ class NinjutsuParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[NinjutsuParser] Created ActivatedAbility for Ninjutsu")
+        logger.debug("[NinjutsuParser] Created ActivatedAbility for Ninjutsu")
         
         return [activated_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Ninjutsu keyword without reminder text (e.g., 'Ninjutsu {1}{U}')"""
-        logger.debug(f"[NinjutsuParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[NinjutsuParser] Parsing keyword only: %s", keyword_text)
         
         m = NINJUTSU_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[NinjutsuParser] No cost found in keyword text")
+            logger.debug("[NinjutsuParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -128,7 +128,7 @@ class NinjutsuParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[NinjutsuParser] Created ActivatedAbility for Ninjutsu {cost_text}")
+        logger.debug("[NinjutsuParser] Created ActivatedAbility for Ninjutsu %s", cost_text)
         
         return [activated_ability]
 
@@ -146,7 +146,7 @@ class CommanderNinjutsuParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Commander ninjutsu reminder text into ActivatedAbility"""
-        logger.debug(f"[CommanderNinjutsuParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[CommanderNinjutsuParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "return an unblocked" not in lower:
@@ -194,17 +194,17 @@ class CommanderNinjutsuParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[CommanderNinjutsuParser] Created ActivatedAbility for Commander ninjutsu")
+        logger.debug("[CommanderNinjutsuParser] Created ActivatedAbility for Commander ninjutsu")
         
         return [activated_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Commander ninjutsu keyword without reminder text"""
-        logger.debug(f"[CommanderNinjutsuParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[CommanderNinjutsuParser] Parsing keyword only: %s", keyword_text)
         
         m = NINJUTSU_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[CommanderNinjutsuParser] No cost found in keyword text")
+            logger.debug("[CommanderNinjutsuParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -245,7 +245,7 @@ class CommanderNinjutsuParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[CommanderNinjutsuParser] Created ActivatedAbility for Commander ninjutsu {cost_text}")
+        logger.debug("[CommanderNinjutsuParser] Created ActivatedAbility for Commander ninjutsu %s", cost_text)
         
         return [activated_ability]
 
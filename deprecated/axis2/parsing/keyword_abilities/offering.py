@@ -27,7 +27,7 @@ class OfferingParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Offering reminder text"""
-        logger.debug(f"[OfferingParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[OfferingParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "sacrifice" not in lower or "cast this card" not in lower:
@@ -39,22 +39,22 @@ class OfferingParser:
         
         offering_type = m.group(1).strip()
         
-        logger.debug(f"[OfferingParser] Detected {offering_type} offering")
+        logger.debug("[OfferingParser] Detected %s offering", offering_type)
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Offering keyword without reminder text (e.g., 'Rat offering')"""
-        logger.debug(f"[OfferingParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[OfferingParser] Parsing keyword only: %s", keyword_text)
         
         m = OFFERING_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[OfferingParser] No offering type found in keyword text")
+            logger.debug("[OfferingParser] No offering type found in keyword text")
             return []
         
         offering_type = m.group(1).strip()
         
-        logger.debug(f"[OfferingParser] Detected {offering_type} offering")
+        logger.debug("[OfferingParser] Detected %s offering", offering_type)
         
         return []
 
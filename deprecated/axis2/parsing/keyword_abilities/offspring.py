@@ -27,7 +27,7 @@ class OffspringParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Offspring reminder text into TriggeredAbility"""
-        logger.debug(f"[OffspringParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[OffspringParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "pay an additional" not in lower or "enters" not in lower or "create a token" not in lower or "1/1" not in lower:
@@ -35,7 +35,7 @@ class OffspringParser:
         
         m = OFFSPRING_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[OffspringParser] No offspring cost found in reminder text")
+            logger.debug("[OffspringParser] No offspring cost found in reminder text")
             return []
         
         offspring_cost = m.group(1).strip()
@@ -60,17 +60,17 @@ class OffspringParser:
             condition="offspring_cost_was_paid"
         )
         
-        logger.debug(f"[OffspringParser] Created TriggeredAbility for Offspring")
+        logger.debug("[OffspringParser] Created TriggeredAbility for Offspring")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Offspring keyword without reminder text (e.g., 'Offspring {4}')"""
-        logger.debug(f"[OffspringParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[OffspringParser] Parsing keyword only: %s", keyword_text)
         
         m = OFFSPRING_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[OffspringParser] No offspring cost found in keyword text")
+            logger.debug("[OffspringParser] No offspring cost found in keyword text")
             return []
         
         offspring_cost = m.group(1).strip()
@@ -95,7 +95,7 @@ class OffspringParser:
             condition="offspring_cost_was_paid"
         )
         
-        logger.debug(f"[OffspringParser] Created TriggeredAbility for Offspring")
+        logger.debug("[OffspringParser] Created TriggeredAbility for Offspring")
         
         return [triggered_ability]
 
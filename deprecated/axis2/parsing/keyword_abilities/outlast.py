@@ -28,7 +28,7 @@ class OutlastParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Outlast reminder text into ActivatedAbility"""
-        logger.debug(f"[OutlastParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[OutlastParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "put a +1/+1 counter" not in lower:
@@ -58,17 +58,17 @@ class OutlastParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[OutlastParser] Created ActivatedAbility for Outlast")
+        logger.debug("[OutlastParser] Created ActivatedAbility for Outlast")
         
         return [activated_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Outlast keyword without reminder text (e.g., 'Outlast {2}{W}')"""
-        logger.debug(f"[OutlastParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[OutlastParser] Parsing keyword only: %s", keyword_text)
         
         m = OUTLAST_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[OutlastParser] No cost found in keyword text")
+            logger.debug("[OutlastParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -91,7 +91,7 @@ class OutlastParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[OutlastParser] Created ActivatedAbility for Outlast {cost_text}")
+        logger.debug("[OutlastParser] Created ActivatedAbility for Outlast %s", cost_text)
         
         return [activated_ability]
 
@@ -27,7 +27,7 @@ class OverloadParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Overload reminder text"""
-        logger.debug(f"[OverloadParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[OverloadParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "overload cost" not in lower:
@@ -36,22 +36,22 @@ class OverloadParser:
         m = OVERLOAD_RE.search(reminder_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[OverloadParser] Detected Overload cost: {cost_text}")
+            logger.debug("[OverloadParser] Detected Overload cost: %s", cost_text)
         
-        logger.debug(f"[OverloadParser] Detected Overload")
+        logger.debug("[OverloadParser] Detected Overload")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Overload keyword without reminder text (e.g., 'Overload {X}{X}{R}{R}')"""
-        logger.debug(f"[OverloadParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[OverloadParser] Parsing keyword only: %s", keyword_text)
         
         m = OVERLOAD_RE.search(keyword_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[OverloadParser] Detected Overload cost: {cost_text}")
+            logger.debug("[OverloadParser] Detected Overload cost: %s", cost_text)
         
-        logger.debug(f"[OverloadParser] Detected Overload")
+        logger.debug("[OverloadParser] Detected Overload")
         
         return []
 
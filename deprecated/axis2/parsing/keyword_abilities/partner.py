@@ -27,14 +27,14 @@ class PartnerParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Partner reminder text"""
-        logger.debug(f"[PartnerParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[PartnerParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         
         m = PARTNER_WITH_RE.search(reminder_text)
         if m:
             partner_name = m.group(1).strip()
-            logger.debug(f"[PartnerParser] Detected Partner with: {partner_name}")
+            logger.debug("[PartnerParser] Detected Partner with: %s", partner_name)
             
             if "enters" in lower and "search" in lower:
                 search_effect = SearchEffect(
@@ -62,23 +62,23 @@ class PartnerParser:
                     trigger_filter=None
                 )
                 
-                logger.debug(f"[PartnerParser] Created TriggeredAbility for Partner with {partner_name}")
+                logger.debug("[PartnerParser] Created TriggeredAbility for Partner with %s", partner_name)
                 return [triggered_ability]
         
-        logger.debug(f"[PartnerParser] Detected Partner (deck construction only)")
+        logger.debug("[PartnerParser] Detected Partner (deck construction only)")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Partner keyword without reminder text"""
-        logger.debug(f"[PartnerParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[PartnerParser] Parsing keyword only: %s", keyword_text)
         
         m = PARTNER_WITH_RE.search(keyword_text)
         if m:
             partner_name = m.group(1).strip()
-            logger.debug(f"[PartnerParser] Detected Partner with: {partner_name}")
+            logger.debug("[PartnerParser] Detected Partner with: %s", partner_name)
         
-        logger.debug(f"[PartnerParser] Detected Partner (deck construction only)")
+        logger.debug("[PartnerParser] Detected Partner (deck construction only)")
         
         return []
 
@@ -21,7 +21,7 @@ class PersistParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Persist reminder text into TriggeredAbility"""
-        logger.debug(f"[PersistParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[PersistParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "dies" not in lower or "return it to the battlefield" not in lower or "-1/-1 counter" not in lower:
@@ -47,13 +47,13 @@ class PersistParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[PersistParser] Created TriggeredAbility for Persist")
+        logger.debug("[PersistParser] Created TriggeredAbility for Persist")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Persist keyword without reminder text"""
-        logger.debug(f"[PersistParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[PersistParser] Parsing keyword only: %s", keyword_text)
         
         return_effect = ChangeZoneEffect(
             subject=Subject(scope="self"),
@@ -75,7 +75,7 @@ class PersistParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[PersistParser] Created TriggeredAbility for Persist")
+        logger.debug("[PersistParser] Created TriggeredAbility for Persist")
         
         return [triggered_ability]
 
@@ -27,7 +27,7 @@ class PlotParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Plot reminder text"""
-        logger.debug(f"[PlotParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[PlotParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "exile this card" not in lower or "cast it" not in lower:
@@ -35,27 +35,27 @@ class PlotParser:
         
         m = PLOT_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[PlotParser] No plot cost found in reminder text")
+            logger.debug("[PlotParser] No plot cost found in reminder text")
             return []
         
         plot_cost = m.group(1).strip()
         
-        logger.debug(f"[PlotParser] Detected Plot (special action, handled by Axis3)")
+        logger.debug("[PlotParser] Detected Plot (special action, handled by Axis3)")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Plot keyword without reminder text (e.g., 'Plot {2}{R}')"""
-        logger.debug(f"[PlotParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[PlotParser] Parsing keyword only: %s", keyword_text)
         
         m = PLOT_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[PlotParser] No plot cost found in keyword text")
+            logger.debug("[PlotParser] No plot cost found in keyword text")
             return []
         
         plot_cost = m.group(1).strip()
         
-        logger.debug(f"[PlotParser] Detected Plot (special action, handled by Axis3)")
+        logger.debug("[PlotParser] Detected Plot (special action, handled by Axis3)")
         
         return []
 
@@ -27,7 +27,7 @@ class PoisonousParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Poisonous reminder text into TriggeredAbility"""
-        logger.debug(f"[PoisonousParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[PoisonousParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "deals combat damage" not in lower or "player" not in lower or "poison counter" not in lower:
@@ -35,7 +35,7 @@ class PoisonousParser:
         
         m = POISONOUS_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[PoisonousParser] No poisonous value found in reminder text")
+            logger.debug("[PoisonousParser] No poisonous value found in reminder text")
             return []
         
         poisonous_value = int(m.group(1))
@@ -53,17 +53,17 @@ class PoisonousParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[PoisonousParser] Created TriggeredAbility for Poisonous {poisonous_value}")
+        logger.debug("[PoisonousParser] Created TriggeredAbility for Poisonous %s", poisonous_value)
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Poisonous keyword without reminder text (e.g., 'Poisonous 1')"""
-        logger.debug(f"[PoisonousParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[PoisonousParser] Parsing keyword only: %s", keyword_text)
         
         m = POISONOUS_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[PoisonousParser] No poisonous value found in keyword text")
+            logger.debug("[PoisonousParser] No poisonous value found in keyword text")
             return []
         
         poisonous_value = int(m.group(1))
@@ -81,7 +81,7 @@ class PoisonousParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[PoisonousParser] Created TriggeredAbility for Poisonous {poisonous_value}")
+        logger.debug("[PoisonousParser] Created TriggeredAbility for Poisonous %s", poisonous_value)
         
         return [triggered_ability]
 
@@ -21,21 +21,21 @@ class PrototypeParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Prototype reminder text"""
-        logger.debug(f"[PrototypeParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[PrototypeParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower and "prototype" not in lower:
             return []
         
-        logger.debug(f"[PrototypeParser] Detected Prototype")
+        logger.debug("[PrototypeParser] Detected Prototype")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Prototype keyword without reminder text"""
-        logger.debug(f"[PrototypeParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[PrototypeParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[PrototypeParser] Detected Prototype")
+        logger.debug("[PrototypeParser] Detected Prototype")
         
         return []
 
@@ -23,7 +23,7 @@ class ProvokeParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Provoke reminder text into TriggeredAbility"""
-        logger.debug(f"[ProvokeParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ProvokeParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "attacks" not in lower or ("block" not in lower and "untap" not in lower):
@@ -52,13 +52,13 @@ class ProvokeParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[ProvokeParser] Created TriggeredAbility for Provoke")
+        logger.debug("[ProvokeParser] Created TriggeredAbility for Provoke")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Provoke keyword without reminder text"""
-        logger.debug(f"[ProvokeParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ProvokeParser] Parsing keyword only: %s", keyword_text)
         
         condition_text = "Whenever this creature attacks, you may choose to have target creature defending player controls block this creature this combat if able. If you do, untap that creature."
         
@@ -83,7 +83,7 @@ class ProvokeParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[ProvokeParser] Created TriggeredAbility for Provoke")
+        logger.debug("[ProvokeParser] Created TriggeredAbility for Provoke")
         
         return [triggered_ability]
 
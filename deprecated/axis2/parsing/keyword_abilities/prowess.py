@@ -21,7 +21,7 @@ class ProwessParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Prowess reminder text into TriggeredAbility"""
-        logger.debug(f"[ProwessParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ProwessParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast a noncreature spell" not in lower or "gets +1/+1" not in lower:
@@ -48,13 +48,13 @@ class ProwessParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[ProwessParser] Created TriggeredAbility for Prowess")
+        logger.debug("[ProwessParser] Created TriggeredAbility for Prowess")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Prowess keyword without reminder text"""
-        logger.debug(f"[ProwessParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ProwessParser] Parsing keyword only: %s", keyword_text)
         
         pt_effect = ContinuousEffect(
             kind="pt_mod",
@@ -77,7 +77,7 @@ class ProwessParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[ProwessParser] Created TriggeredAbility for Prowess")
+        logger.debug("[ProwessParser] Created TriggeredAbility for Prowess")
         
         return [triggered_ability]
 
@@ -27,7 +27,7 @@ class ProwlParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Prowl reminder text"""
-        logger.debug(f"[ProwlParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ProwlParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this" not in lower or "prowl cost" not in lower:
@@ -39,22 +39,22 @@ class ProwlParser:
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[ProwlParser] Detected Prowl with cost: {cost_text}")
+        logger.debug("[ProwlParser] Detected Prowl with cost: %s", cost_text)
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Prowl keyword without reminder text (e.g., 'Prowl {1}{B}')"""
-        logger.debug(f"[ProwlParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ProwlParser] Parsing keyword only: %s", keyword_text)
         
         m = PROWL_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[ProwlParser] No cost found in keyword text")
+            logger.debug("[ProwlParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[ProwlParser] Detected Prowl with cost: {cost_text}")
+        logger.debug("[ProwlParser] Detected Prowl with cost: %s", cost_text)
         
         return []
 
@@ -27,7 +27,7 @@ class RampageParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Rampage reminder text into TriggeredAbility"""
-        logger.debug(f"[RampageParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[RampageParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "becomes blocked" not in lower or "gets +" not in lower:
@@ -35,7 +35,7 @@ class RampageParser:
         
         m = RAMPAGE_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[RampageParser] No rampage value found in reminder text")
+            logger.debug("[RampageParser] No rampage value found in reminder text")
             return []
         
         rampage_value = int(m.group(1))
@@ -65,17 +65,17 @@ class RampageParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[RampageParser] Created TriggeredAbility for Rampage {rampage_value}")
+        logger.debug("[RampageParser] Created TriggeredAbility for Rampage %s", rampage_value)
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Rampage keyword without reminder text (e.g., 'Rampage 2')"""
-        logger.debug(f"[RampageParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[RampageParser] Parsing keyword only: %s", keyword_text)
         
         m = RAMPAGE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[RampageParser] No rampage value found in keyword text")
+            logger.debug("[RampageParser] No rampage value found in keyword text")
             return []
         
         rampage_value = int(m.group(1))
@@ -105,7 +105,7 @@ class RampageParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[RampageParser] Created TriggeredAbility for Rampage {rampage_value}")
+        logger.debug("[RampageParser] Created TriggeredAbility for Rampage %s", rampage_value)
         
         return [triggered_ability]
 
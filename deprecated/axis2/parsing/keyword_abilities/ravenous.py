@@ -21,7 +21,7 @@ class RavenousParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Ravenous reminder text into ReplacementEffect and TriggeredAbility"""
-        logger.debug(f"[RavenousParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[RavenousParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "enters" not in lower or "+1/+1 counter" not in lower:
@@ -47,13 +47,13 @@ class RavenousParser:
             condition="X_is_5_or_more"
         )
         
-        logger.debug(f"[RavenousParser] Created ReplacementEffect and TriggeredAbility for Ravenous")
+        logger.debug("[RavenousParser] Created ReplacementEffect and TriggeredAbility for Ravenous")
         
         return [replacement_effect, draw_trigger]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Ravenous keyword without reminder text"""
-        logger.debug(f"[RavenousParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[RavenousParser] Parsing keyword only: %s", keyword_text)
         
         replacement_effect = ReplacementEffect(
             kind="enters_with_counters",
@@ -75,7 +75,7 @@ class RavenousParser:
             condition="X_is_5_or_more"
         )
         
-        logger.debug(f"[RavenousParser] Created ReplacementEffect and TriggeredAbility for Ravenous")
+        logger.debug("[RavenousParser] Created ReplacementEffect and TriggeredAbility for Ravenous")
         
         return [replacement_effect, draw_trigger]
 
@@ -21,7 +21,7 @@ class ReadAheadParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Read Ahead reminder text into ReplacementEffect"""
-        logger.debug(f"[ReadAheadParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ReadAheadParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "choose" not in lower or "lore counter" not in lower:
@@ -39,13 +39,13 @@ class ReadAheadParser:
             zones=["battlefield"]
         )
         
-        logger.debug(f"[ReadAheadParser] Created ReplacementEffect for Read Ahead")
+        logger.debug("[ReadAheadParser] Created ReplacementEffect for Read Ahead")
         
         return [replacement_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Read Ahead keyword without reminder text"""
-        logger.debug(f"[ReadAheadParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ReadAheadParser] Parsing keyword only: %s", keyword_text)
         
         replacement_effect = ReplacementEffect(
             kind="enters_with_counters",
@@ -59,7 +59,7 @@ class ReadAheadParser:
             zones=["battlefield"]
         )
         
-        logger.debug(f"[ReadAheadParser] Created ReplacementEffect for Read Ahead")
+        logger.debug("[ReadAheadParser] Created ReplacementEffect for Read Ahead")
         
         return [replacement_effect]
 
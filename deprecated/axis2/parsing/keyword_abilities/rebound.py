@@ -21,7 +21,7 @@ class ReboundParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Rebound reminder text into ReplacementEffect and TriggeredAbility"""
-        logger.debug(f"[ReboundParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ReboundParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell from your hand" not in lower or "exile it" not in lower:
@@ -58,13 +58,13 @@ class ReboundParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[ReboundParser] Created ReplacementEffect and TriggeredAbility for Rebound")
+        logger.debug("[ReboundParser] Created ReplacementEffect and TriggeredAbility for Rebound")
         
         return [replacement_effect, upkeep_trigger]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Rebound keyword without reminder text"""
-        logger.debug(f"[ReboundParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ReboundParser] Parsing keyword only: %s", keyword_text)
         
         exile_effect = ChangeZoneEffect(
             subject=Subject(scope="self"),
@@ -97,7 +97,7 @@ class ReboundParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[ReboundParser] Created ReplacementEffect and TriggeredAbility for Rebound")
+        logger.debug("[ReboundParser] Created ReplacementEffect and TriggeredAbility for Rebound")
         
         return [replacement_effect, upkeep_trigger]
 
@@ -28,7 +28,7 @@ class ReconfigureParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Reconfigure reminder text into ActivatedAbilities"""
-        logger.debug(f"[ReconfigureParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ReconfigureParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "attach" not in lower or "creature" not in lower:
@@ -36,7 +36,7 @@ class ReconfigureParser:
         
         m = RECONFIGURE_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[ReconfigureParser] No reconfigure cost found in reminder text")
+            logger.debug("[ReconfigureParser] No reconfigure cost found in reminder text")
             return []
         
         cost_text = m.group(1).strip()
@@ -74,17 +74,17 @@ class ReconfigureParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[ReconfigureParser] Created two ActivatedAbilities for Reconfigure")
+        logger.debug("[ReconfigureParser] Created two ActivatedAbilities for Reconfigure")
         
         return [attach_ability, unattach_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Reconfigure keyword without reminder text (e.g., 'Reconfigure {2}')"""
-        logger.debug(f"[ReconfigureParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ReconfigureParser] Parsing keyword only: %s", keyword_text)
         
         m = RECONFIGURE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[ReconfigureParser] No reconfigure cost found in keyword text")
+            logger.debug("[ReconfigureParser] No reconfigure cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -122,7 +122,7 @@ class ReconfigureParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[ReconfigureParser] Created two ActivatedAbilities for Reconfigure")
+        logger.debug("[ReconfigureParser] Created two ActivatedAbilities for Reconfigure")
         
         return [attach_ability, unattach_ability]
 
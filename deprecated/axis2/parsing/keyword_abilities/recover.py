@@ -28,7 +28,7 @@ class RecoverParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Recover reminder text into TriggeredAbility"""
-        logger.debug(f"[RecoverParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[RecoverParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "creature is put into your graveyard" not in lower or "pay" not in lower:
@@ -70,17 +70,17 @@ class RecoverParser:
             cost_text=cost_text
         )
         
-        logger.debug(f"[RecoverParser] Created TriggeredAbility for Recover")
+        logger.debug("[RecoverParser] Created TriggeredAbility for Recover")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Recover keyword without reminder text (e.g., 'Recover {2}{B}')"""
-        logger.debug(f"[RecoverParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[RecoverParser] Parsing keyword only: %s", keyword_text)
         
         m = RECOVER_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[RecoverParser] No cost found in keyword text")
+            logger.debug("[RecoverParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -115,7 +115,7 @@ class RecoverParser:
             cost_text=cost_text
         )
         
-        logger.debug(f"[RecoverParser] Created TriggeredAbility for Recover {cost_text}")
+        logger.debug("[RecoverParser] Created TriggeredAbility for Recover %s", cost_text)
         
         return [triggered_ability]
 
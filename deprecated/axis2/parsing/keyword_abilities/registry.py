@@ -4,6 +4,7 @@ from typing import Dict, List, Optional, Tuple
 import re
 import logging
 from axis2.schema import Effect, ParseContext
+from axis2.parsing import trace
 
 logger = logging.getLogger(__name__)
 
@@ -398,6 +399,7 @@ class KeywordAbilityRegistry:
         Returns:
             Tuple of (keyword_name, reminder_text, cost_text) or None
         """
+        active = trace.current()
         text = text.strip()
         if not text:
             return None
@@ -435,7 +437,8 @@ class KeywordAbilityRegistry:
         
         # If it doesn't start with a keyword, reject it
         if not starts_with_keyword:
-            logger.debug(f"[Registry] Rejecting '{text}' - does not start with a known keyword")
+            if active:
+                active.record("keyword_registry", "reject", text)
             return None
         
         # Now check for reminder text pattern
@@ -453,7 +456,8 @@ class KeywordAbilityRegistry:
                 cost = None
             
             keyword_name = KEYWORD_ALIASES.get(keyword_name, keyword_name)
-            logger.debug(f"[Registry] Matched keyword with reminder: '{text}' -> '{keyword_name}'")
+            if active:
+                active.record("keyword_registry", "match", text, keyword=keyword_name, reminder=True)
             return (keyword_name, reminder, cost)
         
         cost_match = KEYWORD_WITH_COST_RE.match(text)
@@ -470,7 +474,8 @@ class KeywordAbilityRegistry:
         
         # Check if the entire line is exactly a keyword name
         if keyword_name in self._parsers:
-            logger.debug(f"[Registry] Matched exact keyword: '{text}' -> '{keyword_name}'")
+            if active:
+                active.record("keyword_registry", "match", text, keyword=keyword_name, reminder=False)
             return (keyword_name, None, None)
         
         # Check for keyword patterns that match the entire line
@@ -506,35 +511,35 @@ class KeywordAbilityRegistry:
         parser = self._parsers.get(keyword_name)
         
         if parser is None:
-            logger.debug(f"[KeywordRegistry] Keyword '{keyword_name}' has no parser (simple keyword)")
+            logger.debug("[KeywordRegistry] Keyword '%s' has no parser (simple keyword)", keyword_name)
             return []
         
-        logger.debug(f"[KeywordRegistry] Parsing keyword '{keyword_name}' with parser {type(parser).__name__}")
+        logger.debug("[KeywordRegistry] Parsing keyword '%s' with parser %s", keyword_name, type(parser).__name__)
         
         try:
             if reminder_text:
                 if hasattr(parser, 'can_parse_reminder'):
                     can_parse = parser.can_parse_reminder(reminder_text)
-                    logger.debug(f"[KeywordRegistry] can_parse_reminder('{reminder_text[:50]}...'): {can_parse}")
+                    logger.debug("[KeywordRegistry] can_parse_reminder('%.50s...'): %s", reminder_text, can_parse)
                     if can_parse:
                         effects = parser.parse_reminder(reminder_text, ctx)
-                        logger.debug(f"[KeywordRegistry] Parsed {len(effects)} effects from reminder text")
+                        logger.debug("[KeywordRegistry] Parsed %d effects from reminder text", len(effects))
                         return effects
                     else:
-                        logger.warning(f"[KeywordRegistry] Parser cannot parse reminder text: '{reminder_text[:100]}'")
+                        logger.debug("[KeywordRegistry] Parser cannot parse reminder text: '%.100s'", reminder_text)
                         return []
                 else:
-                    logger.debug(f"[KeywordRegistry] Parser has no can_parse_reminder method")
+                    logger.debug("[KeywordRegistry] Parser has no can_parse_reminder method")
                     return []
             else:
                 if hasattr(parser, 'parse_keyword_only'):
                     effects = parser.parse_keyword_only(keyword_text, ctx)
-                    logger.debug(f"[KeywordRegistry] Parsed {len(effects)} effects from keyword only")
+                    logger.debug("[KeywordRegistry] Parsed %d effects from keyword only", len(effects))
                     return effects
                 else:
-                    logger.debug(f"[KeywordRegistry] Parser has no parse_keyword_only method")
+                    logger.debug("[KeywordRegistry] Parser has no parse_keyword_only method")
                     return []
         except Exception as e:
-            logger.error(f"[KeywordRegistry] Error parsing keyword '{keyword_name}': {e}")
+            logger.error("[KeywordRegistry] Error parsing keyword '%s': %s", keyword_name, e)
             return []
 
@@ -28,7 +28,7 @@ class ReinforceParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Reinforce reminder text into ActivatedAbility"""
-        logger.debug(f"[ReinforceParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ReinforceParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "discard this card" not in lower or "+1/+1 counter" not in lower:
@@ -66,17 +66,17 @@ class ReinforceParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[ReinforceParser] Created ActivatedAbility for Reinforce {reinforce_value}")
+        logger.debug("[ReinforceParser] Created ActivatedAbility for Reinforce %s", reinforce_value)
         
         return [activated_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Reinforce keyword without reminder text (e.g., 'Reinforce 1 — {1}{W}')"""
-        logger.debug(f"[ReinforceParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ReinforceParser] Parsing keyword only: %s", keyword_text)
         
         m = REINFORCE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[ReinforceParser] No reinforce value or cost found in keyword text")
+            logger.debug("[ReinforceParser] No reinforce value or cost found in keyword text")
             return []
         
         reinforce_value = int(m.group(1))
@@ -107,7 +107,7 @@ class ReinforceParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[ReinforceParser] Created ActivatedAbility for Reinforce {reinforce_value} {cost_text}")
+        logger.debug("[ReinforceParser] Created ActivatedAbility for Reinforce %s %s", reinforce_value, cost_text)
         
         return [activated_ability]
 
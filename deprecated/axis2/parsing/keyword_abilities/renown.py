@@ -27,7 +27,7 @@ class RenownParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Renown reminder text into TriggeredAbility"""
-        logger.debug(f"[RenownParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[RenownParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "deals combat damage to a player" not in lower or "renowned" not in lower:
@@ -35,7 +35,7 @@ class RenownParser:
         
         m = RENOWN_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[RenownParser] No renown value found in reminder text")
+            logger.debug("[RenownParser] No renown value found in reminder text")
             return []
         
         renown_value = int(m.group(1))
@@ -55,17 +55,17 @@ class RenownParser:
             condition="not_renowned"
         )
         
-        logger.debug(f"[RenownParser] Created TriggeredAbility for Renown {renown_value}")
+        logger.debug("[RenownParser] Created TriggeredAbility for Renown %s", renown_value)
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Renown keyword without reminder text (e.g., 'Renown 1')"""
-        logger.debug(f"[RenownParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[RenownParser] Parsing keyword only: %s", keyword_text)
         
         m = RENOWN_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[RenownParser] No renown value found in keyword text")
+            logger.debug("[RenownParser] No renown value found in keyword text")
             return []
         
         renown_value = int(m.group(1))
@@ -85,7 +85,7 @@ class RenownParser:
             condition="not_renowned"
         )
         
-        logger.debug(f"[RenownParser] Created TriggeredAbility for Renown {renown_value}")
+        logger.debug("[RenownParser] Created TriggeredAbility for Renown %s", renown_value)
         
         return [triggered_ability]
 
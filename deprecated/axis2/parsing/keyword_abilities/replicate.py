@@ -27,7 +27,7 @@ class ReplicateParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Replicate reminder text"""
-        logger.debug(f"[ReplicateParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ReplicateParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "copy it" not in lower:
@@ -39,22 +39,22 @@ class ReplicateParser:
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[ReplicateParser] Detected Replicate with cost: {cost_text}")
+        logger.debug("[ReplicateParser] Detected Replicate with cost: %s", cost_text)
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Replicate keyword without reminder text (e.g., 'Replicate {R}')"""
-        logger.debug(f"[ReplicateParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ReplicateParser] Parsing keyword only: %s", keyword_text)
         
         m = REPLICATE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[ReplicateParser] No cost found in keyword text")
+            logger.debug("[ReplicateParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
         
-        logger.debug(f"[ReplicateParser] Detected Replicate with cost: {cost_text}")
+        logger.debug("[ReplicateParser] Detected Replicate with cost: %s", cost_text)
         
         return []
 
@@ -21,21 +21,21 @@ class RetraceParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Retrace reminder text"""
-        logger.debug(f"[RetraceParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[RetraceParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this card from your graveyard" not in lower or "discarding a land card" not in lower:
             return []
         
-        logger.debug(f"[RetraceParser] Detected Retrace")
+        logger.debug("[RetraceParser] Detected Retrace")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Retrace keyword without reminder text"""
-        logger.debug(f"[RetraceParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[RetraceParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[RetraceParser] Detected Retrace")
+        logger.debug("[RetraceParser] Detected Retrace")
         
         return []
 
@@ -21,7 +21,7 @@ class RiotParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Riot reminder text into ReplacementEffect"""
-        logger.debug(f"[RiotParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[RiotParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "enters the battlefield" not in lower:
@@ -45,13 +45,13 @@ class RiotParser:
             source_kind="static_ability"
         )
         
-        logger.debug(f"[RiotParser] Created ReplacementEffect and ContinuousEffect for Riot")
+        logger.debug("[RiotParser] Created ReplacementEffect and ContinuousEffect for Riot")
         
         return [replacement_effect, haste_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Riot keyword without reminder text"""
-        logger.debug(f"[RiotParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[RiotParser] Parsing keyword only: %s", keyword_text)
         
         replacement_effect = ReplacementEffect(
             kind="enters_with_counters",
@@ -71,7 +71,7 @@ class RiotParser:
             source_kind="static_ability"
         )
         
-        logger.debug(f"[RiotParser] Created ReplacementEffect and ContinuousEffect for Riot")
+        logger.debug("[RiotParser] Created ReplacementEffect and ContinuousEffect for Riot")
         
         return [replacement_effect, haste_effect]
 
@@ -27,7 +27,7 @@ class RippleParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Ripple reminder text into TriggeredAbility"""
-        logger.debug(f"[RippleParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[RippleParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "reveal" not in lower:
@@ -35,7 +35,7 @@ class RippleParser:
         
         m = RIPPLE_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[RippleParser] No ripple value found in reminder text")
+            logger.debug("[RippleParser] No ripple value found in reminder text")
             return []
         
         ripple_value = int(m.group(1))
@@ -59,17 +59,17 @@ class RippleParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[RippleParser] Created TriggeredAbility for Ripple {ripple_value}")
+        logger.debug("[RippleParser] Created TriggeredAbility for Ripple %s", ripple_value)
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Ripple keyword without reminder text (e.g., 'Ripple 4')"""
-        logger.debug(f"[RippleParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[RippleParser] Parsing keyword only: %s", keyword_text)
         
         m = RIPPLE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[RippleParser] No ripple value found in keyword text")
+            logger.debug("[RippleParser] No ripple value found in keyword text")
             return []
         
         ripple_value = int(m.group(1))
@@ -93,7 +93,7 @@ class RippleParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[RippleParser] Created TriggeredAbility for Ripple {ripple_value}")
+        logger.debug("[RippleParser] Created TriggeredAbility for Ripple %s", ripple_value)
         
         return [triggered_ability]
 
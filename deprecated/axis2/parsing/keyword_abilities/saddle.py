@@ -27,7 +27,7 @@ class SaddleParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Saddle reminder text into ActivatedAbility"""
-        logger.debug(f"[SaddleParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[SaddleParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "tap" not in lower or "creatures" not in lower or "saddled" not in lower:
@@ -35,7 +35,7 @@ class SaddleParser:
         
         m = SADDLE_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[SaddleParser] No saddle value found in reminder text")
+            logger.debug("[SaddleParser] No saddle value found in reminder text")
             return []
         
         saddle_value = int(m.group(1))
@@ -58,17 +58,17 @@ class SaddleParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[SaddleParser] Created ActivatedAbility for Saddle {saddle_value}")
+        logger.debug("[SaddleParser] Created ActivatedAbility for Saddle %s", saddle_value)
         
         return [activated_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Saddle keyword without reminder text (e.g., 'Saddle 1')"""
-        logger.debug(f"[SaddleParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[SaddleParser] Parsing keyword only: %s", keyword_text)
         
         m = SADDLE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[SaddleParser] No saddle value found in keyword text")
+            logger.debug("[SaddleParser] No saddle value found in keyword text")
             return []
         
         saddle_value = int(m.group(1))
@@ -91,7 +91,7 @@ class SaddleParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[SaddleParser] Created ActivatedAbility for Saddle {saddle_value}")
+        logger.debug("[SaddleParser] Created ActivatedAbility for Saddle %s", saddle_value)
         
         return [activated_ability]
 
@@ -28,7 +28,7 @@ class ScavengeParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Scavenge reminder text into ActivatedAbility"""
-        logger.debug(f"[ScavengeParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ScavengeParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "exile this card" not in lower or "graveyard" not in lower:
@@ -62,17 +62,17 @@ class ScavengeParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[ScavengeParser] Created ActivatedAbility for Scavenge")
+        logger.debug("[ScavengeParser] Created ActivatedAbility for Scavenge")
         
         return [activated_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Scavenge keyword without reminder text (e.g., 'Scavenge {3}{B}{G}')"""
-        logger.debug(f"[ScavengeParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ScavengeParser] Parsing keyword only: %s", keyword_text)
         
         m = SCAVENGE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[ScavengeParser] No cost found in keyword text")
+            logger.debug("[ScavengeParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -99,7 +99,7 @@ class ScavengeParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[ScavengeParser] Created ActivatedAbility for Scavenge {cost_text}")
+        logger.debug("[ScavengeParser] Created ActivatedAbility for Scavenge %s", cost_text)
         
         return [activated_ability]
 
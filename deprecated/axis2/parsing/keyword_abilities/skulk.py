@@ -21,21 +21,21 @@ class SkulkParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Skulk reminder text"""
-        logger.debug(f"[SkulkParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[SkulkParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "can't be blocked" not in lower or "greater power" not in lower:
             return []
         
-        logger.debug(f"[SkulkParser] Detected Skulk")
+        logger.debug("[SkulkParser] Detected Skulk")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Skulk keyword without reminder text"""
-        logger.debug(f"[SkulkParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[SkulkParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[SkulkParser] Detected Skulk")
+        logger.debug("[SkulkParser] Detected Skulk")
         
         return []
 
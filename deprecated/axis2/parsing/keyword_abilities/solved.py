@@ -21,21 +21,21 @@ class SolvedParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Solved reminder text"""
-        logger.debug(f"[SolvedParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[SolvedParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "solved" not in lower:
             return []
         
-        logger.debug(f"[SolvedParser] Detected Solved (conditional ability modifier, handled by Axis3)")
+        logger.debug("[SolvedParser] Detected Solved (conditional ability modifier, handled by Axis3)")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Solved keyword without reminder text (e.g., 'Solved — [Ability text]')"""
-        logger.debug(f"[SolvedParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[SolvedParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[SolvedParser] Detected Solved (conditional ability modifier, handled by Axis3)")
+        logger.debug("[SolvedParser] Detected Solved (conditional ability modifier, handled by Axis3)")
         
         return []
 
@@ -21,7 +21,7 @@ class SoulbondParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Soulbond reminder text into two TriggeredAbilities"""
-        logger.debug(f"[SoulbondParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[SoulbondParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "pair" not in lower or "enters the battlefield" not in lower:
@@ -54,13 +54,13 @@ class SoulbondParser:
             condition="both_unpaired"
         )
         
-        logger.debug(f"[SoulbondParser] Created two TriggeredAbilities for Soulbond")
+        logger.debug("[SoulbondParser] Created two TriggeredAbilities for Soulbond")
         
         return [etb_trigger, other_etb_trigger]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Soulbond keyword without reminder text"""
-        logger.debug(f"[SoulbondParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[SoulbondParser] Parsing keyword only: %s", keyword_text)
         
         pairing_effect = ContinuousEffect(
             kind="pairing",
@@ -89,7 +89,7 @@ class SoulbondParser:
             condition="both_unpaired"
         )
         
-        logger.debug(f"[SoulbondParser] Created two TriggeredAbilities for Soulbond")
+        logger.debug("[SoulbondParser] Created two TriggeredAbilities for Soulbond")
         
         return [etb_trigger, other_etb_trigger]
 
@@ -28,7 +28,7 @@ class SoulshiftParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Soulshift reminder text into TriggeredAbility"""
-        logger.debug(f"[SoulshiftParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[SoulshiftParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "dies" not in lower or "return target spirit" not in lower:
@@ -36,7 +36,7 @@ class SoulshiftParser:
         
         m = SOULSHIFT_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[SoulshiftParser] No soulshift value found in reminder text")
+            logger.debug("[SoulshiftParser] No soulshift value found in reminder text")
             return []
         
         soulshift_value = m.group(1)
@@ -70,17 +70,17 @@ class SoulshiftParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[SoulshiftParser] Created TriggeredAbility for Soulshift {soulshift_value}")
+        logger.debug("[SoulshiftParser] Created TriggeredAbility for Soulshift %s", soulshift_value)
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Soulshift keyword without reminder text (e.g., 'Soulshift 7')"""
-        logger.debug(f"[SoulshiftParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[SoulshiftParser] Parsing keyword only: %s", keyword_text)
         
         m = SOULSHIFT_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[SoulshiftParser] No soulshift value found in keyword text")
+            logger.debug("[SoulshiftParser] No soulshift value found in keyword text")
             return []
         
         soulshift_value = m.group(1)
@@ -114,7 +114,7 @@ class SoulshiftParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[SoulshiftParser] Created TriggeredAbility for Soulshift {soulshift_value}")
+        logger.debug("[SoulshiftParser] Created TriggeredAbility for Soulshift %s", soulshift_value)
         
         return [triggered_ability]
 
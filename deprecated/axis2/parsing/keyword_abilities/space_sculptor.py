@@ -21,7 +21,7 @@ class SpaceSculptorParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Space Sculptor reminder text into StaticEffect"""
-        logger.debug(f"[SpaceSculptorParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[SpaceSculptorParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "sector" not in lower:
@@ -35,13 +35,13 @@ class SpaceSculptorParser:
             zones=["battlefield"]
         )
         
-        logger.debug(f"[SpaceSculptorParser] Created StaticEffect for Space Sculptor")
+        logger.debug("[SpaceSculptorParser] Created StaticEffect for Space Sculptor")
         
         return [static_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Space Sculptor keyword without reminder text"""
-        logger.debug(f"[SpaceSculptorParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[SpaceSculptorParser] Parsing keyword only: %s", keyword_text)
         
         static_effect = StaticEffect(
             kind="grant_designation",
@@ -51,7 +51,7 @@ class SpaceSculptorParser:
             zones=["battlefield"]
         )
         
-        logger.debug(f"[SpaceSculptorParser] Created StaticEffect for Space Sculptor")
+        logger.debug("[SpaceSculptorParser] Created StaticEffect for Space Sculptor")
         
         return [static_effect]
 
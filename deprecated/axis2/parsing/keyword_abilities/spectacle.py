@@ -27,7 +27,7 @@ class SpectacleParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Spectacle reminder text"""
-        logger.debug(f"[SpectacleParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[SpectacleParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "spectacle cost" not in lower:
@@ -36,22 +36,22 @@ class SpectacleParser:
         m = SPECTACLE_RE.search(reminder_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[SpectacleParser] Detected Spectacle cost: {cost_text}")
+            logger.debug("[SpectacleParser] Detected Spectacle cost: %s", cost_text)
         
-        logger.debug(f"[SpectacleParser] Detected Spectacle")
+        logger.debug("[SpectacleParser] Detected Spectacle")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Spectacle keyword without reminder text (e.g., 'Spectacle {R}')"""
-        logger.debug(f"[SpectacleParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[SpectacleParser] Parsing keyword only: %s", keyword_text)
         
         m = SPECTACLE_RE.search(keyword_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[SpectacleParser] Detected Spectacle cost: {cost_text}")
+            logger.debug("[SpectacleParser] Detected Spectacle cost: %s", cost_text)
         
-        logger.debug(f"[SpectacleParser] Detected Spectacle")
+        logger.debug("[SpectacleParser] Detected Spectacle")
         
         return []
 
@@ -27,7 +27,7 @@ class SpliceParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Splice reminder text"""
-        logger.debug(f"[SpliceParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[SpliceParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast an" not in lower or "reveal this card" not in lower:
@@ -40,23 +40,23 @@ class SpliceParser:
         splice_type = m.group(1).strip()
         cost_text = m.group(2).strip()
         
-        logger.debug(f"[SpliceParser] Detected Splice onto {splice_type} with cost: {cost_text}")
+        logger.debug("[SpliceParser] Detected Splice onto %s with cost: %s", splice_type, cost_text)
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Splice keyword without reminder text (e.g., 'Splice onto Arcane {1}{R}')"""
-        logger.debug(f"[SpliceParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[SpliceParser] Parsing keyword only: %s", keyword_text)
         
         m = SPLICE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[SpliceParser] No splice type or cost found in keyword text")
+            logger.debug("[SpliceParser] No splice type or cost found in keyword text")
             return []
         
         splice_type = m.group(1).strip()
         cost_text = m.group(2).strip()
         
-        logger.debug(f"[SpliceParser] Detected Splice onto {splice_type} with cost: {cost_text}")
+        logger.debug("[SpliceParser] Detected Splice onto %s with cost: %s", splice_type, cost_text)
         
         return []
 
@@ -21,21 +21,21 @@ class SplitSecondParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Split Second reminder text"""
-        logger.debug(f"[SplitSecondParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[SplitSecondParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "spell is on the stack" not in lower or "can't cast spells" not in lower:
             return []
         
-        logger.debug(f"[SplitSecondParser] Detected Split Second")
+        logger.debug("[SplitSecondParser] Detected Split Second")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Split Second keyword without reminder text"""
-        logger.debug(f"[SplitSecondParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[SplitSecondParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[SplitSecondParser] Detected Split Second")
+        logger.debug("[SplitSecondParser] Detected Split Second")
         
         return []
 
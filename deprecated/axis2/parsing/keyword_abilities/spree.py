@@ -21,21 +21,21 @@ class SpreeParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Spree reminder text"""
-        logger.debug(f"[SpreeParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[SpreeParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "choose" not in lower or "modes" not in lower:
             return []
         
-        logger.debug(f"[SpreeParser] Detected Spree (spell modifier, handled by Axis3)")
+        logger.debug("[SpreeParser] Detected Spree (spell modifier, handled by Axis3)")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Spree keyword without reminder text"""
-        logger.debug(f"[SpreeParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[SpreeParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[SpreeParser] Detected Spree (spell modifier, handled by Axis3)")
+        logger.debug("[SpreeParser] Detected Spree (spell modifier, handled by Axis3)")
         
         return []
 
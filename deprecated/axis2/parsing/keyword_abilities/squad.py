@@ -27,7 +27,7 @@ class SquadParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Squad reminder text into TriggeredAbility"""
-        logger.debug(f"[SquadParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[SquadParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "squad cost" not in lower or "create" not in lower or "token" not in lower:
@@ -35,7 +35,7 @@ class SquadParser:
         
         m = SQUAD_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[SquadParser] No squad cost found in reminder text")
+            logger.debug("[SquadParser] No squad cost found in reminder text")
             return []
         
         cost_text = m.group(1).strip()
@@ -58,17 +58,17 @@ class SquadParser:
             condition="squad_cost_was_paid"
         )
         
-        logger.debug(f"[SquadParser] Created TriggeredAbility for Squad")
+        logger.debug("[SquadParser] Created TriggeredAbility for Squad")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Squad keyword without reminder text (e.g., 'Squad {2}')"""
-        logger.debug(f"[SquadParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[SquadParser] Parsing keyword only: %s", keyword_text)
         
         m = SQUAD_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[SquadParser] No squad cost found in keyword text")
+            logger.debug("[SquadParser] No squad cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -91,7 +91,7 @@ class SquadParser:
             condition="squad_cost_was_paid"
         )
         
-        logger.debug(f"[SquadParser] Created TriggeredAbility for Squad")
+        logger.debug("[SquadParser] Created TriggeredAbility for Squad")
         
         return [triggered_ability]
 
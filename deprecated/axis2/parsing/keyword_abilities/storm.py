@@ -21,21 +21,21 @@ class StormParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Storm reminder text"""
-        logger.debug(f"[StormParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[StormParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast this spell" not in lower or "copy it" not in lower:
             return []
         
-        logger.debug(f"[StormParser] Detected Storm")
+        logger.debug("[StormParser] Detected Storm")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Storm keyword without reminder text"""
-        logger.debug(f"[StormParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[StormParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[StormParser] Detected Storm")
+        logger.debug("[StormParser] Detected Storm")
         
         return []
 
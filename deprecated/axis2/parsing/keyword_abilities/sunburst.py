@@ -21,7 +21,7 @@ class SunburstParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Sunburst reminder text into ReplacementEffect"""
-        logger.debug(f"[SunburstParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[SunburstParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "enters" not in lower or ("+1/+1 counter" not in lower and "charge counter" not in lower):
@@ -41,13 +41,13 @@ class SunburstParser:
             zones=["battlefield"]
         )
         
-        logger.debug(f"[SunburstParser] Created ReplacementEffect for Sunburst")
+        logger.debug("[SunburstParser] Created ReplacementEffect for Sunburst")
         
         return [replacement_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Sunburst keyword without reminder text"""
-        logger.debug(f"[SunburstParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[SunburstParser] Parsing keyword only: %s", keyword_text)
         
         replacement_effect = ReplacementEffect(
             kind="enters_with_counters",
@@ -61,7 +61,7 @@ class SunburstParser:
             zones=["battlefield"]
         )
         
-        logger.debug(f"[SunburstParser] Created ReplacementEffect for Sunburst")
+        logger.debug("[SunburstParser] Created ReplacementEffect for Sunburst")
         
         return [replacement_effect]
 
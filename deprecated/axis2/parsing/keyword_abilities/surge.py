@@ -27,7 +27,7 @@ class SurgeParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Surge reminder text"""
-        logger.debug(f"[SurgeParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[SurgeParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "cast a spell" not in lower or "surge cost" not in lower:
@@ -36,22 +36,22 @@ class SurgeParser:
         m = SURGE_RE.search(reminder_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[SurgeParser] Detected Surge cost: {cost_text}")
+            logger.debug("[SurgeParser] Detected Surge cost: %s", cost_text)
         
-        logger.debug(f"[SurgeParser] Detected Surge")
+        logger.debug("[SurgeParser] Detected Surge")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Surge keyword without reminder text (e.g., 'Surge {1}{R}')"""
-        logger.debug(f"[SurgeParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[SurgeParser] Parsing keyword only: %s", keyword_text)
         
         m = SURGE_RE.search(keyword_text)
         if m:
             cost_text = m.group(1).strip()
-            logger.debug(f"[SurgeParser] Detected Surge cost: {cost_text}")
+            logger.debug("[SurgeParser] Detected Surge cost: %s", cost_text)
         
-        logger.debug(f"[SurgeParser] Detected Surge")
+        logger.debug("[SurgeParser] Detected Surge")
         
         return []
 
@@ -28,7 +28,7 @@ class SuspendParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Suspend reminder text into ReplacementEffect and TriggeredAbilities"""
-        logger.debug(f"[SuspendParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[SuspendParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "exile it" not in lower or "time counter" not in lower:
@@ -36,7 +36,7 @@ class SuspendParser:
         
         m = SUSPEND_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[SuspendParser] No suspend value or cost found in reminder text")
+            logger.debug("[SuspendParser] No suspend value or cost found in reminder text")
             return []
         
         suspend_value = int(m.group(1))
@@ -89,17 +89,17 @@ class SuspendParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[SuspendParser] Created ReplacementEffect and TriggeredAbilities for Suspend {suspend_value}")
+        logger.debug("[SuspendParser] Created ReplacementEffect and TriggeredAbilities for Suspend %s", suspend_value)
         
         return [replacement_effect, upkeep_trigger, last_counter_trigger]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Suspend keyword without reminder text (e.g., 'Suspend 4 — {W}{U}')"""
-        logger.debug(f"[SuspendParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[SuspendParser] Parsing keyword only: %s", keyword_text)
         
         m = SUSPEND_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[SuspendParser] No suspend value or cost found in keyword text")
+            logger.debug("[SuspendParser] No suspend value or cost found in keyword text")
             return []
         
         suspend_value = int(m.group(1))
@@ -152,7 +152,7 @@ class SuspendParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[SuspendParser] Created ReplacementEffect and TriggeredAbilities for Suspend {suspend_value}")
+        logger.debug("[SuspendParser] Created ReplacementEffect and TriggeredAbilities for Suspend %s", suspend_value)
         
         return [replacement_effect, upkeep_trigger, last_counter_trigger]
 
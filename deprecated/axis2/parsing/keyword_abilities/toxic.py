@@ -27,7 +27,7 @@ class ToxicParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Toxic reminder text into ContinuousEffect"""
-        logger.debug(f"[ToxicParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[ToxicParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "combat damage" not in lower or "poison counter" not in lower:
@@ -35,7 +35,7 @@ class ToxicParser:
         
         m = TOXIC_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[ToxicParser] No toxic value found in reminder text")
+            logger.debug("[ToxicParser] No toxic value found in reminder text")
             return []
         
         toxic_value = int(m.group(1))
@@ -50,17 +50,17 @@ class ToxicParser:
             source_kind="static_ability"
         )
         
-        logger.debug(f"[ToxicParser] Created ContinuousEffect for Toxic {toxic_value}")
+        logger.debug("[ToxicParser] Created ContinuousEffect for Toxic %s", toxic_value)
         
         return [continuous_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Toxic keyword without reminder text (e.g., 'Toxic 1')"""
-        logger.debug(f"[ToxicParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[ToxicParser] Parsing keyword only: %s", keyword_text)
         
         m = TOXIC_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[ToxicParser] No toxic value found in keyword text")
+            logger.debug("[ToxicParser] No toxic value found in keyword text")
             return []
         
         toxic_value = int(m.group(1))
@@ -75,7 +75,7 @@ class ToxicParser:
             source_kind="static_ability"
         )
         
-        logger.debug(f"[ToxicParser] Created ContinuousEffect for Toxic {toxic_value}")
+        logger.debug("[ToxicParser] Created ContinuousEffect for Toxic %s", toxic_value)
         
         return [continuous_effect]
 
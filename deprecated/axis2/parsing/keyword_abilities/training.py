@@ -21,7 +21,7 @@ class TrainingParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Training reminder text into TriggeredAbility"""
-        logger.debug(f"[TrainingParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[TrainingParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "attacks" not in lower or "another creature" not in lower or "greater power" not in lower or "+1/+1 counter" not in lower:
@@ -42,13 +42,13 @@ class TrainingParser:
             condition="at_least_one_other_attacking_creature_with_greater_power"
         )
         
-        logger.debug(f"[TrainingParser] Created TriggeredAbility for Training")
+        logger.debug("[TrainingParser] Created TriggeredAbility for Training")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Training keyword without reminder text"""
-        logger.debug(f"[TrainingParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[TrainingParser] Parsing keyword only: %s", keyword_text)
         
         put_counter_effect = PutCounterEffect(
             counter_type="+1/+1",
@@ -65,7 +65,7 @@ class TrainingParser:
             condition="at_least_one_other_attacking_creature_with_greater_power"
         )
         
-        logger.debug(f"[TrainingParser] Created TriggeredAbility for Training")
+        logger.debug("[TrainingParser] Created TriggeredAbility for Training")
         
         return [triggered_ability]
 
@@ -28,7 +28,7 @@ class TransfigureParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Transfigure reminder text into ActivatedAbility"""
-        logger.debug(f"[TransfigureParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[TransfigureParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "sacrifice" not in lower or "search your library" not in lower:
@@ -62,17 +62,17 @@ class TransfigureParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[TransfigureParser] Created ActivatedAbility for Transfigure")
+        logger.debug("[TransfigureParser] Created ActivatedAbility for Transfigure")
         
         return [activated_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Transfigure keyword without reminder text (e.g., 'Transfigure {1}{B}{B}')"""
-        logger.debug(f"[TransfigureParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[TransfigureParser] Parsing keyword only: %s", keyword_text)
         
         m = TRANSFIGURE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[TransfigureParser] No cost found in keyword text")
+            logger.debug("[TransfigureParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -99,7 +99,7 @@ class TransfigureParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[TransfigureParser] Created ActivatedAbility for Transfigure {cost_text}")
+        logger.debug("[TransfigureParser] Created ActivatedAbility for Transfigure %s", cost_text)
         
         return [activated_ability]
 
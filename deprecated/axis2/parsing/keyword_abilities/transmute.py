@@ -28,7 +28,7 @@ class TransmuteParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Transmute reminder text into ActivatedAbility"""
-        logger.debug(f"[TransmuteParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[TransmuteParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "discard this card" not in lower or "search your library" not in lower:
@@ -62,17 +62,17 @@ class TransmuteParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[TransmuteParser] Created ActivatedAbility for Transmute")
+        logger.debug("[TransmuteParser] Created ActivatedAbility for Transmute")
         
         return [activated_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Transmute keyword without reminder text (e.g., 'Transmute {1}{U}{U}')"""
-        logger.debug(f"[TransmuteParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[TransmuteParser] Parsing keyword only: %s", keyword_text)
         
         m = TRANSMUTE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[TransmuteParser] No cost found in keyword text")
+            logger.debug("[TransmuteParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -99,7 +99,7 @@ class TransmuteParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[TransmuteParser] Created ActivatedAbility for Transmute {cost_text}")
+        logger.debug("[TransmuteParser] Created ActivatedAbility for Transmute %s", cost_text)
         
         return [activated_ability]
 
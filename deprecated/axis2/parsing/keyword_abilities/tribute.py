@@ -27,7 +27,7 @@ class TributeParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Tribute reminder text into ReplacementEffect"""
-        logger.debug(f"[TributeParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[TributeParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "enters the battlefield" not in lower or "opponent" not in lower:
@@ -35,7 +35,7 @@ class TributeParser:
         
         m = TRIBUTE_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[TributeParser] No tribute value found in reminder text")
+            logger.debug("[TributeParser] No tribute value found in reminder text")
             return []
         
         tribute_value = int(m.group(1))
@@ -48,17 +48,17 @@ class TributeParser:
             zones=["battlefield"]
         )
         
-        logger.debug(f"[TributeParser] Created ReplacementEffect for Tribute {tribute_value}")
+        logger.debug("[TributeParser] Created ReplacementEffect for Tribute %s", tribute_value)
         
         return [replacement_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Tribute keyword without reminder text (e.g., 'Tribute 3')"""
-        logger.debug(f"[TributeParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[TributeParser] Parsing keyword only: %s", keyword_text)
         
         m = TRIBUTE_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[TributeParser] No tribute value found in keyword text")
+            logger.debug("[TributeParser] No tribute value found in keyword text")
             return []
         
         tribute_value = int(m.group(1))
@@ -71,7 +71,7 @@ class TributeParser:
             zones=["battlefield"]
         )
         
-        logger.debug(f"[TributeParser] Created ReplacementEffect for Tribute {tribute_value}")
+        logger.debug("[TributeParser] Created ReplacementEffect for Tribute %s", tribute_value)
         
         return [replacement_effect]
 
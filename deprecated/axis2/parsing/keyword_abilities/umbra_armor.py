@@ -26,12 +26,12 @@ class UmbraArmorParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Umbra armor reminder text into ReplacementEffect"""
-        logger.debug(f"[UmbraArmorParser] Parsing reminder text: {reminder_text}")
+        logger.debug("[UmbraArmorParser] Parsing reminder text: %s", reminder_text)
         
         m = RE_WOULD_BE_DESTROYED.search(reminder_text)
         if not m:
-            logger.warning(f"[UmbraArmorParser] Regex did not match reminder text: '{reminder_text}'")
-            logger.warning(f"[UmbraArmorParser] Pattern: {RE_WOULD_BE_DESTROYED.pattern}")
+            logger.debug("[UmbraArmorParser] Regex did not match reminder text: '%s'", reminder_text)
+            logger.debug("[UmbraArmorParser] Pattern: %s", RE_WOULD_BE_DESTROYED.pattern)
             return []
         
         try:
@@ -41,7 +41,7 @@ class UmbraArmorParser:
             subject = parse_destruction_subject(subject_raw)
             actions = parse_destruction_instead_actions(action_raw)
             
-            logger.debug(f"[UmbraArmorParser] Parsed subject: {subject.scope}, actions: {actions}")
+            logger.debug("[UmbraArmorParser] Parsed subject: %s, actions: %s", subject.scope, actions)
             
             effect = ReplacementEffect(
                 kind="prevent_destruction",
@@ -52,11 +52,11 @@ class UmbraArmorParser:
                 text=reminder_text
             )
             
-            logger.debug(f"[UmbraArmorParser] Created ReplacementEffect: {effect.kind}")
+            logger.debug("[UmbraArmorParser] Created ReplacementEffect: %s", effect.kind)
             
             return [effect]
         except (ValueError, AttributeError) as e:
-            logger.error(f"[UmbraArmorParser] Error parsing: {e}")
+            logger.error("[UmbraArmorParser] Error parsing: %s", e)
             return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
@@ -21,21 +21,21 @@ class UndauntedParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Undaunted reminder text"""
-        logger.debug(f"[UndauntedParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[UndauntedParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "costs" not in lower or "less" not in lower or "opponent" not in lower:
             return []
         
-        logger.debug(f"[UndauntedParser] Detected Undaunted")
+        logger.debug("[UndauntedParser] Detected Undaunted")
         
         return []
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Undaunted keyword without reminder text"""
-        logger.debug(f"[UndauntedParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[UndauntedParser] Parsing keyword only: %s", keyword_text)
         
-        logger.debug(f"[UndauntedParser] Detected Undaunted")
+        logger.debug("[UndauntedParser] Detected Undaunted")
         
         return []
 
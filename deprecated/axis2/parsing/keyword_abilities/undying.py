@@ -21,7 +21,7 @@ class UndyingParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Undying reminder text into TriggeredAbility"""
-        logger.debug(f"[UndyingParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[UndyingParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "dies" not in lower or "no +1/+1 counters" not in lower or "return it to the battlefield" not in lower:
@@ -44,13 +44,13 @@ class UndyingParser:
             condition="no_+1/+1_counters_on_it"
         )
         
-        logger.debug(f"[UndyingParser] Created TriggeredAbility for Undying")
+        logger.debug("[UndyingParser] Created TriggeredAbility for Undying")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Undying keyword without reminder text"""
-        logger.debug(f"[UndyingParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[UndyingParser] Parsing keyword only: %s", keyword_text)
         
         return_effect = ChangeZoneEffect(
             subject=Subject(scope="self"),
@@ -69,7 +69,7 @@ class UndyingParser:
             condition="no_+1/+1_counters_on_it"
         )
         
-        logger.debug(f"[UndyingParser] Created TriggeredAbility for Undying")
+        logger.debug("[UndyingParser] Created TriggeredAbility for Undying")
         
         return [triggered_ability]
 
@@ -28,7 +28,7 @@ class UnearthParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Unearth reminder text into ActivatedAbility"""
-        logger.debug(f"[UnearthParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[UnearthParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "return this card" not in lower or "graveyard" not in lower:
@@ -97,17 +97,17 @@ class UnearthParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[UnearthParser] Created ActivatedAbility, TriggeredAbility, and ReplacementEffect for Unearth")
+        logger.debug("[UnearthParser] Created ActivatedAbility, TriggeredAbility, and ReplacementEffect for Unearth")
         
         return [activated_ability, end_step_trigger, replacement_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Unearth keyword without reminder text (e.g., 'Unearth {B}')"""
-        logger.debug(f"[UnearthParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[UnearthParser] Parsing keyword only: %s", keyword_text)
         
         m = UNEARTH_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[UnearthParser] No cost found in keyword text")
+            logger.debug("[UnearthParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1).strip()
@@ -154,7 +154,7 @@ class UnearthParser:
             is_mana_ability=False
         )
         
-        logger.debug(f"[UnearthParser] Created ActivatedAbility and TriggeredAbility for Unearth {cost_text}")
+        logger.debug("[UnearthParser] Created ActivatedAbility and TriggeredAbility for Unearth %s", cost_text)
         
         return [activated_ability, end_step_trigger]
 
@@ -21,7 +21,7 @@ class UnleashParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Unleash reminder text into ReplacementEffect and ContinuousEffect"""
-        logger.debug(f"[UnleashParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[UnleashParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "enter" not in lower or "+1/+1 counter" not in lower or "can't block" not in lower:
@@ -44,13 +44,13 @@ class UnleashParser:
             source_kind="static_ability"
         )
         
-        logger.debug(f"[UnleashParser] Created ReplacementEffect and ContinuousEffect for Unleash")
+        logger.debug("[UnleashParser] Created ReplacementEffect and ContinuousEffect for Unleash")
         
         return [replacement_effect, block_restriction]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Unleash keyword without reminder text"""
-        logger.debug(f"[UnleashParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[UnleashParser] Parsing keyword only: %s", keyword_text)
         
         replacement_effect = ReplacementEffect(
             kind="enters_with_counters",
@@ -69,7 +69,7 @@ class UnleashParser:
             source_kind="static_ability"
         )
         
-        logger.debug(f"[UnleashParser] Created ReplacementEffect and ContinuousEffect for Unleash")
+        logger.debug("[UnleashParser] Created ReplacementEffect and ContinuousEffect for Unleash")
         
         return [replacement_effect, block_restriction]
 
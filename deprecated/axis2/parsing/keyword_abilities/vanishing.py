@@ -27,7 +27,7 @@ class VanishingParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Vanishing reminder text into ReplacementEffect and TriggeredAbilities"""
-        logger.debug(f"[VanishingParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[VanishingParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "enters the battlefield" not in lower or "time counter" not in lower:
@@ -35,7 +35,7 @@ class VanishingParser:
         
         m = VANISHING_RE.search(reminder_text)
         if not m:
-            logger.debug(f"[VanishingParser] No vanishing value found in reminder text")
+            logger.debug("[VanishingParser] No vanishing value found in reminder text")
             return []
         
         vanishing_value = int(m.group(1))
@@ -77,17 +77,17 @@ class VanishingParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[VanishingParser] Created ReplacementEffect and TriggeredAbilities for Vanishing {vanishing_value}")
+        logger.debug("[VanishingParser] Created ReplacementEffect and TriggeredAbilities for Vanishing %s", vanishing_value)
         
         return [replacement_effect, upkeep_trigger, last_counter_trigger]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Vanishing keyword without reminder text (e.g., 'Vanishing 2')"""
-        logger.debug(f"[VanishingParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[VanishingParser] Parsing keyword only: %s", keyword_text)
         
         m = VANISHING_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[VanishingParser] No vanishing value found in keyword text")
+            logger.debug("[VanishingParser] No vanishing value found in keyword text")
             return []
         
         vanishing_value = int(m.group(1))
@@ -129,7 +129,7 @@ class VanishingParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[VanishingParser] Created ReplacementEffect and TriggeredAbilities for Vanishing {vanishing_value}")
+        logger.debug("[VanishingParser] Created ReplacementEffect and TriggeredAbilities for Vanishing %s", vanishing_value)
         
         return [replacement_effect, upkeep_trigger, last_counter_trigger]
 
@@ -21,7 +21,7 @@ class VisitParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Visit reminder text"""
-        logger.debug(f"[VisitParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[VisitParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "roll to visit" not in lower or "attractions" not in lower:
@@ -36,13 +36,13 @@ class VisitParser:
             condition="result_matches_lit_number"
         )
         
-        logger.debug(f"[VisitParser] Created TriggeredAbility for Visit")
+        logger.debug("[VisitParser] Created TriggeredAbility for Visit")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Visit keyword without reminder text (e.g., 'Visit — Create a Food token.')"""
-        logger.debug(f"[VisitParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[VisitParser] Parsing keyword only: %s", keyword_text)
         
         triggered_ability = TriggeredAbility(
             condition_text="Whenever you roll to visit your Attractions, if the result is equal to a number that is lit up on this Attraction, [effect].",
@@ -53,7 +53,7 @@ class VisitParser:
             condition="result_matches_lit_number"
         )
         
-        logger.debug(f"[VisitParser] Created TriggeredAbility for Visit")
+        logger.debug("[VisitParser] Created TriggeredAbility for Visit")
         
         return [triggered_ability]
 
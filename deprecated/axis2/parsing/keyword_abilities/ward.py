@@ -27,7 +27,7 @@ class WardParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Ward reminder text into TriggeredAbility"""
-        logger.debug(f"[WardParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[WardParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "becomes the target" not in lower or "counter" not in lower:
@@ -50,17 +50,17 @@ class WardParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[WardParser] Created TriggeredAbility for Ward")
+        logger.debug("[WardParser] Created TriggeredAbility for Ward")
         
         return [triggered_ability]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Ward keyword without reminder text (e.g., 'Ward {2}')"""
-        logger.debug(f"[WardParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[WardParser] Parsing keyword only: %s", keyword_text)
         
         m = WARD_COST_RE.search(keyword_text)
         if not m:
-            logger.debug(f"[WardParser] No cost found in keyword text")
+            logger.debug("[WardParser] No cost found in keyword text")
             return []
         
         cost_text = m.group(1) or m.group(0)
@@ -76,7 +76,7 @@ class WardParser:
             trigger_filter=None
         )
         
-        logger.debug(f"[WardParser] Created TriggeredAbility for Ward {cost_text}")
+        logger.debug("[WardParser] Created TriggeredAbility for Ward %s", cost_text)
         
         return [triggered_ability]
 
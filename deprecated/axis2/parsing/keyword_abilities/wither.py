@@ -21,7 +21,7 @@ class WitherParser:
     
     def parse_reminder(self, reminder_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Wither reminder text into ContinuousEffect"""
-        logger.debug(f"[WitherParser] Parsing reminder text: {reminder_text[:100]}")
+        logger.debug("[WitherParser] Parsing reminder text: %s", reminder_text[:100])
         
         lower = reminder_text.lower()
         if "deals damage" not in lower or "-1/-1 counter" not in lower:
@@ -36,13 +36,13 @@ class WitherParser:
             source_kind="static_ability"
         )
         
-        logger.debug(f"[WitherParser] Created ContinuousEffect for Wither")
+        logger.debug("[WitherParser] Created ContinuousEffect for Wither")
         
         return [continuous_effect]
     
     def parse_keyword_only(self, keyword_text: str, ctx: ParseContext) -> List[Effect]:
         """Parse Wither keyword without reminder text"""
-        logger.debug(f"[WitherParser] Parsing keyword only: {keyword_text}")
+        logger.debug("[WitherParser] Parsing keyword only: %s", keyword_text)
         
         continuous_effect = ContinuousEffect(
             kind="damage_modification",
@@ -53,7 +53,7 @@ class WitherParser:
             source_kind="static_ability"
         )
         
-        logger.debug(f"[WitherParser] Created ContinuousEffect for Wither")
+        logger.debug("[WitherParser] Created ContinuousEffect for Wither")
         
         return [continuous_effect]
 
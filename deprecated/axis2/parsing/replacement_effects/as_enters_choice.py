@@ -32,6 +32,7 @@ RE_AS_ENTERS_CHOOSE_GENERIC = re.compile(
 class AsEntersChoiceParser(ReplacementEffectParser):
     """Parses 'as enters' replacement effects that create choices"""
     priority = 48  # Higher than enter_tapped but lower than destruction
+    cues = ("choose",)
     
     def can_parse(self, text: str) -> bool:
         lower = text.lower()
@@ -39,7 +40,7 @@ class AsEntersChoiceParser(ReplacementEffectParser):
                ("as" in lower and "enter" in lower and "choose" in lower)
     
     def parse(self, text: str) -> ParseResult:
-        logger.debug(f"[AsEntersChoiceParser] Parsing: {text[:100]}")
+        logger.debug("[AsEntersChoiceParser] Parsing: %s", text[:100])
         
         # Check for specific choice types
         if RE_AS_ENTERS_CHOOSE_COLOR.search(text):
@@ -54,7 +55,7 @@ class AsEntersChoiceParser(ReplacementEffectParser):
                 zones=["battlefield"],
                 text=text
             )
-            logger.debug(f"[AsEntersChoiceParser] Created color choice replacement effect")
+            logger.debug("[AsEntersChoiceParser] Created color choice replacement effect")
             return ParseResult(
                 matched=True,
                 effect=effect,
@@ -73,7 +74,7 @@ class AsEntersChoiceParser(ReplacementEffectParser):
                 zones=["battlefield"],
                 text=text
             )
-            logger.debug(f"[AsEntersChoiceParser] Created creature type choice replacement effect")
+            logger.debug("[AsEntersChoiceParser] Created creature type choice replacement effect")
             return ParseResult(
                 matched=True,
                 effect=effect,
@@ -92,7 +93,7 @@ class AsEntersChoiceParser(ReplacementEffectParser):
                 zones=["battlefield"],
                 text=text
             )
-            logger.debug(f"[AsEntersChoiceParser] Created player choice replacement effect")
+            logger.debug("[AsEntersChoiceParser] Created player choice replacement effect")
             return ParseResult(
                 matched=True,
                 effect=effect,
@@ -103,7 +104,7 @@ class AsEntersChoiceParser(ReplacementEffectParser):
         m = RE_AS_ENTERS_CHOOSE_GENERIC.search(text)
         if m:
             choice_text = m.group(1).strip()
-            logger.debug(f"[AsEntersChoiceParser] Found generic choice: {choice_text}")
+            logger.debug("[AsEntersChoiceParser] Found generic choice: %s", choice_text)
             
             effect = ReplacementEffect(
                 kind="as_enters_choice",
@@ -116,13 +117,13 @@ class AsEntersChoiceParser(ReplacementEffectParser):
                 zones=["battlefield"],
                 text=text
             )
-            logger.debug(f"[AsEntersChoiceParser] Created generic choice replacement effect")
+            logger.debug("[AsEntersChoiceParser] Created generic choice replacement effect")
             return ParseResult(
                 matched=True,
                 effect=effect,
                 consumed_text=text
             )
         
-        logger.debug(f"[AsEntersChoiceParser] No match found")
+        logger.debug("[AsEntersChoiceParser] No match found")
         return ParseResult(matched=False)
 
@@ -32,6 +32,7 @@ class ParseResult:
 class ReplacementEffectParser(Protocol):
     """Interface all replacement effect parsers must implement"""
     priority: int
+    cues: tuple[str, ...] = ()  # lower-case substrings can_parse needs; see BaseParserRegistry
     
     def can_parse(self, text: str) -> bool:
         """Quick check if this parser might match. Must be CHEAP."""
@@ -53,6 +53,7 @@ def _extract_duration(text: str) -> tuple[str, str | None]:
 class CounterModificationParser(ReplacementEffectParser):
     """Parses counter modification replacement effects: 'if you would put counters, put that many plus one instead'"""
     priority = 50  # Medium-high priority
+    cues = ("would put",)
     
     def can_parse(self, text: str) -> bool:
         # ⚠️ CHEAP CHECK ONLY
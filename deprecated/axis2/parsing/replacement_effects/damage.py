@@ -6,6 +6,7 @@ from .patterns import RE_DAMAGE_PREVENTION
 from axis2.schema import ReplacementEffect, Subject
 from axis2.parsing.subject import subject_from_text
 from axis2.schema import ParseContext
+from axis2.parsing import trace
 import re
 import logging
 
@@ -29,28 +30,26 @@ RE_DAMAGE_PREVENT = re.compile(
 class DamageParser(ReplacementEffectParser):
     """Parses damage prevention/redirection replacement effects"""
     priority = 35  # Medium priority
+    cues = ("damage",)
 
     def can_parse(self, text: str) -> bool:
         # ⚠️ CHEAP CHECK ONLY
         lower = text.lower()
         # Check for "damage" and "would be dealt" separately to match "damage that would be dealt"
-        result = ("damage" in lower and "would be dealt" in lower) or ("prevent" in lower and "damage" in lower)
-        logger.debug(f"[DamageParser] can_parse: '{text[:80]}...' -> {result}")
-        return result
+        return ("damage" in lower and "would be dealt" in lower) or ("prevent" in lower and "damage" in lower)
 
     def parse(self, text: str, ctx: Optional[ParseContext] = None) -> ParseResult:
+        active = trace.current()
         lower = text.lower()
         
-        logger.debug(f"[DamageParser] Parsing: '{text[:100]}...'")
-        
         # Try damage redirection pattern first (more specific)
         redir_match = RE_DAMAGE_REDIRECTION.search(text)
-        print(f"[DamageParser PRINT] Regex match result: {redir_match is not None}")
-        print(f"[DamageParser PRINT] Text being matched: '{text}'")
-        print(f"[DamageParser PRINT] Pattern: {RE_DAMAGE_REDIRECTION.pattern}")
-        logger.debug(f"[DamageParser] Regex match result: {redir_match is not None}")
+        if active:
+            active.record(
+                "damage_replacement", "redirection", text,
+                groups=redir_match.groups() if redir_match else None,
+            )
         if redir_match:
-            logger.debug(f"[DamageParser] Matched groups: 1='{redir_match.group(1)}', 2='{redir_match.group(2)}'")
             original_target_text = redir_match.group(1).strip()
             redirect_target_text = redir_match.group(2).strip()
             
@@ -101,7 +100,7 @@ class DamageParser(ReplacementEffectParser):
                 text=text
             )
             
-            logger.debug(f"[DamageParser] Parsed damage redirection: {original_target_text} -> {redirect_target_text}")
+            logger.debug("[DamageParser] Parsed damage redirection: %s -> %s", original_target_text, redirect_target_text)
             
             return ParseResult(
                 matched=True,
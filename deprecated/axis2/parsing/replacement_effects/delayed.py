@@ -9,6 +9,7 @@ from axis2.schema import ReplacementEffect
 class DelayedParser(ReplacementEffectParser):
     """Parses delayed replacement effects: 'the next time X would Y this turn'"""
     priority = 55  # Highest priority - very specific pattern
+    cues = ("the next time",)
 
     def can_parse(self, text: str) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -63,20 +63,21 @@ def parse_destruction_subject(raw: str) -> Subject:
 class DestructionParser(ReplacementEffectParser):
     """Parses destruction replacement effects: 'if X would be destroyed, Y instead'"""
     priority = 46
+    cues = ("would be destroyed",)
     
     def can_parse(self, text: str) -> bool:
         result = "would be destroyed" in text.lower() and "instead" in text.lower()
-        logger.debug(f"[DestructionParser] can_parse('{text[:80]}'): {result}")
+        logger.debug("[DestructionParser] can_parse('%s'): %s", text[:80], result)
         return result
     
     def parse(self, text: str) -> ParseResult:
-        logger.debug(f"[DestructionParser] parse called with: {text[:100]}")
+        logger.debug("[DestructionParser] parse called with: %s", text[:100])
         m = RE_WOULD_BE_DESTROYED.search(text)
         if not m:
-            logger.debug(f"[DestructionParser] Regex did not match: {text[:100]}")
+            logger.debug("[DestructionParser] Regex did not match: %s", text[:100])
             return ParseResult(matched=False)
         
-        logger.debug(f"[DestructionParser] Regex matched! Group 1: '{m.group(1)}', Group 2: '{m.group(2)}'")
+        logger.debug("[DestructionParser] Regex matched! Group 1: '%s', Group 2: '%s'", m.group(1), m.group(2))
         
         try:
             subject_raw = m.group(1).strip()
@@ -85,7 +86,7 @@ class DestructionParser(ReplacementEffectParser):
             subject = parse_destruction_subject(subject_raw)
             actions = parse_destruction_instead_actions(action_raw)
             
-            logger.debug(f"[DestructionParser] Parsed subject: {subject.scope}, actions: {actions}")
+            logger.debug("[DestructionParser] Parsed subject: %s, actions: %s", subject.scope, actions)
             
             effect = ReplacementEffect(
                 kind="prevent_destruction",
@@ -95,7 +96,7 @@ class DestructionParser(ReplacementEffectParser):
                 zones=["battlefield"]
             )
             
-            logger.debug(f"[DestructionParser] Created ReplacementEffect: {effect.kind}")
+            logger.debug("[DestructionParser] Created ReplacementEffect: %s", effect.kind)
             
             return ParseResult(
                 matched=True,
@@ -103,7 +104,7 @@ class DestructionParser(ReplacementEffectParser):
                 consumed_text=text
             )
         except (ValueError, AttributeError) as e:
-            logger.error(f"[DestructionParser] Error parsing: {e}")
+            logger.error("[DestructionParser] Error parsing: %s", e)
             return ParseResult(
                 matched=True,
                 errors=[f"Failed to parse destruction replacement: {e}"]
@@ -9,6 +9,7 @@ from axis2.schema import ReplacementEffect
 class DiesParser(ReplacementEffectParser):
     """Parses dies replacement effects: 'if X would die, Y instead'"""
     priority = 45  # High priority
+    cues = ("would die",)
 
     def can_parse(self, text: str) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -9,6 +9,7 @@ import re
 class DrawParser(ReplacementEffectParser):
     """Parses draw replacement effects: 'if X would draw, draw Y instead'"""
     priority = 30  # Lower priority
+    cues = ("would draw",)
 
     def can_parse(self, text: str) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -8,6 +8,7 @@ from axis2.schema import ReplacementEffect, Subject
 class EnterTappedParser(ReplacementEffectParser):
     """Parses enter tapped replacement effects: 'enters the battlefield tapped'"""
     priority = 40  # Medium priority
+    cues = ("battlefield tapped",)
 
     def can_parse(self, text: str) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -15,6 +15,7 @@ RE_MANA_REPLACEMENT = re.compile(
 class ManaReplacementParser(ReplacementEffectParser):
     """Parses replacement effects for mana abilities: 'If condition, add X instead'"""
     priority = 60  # High priority - specific pattern
+    cues = ("instead",)
     
     def can_parse(self, text: str) -> bool:
         # ⚠️ CHEAP CHECK ONLY
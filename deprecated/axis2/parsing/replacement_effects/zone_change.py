@@ -9,6 +9,7 @@ from axis2.schema import ReplacementEffect, Subject
 class ZoneChangeParser(ReplacementEffectParser):
     """Parses zone change replacement effects: 'if X would be put into a graveyard from anywhere, Y instead'"""
     priority = 50  # High priority - specific pattern
+    cues = ("would be put into",)
 
     def can_parse(self, text: str) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -35,6 +35,7 @@ class ParseResult:
 class StaticEffectParser(Protocol):
     """Interface all static effect parsers must implement"""
     priority: int  # Higher = tried first
+    cues: tuple[str, ...] = ()  # lower-case substrings can_parse needs; see BaseParserRegistry
     
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         """
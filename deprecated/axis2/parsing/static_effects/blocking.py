@@ -8,6 +8,7 @@ from axis2.schema import StaticEffect, Subject, ParseContext
 class BlockingParser(StaticEffectParser):
     """Parses blocking restriction effects: 'each creature you control can't be blocked by more than one'"""
     priority = 50  # Medium priority
+    cues = ("be blocked by more than",)
 
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -9,6 +9,7 @@ import re
 class CostModificationParser(StaticEffectParser):
     """Parses cost modification effects: 'artifact spells you cast cost {1} less to cast'"""
     priority = 25  # Lower priority
+    cues = ("cast cost",)
 
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -8,6 +8,7 @@ from axis2.schema import StaticEffect, Subject, ParseContext
 class CrewPowerParser(StaticEffectParser):
     """Parses crew power bonus effects: 'crews vehicles as though its power were 2 greater'"""
     priority = 45  # Medium priority
+    cues = ("crews vehicles",)
 
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -89,9 +89,9 @@ def parse_general_static_effects(text: str, ctx: ParseContext) -> List[StaticEff
     if result.is_success:
         effects.extend(result.all_effects)
     else:
-        logger.warning(f"Failed to parse static effect: {text[:50]}...")
+        logger.debug("Failed to parse static effect: %s...", text[:50])
         if result.errors:
-            logger.debug(f"Errors: {result.errors}")
+            logger.debug("Errors: %s", result.errors)
 
     return effects
 
@@ -8,6 +8,7 @@ from axis2.schema import StaticEffect, Subject, ParseContext
 class HasteParser(StaticEffectParser):
     """Parses haste grant effects: 'all creatures have haste'"""
     priority = 40  # Medium priority
+    cues = ("all creatures have haste",)
 
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
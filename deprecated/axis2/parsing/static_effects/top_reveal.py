@@ -8,6 +8,7 @@ from axis2.schema import StaticEffect, Subject, ParseContext
 class TopRevealParser(StaticEffectParser):
     """Parses top reveal effects: 'play with the top card of their libraries revealed'"""
     priority = 35  # Lower priority
+    cues = ("top card",)
 
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -8,6 +8,7 @@ from axis2.schema import StaticEffect, Subject, ParseContext
 class ZoneAdditionParser(StaticEffectParser):
     """Parses zone addition effects: 'noninstant, nonsorcery cards on top of a library are on the battlefield'"""
     priority = 30  # Lower priority
+    cues = ("on top of a library are on the battlefield",)
 
     def can_parse(self, text: str, ctx: ParseContext) -> bool:
         # ⚠️ CHEAP CHECK ONLY
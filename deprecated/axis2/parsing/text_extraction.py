@@ -6,14 +6,12 @@ structured abilities have been parsed from Axis1.
 """
 
 import re
-import logging
 from typing import List, Tuple, Optional
 from axis1.schema import Axis1Face
 from axis2.schema import ActivatedAbility, TriggeredAbility, Effect, ParseContext
 from axis2.parsing.keywords import extract_keywords
 from axis2.parsing.sentences import split_into_sentences
-
-logger = logging.getLogger(__name__)
+from axis2.parsing import trace
 
 
 def get_remaining_text_for_parsing(
@@ -49,6 +47,7 @@ def get_remaining_text_for_parsing(
         - keyword_names: List of keyword names found
         - keyword_effects: List of Effect objects from keyword abilities
     """
+    active = trace.current()
     text = (face.oracle_text or "").strip()
     if not text:
         return ""
@@ -77,8 +76,6 @@ def get_remaining_text_for_parsing(
         lines = text.split("\n")
         cleaned_lines = []
         
-        logger.debug(f"[TEXT_EXTRACT] Original text: {text[:200]}")
-        
         for line in lines:
             stripped = line.strip()
             if not stripped:
@@ -89,8 +86,8 @@ def get_remaining_text_for_parsing(
             keyword_result = registry.detect_keyword(stripped)
             if keyword_result:
                 keyword_name, reminder_text, cost_text = keyword_result
-                print(f"[TEXT_EXTRACT PRINT] Line '{stripped}' detected as keyword: {keyword_name}")
-                logger.debug(f"[TEXT_EXTRACT] Found keyword: {keyword_name}, reminder: {reminder_text[:50] if reminder_text else None}")
+                if active:
+                    active.record("text_extraction", "keyword", stripped, keyword=keyword_name, reminder=reminder_text)
                 
                 # Parse the keyword ability
                 parsed_effects = registry.parse_keyword(
@@ -108,12 +105,11 @@ def get_remaining_text_for_parsing(
             cleaned_lines.append(stripped)
         
         text = "\n".join(cleaned_lines)
-        print(f"[TEXT_EXTRACT PRINT] Removed {len(keyword_lines_to_remove)} keyword lines")
-        print(f"[TEXT_EXTRACT PRINT] Parsed {len(keyword_effects)} keyword effects")
-        print(f"[TEXT_EXTRACT PRINT] Remaining text after keyword removal: {text[:300]}")
-        logger.debug(f"[TEXT_EXTRACT] Removed {len(keyword_lines_to_remove)} keyword lines")
-        logger.debug(f"[TEXT_EXTRACT] Parsed {len(keyword_effects)} keyword effects")
-        logger.debug(f"[TEXT_EXTRACT] Remaining text after keyword removal: {text[:300]}")
+        if active:
+            active.record(
+                "text_extraction", "keywords_removed", text[:300],
+                lines=len(keyword_lines_to_remove), effects=len(keyword_effects),
+            )
     
     # Extract parenthetical text (for non-keyword parentheticals)
     parenthetical_text = []
@@ -131,7 +127,8 @@ def get_remaining_text_for_parsing(
         paren_match = re.search(r"\(([^)]+)\)", stripped)
         if paren_match:
             extracted = paren_match.group(1)
-            logger.debug(f"[TEXT_EXTRACT] Found parenthetical text: {extracted[:100]}")
+            if active:
+                active.record("text_extraction", "parenthetical", extracted)
             parenthetical_text.append(extracted)
             # Remove the parenthetical part from the line
             line_without_paren = re.sub(r"\([^)]+\)", "", stripped).strip()
@@ -143,21 +140,18 @@ def get_remaining_text_for_parsing(
     
     # Remove standalone keyword lines (simple keywords without reminder text)
     keywords = extract_keywords("\n".join(cleaned_lines))
-    logger.debug(f"[TEXT_EXTRACT] Extracted simple keywords: {keywords}")
-    logger.debug(f"[TEXT_EXTRACT] Lines before keyword removal: {cleaned_lines}")
     cleaned_lines = [
         line for line in cleaned_lines
         if line.lower() not in [kw.lower() for kw in keywords]
     ]
-    logger.debug(f"[TEXT_EXTRACT] Lines after keyword removal: {cleaned_lines}")
     
     # Add back parenthetical text as separate lines (for non-keyword parentheticals)
     if parenthetical_text:
-        logger.debug(f"[TEXT_EXTRACT] Adding {len(parenthetical_text)} parenthetical text lines back")
         cleaned_lines.extend(parenthetical_text)
     
     text = "\n".join(cleaned_lines)
-    logger.debug(f"[TEXT_EXTRACT] Final remaining text: {text[:200]}")
+    if active:
+        active.record("text_extraction", "remaining", text[:200], simple_keywords=keywords)
     
     return text.strip(), keyword_names, keyword_effects
 
@@ -0,0 +1,105 @@
+"""
+Structured parse tracing for the Axis2 parser.
+
+Tracing is off unless a ParseTrace is active. The active trace is held
+in a ContextVar, so builds running in other threads never record into
+it. Call sites read it once per call and guard every record with that
+local, so nothing is formatted, timed or allocated when it is off:
+
+    from axis2.parsing import trace
+
+    active = trace.current()
+    ...
+    if active:
+        active.record("dispatcher", "no_match", sentence, errors=result.errors)
+
+Collect a trace for one build:
+
+    with trace.tracing() as t:
+        Axis2Builder.build(card)
+    t.records    # per-sentence decisions
+    t.timings    # per-parser calls / matches / seconds
+
+With log=True every record is also written to the "axis2.trace" logger
+at DEBUG, which replaces the old unconditional debug prints. Setting
+AXIS2_TRACE=1 turns that on for the whole process.
+"""
+
+import logging
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+
+_log = logging.getLogger("axis2.trace")
+
+
+class TraceRecord(NamedTuple):
+    source: str                 # "dispatcher", "registry", "builder.ltb", ...
+    event: str                  # "sentence", "match", "no_match", ...
+    text: Optional[str]
+    fields: Dict[str, Any]
+
+    def format(self) -> str:
+        parts = [f"[{self.source}] {self.event}"]
+        if self.text is not None:
+            parts.append(repr(self.text[:120]))
+        parts.extend(f"{key}={value!r}" for key, value in self.fields.items())
+        return " ".join(parts)
+
+
+class ParserTiming:
+    __slots__ = ("calls", "matches", "seconds")
+
+    def __init__(self):
+        self.calls = 0
+        self.matches = 0
+        self.seconds = 0.0
+
+    def __repr__(self):
+        return f"ParserTiming(calls={self.calls}, matches={self.matches}, seconds={self.seconds:.6f})"
+
+
+class ParseTrace:
+    def __init__(self, log: bool = False):
+        self.log = log
+        self.records: List[TraceRecord] = []
+        self.timings: Dict[str, ParserTiming] = {}
+
+    def record(self, source: str, event: str, text: Optional[str] = None, **fields):
+        rec = TraceRecord(source, event, text, fields)
+        self.records.append(rec)
+        if self.log:
+            _log.debug(rec.format())
+
+    def timing(self, parser: Any, seconds: float, matched: bool):
+        name = type(parser).__name__
+        timing = self.timings.get(name)
+        if timing is None:
+            timing = self.timings[name] = ParserTiming()
+        timing.calls += 1
+        timing.matches += matched
+        timing.seconds += seconds
+
+    def lines(self) -> List[str]:
+        return [rec.format() for rec in self.records]
+
+
+# The trace the current thread/context records into, or None when off
+_active: ContextVar[Optional[ParseTrace]] = ContextVar(
+    "axis2_parse_trace", default=ParseTrace(log=True) if os.getenv("AXIS2_TRACE") else None
+)
+
+current = _active.get
+
+
+@contextmanager
+def tracing(log: bool = False) -> Iterator[ParseTrace]:
+    """Record into a fresh ParseTrace for the duration of the block (this context only)."""
+    t = ParseTrace(log=log)
+    token = _active.set(t)
+    try:
+        yield t
+    finally:
+        _active.reset(token)
@@ -7,6 +7,7 @@ from axis2.schema import AttacksEvent
 class AttacksParser(TriggerParser):
     """Parses attacks triggers: 'whenever X attacks'"""
     priority = 25  # Lower priority
+    cues = ("attacks",)
 
     def can_parse(self, text: str) -> bool:
         # ⚠️ CHEAP CHECK ONLY
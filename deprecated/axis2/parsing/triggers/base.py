@@ -22,6 +22,7 @@ class ParseResult:
 class TriggerParser(Protocol):
     """Interface all trigger parsers must implement"""
     priority: int
+    cues: tuple[str, ...] = ()  # lower-case substrings can_parse needs; see BaseParserRegistry
     
     def can_parse(self, text: str) -> bool:
         """Quick check if this parser might match. Must be CHEAP."""
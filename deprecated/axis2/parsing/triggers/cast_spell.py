@@ -8,6 +8,7 @@ from axis2.schema import CastSpellEvent
 class CastSpellParser(TriggerParser):
     """Parses cast spell triggers: 'whenever you cast a spell'"""
     priority = 30  # Lower priority
+    cues = ("spell",)
 
     def can_parse(self, text: str) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -7,6 +7,7 @@ from axis2.schema import DealsDamageEvent
 class DamageParser(TriggerParser):
     """Parses damage triggers: 'when X deals damage to Y'"""
     priority = 45  # High priority
+    cues = ("damage",)
 
     def can_parse(self, text: str) -> bool:
         # ⚠️ CHEAP CHECK ONLY
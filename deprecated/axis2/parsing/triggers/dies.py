@@ -6,6 +6,7 @@ from axis2.schema import DiesEvent
 
 class DiesParser(TriggerParser):
     priority = 36
+    cues = ("dies",)
     
     def can_parse(self, text: str) -> bool:
         return "dies" in text.lower() and ("when" in text.lower() or "whenever" in text.lower())
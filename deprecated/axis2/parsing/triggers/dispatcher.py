@@ -27,8 +27,8 @@ def parse_trigger_event(condition_text: str) -> Optional[Union[ZoneChangeEvent,
     if result.is_success:
         return result.event
     else:
-        logger.warning(f"Failed to parse trigger event: {condition_text[:50]}...")
+        logger.debug("Failed to parse trigger event: %s...", condition_text[:50])
         if result.errors:
-            logger.debug(f"Errors: {result.errors}")
+            logger.debug("Errors: %s", result.errors)
         return None
 
@@ -7,6 +7,7 @@ from axis2.schema import EntersBattlefieldEvent
 class ETBParser(TriggerParser):
     """Parses enters-the-battlefield triggers: 'when X enters the battlefield'"""
     priority = 40  # Medium priority
+    cues = ("enters",)
 
     def can_parse(self, text: str) -> bool:
         # ⚠️ CHEAP CHECK ONLY
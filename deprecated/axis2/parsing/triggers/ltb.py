@@ -7,6 +7,7 @@ from axis2.schema import LeavesBattlefieldEvent
 class LTBParser(TriggerParser):
     """Parses leaves-the-battlefield triggers: 'when X leaves the battlefield'"""
     priority = 35  # Medium priority
+    cues = ("leaves the battlefield",)
 
     def can_parse(self, text: str) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -27,6 +27,7 @@ BEGINNING_OF_COMBAT_RE = re.compile(
 class StepTriggerParser(TriggerParser):
     """Parses step triggers: 'At the beginning of your upkeep', 'At the beginning of your end step', etc."""
     priority = 60  # High priority - specific patterns
+    cues = ("at the beginning of",)
     
     def can_parse(self, text: str) -> bool:
         # ⚠️ CHEAP CHECK ONLY
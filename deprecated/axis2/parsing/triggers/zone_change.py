@@ -7,6 +7,7 @@ from axis2.schema import ZoneChangeEvent
 class ZoneChangeParser(TriggerParser):
     """Parses zone change triggers: 'when X is put into Y from Z'"""
     priority = 50  # High priority - specific pattern
+    cues = ("is put into",)
 
     def can_parse(self, text: str) -> bool:
         # ⚠️ CHEAP CHECK ONLY
@@ -22,8 +22,8 @@ def apply_keyword_abilities(game_state: "GameState", rt_obj: "RuntimeObject", ec
     # Start with printed/static keywords
     keywords: Set[str] = set(getattr(rt_obj.characteristics, "abilities", []))
 
-    # Add keywords from continuous effects
-    for ce in getattr(game_state, "continuous_effects", []):
+    # Add keywords from the continuous effects that can touch this object
+    for ce in game_state.layers.affected.effects_for(rt_obj.id):
         if ce.layer == 6 and ce.add_abilities and ce.applies_to(game_state, rt_obj.id):
             ce.add_abilities(game_state, rt_obj.id, keywords)
 
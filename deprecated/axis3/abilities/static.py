@@ -4,11 +4,56 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Callable, Optional, Set, List
 
+from axis3.state.zones import ZoneType
+
 # For type hints only:
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from axis3.state.game_state import GameState
 
+@dataclass(frozen=True)
+class AffectedFilter:
+    """
+    Structured description of the objects a continuous effect can touch,
+    used by LayerSystem's affected-object index. Every set field must
+    match, and only battlefield objects match. applies_to is still
+    checked for the objects that pass, so the filter only has to be
+    broad enough, not exact.
+    """
+    self_only: bool = False              # the effect's source itself
+    attached_to_source: bool = False     # what the source is attached to
+    you_control: bool = False            # controlled by the source's controller
+    controller: Optional[int] = None     # controlled by this player
+    card_type: Optional[str] = None      # printed type, e.g. "Creature"
+    subtype: Optional[str] = None        # printed subtype, e.g. "Elf"
+
+    def matches(self, game_state: GameState, source_id: Optional["RuntimeObjectId"], obj) -> bool:
+        if obj.zone != ZoneType.BATTLEFIELD:
+            return False
+        if self.self_only and obj.id != source_id:
+            return False
+        if self.attached_to_source or self.you_control:
+            source = game_state.objects.get(source_id)
+            if source is None:
+                return False
+            if self.attached_to_source and getattr(source, "attached_to", None) != obj.id:
+                return False
+            if self.you_control and obj.controller != source.controller:
+                return False
+        if self.controller is not None and obj.controller != self.controller:
+            return False
+        if self.card_type is not None and self.card_type not in obj.characteristics.types:
+            return False
+        if self.subtype is not None and self.subtype not in obj.characteristics.subtypes:
+            return False
+        return True
+
+    @property
+    def follows_source(self) -> bool:
+        """Whether a change to the source can change what matches."""
+        return self.self_only or self.attached_to_source or self.you_control
+
+
 @dataclass
 class RuntimeContinuousEffect:
     """
@@ -19,6 +64,14 @@ class RuntimeContinuousEffect:
     layer: int                             # Layer 1-7
     sublayer: Optional[str] = None         # e.g., '7b', '7c', etc.
     applies_to: Callable[[GameState, "RuntimeObjectId"], bool] = lambda gs, oid: True
+    # Objects the effect can touch; None means it is checked against every object
+    affects: Optional[AffectedFilter] = None
+    # applies_to / modify_* may only look at the battlefield (and the
+    # objects' own state): the LayerSystem keeps other cached entries when
+    # a card moves between hand, library, graveyard etc. Set this if they
+    # read those zones (e.g. count cards in a graveyard) so such moves
+    # re-evaluate everything.
+    depends_on_zones: bool = False
 
     # Optional effect functions
     modify_power: Optional[Callable[[GameState, "RuntimeObjectId", int], int]] = None
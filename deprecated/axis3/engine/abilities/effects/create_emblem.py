@@ -43,6 +43,7 @@ class CreateEmblemEffect(ContinuousEffect):
         # Register static effects globally
         for eff in self.static_effects:
             game_state.continuous_effects.append(eff)
+        game_state.layers.invalidate()
 
         # Optional event emission for UI
         if hasattr(game_state, "event_bus"):
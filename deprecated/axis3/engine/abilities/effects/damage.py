@@ -41,6 +41,9 @@ class DealDamageEffect(ContinuousEffect):
 
             damaged_ids.append(getattr(target, "id", None))
 
+        if damaged_ids:
+            game_state.mark_changed()
+
         # Optional UI event
         if hasattr(game_state, "event_bus"):
             game_state.event_bus.publish({
@@ -50,6 +50,7 @@ class FightEffect(ContinuousEffect):
             a.damage += a_damage
         if hasattr(b, "damage"):
             b.damage += b_damage
+        game_state.mark_changed()
 
         # Optional UI event
         if hasattr(game_state, "event_bus"):
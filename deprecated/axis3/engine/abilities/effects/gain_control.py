@@ -39,6 +39,7 @@ class GainControlEffect(ContinuousEffect):
             obj.controller = controller
 
             changed_ids.append(getattr(obj, "id", None))
+            game_state.object_moved(obj.id)
 
         # Optional UI event
         if hasattr(game_state, "event_bus"):
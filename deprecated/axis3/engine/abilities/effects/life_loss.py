@@ -27,6 +27,7 @@ class LoseLifeEffect(ContinuousEffect):
 
         # Apply life loss
         player.life -= self.amount
+        game_state.mark_changed()
 
         # Optional UI event
         if hasattr(game_state, "event_bus"):
@@ -38,6 +38,7 @@ class PutCountersEffect(ContinuousEffect):
 
             obj.counters[self.counter_type] = obj.counters.get(self.counter_type, 0) + self.amount
             affected_ids.append(getattr(obj, "id", None))
+            game_state.layers.invalidate(obj.id)
 
         # Optional UI event
         if hasattr(game_state, "event_bus"):
@@ -48,6 +48,7 @@ class ReturnFromGYEffect(ContinuousEffect):
             game_state.battlefield.append(card)
 
             returned_ids.append(getattr(card, "id", None))
+            game_state.object_moved(card.id)
 
         # Optional UI event
         if hasattr(game_state, "event_bus"):
@@ -1,6 +1,7 @@
 # axis3/engine/combat.py
 
 from axis3.state.game_state import GameState
+from axis3.state.zones import ZoneType as Zone
 
 def combat_step(game_state: GameState):
     """
@@ -8,8 +9,7 @@ def combat_step(game_state: GameState):
     """
     # Simplified: assign damage to first blocker/attacker
     # You can expand with real blockers, trample, etc.
-    for obj_id, rt_obj in game_state.objects.items():
-        if rt_obj.zone.name == "BATTLEFIELD" and "Creature" in rt_obj.characteristics.types:
-            ec = game_state.layers.evaluate(obj_id)
-            # Example: reset damage (in real combat, assign accordingly)
-            rt_obj.damage = 0
+    for rt_obj in game_state.index.of_type("Creature", Zone.BATTLEFIELD):
+        ec = game_state.layers.evaluate(rt_obj.id)
+        # Example: reset damage (in real combat, assign accordingly)
+        rt_obj.damage = 0
@@ -81,6 +81,12 @@ def build_game_state_from_decks(
     # Prepare final objects dict
     objects: dict = {}
 
+    # Precompiled Axis2 cards for both decks in one round trip
+    player1_deck_axis1 = list(player1_deck_axis1)
+    player2_deck_axis1 = list(player2_deck_axis1)
+    if hasattr(axis2_builder, "prefetch"):
+        axis2_builder.prefetch(player1_deck_axis1 + player2_deck_axis1)
+
     # Build Axis2 + runtime objects for Player 0
     for axis1_card in player1_deck_axis1:
         axis2 = axis2_builder.build(axis1_card, game_state=dummy_state)
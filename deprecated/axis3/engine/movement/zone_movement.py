@@ -87,7 +87,11 @@ class ZoneMovementEngine:
         if controller is not None:
             obj.controller = controller
 
-        # 6. Enter/leave battlefield hooks
+        # 6. Re-index and drop cached characteristics before any hook
+        #    looks at the object in its new zone
+        game_state.object_moved(obj.id, from_zone=from_zone)
+
+        # 7. Enter/leave battlefield hooks
         if self._is_battlefield(final_to_zone):
             self._apply_etb_replacements(game_state, obj)
             self._fire_etb_triggers(game_state, obj)
@@ -95,9 +99,6 @@ class ZoneMovementEngine:
         if self._is_battlefield(from_zone):
             self._fire_ltb_triggers(game_state, obj)
 
-        # 7. Reapply layers after zone movement
-        game_state.layers.apply_all_layers()
-
     # ============================================================
     # INTERNAL HELPERS
     # ============================================================
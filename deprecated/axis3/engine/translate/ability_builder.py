@@ -82,3 +82,5 @@ def register_runtime_abilities_for_object(game_state: GameState, rt_obj: Runtime
             remove_abilities=getattr(eff, "remove_abilities", None),
         )
         rt_obj.static_abilities.append(rce)
+
+    game_state.layers.invalidate(rt_obj.id)
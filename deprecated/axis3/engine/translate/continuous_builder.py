@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import List
 
-from axis3.abilities.static import RuntimeContinuousEffect
+from axis3.abilities.static import AffectedFilter, RuntimeContinuousEffect
 from axis3.state.game_state import GameState
 from axis3.state.objects import RuntimeObject
 from axis3.state.zones import ZoneType as Zone
@@ -46,6 +46,7 @@ def build_continuous_effects_for_object(game_state: GameState, rt_obj: RuntimeOb
                     layer=7,
                     sublayer="7b",
                     applies_to=applies_to,
+                    affects=AffectedFilter(controller=rt_obj.controller, card_type="Creature"),
                     modify_power=mod_p,
                     modify_toughness=mod_t,
                 )
@@ -79,6 +80,7 @@ def build_continuous_effects_for_object(game_state: GameState, rt_obj: RuntimeOb
                     layer=6,
                     sublayer=None,
                     applies_to=applies_to,
+                    affects=AffectedFilter(attached_to_source=True),
                     grant_abilities=grant_abil,
                 )
             )
@@ -90,7 +92,10 @@ def build_continuous_effects_for_object(game_state: GameState, rt_obj: RuntimeOb
                     layer=7,
                     sublayer="7b",
                     applies_to=applies_to,
+                    affects=AffectedFilter(attached_to_source=True),
                     modify_power=mod_p,
                     modify_toughness=mod_t,
                 )
             )
+
+    game_state.layers.invalidate()
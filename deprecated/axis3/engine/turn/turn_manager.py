@@ -303,9 +303,8 @@ class TurnManager:
         ))
 
         # Simple example: remove damage from creatures on battlefield.
-        for obj in self.gs.objects.values():
-            if getattr(obj.zone, "name", None) == "BATTLEFIELD":
-                obj.damage = 0
+        for obj in self.gs.index.battlefield():
+            obj.damage = 0
 
         run_sbas(self.gs)
 
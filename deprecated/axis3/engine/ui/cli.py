@@ -23,10 +23,9 @@ class CLI(UIInterface):
         print("=" * 50)
 
         print("\n--- Battlefield ---")
-        for obj in gs.objects.values():
-            if obj.zone.name == "BATTLEFIELD":
-                print(f"  {obj.id}: {obj.name} "
-                      f"(tapped={obj.tapped}, dmg={obj.damage})")
+        for obj in gs.index.battlefield():
+            print(f"  {obj.id}: {obj.name} "
+                  f"(tapped={obj.tapped}, dmg={obj.damage})")
 
         print("\n--- Stack ---")
         if gs.stack.is_empty():
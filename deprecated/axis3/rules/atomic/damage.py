@@ -49,6 +49,7 @@ def apply_damage(game_state, event: Event):
         return
 
     rt_obj.damage += amount
+    game_state.mark_changed()
 
     # Derived event: damage was dealt
     game_state.event_bus.publish(Event(
@@ -31,6 +31,7 @@ def apply_draw(game_state, event: Event):
         rt_obj = game_state.objects[card_id]
         rt_obj.zone = Zone.HAND
         rt_obj.controller = player_id
+        game_state.object_moved(card_id, from_zone=Zone.LIBRARY)
 
 
         # 2️⃣ Derived event: a card was drawn
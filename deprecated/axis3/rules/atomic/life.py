@@ -23,6 +23,7 @@ def apply_life_change(game_state, event: Event):
     # 2️⃣ Apply the life change
     player = game_state.players[player_id]
     player.life += amount
+    game_state.mark_changed()
 
     # 3️⃣ Publish a derived event (NOT another LIFE_CHANGE)
     game_state.event_bus.publish(Event(
@@ -4,6 +4,7 @@ from axis3.state.zones import ZoneType as Zone
 from axis3.rules.events.event import Event
 from axis3.rules.events.types import EventType
 from axis3.rules.replacement.apply import apply_replacements
+from axis1.vocab import CardType
 
 
 def apply_zone_change(game_state, event: Event):
@@ -37,9 +38,11 @@ def apply_zone_change(game_state, event: Event):
         game_state.zone_list(controller, to_zone).append(obj_id)
         rt_obj.zone = to_zone
         rt_obj.controller = controller
+        game_state.object_moved(obj_id, from_zone=from_zone)
     else:
         # Token ceases to exist
         del game_state.objects[obj_id]
+        game_state.object_moved(obj_id, from_zone=from_zone)
         return
 
     # 3️⃣ Reset damage if leaving battlefield
@@ -61,7 +64,7 @@ def apply_zone_change(game_state, event: Event):
 
     # Creature dies
     ec = game_state.layers.evaluate(obj_id)
-    if from_zone == Zone.BATTLEFIELD and to_zone == Zone.GRAVEYARD and "Creature" in ec.types:
+    if from_zone == Zone.BATTLEFIELD and to_zone == Zone.GRAVEYARD and ec.type_mask & CardType.CREATURE:
         game_state.event_bus.publish(Event(
             type=EventType.CREATURE_DIES,
             payload={"obj_id": obj_id, "controller": controller, "cause": cause}
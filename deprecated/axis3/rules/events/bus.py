@@ -1,10 +1,11 @@
 # axis3/rules/events/bus.py
 
+from typing import List
+
 from axis3.rules.events.event import Event
 from axis3.rules.events.queue import EventQueue
 from axis3.rules.replacement.apply import apply_replacements
 from axis3.engine.events.registry import EventCallbackRegistry
-from axis3.rules.sba.checker import run_sbas
 from axis3.rules.atomic.dispatch import apply_atomic_event
 
 
@@ -21,6 +22,15 @@ class EventBus:
         self.queue.push(event)
         self._drain()
 
+    def publish_batch(self, events: List[Event]):
+        """
+        Queue events that happen simultaneously (e.g. one round of
+        state-based actions) and process them together.
+        """
+        for event in events:
+            self.queue.push(event)
+        self._drain()
+
     def _drain(self):
         while not self.queue.is_empty():
             event = self.queue.pop()
@@ -37,7 +47,7 @@ class EventBus:
             self.event_callbacks.notify(event)
 
             # 4️⃣ State-based actions
-            run_sbas(self.game_state)
+            self.game_state.sba.run()
 
     # Add this so tests and other code can subscribe to triggers
     def subscribe(self, event_type: str, callback):
@@ -9,9 +9,8 @@ def handle_untap_event(gs: "GameState", event: Event):
     print(f"Untapping player {active}")
 
     # 1. Untap permanents
-    for obj in gs.objects.values():
-        if obj.zone.name == "BATTLEFIELD" and obj.controller == active:
-            obj.tapped = False
+    for obj in gs.index.battlefield(active):
+        obj.tapped = False
 
     # 2. Clear mana pool
     player = gs.players[active]
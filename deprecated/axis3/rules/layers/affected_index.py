@@ -0,0 +1,75 @@
+# axis3/rules/layers/affected_index.py
+
+from __future__ import annotations
+from typing import Dict, List, Optional
+
+from axis3.state.objects import RuntimeObjectId
+from axis3.state.zones import ZoneType as Zone
+
+
+class AffectedIndex:
+    """
+    Maps each battlefield object to the continuous effects that can touch
+    it, so layer evaluation only visits those instead of every effect.
+
+    Effects with an AffectedFilter (see axis3.abilities.static) are listed
+    only under the objects their filter matches. Effects without one are
+    listed under every object, and they are all that objects off the
+    battlefield get. Lists keep the order of game_state.continuous_effects.
+
+    The index is rebuilt when the effect list changes and updated per
+    object on zone and control changes (object_changed).
+    """
+
+    def __init__(self, game_state: "GameState"):
+        self.game_state = game_state
+        self._stale = True
+        self._effect_count = 0
+        self._unfiltered: List = []
+        self._by_object: Dict[RuntimeObjectId, List] = {}
+
+    def effects_for(self, obj_id: RuntimeObjectId) -> List:
+        effects = getattr(self.game_state, "continuous_effects", [])
+        if self._stale or len(effects) != self._effect_count:
+            self._rebuild(effects)
+        return self._by_object.get(obj_id, self._unfiltered)
+
+    def invalidate(self):
+        """The effect list changed in place; rebuild on next use."""
+        self._stale = True
+
+    def object_changed(self, obj_id: RuntimeObjectId):
+        """`obj_id` changed zone or controller, or left the game."""
+        if self._stale:
+            return
+        effects = getattr(self.game_state, "continuous_effects", [])
+        for ce in effects:
+            affects = getattr(ce, "affects", None)
+            if affects is not None and ce.source_id == obj_id and affects.follows_source:
+                # Its effects may now touch other objects
+                self._stale = True
+                return
+        obj = self.game_state.objects.get(obj_id)
+        entry = self._entry(effects, obj) if obj is not None else None
+        if entry is None:
+            self._by_object.pop(obj_id, None)
+        else:
+            self._by_object[obj_id] = entry
+
+    def _entry(self, effects: List, obj) -> Optional[List]:
+        if obj.zone != Zone.BATTLEFIELD:
+            return None
+        return [
+            ce for ce in effects
+            if getattr(ce, "affects", None) is None
+            or ce.affects.matches(self.game_state, ce.source_id, obj)
+        ]
+
+    def _rebuild(self, effects: List):
+        self._unfiltered = [ce for ce in effects if getattr(ce, "affects", None) is None]
+        self._by_object = {}
+        if len(self._unfiltered) < len(effects):
+            for obj in self.game_state.index.battlefield():
+                self._by_object[obj.id] = self._entry(effects, obj)
+        self._effect_count = len(effects)
+        self._stale = False
@@ -1,19 +1,98 @@
 # src/axis3/rules/layers/layersystem.py
 
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 from axis3.state.objects import RuntimeObject, RuntimeObjectId
 from axis3.rules.layers.types import EvaluatedCharacteristics
+from axis3.rules.layers.affected_index import AffectedIndex
 from axis3.abilities.static import RuntimeContinuousEffect, RuntimeStaticAbility
 from axis3.abilities.keyword import apply_keyword_abilities
+from axis1.vocab import color_mask, supertype_mask, type_mask
 
 class LayerSystem:
     """
     Central system for evaluating MTG layers 1–7 for all objects.
     Handles continuous effects, static abilities, and keyword abilities.
+
+    Evaluated characteristics are cached per object. An entry is reused
+    until something it can depend on changes:
+      - object_changed(obj_id)  obj_id changed zone, controller or what it
+                                is attached to, or left the game; only
+                                its own entry goes unless it was or is on
+                                the battlefield or is an effect source
+      - invalidate()            continuous effects changed
+      - invalidate(obj_id)      that object's counters / static abilities
+                                changed; objects whose evaluation used an
+                                effect from obj_id are dropped too
+    Continuous effects are looked up through an AffectedIndex, so each
+    object only visits the effects that can touch it.
+    Damage and tapping don't touch characteristics, so they keep entries.
+    Callers must treat the returned EvaluatedCharacteristics as read-only.
     """
 
     def __init__(self, game_state: "GameState"):
         self.game_state = game_state
+        self._generation = 0
+        self._object_generations: Dict[RuntimeObjectId, int] = {}
+        # obj_id -> ((generation, object generation, effect count), ec)
+        self._cache: Dict[RuntimeObjectId, Tuple[Tuple[int, int, int], EvaluatedCharacteristics]] = {}
+        # effect source -> objects whose cached evaluation used its effects
+        self._dependents: Dict[RuntimeObjectId, Set[RuntimeObjectId]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.affected = AffectedIndex(game_state)
+
+    def invalidate(self, obj_id: Optional[RuntimeObjectId] = None):
+        """
+        Drop cached characteristics: all of them, or those of `obj_id` and
+        of the objects that depend on its effects.
+        """
+        self.game_state.mark_changed()
+        if obj_id is None:
+            self._generation += 1
+            self._cache.clear()
+            self._dependents.clear()
+            self.affected.invalidate()
+            return
+        stale = self._dependents.pop(obj_id, set())
+        stale.add(obj_id)
+        for oid in stale:
+            self._object_generations[oid] = self._object_generations.get(oid, 0) + 1
+            self._cache.pop(oid, None)
+
+    def object_changed(self, obj_id: RuntimeObjectId, battlefield: bool = True):
+        """
+        `obj_id` changed zone, controller or attachment (or ceased to
+        exist). `battlefield` says whether it was or now is on the
+        battlefield. If so, if it is the source of a continuous effect,
+        or if any effect declares depends_on_zones, that can change what
+        any effect applies to and every cached entry goes. Otherwise a
+        move between other zones (a draw, a discard) only drops the
+        object's own entry. The affected index is only updated for this
+        object either way.
+        """
+        if battlefield or self._affects_other_objects(obj_id):
+            self.game_state.mark_changed()
+            self._generation += 1
+            self._cache.clear()
+            self._dependents.clear()
+        else:
+            self._object_generations[obj_id] = self._object_generations.get(obj_id, 0) + 1
+            self._cache.pop(obj_id, None)
+        self.affected.object_changed(obj_id)
+
+    def _affects_other_objects(self, obj_id: RuntimeObjectId) -> bool:
+        return any(
+            getattr(ce, "source_id", None) == obj_id or getattr(ce, "depends_on_zones", False)
+            for ce in getattr(self.game_state, "continuous_effects", [])
+        )
+
+    def _stamp(self, obj_id: RuntimeObjectId) -> Tuple[int, int, int]:
+        # The effect count catches effects appended without invalidate()
+        return (
+            self._generation,
+            self._object_generations.get(obj_id, 0),
+            len(getattr(self.game_state, "continuous_effects", ())),
+        )
 
     def get_land_play_bonus(self, player_id: int) -> int:
         bonus = 0
@@ -27,7 +106,23 @@ class LayerSystem:
     def evaluate(self, obj_id: RuntimeObjectId) -> EvaluatedCharacteristics:
         """
         Evaluate all characteristics for a permanent, applying static abilities in layer order.
+        Returns the cached result when nothing it depends on has changed.
         """
+        stamp = self._stamp(obj_id)
+        cached = self._cache.get(obj_id)
+        if cached is not None and cached[0] == stamp:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        sources: Set[RuntimeObjectId] = set()
+        ec = self._evaluate(obj_id, sources)
+        self._cache[obj_id] = (stamp, ec)
+        for source_id in sources:
+            self._dependents.setdefault(source_id, set()).add(obj_id)
+        return ec
+
+    def _evaluate(self, obj_id: RuntimeObjectId, sources: Set[RuntimeObjectId]) -> EvaluatedCharacteristics:
         rt_obj: RuntimeObject = self.game_state.objects[obj_id]
 
         # Base printed characteristics
@@ -40,9 +135,12 @@ class LayerSystem:
             colors=set(rt_obj.characteristics.colors),
             abilities=set(getattr(rt_obj.characteristics, "abilities", [])),
         )
+        ec.type_mask = type_mask(ec.types)
+        ec.supertype_mask = supertype_mask(ec.supertypes)
+        ec.color_mask = color_mask(ec.colors)
 
         # Apply continuous effects from other objects
-        ec = self._apply_continuous_effects(rt_obj, ec)
+        ec = self._apply_continuous_effects(rt_obj, ec, sources)
 
         # Apply layers 1–3 (type, supertype, subtype changes, if needed)
         ec = self._apply_layer1(rt_obj, ec)
@@ -71,27 +169,33 @@ class LayerSystem:
         return ec
 
     def _apply_continuous_effects(
-        self, rt_obj: RuntimeObject, ec: EvaluatedCharacteristics
+        self, rt_obj: RuntimeObject, ec: EvaluatedCharacteristics, sources: Set[RuntimeObjectId]
     ) -> EvaluatedCharacteristics:
         """
         Apply all continuous effects from the game state that affect this object.
+        Records the source of every effect that applied in `sources`.
         """
-        for ce in getattr(self.game_state, "continuous_effects", []):
+        for ce in self.affected.effects_for(rt_obj.id):
             if not isinstance(ce, RuntimeContinuousEffect):
                 continue
             if ce.applies_to(self.game_state, rt_obj.id):
+                if ce.source_id is not None:
+                    sources.add(ce.source_id)
                 if ce.modify_power:
                     ec.power = ce.modify_power(self.game_state, rt_obj.id, ec.power)
                 if ce.modify_toughness:
                     ec.toughness = ce.modify_toughness(self.game_state, rt_obj.id, ec.toughness)
                 if ce.add_types:
                     ec.types.update(ce.add_types)
+                    ec.type_mask |= type_mask(ce.add_types)
                 if ce.add_subtypes:
                     ec.subtypes.update(ce.add_subtypes)
                 if ce.add_supertypes:
                     ec.supertypes.update(ce.add_supertypes)
+                    ec.supertype_mask |= supertype_mask(ce.add_supertypes)
                 if ce.add_colors:
                     ec.colors.update(ce.add_colors)
+                    ec.color_mask |= color_mask(ce.add_colors)
                 if ce.add_abilities:
                     ec.abilities.update(ce.add_abilities)
                 if ce.remove_abilities:
@@ -17,3 +17,8 @@ class EvaluatedCharacteristics:
     colors: Set[str]
     abilities: Set[str]
 
+    # Bit encodings of types/supertypes/colors (see axis1.vocab)
+    type_mask: int = 0
+    supertype_mask: int = 0
+    color_mask: int = 0
+
@@ -1,2 +1,2 @@
-from .checker import run_sbas
+from .checker import StateBasedActions, run_sbas
 from .rules import check_lethal_damage, check_zero_toughness, check_tokens, check_legend_rule
\ No newline at end of file
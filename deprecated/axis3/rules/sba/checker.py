@@ -1,37 +1,162 @@
 # axis3/rules/sba/checker.py
 
+from typing import Dict, List, Optional, Tuple
+
+from axis1.vocab import Supertype
+from axis3.rules.events.event import Event
+from axis3.rules.layers.types import EvaluatedCharacteristics
 from axis3.rules.sba.rules import (
     check_lethal_damage,
     check_zero_toughness,
     check_tokens,
     check_legend_rule,
 )
+from axis3.state.objects import RuntimeObjectId
 
-def run_sbas(game_state: "GameState"):
-    """
-    Run state-based actions until the game state stabilizes.
+
+class StateBasedActions:
     """
-    
-    while True:
-        changed = False
+    State-based actions (CR 704) for one game.
 
-        # Game loss
-        for player in game_state.players:
-            if player.life <= 0:
-                player.dead = True
-                return
+    A pass is one sweep over the battlefield, one controller at a time
+    (through GameState.index). Each permanent is
+    evaluated once and put through the per-object checks, and legendary
+    permanents are grouped for the legend rule. Objects that have left
+    the battlefield are checked for token cleanup. Everything the sweep
+    finds is performed together as one event batch (CR 704.3), and
+    passes repeat until a sweep finds nothing.
 
-        if check_lethal_damage(game_state):
-            changed = True
+    A permanent passed every check if its evaluated characteristics (the
+    LayerSystem cache entry) and its damage are the same as at the last
+    sweep. Such a permanent is skipped, so a pass over an unchanged
+    battlefield does almost no work.
 
-        if check_zero_toughness(game_state):
-            changed = True
+    Whole runs are skipped when GameState.mark_changed() has not been
+    called (and no continuous effect was added) since the last run found
+    the state stable, and while a run is already in progress. `executed`
+    and `skipped` count runs for the game, `passes` counts sweeps.
+    """
 
-        if check_tokens(game_state):
-            changed = True
+    def __init__(self, game_state: "GameState"):
+        self.game_state = game_state
+        # Battlefield objects at the last sweep -> (ec, damage) they passed
+        # with, or None if they did not pass
+        self._checked: Dict[RuntimeObjectId, Optional[Tuple[EvaluatedCharacteristics, int]]] = {}
+        # Objects that changed zone since the last sweep (insertion ordered)
+        self._moved: Dict[RuntimeObjectId, None] = {}
+        self._running = False
+        # _state_key() when the last run found nothing to do
+        self._stable_at: Optional[Tuple[int, int]] = None
+        self.executed = 0
+        self.skipped = 0
+        self.passes = 0
+        self.actions = 0
 
-        if check_legend_rule(game_state):
-            changed = True
+    def moved(self, obj_id: RuntimeObjectId):
+        """`obj_id` changed zone or was created; check it at the next sweep."""
+        self._moved[obj_id] = None
 
-        if not changed:
+    def run(self):
+        """Run state-based actions until the game state stabilizes."""
+        if self._running or self._state_key() == self._stable_at:
+            # Nothing changed since the last check, or re-entered through
+            # the event bus while a batch is performed (the outer loop
+            # sweeps again once the batch is done)
+            self.skipped += 1
             return
+
+        self.executed += 1
+        self._running = True
+        try:
+            while True:
+                # Game loss
+                for player in self.game_state.players:
+                    if player.life <= 0:
+                        player.dead = True
+                        return
+
+                events = self.sweep()
+                if not events:
+                    self._stable_at = self._state_key()
+                    return
+                self.actions += len(events)
+                self.game_state.event_bus.publish_batch(events)
+        finally:
+            self._running = False
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "executed": self.executed,
+            "skipped": self.skipped,
+            "passes": self.passes,
+            "actions": self.actions,
+        }
+
+    def _state_key(self) -> Tuple[int, int]:
+        return (
+            self.game_state.mutations,
+            len(getattr(self.game_state, "continuous_effects", ())),
+        )
+
+    def sweep(self) -> List[Event]:
+        """Collect every state-based action that applies right now."""
+        self.passes += 1
+        objects = self.game_state.objects
+        evaluate = self.game_state.layers.evaluate
+        checked = self._checked
+        on_battlefield = {}
+        events = []
+
+        for player in self.game_state.players:
+            changed = False
+            permanents = self.game_state.index.battlefield(player.id)
+            for obj in permanents:
+                obj_id = obj.id
+                ec = evaluate(obj_id)
+                passed = checked.get(obj_id)
+                if passed is not None and passed[0] is ec and passed[1] == obj.damage:
+                    on_battlefield[obj_id] = passed
+                    continue
+
+                changed = True
+                event = check_zero_toughness(obj, ec) or check_lethal_damage(obj, ec)
+                if event is None:
+                    on_battlefield[obj_id] = (ec, obj.damage)
+                else:
+                    on_battlefield[obj_id] = None
+                    events.append(event)
+
+            # Only a changed permanent can break the legend rule
+            if changed:
+                events.extend(check_legend_rule(self._legends(permanents, on_battlefield)))
+
+        # Objects that left the battlefield or moved elsewhere
+        departed = [i for i in checked if i not in on_battlefield]
+        for obj_id in dict.fromkeys(departed + list(self._moved)):
+            obj = objects.get(obj_id)
+            if obj is not None:
+                event = check_tokens(obj)
+                if event is not None:
+                    events.append(event)
+
+        self._checked = on_battlefield
+        self._moved = {}
+        return events
+
+    def _legends(self, permanents, on_battlefield) -> Dict[str, List]:
+        """One player's legendary permanents by name, minus those already dying."""
+        legends_by_name = {}
+        for obj in permanents:
+            passed = on_battlefield.get(obj.id)
+            if passed is None:
+                continue
+            if passed[0].supertype_mask & Supertype.LEGENDARY:
+                legends_by_name.setdefault(obj.characteristics.name, []).append(obj)
+        return legends_by_name
+
+
+def run_sbas(game_state: "GameState"):
+    """
+    Run state-based actions until the game state stabilizes.
+    """
+    game_state.sba.run()
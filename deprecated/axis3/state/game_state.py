@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 
 from axis3.state.objects import RuntimeObject, RuntimeObjectId
+from axis3.state.object_index import ObjectIndex, zone_key
 from axis3.state.registries import EffectRegistries
 from axis3.state.commander import CommanderEngine
 
@@ -17,6 +18,7 @@ from axis3.engine.movement.zone_movement import ZoneMovementEngine
 from axis3.engine.stack.stack import Stack
 from axis3.rules.events.bus import EventBus
 from axis3.rules.layers.layersystem import LayerSystem
+from axis3.rules.sba.checker import StateBasedActions
 from axis3.state.zones import ZoneType
 
 
@@ -50,6 +52,8 @@ class GameState:
       - Commander logic to CommanderEngine
       - Effect storage to EffectRegistries
       - Layer application to LayerSystem
+      - Object lookups by zone / controller / type to ObjectIndex
+      - State-based actions to StateBasedActions
       - Event dispatch to EventBus
 
     GameState no longer contains mechanic-specific logic.
@@ -62,6 +66,8 @@ class GameState:
     stack: Stack = field(default_factory=Stack)
     event_bus: EventBus = field(init=False)
     layers: LayerSystem = field(init=False)
+    index: ObjectIndex = field(init=False)
+    sba: StateBasedActions = field(init=False)
 
     # Effect registries (permissions, alt costs, reductions, replacements…)
     registries: EffectRegistries = field(default_factory=EffectRegistries)
@@ -73,6 +79,9 @@ class GameState:
 
     debug_log: List[str] = field(default_factory=list)
 
+    # Bumped by every change state-based actions have to look at
+    mutations: int = field(default=0, init=False)
+
     # ============================================================
     # INITIALIZATION
     # ============================================================
@@ -84,6 +93,12 @@ class GameState:
         # Layer system
         self.layers = LayerSystem(game_state=self)
 
+        # Object indexes
+        self.index = ObjectIndex(self)
+
+        # State-based actions
+        self.sba = StateBasedActions(self)
+
         # Commander engine
         self.commander = CommanderEngine(self)
 
@@ -111,13 +126,14 @@ class GameState:
     # ZONE ACCESS
     # ============================================================
 
-    def zone_list(self, controller_id: int, zone: str) -> List[str]:
+    def zone_list(self, controller_id: int, zone) -> List[str]:
         """
         Return the list corresponding to a player's zone.
+        `zone` is a ZoneType or its name.
         """
 
         player = self.players[controller_id]
-        zone = zone.upper()
+        zone = zone.name if isinstance(zone, ZoneType) else zone.upper()
 
         if zone == "LIBRARY":
             return player.library
@@ -141,6 +157,29 @@ class GameState:
     def get_object(self, obj_id: str) -> Optional[RuntimeObject]:
         return self.objects.get(obj_id)
 
+    def object_moved(self, obj_id: RuntimeObjectId, from_zone=None, created: bool = False):
+        """
+        `obj_id` was created, changed zone or controller, or left the
+        game. Every such path calls this once the object is updated, to
+        re-index it, drop cached characteristics and have state-based
+        actions look at it.
+
+        `from_zone` is where it was; if not given, the index is asked.
+        Only moves into or out of the battlefield invalidate other
+        objects' characteristics.
+        """
+        if created:
+            was = None
+        elif from_zone is not None:
+            was = zone_key(from_zone)
+        else:
+            # Unknown to the index counts as the battlefield
+            was = self.index.zone_of(obj_id) or "BATTLEFIELD"
+        self.index.update(obj_id)
+        battlefield = "BATTLEFIELD" in (was, self.index.zone_of(obj_id))
+        self.layers.object_changed(obj_id, battlefield=battlefield)
+        self.sba.moved(obj_id)
+
     # ============================================================
     # ZONE MOVEMENT (delegated)
     # ============================================================
@@ -182,6 +221,14 @@ class GameState:
     def add_debug_log(self, msg: str):
         self.debug_log.append(msg)
 
+    def mark_changed(self):
+        """
+        Record a change to damage, life, zones, control, counters or
+        continuous effects. StateBasedActions skips runs while this has
+        not been called since its last check.
+        """
+        self.mutations += 1
+
     # ============================================================
     # OBJECT CREATION
     # ============================================================
@@ -203,6 +250,7 @@ class GameState:
 
         self.objects[obj_id] = obj
         self.zone_list(controller, zone.name).append(obj_id)
+        self.object_moved(obj_id, created=True)
 
         return obj
 
@@ -221,5 +269,6 @@ class GameState:
 
         self.objects[obj_id] = token
         self.players[controller].battlefield.append(obj_id)
+        self.object_moved(obj_id, created=True)
 
         return token
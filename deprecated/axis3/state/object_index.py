@@ -0,0 +1,120 @@
+# axis3/state/object_index.py
+
+from __future__ import annotations
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from axis3.state.objects import RuntimeObject, RuntimeObjectId
+from axis3.state.zones import ZoneType
+
+if TYPE_CHECKING:
+    from axis3.state.game_state import GameState
+
+
+def zone_key(zone) -> str:
+    # Zones are ZoneType, but some movement code still stores names
+    return zone.name if isinstance(zone, ZoneType) else str(zone).upper()
+
+
+def _printed_types(obj: RuntimeObject) -> Tuple[str, ...]:
+    characteristics = getattr(obj, "characteristics", None)
+    if characteristics is not None:
+        return tuple(characteristics.types)
+    if obj.axis3_card is not None:
+        return tuple(obj.axis3_card.types)
+    return ()
+
+
+class ObjectIndex:
+    """
+    Runtime objects by zone, by (controller, zone) and by printed card
+    type, so loops over e.g. the battlefield don't scan every object in
+    the game.
+
+    GameState.object_moved() keeps it current on creation, zone changes
+    and control changes. Objects added to or removed from
+    game_state.objects directly are picked up by a rebuild on the next
+    lookup. Types are the printed ones; use the LayerSystem for the
+    evaluated types.
+    """
+
+    def __init__(self, game_state: "GameState"):
+        self.game_state = game_state
+        # obj_id -> (zone, controller, types) it is indexed under
+        self._entries: Dict[RuntimeObjectId, Tuple[str, int, Tuple[str, ...]]] = {}
+        # Dicts used as insertion-ordered sets
+        self._by_zone: Dict[str, Dict[RuntimeObjectId, None]] = {}
+        self._by_controller_zone: Dict[Tuple[int, str], Dict[RuntimeObjectId, None]] = {}
+        self._by_type: Dict[str, Dict[RuntimeObjectId, None]] = {}
+
+    # ------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------
+
+    def in_zone(self, zone, controller: Optional[int] = None) -> List[RuntimeObject]:
+        """Objects in `zone`, optionally only those `controller` controls."""
+        self._sync()
+        if controller is None:
+            ids = self._by_zone.get(zone_key(zone), ())
+        else:
+            ids = self._by_controller_zone.get((controller, zone_key(zone)), ())
+        objects = self.game_state.objects
+        return [objects[obj_id] for obj_id in ids]
+
+    def battlefield(self, controller: Optional[int] = None) -> List[RuntimeObject]:
+        return self.in_zone(ZoneType.BATTLEFIELD, controller)
+
+    def of_type(self, card_type: str, zone=None) -> List[RuntimeObject]:
+        """Objects with printed type `card_type`, optionally only in `zone`."""
+        self._sync()
+        ids = self._by_type.get(card_type, ())
+        objects = self.game_state.objects
+        if zone is None:
+            return [objects[obj_id] for obj_id in ids]
+        in_zone = self._by_zone.get(zone_key(zone), {})
+        return [objects[obj_id] for obj_id in ids if obj_id in in_zone]
+
+    def zone_of(self, obj_id: RuntimeObjectId) -> Optional[str]:
+        """Zone name `obj_id` is indexed under, without syncing first."""
+        entry = self._entries.get(obj_id)
+        return entry[0] if entry is not None else None
+
+    # ------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------
+
+    def update(self, obj_id: RuntimeObjectId):
+        """Re-index `obj_id` after it was created, moved or changed controller."""
+        self._remove(obj_id)
+        obj = self.game_state.objects.get(obj_id)
+        if obj is not None:
+            self._add(obj)
+
+    def _add(self, obj: RuntimeObject):
+        zone = zone_key(obj.zone)
+        types = _printed_types(obj)
+        self._entries[obj.id] = (zone, obj.controller, types)
+        self._by_zone.setdefault(zone, {})[obj.id] = None
+        self._by_controller_zone.setdefault((obj.controller, zone), {})[obj.id] = None
+        for card_type in types:
+            self._by_type.setdefault(card_type, {})[obj.id] = None
+
+    def _remove(self, obj_id: RuntimeObjectId):
+        entry = self._entries.pop(obj_id, None)
+        if entry is None:
+            return
+        zone, controller, types = entry
+        self._by_zone[zone].pop(obj_id, None)
+        self._by_controller_zone[(controller, zone)].pop(obj_id, None)
+        for card_type in types:
+            self._by_type[card_type].pop(obj_id, None)
+
+    def _sync(self):
+        objects = self.game_state.objects
+        if len(self._entries) == len(objects):
+            return
+        self._entries.clear()
+        self._by_zone.clear()
+        self._by_controller_zone.clear()
+        self._by_type.clear()
+        for obj in objects.values():
+            self._add(obj)
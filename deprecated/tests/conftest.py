@@ -1,9 +1,17 @@
 import pytest
 import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
 
 from axis1.schema import Axis1Card, Axis1Face, Axis1Characteristics
 from axis2.builder import Axis2Builder
 from axis2.schema import Axis2Card
+from axis3.state.game_state import GameState, PlayerState
+from axis3.state.objects import RuntimeObject
+from axis3.state.zones import ZoneType
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from db.models import Base, Axis1CardModel, Axis2TestCard
@@ -119,6 +127,41 @@ def axis2_card_factory():
 
     return make_axis1_card
 
+# ------------------------------------------------------------
+# AXIS3 GAME STATE FIXTURES
+# ------------------------------------------------------------
+
+@pytest.fixture
+def axis3_game():
+    """
+    Builds two-player GameStates holding bare runtime objects.
+    No Axis2 cards: characteristics are set directly.
+
+    Each object is an id or an (id, controller, types, zone) tuple;
+    missing fields default to player 0, ["Creature"] and the battlefield.
+    Trailing digits are dropped from the name, so "isamaru1" and
+    "isamaru2" are both "isamaru". Keyword arguments apply to every object.
+    """
+
+    def make_game(*objects, power=2, toughness=2, subtypes=(), supertypes=(), colors=(), tokens=()):
+        gs = GameState(players=[PlayerState(id=0), PlayerState(id=1)], objects={})
+        gs.continuous_effects = []
+        for spec in objects:
+            spec = (spec,) if isinstance(spec, str) else tuple(spec)
+            obj_id, controller, types, zone = spec + (0, ["Creature"], ZoneType.BATTLEFIELD)[len(spec) - 1:]
+            obj = RuntimeObject(id=obj_id, owner=controller, controller=controller, zone=zone,
+                                name=obj_id, is_token=obj_id in tokens)
+            obj.characteristics = SimpleNamespace(
+                name=obj_id.rstrip("0123456789"), power=power, toughness=toughness, types=list(types),
+                subtypes=list(subtypes), supertypes=list(supertypes), colors=list(colors), abilities=[],
+            )
+            gs.objects[obj_id] = obj
+            gs.zone_list(controller, zone).append(obj_id)
+        return gs
+
+    return make_game
+
+
 # ------------------------------------------------------------
 # BASIC AXIS1 CARD FIXTURES
 # ------------------------------------------------------------
@@ -265,3 +308,120 @@ def pg_session(pg_engine):
         yield session
     finally:
         session.close()
+
+
+# ------------------------------------------------------------
+# LOCAL SCRYFALL STUB SERVER
+# ------------------------------------------------------------
+
+class ScryfallStub:
+    """
+    Minimal stand-in for api.scryfall.com served from a local thread.
+
+    Cards are generated from their id; `fail_once` ids answer 429 on the
+    first request. `latency` is added to every response so concurrency
+    and request counts can be measured offline.
+    """
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.fail_once = set()
+        self.versions = {}
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.server = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address
+        return f"http://{host}:{port}"
+
+    @staticmethod
+    def card(card_id):
+        return {
+            "id": card_id,
+            "oracle_id": f"oracle-{card_id}",
+            "name": f"Card {card_id}",
+            "layout": "normal",
+            "type_line": "Creature — Elf",
+            "oracle_text": "{T}: Add {G}.",
+        }
+
+    def etag(self, card_id):
+        return f'"{card_id}-v{self.versions.get(card_id, 1)}"'
+
+    def handle(self, method, path, body, headers=None):
+        with self.lock:
+            self.requests.append((method, path))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            if path == "/cards/collection":
+                ids = [ident["id"] for ident in body["identifiers"]]
+                if len(ids) > 75:
+                    return 422, {"object": "error", "status": 422}
+                found = [card_id for card_id in ids if not card_id.startswith("missing")]
+                return 200, {
+                    "data": [self.card(card_id) for card_id in found],
+                    "not_found": [{"id": card_id} for card_id in ids if card_id not in found],
+                }
+            if path.startswith("/cards/"):
+                card_id = path.rsplit("/", 1)[-1]
+                with self.lock:
+                    if card_id in self.fail_once:
+                        self.fail_once.discard(card_id)
+                        return 429, {"object": "error", "status": 429}
+                if headers and headers.get("If-None-Match") == self.etag(card_id):
+                    return 304, None
+                return 200, self.card(card_id)
+            if path.startswith("/decks/"):
+                ids = path.rsplit("/", 1)[-1].split(",")
+                return 200, {"entries": [{"id": card_id} for card_id in ids]}
+            return 404, {"object": "error", "status": 404}
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def scryfall_stub():
+    stub = ScryfallStub()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self, method):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length)) if length else None
+            status, payload = stub.handle(method, self.path, body, self.headers)
+            data = json.dumps(payload).encode() if payload is not None else b""
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            if self.path.startswith("/cards/") and status in (200, 304):
+                self.send_header("ETag", stub.etag(self.path.rsplit("/", 1)[-1]))
+            self.send_header("Content-Length", str(len(data)))
+            if status == 429:
+                self.send_header("Retry-After", "0")
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            self._reply("GET")
+
+        def do_POST(self):
+            self._reply("POST")
+
+        def log_message(self, *args):
+            pass
+
+    stub.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=stub.server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    try:
+        yield stub
+    finally:
+        stub.server.shutdown()
+        stub.server.server_close()
@@ -49,3 +49,94 @@ def test_map_basic_creature_card():
     assert card.metadata.rarity == "rare"
     assert card.metadata.artist == "Cool Artist"
     assert card.metadata.image_uris["normal"] == "http://example.com/card.png"
+
+
+def test_scan_oracle_text_classifies_each_line_once():
+    from scryfall.mappers.axis1_mapper import scan_oracle_text
+
+    scan = scan_oracle_text(
+        "+1: Draw a card.\n"
+        "Equip {2} (Attach to target creature you control.)\n"
+        "{T}, Sacrifice this land：Add {G}.\n"
+        "Whenever this creature attacks, scry 1.\n"
+        "Changeling (This card is every creature type.)"
+    )
+
+    assert [(kind, line) for kind, line, _ in scan.activated] == [
+        ("loyalty", "+1: Draw a card."),
+        ("equip", "Equip {2}"),
+        ("activated", "{T}, Sacrifice this land:Add {G}."),
+    ]
+    assert scan.triggers == ("Whenever this creature attacks, scry 1.",)
+    assert "every creature type" in scan.lowered
+
+
+def test_map_classifies_loyalty_equip_and_trigger_lines():
+    card = Axis1Mapper().map({
+        "id": "pw-1",
+        "name": "Test Walker",
+        "type_line": "Legendary Planeswalker — Test",
+        "oracle_text": "+1: Draw a card.\n−3: Exile target creature.\nWhen this enters, scry 2.",
+    })
+    face = card.faces[0]
+
+    assert [a.cost for a in face.activated_abilities] == ["+1", "−3"]
+    assert face.activated_abilities[0].cost_metadata == {"loyalty": 1}
+    assert face.triggered_abilities[0].condition == "When this enters"
+    assert face.triggered_abilities[0].event_hint == "enters_battlefield"
+
+
+def test_trusted_mapping_matches_validated_mapping():
+    scry = {
+        "id": "mdfc-1",
+        "name": "Front // Back",
+        "layout": "modal_dfc",
+        "cmc": 3,
+        "color_identity": ["G", "U"],
+        "legalities": {"modern": "legal"},
+        "card_faces": [
+            {"name": "Front", "type_line": "Creature — Elf", "colors": ["G"],
+             "oracle_text": "{T}: Add {G}.\nWhen this enters, draw a card."},
+            {"name": "Back", "type_line": "Land", "oracle_text": "Equip {1}"},
+        ],
+    }
+
+    trusted = Axis1Mapper().map(scry)
+    validated = Axis1Mapper(validate=True).map(scry)
+
+    assert trusted.model_dump() == validated.model_dump()
+    assert list(trusted.model_dump()) == list(validated.model_dump())
+    assert trusted.characteristics.mana_value == 3.0
+    # Defaults are fresh per model, never shared between faces
+    front, back = trusted.faces
+    assert front.face_layout_rules is not back.face_layout_rules
+    assert front.face_layout_rules.adventure is not back.face_layout_rules.adventure
+    assert front.colors is not trusted.characteristics.colors
+
+
+def test_mapped_vocab_is_interned_and_bit_encoded():
+    from axis1.vocab import CardType, Color, Supertype, CARD_TYPE_BITS, mask_names
+
+    def scry(card_id, name):
+        return {
+            "id": card_id,
+            "name": name,
+            "type_line": "Legendary Creature — Elf Druid",
+            "colors": ["G", "U"],
+            "color_identity": ["G", "U"],
+            "keywords": ["Flying"],
+        }
+
+    for mapper in (Axis1Mapper(), Axis1Mapper(validate=True)):
+        a = mapper.map(scry("a", "".join(["Elf", " A"])))
+        b = mapper.map(scry("b", "".join(["Elf", " B"])))
+        assert a.faces[0].subtypes[0] is b.faces[0].subtypes[0]
+        assert a.characteristics.card_types[1] is b.characteristics.card_types[1]
+        assert a.faces[0].keywords[0] is b.faces[0].keywords[0]
+
+        face = a.faces[0]
+        assert face.type_mask == CardType.CREATURE
+        assert face.supertype_mask == Supertype.LEGENDARY
+        assert face.color_mask == Color.G | Color.U
+        assert a.characteristics.color_identity_mask == Color.G | Color.U
+        assert mask_names(CARD_TYPE_BITS, face.type_mask) == ["Creature"]
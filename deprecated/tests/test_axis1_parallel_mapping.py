@@ -0,0 +1,29 @@
+from scryfall.mappers.parallel import map_cards_parallel
+
+
+def _scry(i: int) -> dict:
+    return {
+        "id": f"card-{i}",
+        "name": f"Card {i}",
+        "layout": "normal",
+        "type_line": "Creature — Elf",
+        "oracle_text": "{T}: Add {G}.",
+    }
+
+
+def test_parallel_mapping_preserves_input_order_and_reports_errors():
+    cards = [_scry(i) for i in range(40)]
+    cards[7] = {"id": "broken"}  # no name → mapper raises
+
+    results = list(map_cards_parallel(cards, workers=2, chunk_size=3, max_pending=2))
+
+    assert [r.card_id for r in results] == [c["id"] for c in cards]
+    assert results[7].data is None and results[7].error
+    assert results[0].data["names"] == ["Card 0"]
+    assert results[39].data["faces"][0]["activated_abilities"][0]["cost"] == "{T}"
+
+
+def test_single_worker_maps_in_process():
+    results = list(map_cards_parallel([_scry(1), _scry(2)], workers=1))
+
+    assert [r.data["card_id"] for r in results] == ["card-1", "card-2"]
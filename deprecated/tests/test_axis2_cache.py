@@ -0,0 +1,116 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from axis2.builder import Axis2Builder
+from axis2.cache import PARSER_VERSION, CachingAxis2Builder, axis2_row, compile_key
+from axis2.parallel import compile_cards_parallel
+from db.models import Base
+from db.repository import Axis1Repository, Axis2CardRepository
+from scryfall.mappers.axis1_mapper import Axis1Mapper
+
+
+class CountingBuilder:
+    def __init__(self):
+        self.built = []
+
+    def build(self, axis1_card, **kwargs):
+        self.built.append((axis1_card.card_id, kwargs) if kwargs else axis1_card.card_id)
+        return Axis2Builder.build(axis1_card)
+
+
+def _printing(card_id, set_code, oracle_text="Flying", flavor_text=None):
+    return Axis1Mapper().map({
+        "id": card_id,
+        "oracle_id": "oracle-bird",
+        "name": "Storm Crow",
+        "set": set_code,
+        "collector_number": "1",
+        "type_line": "Creature — Bird",
+        "mana_cost": "{1}{U}",
+        "cmc": 2,
+        "colors": ["U"],
+        "power": "1",
+        "toughness": "2",
+        "oracle_text": oracle_text,
+        "flavor_text": flavor_text,
+        "keywords": ["Flying"],
+    })
+
+
+def test_printings_share_one_compilation():
+    inner = CountingBuilder()
+    builder = CachingAxis2Builder(inner)
+
+    first = builder.build(_printing("a", "alp"))
+    second = builder.build(_printing("b", "ice", flavor_text="Caw-caw!"))
+    third = builder.build(_printing("b", "ice"))
+
+    assert inner.built == ["a"]
+    assert builder.stats.as_dict()["hits"]["memory"] == 2
+    assert (second.card_id, second.set) == ("b", "ice")
+    assert (first.card_id, first.set) == ("a", "alp")
+    # Hits are independent copies
+    assert second is not third
+    assert second.characteristics is not third.characteristics
+    assert second.characteristics == first.characteristics
+
+
+def test_rules_changes_miss_the_cache():
+    assert compile_key(_printing("a", "alp")) == compile_key(_printing("b", "ice"))
+    assert compile_key(_printing("a", "alp")) != compile_key(_printing("a", "alp", oracle_text="Defender"))
+
+
+def test_build_options_bypass_the_cache():
+    inner = CountingBuilder()
+    builder = CachingAxis2Builder(inner)
+
+    builder.build(_printing("a", "alp"))
+    builder.build(_printing("a", "alp"), strict=True)
+    builder.build(_printing("a", "alp"), strict=True)
+
+    assert inner.built == ["a", ("a", {"strict": True}), ("a", {"strict": True})]
+    assert builder.stats.as_dict()["hits"]["memory"] == 0
+
+
+def test_disk_tier_survives_a_new_process(tmp_path):
+    CachingAxis2Builder(store_dir=str(tmp_path)).build(_printing("a", "alp"))
+
+    inner = CountingBuilder()
+    builder = CachingAxis2Builder(inner, store_dir=str(tmp_path))
+    card = builder.build(_printing("b", "ice"))
+
+    assert inner.built == []
+    assert builder.stats.as_dict()["hits"]["disk"] == 1
+    assert card.card_id == "b"
+    assert card.characteristics.types == ["Creature"]
+
+
+def test_precompiled_table_serves_builds(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'cards.db'}")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    printings = [_printing("a", "alp"), _printing("b", "ice"), _printing("c", "alp", oracle_text="Defender")]
+
+    with Session() as session:
+        Axis1Repository(session).save_many(printings)
+        repo = Axis2CardRepository(session)
+        results = list(compile_cards_parallel(Axis1Repository(session).iter_axis1_json(), workers=1))
+        assert [r.skipped for r in results] == [False, True, False]
+        rows = [axis2_row(r.compile_key, r.blob, r.oracle_id, r.name) for r in results if not r.skipped]
+        assert repo.save_many(rows) == 2
+        assert len(repo.existing_keys(PARSER_VERSION)) == 2
+
+    inner = CountingBuilder()
+    builder = CachingAxis2Builder(inner, session_factory=Session)
+    assert builder.prefetch(printings) == 2
+    cards = [builder.build(card) for card in printings]
+
+    assert inner.built == []
+    assert [card.card_id for card in cards] == ["a", "b", "c"]
+
+    with Session() as session:
+        Axis2CardRepository(session).save_many([{
+            "compile_key": "old", "parser_version": "0" * 16, "oracle_id": None,
+            "name": "Old", "axis2_blob": b"",
+        }])
+        assert Axis2CardRepository(session).delete_stale(PARSER_VERSION) == 1
@@ -0,0 +1,44 @@
+from axis2.parsing import trace
+from axis2.parsing.effects.dispatcher import parse_effect_text
+from axis2.schema import AddManaEffect, ParseContext
+
+
+CTX = ParseContext(card_name="Test Card", primary_type="artifact", face_name="Test Card", face_types=["Artifact"])
+
+
+def _registry_passes(records):
+    return [r.text for r in records if r.source == "registry"]
+
+
+def test_single_sentence_is_parsed_once():
+    with trace.tracing() as t:
+        effects = parse_effect_text("Draw two cards.", CTX)
+
+    assert effects
+    assert len(_registry_passes(t.records)) == 1
+
+
+def test_multi_sentence_text_skips_the_full_text_pass():
+    text = "Draw a card. You gain 3 life."
+    with trace.tracing() as t:
+        parse_effect_text(text, CTX)
+
+    assert text not in _registry_passes(t.records)
+
+
+def test_conditional_mana_still_uses_the_full_text():
+    text = "Add {C}. If you control an Urza's Power-Plant and an Urza's Tower, add {C}{C} instead."
+
+    effects = parse_effect_text(text, CTX)
+
+    assert len(effects) == 1
+    assert isinstance(effects[0], AddManaEffect)
+    assert effects[0].mana == ["{C}"] and effects[0].replacement_mana == ["{C}", "{C}"]
+
+
+def test_repeated_sentences_get_their_own_effects():
+    effects = parse_effect_text("Draw a card. Draw a card.", CTX)
+
+    assert len(effects) == 2
+    assert effects[0] is not effects[1]
+    assert effects[0] == effects[1]
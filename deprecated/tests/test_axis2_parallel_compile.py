@@ -0,0 +1,49 @@
+import pickle
+
+from axis2.parallel import compile_cards_parallel
+from scryfall.mappers.axis1_mapper import Axis1Mapper
+
+
+def _axis1(i: int, name=None) -> dict:
+    return Axis1Mapper().map({
+        "id": f"card-{i}",
+        "name": name or f"Card {i}",
+        "type_line": "Creature — Elf",
+        "mana_cost": "{G}",
+        "cmc": 1,
+        "power": "1",
+        "toughness": "1",
+        "oracle_text": "{T}: Add {G}.",
+    }).model_dump()
+
+
+def test_parallel_compile_preserves_order_and_reports_errors():
+    rows = [_axis1(i) for i in range(12)]
+    rows[5] = {"card_id": "broken"}  # not a valid Axis1Card
+
+    results = list(compile_cards_parallel(rows, workers=2, chunk_size=3, max_pending=2))
+
+    assert [r.card_id for r in results] == [row["card_id"] for row in rows]
+    assert results[5].blob is None and results[5].error.startswith("ValidationError")
+    card = pickle.loads(results[0].blob)
+    assert card.card_id == "card-0"
+    assert results[0].seconds > 0
+
+
+def test_duplicates_and_stored_keys_are_skipped():
+    first = list(compile_cards_parallel([_axis1(1, "Elf"), _axis1(2, "Elf")], workers=1))
+    assert [r.skipped for r in first] == [False, True]
+    assert first[0].compile_key == first[1].compile_key
+
+    again = list(compile_cards_parallel([_axis1(3, "Elf")], workers=1, skip_keys=[first[0].compile_key]))
+    assert again[0].skipped
+
+
+def test_diagnostics_capture_parser_output():
+    row = _axis1(1)
+    row["faces"][0]["oracle_text"] = "Frobnicate the widget."
+
+    result = next(compile_cards_parallel([row], workers=1, trace=True))
+
+    assert any("no_match" in line and "Frobnicate" in line for line in result.diagnostics)
+    assert result.parser_seconds
@@ -0,0 +1,60 @@
+import threading
+
+from axis2.builder import Axis2Builder
+from axis2.parsing import trace
+from scryfall.mappers.axis1_mapper import Axis1Mapper
+
+
+def _card(oracle_text, name="Test Card"):
+    return Axis1Mapper().map({
+        "id": "card-1",
+        "name": name,
+        "type_line": "Creature — Elf",
+        "mana_cost": "{G}",
+        "cmc": 1,
+        "power": "1",
+        "toughness": "1",
+        "oracle_text": oracle_text,
+    })
+
+
+def test_parsing_is_silent_without_a_trace(capsys):
+    assert trace.current() is None
+
+    Axis2Builder.build(_card("Flying\nWhen this creature enters, draw a card. Frobnicate the widget."))
+
+    assert capsys.readouterr().out == ""
+
+
+def test_tracing_collects_decisions_and_parser_timings():
+    with trace.tracing() as t:
+        Axis2Builder.build(_card("{T}: Add {G}.\nFrobnicate the widget."))
+    assert trace.current() is None
+
+    assert ("builder", "card", "Test Card") in [(r.source, r.event, r.text) for r in t.records]
+    assert any(r.event == "no_match" and "Frobnicate" in r.text for r in t.records)
+    assert t.timings
+    assert all(timing.calls >= timing.matches for timing in t.timings.values())
+
+
+def test_traces_are_per_thread():
+    barrier = threading.Barrier(2)
+    traces = {}
+
+    def build(name):
+        with trace.tracing() as t:
+            barrier.wait()
+            for _ in range(5):
+                Axis2Builder.build(_card("Flying\nFrobnicate the widget.", name=name))
+            barrier.wait()
+        traces[name] = t
+
+    threads = [threading.Thread(target=build, args=(name,)) for name in ("Alpha", "Beta")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for name, t in traces.items():
+        assert {r.text for r in t.records if r.event == "card"} == {name}
+    assert trace.current() is None
@@ -0,0 +1,63 @@
+import pytest
+
+from axis2.parsing import continuous_effects, effects, replacement_effects, static_effects, triggers
+from axis2.schema import ParseContext
+
+
+CTX = ParseContext(card_name="Test Card", primary_type="creature", face_name="Test Card", face_types=["Creature"])
+
+SENTENCES = [
+    "Draw two cards, then discard a card.",
+    "Add {C}. If you control an Urza's Power-Plant and an Urza's Tower, add {C}{C} instead.",
+    "Look at the top four cards of your library. Put one of them into your hand and the rest on the bottom.",
+    "Search your library for a basic land card, put it onto the battlefield tapped, then shuffle.",
+    "Target creature gets +3/+3 and gains trample until end of turn.",
+    "Creatures you control have haste.",
+    "Enchanted creature is a black Zombie in addition to its other colors and types.",
+    "This creature can't be blocked by creatures with power 2 or less.",
+    "When this creature enters, create a 1/1 white Soldier creature token.",
+    "Whenever a creature you control dies, you gain 1 life.",
+    "At the beginning of your upkeep, scry 1.",
+    "If a card would be put into your graveyard from anywhere, exile it instead.",
+    "All damage that would be dealt this turn to you is dealt to enchanted creature instead.",
+    "Prevent the next 3 damage that would be dealt to any target this turn.",
+    "As this enters, choose a color.",
+    "This land enters the battlefield tapped.",
+    "Counter target spell. Its controller loses 2 life.",
+    "Spells you cast cost {1} less to cast.",
+    "Equip {2}",
+    "Frobnicate the widget.",
+]
+
+REGISTRIES = [
+    (effects.get_registry(), CTX),
+    (continuous_effects.registry.get_registry(), CTX),
+    (static_effects.registry.get_registry(), CTX),
+    (triggers.registry.get_registry(), None),
+    (replacement_effects.registry.get_registry(), None),
+]
+
+
+def _can_parse(parser, text, ctx):
+    return parser.can_parse(text, ctx) if ctx is not None else parser.can_parse(text)
+
+
+@pytest.mark.parametrize("registry,ctx", REGISTRIES)
+def test_cue_index_finds_the_same_candidates_as_can_parse(registry, ctx):
+    for text in SENTENCES:
+        expected = [p for p in registry._parsers if _can_parse(p, text, ctx)]
+        assert registry._find_candidates(text, ctx) == expected, text
+
+
+@pytest.mark.parametrize("registry,ctx", REGISTRIES)
+def test_declared_cues_are_necessary(registry, ctx):
+    for parser in registry._parsers:
+        for text in SENTENCES:
+            if parser.cues and _can_parse(parser, text, ctx):
+                assert any(cue in text.lower() for cue in parser.cues), (type(parser).__name__, text)
+
+
+def test_cue_index_skips_unrelated_parsers():
+    registry = effects.get_registry()
+    assert all(p.cues for p in registry._parsers)
+    assert registry._cued_parsers("Scry 2.") == [p for p in registry._parsers if "scry" in p.cues]
@@ -0,0 +1,65 @@
+from axis3.abilities.static import AffectedFilter, RuntimeContinuousEffect
+from axis3.state.zones import ZoneType as Zone
+
+
+def _counted_anthem(gs, source_id, affects, checked):
+    def applies_to(gs_, oid):
+        checked.append(oid)
+        obj = gs_.objects[oid]
+        return obj.controller == gs_.objects[source_id].controller and "Creature" in obj.characteristics.types
+
+    return RuntimeContinuousEffect(
+        source_id=source_id,
+        layer=7,
+        sublayer="7b",
+        applies_to=applies_to,
+        affects=affects,
+        modify_power=lambda gs_, oid, p: p + 1,
+        modify_toughness=lambda gs_, oid, t: t + 1,
+    )
+
+
+def test_filtered_effects_only_visit_matching_objects(axis3_game):
+    gs = axis3_game(("anthem", 0, ["Enchantment"]), "bear", ("wall", 1), ("rock", 0, ["Artifact"]))
+    checked = []
+    gs.continuous_effects.append(
+        _counted_anthem(gs, "anthem", AffectedFilter(you_control=True, card_type="Creature"), checked)
+    )
+
+    assert [gs.layers.evaluate(oid).power for oid in ("bear", "wall", "rock")] == [3, 2, 2]
+    # applies_to only ran for the one object the filter admits
+    assert checked == ["bear"]
+
+
+def test_control_and_zone_changes_update_the_index(axis3_game):
+    gs = axis3_game(("anthem", 0, ["Enchantment"]), "bear", ("wall", 1))
+    gs.continuous_effects.append(
+        _counted_anthem(gs, "anthem", AffectedFilter(you_control=True, card_type="Creature"), [])
+    )
+    assert gs.layers.evaluate("wall").power == 2
+
+    gs.objects["wall"].controller = 0
+    gs.layers.object_changed("wall")
+    assert gs.layers.evaluate("wall").power == 3
+
+    # The source changing controller moves the effect to the other side
+    gs.objects["anthem"].controller = 1
+    gs.objects["wall"].controller = 1
+    gs.layers.object_changed("anthem")
+    assert (gs.layers.evaluate("bear").power, gs.layers.evaluate("wall").power) == (2, 3)
+
+    gs.players[1].battlefield.remove("wall")
+    gs.players[1].graveyard.append("wall")
+    gs.objects["wall"].zone = Zone.GRAVEYARD
+    gs.layers.object_changed("wall")
+    assert gs.layers.affected.effects_for("wall") == []
+
+
+def test_unfiltered_effects_reach_every_object(axis3_game):
+    gs = axis3_game("bear")
+    everywhere = RuntimeContinuousEffect(source_id=None, layer=7, sublayer="7b")
+    filtered = RuntimeContinuousEffect(source_id="bear", layer=7, sublayer="7b", affects=AffectedFilter(self_only=True))
+    gs.continuous_effects.extend([everywhere, filtered])
+
+    assert gs.layers.affected.effects_for("bear") == [everywhere, filtered]
+    assert gs.layers.affected.effects_for("card-in-library") == [everywhere]
@@ -0,0 +1,76 @@
+from axis3.abilities.static import RuntimeContinuousEffect
+from axis3.rules.events.event import Event
+from axis3.rules.events.types import EventType
+from axis3.state.zones import ZoneType as Zone
+
+
+def _anthem(source_id):
+    return RuntimeContinuousEffect(
+        source_id=source_id,
+        layer=7,
+        sublayer="7b",
+        applies_to=lambda gs, oid: gs.objects[oid].zone == Zone.BATTLEFIELD,
+        modify_power=lambda gs, oid, p: p + 1,
+        modify_toughness=lambda gs, oid, t: t + 1,
+    )
+
+
+def test_repeated_evaluation_is_cached_until_invalidated(axis3_game):
+    gs = axis3_game("bear")
+
+    first = gs.layers.evaluate("bear")
+    gs.objects["bear"].damage = 1  # damage never changes characteristics
+    assert gs.layers.evaluate("bear") is first
+    assert (gs.layers.hits, gs.layers.misses) == (1, 1)
+
+    gs.layers.invalidate()
+    assert gs.layers.evaluate("bear") is not first
+
+
+def test_new_effects_and_their_sources_invalidate_dependents(axis3_game):
+    gs = axis3_game("bear", "elf")
+    assert gs.layers.evaluate("bear").power == 2
+
+    # Appended without an explicit invalidate(): the effect count changes
+    gs.continuous_effects.append(_anthem("anthem"))
+    buffed = gs.layers.evaluate("bear")
+    assert (buffed.power, buffed.toughness) == (3, 3)
+
+    elf = gs.layers.evaluate("elf")
+    gs.layers.invalidate("elf")  # unrelated object: bear keeps its entry
+    assert gs.layers.evaluate("bear") is buffed
+    assert gs.layers.evaluate("elf") is not elf
+
+    gs.layers.invalidate("anthem")  # the source changed: its dependents re-evaluate
+    assert gs.layers.evaluate("bear") is not buffed
+
+
+def test_moves_off_the_battlefield_keep_other_entries(axis3_game):
+    gs = axis3_game("bear", "elf", ("card", 0, ["Creature"], Zone.LIBRARY))
+    bear = gs.layers.evaluate("bear")
+
+    gs.event_bus.publish(Event(type=EventType.DRAW, payload={"player_id": 0}))
+    assert gs.players[0].hand == ["card"]
+    assert gs.layers.evaluate("bear") is bear
+
+    gs.event_bus.publish(Event(
+        type=EventType.ZONE_CHANGE,
+        payload={"obj_id": "elf", "from_zone": Zone.BATTLEFIELD, "to_zone": Zone.GRAVEYARD, "controller": 0},
+    ))
+    assert gs.layers.evaluate("bear") is not bear
+
+
+def test_zone_dependent_effects_see_moves_between_other_zones(axis3_game):
+    gs = axis3_game("lhurgoyf", ("card", 0, ["Creature"], Zone.LIBRARY))
+    gs.continuous_effects.append(RuntimeContinuousEffect(
+        source_id="lhurgoyf",
+        layer=7,
+        sublayer="7a",
+        applies_to=lambda gs_, oid: oid == "lhurgoyf",
+        modify_power=lambda gs_, oid, p: len(gs_.players[0].hand),
+        depends_on_zones=True,
+    ))
+    assert gs.layers.evaluate("lhurgoyf").power == 0
+
+    gs.event_bus.publish(Event(type=EventType.DRAW, payload={"player_id": 0}))
+    assert gs.layers.evaluate("lhurgoyf").power == 1
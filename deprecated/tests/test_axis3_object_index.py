@@ -0,0 +1,39 @@
+from axis3.rules.events.event import Event
+from axis3.rules.events.types import EventType
+from axis3.state.zones import ZoneType as Zone
+
+
+def _ids(objs):
+    return [obj.id for obj in objs]
+
+
+def test_lookups_by_zone_controller_and_type(axis3_game):
+    gs = axis3_game(
+        "bear",
+        ("forest", 0, ["Land"]),
+        ("wall", 1),
+        ("giant", 0, ["Creature"], Zone.LIBRARY),
+    )
+
+    assert _ids(gs.index.battlefield()) == ["bear", "forest", "wall"]
+    assert _ids(gs.index.battlefield(1)) == ["wall"]
+    assert _ids(gs.index.in_zone(Zone.LIBRARY, 0)) == ["giant"]
+    assert _ids(gs.index.of_type("Creature")) == ["bear", "wall", "giant"]
+    assert _ids(gs.index.of_type("Creature", Zone.BATTLEFIELD)) == ["bear", "wall"]
+
+
+def test_zone_and_control_changes_update_the_index(axis3_game):
+    gs = axis3_game("bear", ("wall", 1))
+    gs.index.battlefield()
+
+    gs.event_bus.publish(Event(
+        type=EventType.ZONE_CHANGE,
+        payload={"obj_id": "bear", "from_zone": Zone.BATTLEFIELD, "to_zone": Zone.GRAVEYARD, "controller": 0},
+    ))
+    assert _ids(gs.index.battlefield()) == ["wall"]
+    assert _ids(gs.index.in_zone(Zone.GRAVEYARD, 0)) == ["bear"]
+
+    gs.objects["wall"].controller = 0
+    gs.object_moved("wall")
+    assert _ids(gs.index.battlefield(0)) == ["wall"]
+    assert gs.index.battlefield(1) == []
@@ -0,0 +1,63 @@
+from axis3.rules.sba import checker, run_sbas
+
+
+def test_actions_are_collected_then_performed_together(axis3_game):
+    gs = axis3_game("bear", "elf", "wolf")
+    gs.objects["bear"].damage = 2
+    gs.objects["elf"].damage = 5
+
+    events = gs.sba.sweep()
+    assert [e.payload["obj_id"] for e in events] == ["bear", "elf"]
+    assert gs.players[0].battlefield == ["bear", "elf", "wolf"]  # nothing moved yet
+
+    run_sbas(gs)
+    assert gs.players[0].battlefield == ["wolf"]
+    assert gs.players[0].graveyard == ["bear", "elf"]
+
+
+def test_unchanged_permanents_are_not_rechecked(axis3_game, monkeypatch):
+    gs = axis3_game("bear", "elf")
+    run_sbas(gs)
+
+    calls = []
+    original = checker.check_lethal_damage
+    monkeypatch.setattr(checker, "check_lethal_damage", lambda obj, ec: calls.append(obj.id) or original(obj, ec))
+
+    assert gs.sba.sweep() == []
+    assert calls == []
+
+    gs.objects["elf"].damage = 1
+    assert gs.sba.sweep() == []
+    assert calls == ["elf"]
+
+
+def test_dead_tokens_cease_to_exist_and_legends_are_kept_once(axis3_game):
+    gs = axis3_game("saproling", tokens=("saproling",))
+    gs.objects["saproling"].damage = 2
+    run_sbas(gs)
+    assert "saproling" not in gs.objects
+    assert gs.players[0].graveyard == []
+
+    gs = axis3_game("isamaru1", "isamaru2", supertypes=("Legendary",))
+    run_sbas(gs)
+    assert gs.players[0].battlefield == ["isamaru1"]
+    assert gs.players[0].graveyard == ["isamaru2"]
+
+
+def test_runs_are_skipped_until_something_changes(axis3_game):
+    gs = axis3_game("bear")
+    run_sbas(gs)
+    run_sbas(gs)
+    assert (gs.sba.executed, gs.sba.skipped) == (1, 1)
+
+    gs.objects["bear"].damage = 2
+    gs.mark_changed()
+    run_sbas(gs)
+    assert gs.players[0].graveyard == ["bear"]
+    # The nested runs the bus made while moving the bear were skipped
+    assert gs.sba.executed == 2
+    assert gs.sba.skipped > 1
+
+    passes = gs.sba.passes
+    run_sbas(gs)
+    assert gs.sba.passes == passes
@@ -0,0 +1,96 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from db.repository import Axis1Repository
+from db.snapshot import CardPool, write_snapshot
+from scryfall.mappers.axis1_mapper import Axis1Mapper
+
+
+def _scry(card_id, name, type_line, cmc, identity, power=None, keywords=()):
+    return {
+        "id": card_id,
+        "name": name,
+        "type_line": type_line,
+        "cmc": cmc,
+        "colors": list(identity),
+        "color_identity": list(identity),
+        "power": power,
+        "toughness": power,
+        "keywords": list(keywords),
+    }
+
+
+@pytest.fixture
+def pool_cards():
+    mapper = Axis1Mapper()
+    return [
+        mapper.map(_scry("1", "Llanowar Elves", "Creature — Elf Druid", 1.0, "G", "1")),
+        mapper.map(_scry("2", "Serra Angel", "Creature — Angel", 5.0, "W", "4", ["Flying", "Vigilance"])),
+        mapper.map(_scry("3", "Tarmogoyf", "Creature — Lhurgoyf", 2.0, "G", "*")),
+        mapper.map(_scry("4", "Counterspell", "Instant", 2.0, "U")),
+        mapper.map(_scry("5", "Sol Ring", "Artifact", 1.0, "")),
+    ]
+
+
+def test_snapshot_round_trips_characteristics(tmp_path, pool_cards):
+    path = tmp_path / "pool.ax1"
+    assert write_snapshot(pool_cards, str(path)) == 5
+
+    with CardPool.open(str(path)) as pool:
+        assert len(pool) == 5
+        assert pool.row(1) == {
+            "card_id": "2",
+            "name": "Serra Angel",
+            "mana_value": 5.0,
+            "colors": ["W"],
+            "color_identity": ["W"],
+            "card_types": ["Creature"],
+            "subtypes": ["Angel"],
+            "keywords": ["Flying", "Vigilance"],
+            "power": "4",
+            "toughness": "4",
+        }
+        assert pool.row(4)["power"] is None
+
+
+def test_snapshot_filters(tmp_path, pool_cards):
+    path = tmp_path / "pool.ax1"
+    write_snapshot(pool_cards, str(path))
+
+    with CardPool.open(str(path)) as pool:
+        ids = lambda rows: [pool.card_id(i) for i in rows]
+
+        assert ids(pool.filter(card_type="Creature", colors="G")) == ["1", "3"]
+        assert ids(pool.filter(colors="C")) == ["5"]
+        assert ids(pool.filter(keyword="Flying")) == ["2"]
+        assert ids(pool.filter(subtype="Elf")) == ["1"]
+        assert ids(pool.filter(mana_value=2)) == ["3", "4"]
+        assert ids(pool.filter(min_mana_value=2, max_mana_value=4)) == ["3", "4"]
+        # "*" is not numeric, so only printed values match P/T bounds
+        assert ids(pool.filter(card_type="Creature", max_power=3)) == ["1"]
+        assert ids(pool.filter(name="serra")) == ["2"]
+        assert pool.filter(subtype="Goblin") == []
+        # Same validation as Axis1Repository.search
+        with pytest.raises(ValueError, match="unknown color"):
+            pool.filter(colors="X")
+
+
+def test_snapshot_exports_from_repository(tmp_path, db_session: Session, pool_cards):
+    repo = Axis1Repository(db_session)
+    repo.save_many(pool_cards)
+    path = tmp_path / "pool.ax1"
+
+    assert write_snapshot(repo.iter_axis1_json(batch_size=2), str(path)) == 5
+    with CardPool.open(str(path)) as pool:
+        # Exported in (name, card_id) order
+        assert [pool.name(i) for i in range(len(pool))] == [
+            "Counterspell", "Llanowar Elves", "Serra Angel", "Sol Ring", "Tarmogoyf",
+        ]
+
+
+def test_open_rejects_other_files(tmp_path):
+    path = tmp_path / "not-a-pool"
+    path.write_bytes(b"hello world, definitely not a pool")
+
+    with pytest.raises(ValueError):
+        CardPool.open(str(path))
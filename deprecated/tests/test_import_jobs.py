@@ -0,0 +1,136 @@
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from api.jobs import DONE, FAILED, RUNNING, InMemoryJobStore, JobQueue, SqlJobStore
+from db.models import Base
+
+
+def _wait(queue, job_id, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = queue.get(job_id)
+        if job["status"] in (DONE, FAILED):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def _sqlite_store(path=None):
+    # A shared in-memory connection can't serve the worker and the poller
+    # at once; threaded tests get a file database instead
+    if path is None:
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+    else:
+        engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    return SqlJobStore(sessionmaker(bind=engine))
+
+
+@pytest.mark.parametrize("make_store", [
+    lambda tmp_path: InMemoryJobStore(),
+    lambda tmp_path: _sqlite_store(tmp_path / "jobs.db"),
+], ids=["memory", "sqlite"])
+def test_job_reports_progress_and_result(make_store, tmp_path):
+    queue = JobQueue(make_store(tmp_path), max_workers=2)
+
+    def work(progress):
+        progress(1, 2)
+        progress(2, 2)
+        return {"imported_count": 2}
+
+    job = _wait(queue, queue.submit("deck_import", work))
+    queue.shutdown()
+
+    assert job["status"] == DONE
+    assert (job["progress"], job["total"]) == (2, 2)
+    assert job["result"] == {"imported_count": 2}
+
+
+def test_failed_job_records_error():
+    queue = JobQueue(max_workers=1)
+
+    def work(progress):
+        raise RuntimeError("Scryfall request failed")
+
+    job = _wait(queue, queue.submit("deck_import", work))
+    queue.shutdown()
+
+    assert job["status"] == FAILED
+    assert "Scryfall request failed" in job["error"]
+
+
+def test_job_and_store_failures_are_logged(caplog):
+    class BrokenStore(InMemoryJobStore):
+        def update(self, job_id, **fields):
+            if fields.get("status") == FAILED:
+                raise RuntimeError("database is gone")
+            super().update(job_id, **fields)
+
+    queue = JobQueue(BrokenStore(), max_workers=1)
+
+    def work(progress):
+        raise RuntimeError("Scryfall request failed")
+
+    with caplog.at_level("ERROR", logger="api.jobs"):
+        job_id = queue.submit("deck_import", work)
+        queue.shutdown()
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert f"Job {job_id} failed" in messages
+    assert f"Could not record the outcome of job {job_id}" in messages
+
+
+def test_sql_store_fails_only_orphaned_jobs():
+    store = _sqlite_store()
+    now = time.time()
+    for job_id, owner, updated_at in [
+        ("mine", "host-a:1", now),           # this process, before its restart
+        ("stale", "host-b:7", now - 3600),   # owner stopped sending heartbeats
+        ("live", "host-b:7", now),           # another worker is still running it
+    ]:
+        store.create({
+            "id": job_id, "kind": "deck_import", "status": RUNNING, "owner": owner, "progress": 1,
+            "total": 3, "result": None, "error": None, "created_at": 0.0, "updated_at": updated_at,
+        })
+
+    store.fail_interrupted(owner="host-a:1", stale_after=60)
+
+    assert [store.get(job_id)["status"] for job_id in ("mine", "stale", "live")] == [FAILED, FAILED, RUNNING]
+
+
+def test_heartbeat_keeps_running_jobs_fresh():
+    store = InMemoryJobStore()
+    queue = JobQueue(store, max_workers=1, heartbeat_interval=0.01)
+    release = threading.Event()
+    job_id = queue.submit("deck_import", lambda progress: release.wait(5))
+    started = store.get(job_id)["updated_at"]
+
+    time.sleep(0.1)
+    assert store.get(job_id)["updated_at"] > started
+    assert store.get(job_id)["owner"] == queue.owner
+
+    release.set()
+    assert _wait(queue, job_id)["status"] == DONE
+    queue.shutdown()
+
+
+def test_memory_store_evicts_finished_jobs():
+    store = InMemoryJobStore(finished_ttl=60, max_finished=2)
+    for job_id in ("a", "b", "c", "d"):
+        store.create({"id": job_id, "status": RUNNING})
+    for job_id in ("a", "b", "c"):
+        store.update(job_id, status=DONE)
+
+    # Oldest finished job goes once more than two are kept; running ones stay
+    assert [store.get(job_id) is not None for job_id in "abcd"] == [False, True, True, True]
+
+    store.finished_ttl = 0
+    store.create({"id": "e", "status": RUNNING})
+    assert [store.get(job_id) is not None for job_id in "bcde"] == [False, False, True, True]
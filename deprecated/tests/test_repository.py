@@ -1,5 +1,9 @@
-from db.repository import Axis1Repository
+import pytest
+
+from db import repository
+from db.repository import Axis1Repository, SearchNotSupported, _decode_cursor, _encode_cursor, _identity_subsets
 from axis1.schema import Axis1Card
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 def test_repository_save_and_get(db_session: Session):
@@ -21,3 +25,74 @@ def test_repository_save_and_get(db_session: Session):
 
     assert loaded.card_id == "123"
     assert loaded.oracle_id == "oracle-123"
+
+
+def _card(card_id: str, name: str) -> Axis1Card:
+    return Axis1Card(
+        card_id=card_id,
+        oracle_id=f"oracle-{card_id}",
+        layout="normal",
+        names=[name],
+        faces=[],
+        characteristics={"mana_cost": "{G}", "mana_value": 1},
+    )
+
+
+def test_repository_save_many_upserts_in_batches(db_session: Session):
+    """save_many inserts new rows and updates existing ones across batches."""
+
+    repo = Axis1Repository(db_session)
+    repo.save(_card("1", "Old Name"))
+
+    written = repo.save_many(
+        [_card("1", "New Name"), _card("2", "Second"), _card("3", "Third"), _card("2", "Second Again")],
+        batch_size=2,
+    )
+
+    assert written == 4
+    assert repo.get_by_id("1").name == "New Name"
+    assert repo.get_by_id("2").name == "Second Again"
+    assert repo.get_by_id("3").axis1_json["names"] == ["Third"]
+
+
+def test_repository_save_many_splits_statements_at_the_bind_limit(db_session: Session, monkeypatch):
+    # 8 columns per row -> 2 rows per statement
+    monkeypatch.setattr(repository, "MAX_BIND_PARAMS", 16)
+    inserts = []
+    engine = db_session.get_bind()
+    listener = lambda conn, cursor, statement, *args: inserts.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        written = Axis1Repository(db_session).save_many([_card(str(i), f"Card {i}") for i in range(5)])
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert written == 5
+    assert len([s for s in inserts if s.startswith("INSERT")]) == 3
+    assert Axis1Repository(db_session).get_by_id("4").name == "Card 4"
+
+
+def test_repository_stores_import_hashes(db_session: Session):
+    repo = Axis1Repository(db_session)
+
+    repo.save_many([_card("1", "One"), _card("2", "Two")], content_hashes={"1": "h1", "2": "h2"}, mapper_version="v1")
+
+    assert repo.get_import_state(["1", "2", "3"]) == {"1": ("h1", "v1"), "2": ("h2", "v1")}
+
+
+def test_search_color_identity_subsets():
+    assert sorted(_identity_subsets("WU")) == [0, 1, 2, 3]
+    assert _identity_subsets("C") == [0]
+    with pytest.raises(ValueError):
+        _identity_subsets("X")
+
+
+def test_search_needs_postgres(db_session: Session):
+    with pytest.raises(SearchNotSupported):
+        Axis1Repository(db_session).search(name="Elf")
+
+
+def test_search_cursor_round_trip():
+    assert _decode_cursor(_encode_cursor("Llanowar Elves", "abc")) == ("Llanowar Elves", "abc")
+    with pytest.raises(ValueError):
+        _decode_cursor("not-a-cursor")
@@ -0,0 +1,56 @@
+import itertools
+import json
+
+import pytest
+from scryfall.bulk import card_content_hash, iter_bulk_cards, iter_json_array
+
+
+def _chunked(text, size):
+    return (text[i:i + size] for i in range(0, len(text), size))
+
+
+def test_iter_json_array_handles_elements_split_across_chunks():
+    """Cards are yielded in order even when the chunk size is tiny."""
+
+    cards = [
+        {"id": "1", "name": "Elf, Druid", "oracle_text": "{T}: Add {G}.\n[x] ]"},
+        {"id": "2", "name": "Ærathi Berserker", "card_faces": [{"name": "a"}, {"name": "b"}]},
+    ]
+    text = json.dumps(cards, indent=2, ensure_ascii=False)
+
+    for size in (1, 3, 7, len(text)):
+        assert list(iter_json_array(_chunked(text, size))) == cards
+
+
+def test_iter_json_array_rejects_truncated_file():
+    with pytest.raises(ValueError):
+        list(iter_json_array(_chunked('[{"id": "1"}, {"id": ', 4)))
+
+
+def test_iter_json_array_fails_fast_on_a_malformed_element():
+    head = '[{"id": "Æ"}, '
+    # Never decodes, and the stream never ends
+    chunks = itertools.chain(_chunked(head + '{"id": "2" "name": ', 4), itertools.repeat("    "))
+
+    cards = iter_json_array(chunks, max_element_size=64)
+    assert next(cards) == {"id": "Æ"}
+    with pytest.raises(ValueError, match=f"at byte {len(head.encode())}:"):
+        next(cards)
+
+
+def test_iter_bulk_cards_reads_local_file(tmp_path):
+    path = tmp_path / "default-cards.json"
+    path.write_text(json.dumps([{"id": str(i)} for i in range(50)]), encoding="utf-8")
+
+    ids = [card["id"] for card in iter_bulk_cards(str(path), chunk_size=16)]
+
+    assert ids == [str(i) for i in range(50)]
+
+
+def test_card_content_hash_ignores_key_order_and_prices():
+    card = {"id": "1", "name": "Elf", "prices": {"usd": "0.10"}, "legalities": {"modern": "legal"}}
+    reordered = {"legalities": {"modern": "legal"}, "prices": {"usd": "9.99"}, "name": "Elf", "id": "1"}
+    errata = dict(card, oracle_text="Flying")
+
+    assert card_content_hash(card) == card_content_hash(reordered)
+    assert card_content_hash(card) != card_content_hash(errata)
@@ -0,0 +1,112 @@
+import time
+
+import pytest
+
+from scryfall.cache import CacheEntry, CacheStats, CachingScryfallClient, DiskCardStore
+from scryfall.client import ScryfallClient
+from scryfall.mappers.axis1_mapper import MAPPER_VERSION, Axis1Mapper
+from scryfall.rate_limit import TokenBucket
+from scryfall.services.deck_import_service import DeckImportService
+from db.repository import Axis1Repository
+
+
+def _client(stub, **kwargs):
+    inner = ScryfallClient(base_url=stub.url, rate_limiter=TokenBucket(1000))
+    return CachingScryfallClient(inner, **kwargs)
+
+
+def test_memory_cache_serves_repeat_fetches(scryfall_stub):
+    client = _client(scryfall_stub)
+
+    client.fetch_card("c1")
+    client.fetch_collection(["c1", "c2"])
+    client.fetch_collection(["c2", "c1"])
+
+    assert scryfall_stub.requests == [("GET", "/cards/c1"), ("POST", "/cards/collection")]
+    assert client.stats.as_dict()["hits"]["memory"] == 3
+    assert client.stats.misses == 2
+
+
+def test_disk_store_survives_new_client(scryfall_stub, tmp_path):
+    _client(scryfall_stub, store_dir=str(tmp_path)).fetch_card("c1")
+
+    client = _client(scryfall_stub, store_dir=str(tmp_path))
+    assert client.fetch_card("c1")["id"] == "c1"
+
+    assert len(scryfall_stub.requests) == 1
+    assert client.stats.hits["disk"] == 1
+
+
+def test_expired_entry_is_revalidated_with_etag(scryfall_stub):
+    client = _client(scryfall_stub, ttl=0.01)
+    client.fetch_card("c1")
+    time.sleep(0.02)
+
+    assert client.fetch_card("c1")["id"] == "c1"
+    assert client.stats.revalidated == 1
+
+    scryfall_stub.versions["c1"] = 2
+    time.sleep(0.02)
+    client.fetch_card("c1")
+    assert client.stats.refetched == 1
+
+
+def test_expired_batch_entries_count_as_refetched_after_the_fetch(scryfall_stub, monkeypatch):
+    client = _client(scryfall_stub, ttl=0.01)
+    client.fetch_collection(["c1"])
+    time.sleep(0.02)
+
+    def down(card_ids):
+        raise RuntimeError("scryfall unavailable")
+
+    with monkeypatch.context() as m:
+        m.setattr(client.client, "fetch_collection", down)
+        with pytest.raises(RuntimeError):
+            client.fetch_collection(["c1"])
+    assert client.stats.refetched == 0
+
+    client.fetch_collection(["c1"])
+    assert client.stats.refetched == 1
+
+
+def test_deck_import_serves_stored_cards_from_db(scryfall_stub, db_session):
+    stats = CacheStats()
+    repo = Axis1Repository(db_session)
+    repo.save_many([Axis1Mapper().map(scryfall_stub.card("a"))], mapper_version=MAPPER_VERSION)
+    service = DeckImportService(_client(scryfall_stub, stats=stats), Axis1Mapper(), repo, stats=stats)
+
+    cards = service.import_deck(f"{scryfall_stub.url}/decks/a,b")
+
+    assert [c.card_id for c in cards] == ["a", "b"]
+    assert stats.hits["db"] == 1
+    assert repo.get_by_id("b") is not None
+
+
+def test_deck_import_remaps_rows_from_another_mapper_version(scryfall_stub, db_session):
+    stats = CacheStats()
+    repo = Axis1Repository(db_session)
+    repo.save_many([Axis1Mapper().map(scryfall_stub.card("a"))], mapper_version="old")
+    service = DeckImportService(_client(scryfall_stub, stats=stats), Axis1Mapper(), repo, stats=stats)
+
+    cards = service.import_deck(f"{scryfall_stub.url}/decks/a")
+
+    assert [c.card_id for c in cards] == ["a"]
+    assert stats.hits["db"] == 0
+    assert ("POST", "/cards/collection") in scryfall_stub.requests
+    assert repo.get_by_id("a").mapper_version == MAPPER_VERSION
+
+
+def test_disk_store_treats_bad_files_and_ids_as_misses(tmp_path):
+    store = DiskCardStore(str(tmp_path))
+    store.put("c1", CacheEntry({"id": "c1"}, 0.0))
+    assert store.get("c1").card == {"id": "c1"}
+
+    for bad in ('{"fetched_at": 0}', "[1, 2]"):
+        (tmp_path / "c1" / "c1.json").write_text(bad)
+        assert store.get("c1") is None
+
+    for card_id in ("../escape", "a/b", "..", ""):
+        store.put(card_id, CacheEntry({"id": card_id}, 0.0))
+        assert store.get(card_id) is None
+    assert not (tmp_path.parent / "escape.json").exists()
+    assert [p.name for p in tmp_path.iterdir()] == ["c1"]
@@ -1,5 +1,11 @@
+import asyncio
+import time
+
 import pytest
-from scryfall.client import ScryfallClient
+from scryfall.client import ScryfallClient, _retry_after
+from scryfall.mappers.axis1_mapper import Axis1Mapper
+from scryfall.rate_limit import TokenBucket
+from scryfall.services.deck_import_service import DeckImportService
 
 def test_scryfall_search_returns_list(monkeypatch):
     """Test that search() returns a list of cards."""
@@ -10,13 +16,13 @@ def test_scryfall_search_returns_list(monkeypatch):
         "has_more": False
     }
 
-    def fake_get(url, params=None, timeout=10):
+    def fake_get(self, url, params=None, timeout=10):
         class FakeResp:
             def raise_for_status(self): pass
             def json(self): return fake_response
         return FakeResp()
 
-    monkeypatch.setattr("requests.get", fake_get)
+    monkeypatch.setattr("requests.Session.get", fake_get)
 
     client = ScryfallClient()
     results = client.search("elf")
@@ -24,3 +30,121 @@ def test_scryfall_search_returns_list(monkeypatch):
     assert isinstance(results, list)
     assert len(results) == 2
     assert results[0]["id"] == "1"
+
+
+class FakeRepo:
+    def __init__(self):
+        self.saved = []
+
+    def get_many(self, card_ids):
+        return {}
+
+    def save_many(self, cards, batch_size=None, **kwargs):
+        self.saved.extend(cards)
+        return len(self.saved)
+
+
+def test_fetch_cards_is_concurrent_and_ordered(scryfall_stub):
+    """Deck entries are fetched in parallel over one pooled session."""
+
+    scryfall_stub.latency = 0.05
+    ids = [f"c{i}" for i in range(16)]
+    client = ScryfallClient(base_url=scryfall_stub.url, rate_limiter=TokenBucket(1000), max_workers=8)
+
+    started = time.perf_counter()
+    cards = client.fetch_cards(ids)
+    elapsed = time.perf_counter() - started
+
+    assert [c["id"] for c in cards] == ids
+    assert scryfall_stub.max_in_flight > 1
+    assert elapsed < 16 * scryfall_stub.latency
+
+
+def test_client_retries_rate_limited_requests(scryfall_stub):
+    scryfall_stub.fail_once.add("c1")
+    client = ScryfallClient(base_url=scryfall_stub.url, rate_limiter=TokenBucket(1000))
+
+    assert client.fetch_card("c1")["id"] == "c1"
+    assert scryfall_stub.requests.count(("GET", "/cards/c1")) == 2
+
+
+def test_client_raises_on_missing_card(scryfall_stub):
+    client = ScryfallClient(base_url=scryfall_stub.url, rate_limiter=TokenBucket(1000))
+
+    with pytest.raises(RuntimeError):
+        client._get(f"{scryfall_stub.url}/missing")
+
+
+def test_token_bucket_limits_request_rate():
+    bucket = TokenBucket(rate=50, capacity=1)
+
+    started = time.perf_counter()
+    for _ in range(6):
+        bucket.acquire()
+
+    assert time.perf_counter() - started >= 5 / 50 * 0.9
+
+
+def test_default_rate_limit_does_not_burst():
+    assert ScryfallClient().rate_limiter.capacity == 1
+
+
+def test_retry_after_is_capped():
+    class Resp:
+        def __init__(self, value):
+            self.headers = {"Retry-After": value}
+
+    assert _retry_after(Resp("2"), 0.5, 30) == 2.0
+    assert _retry_after(Resp("86400"), 0.5, 30) == 30
+    assert _retry_after(Resp("nan"), 0.5, 30) == 0.5
+    assert _retry_after(Resp("soon"), 0.5, 30) == 0.5
+
+
+def test_fetch_collection_batches_and_dedupes(scryfall_stub):
+    ids = [f"c{i}" for i in range(100)] + ["c0", "c99"]
+    client = ScryfallClient(base_url=scryfall_stub.url, rate_limiter=TokenBucket(1000))
+
+    cards = client.fetch_collection(ids)
+
+    assert [c["id"] for c in cards] == ids
+    assert scryfall_stub.requests == [("POST", "/cards/collection")] * 2
+
+
+def test_fetch_collection_reports_missing_cards(scryfall_stub):
+    client = ScryfallClient(base_url=scryfall_stub.url, rate_limiter=TokenBucket(1000))
+
+    with pytest.raises(RuntimeError, match="missing-1"):
+        client.fetch_collection(["c1", "missing-1"])
+
+
+def test_deck_import_against_stub(scryfall_stub):
+    ids = ["a", "b", "a", "c"]
+    client = ScryfallClient(base_url=scryfall_stub.url, rate_limiter=TokenBucket(1000))
+    repo = FakeRepo()
+    service = DeckImportService(client, Axis1Mapper(), repo)
+
+    cards = service.import_deck(f"{scryfall_stub.url}/decks/{','.join(ids)}")
+
+    assert [c.card_id for c in cards] == ids
+    assert [c.card_id for c in repo.saved] == ["a", "b", "c"]
+    # 1 deck request + 1 collection request for 3 distinct cards
+    assert len(scryfall_stub.requests) == 2
+
+
+class FakeAsyncRepo(FakeRepo):
+    async def get_many(self, card_ids):
+        return {}
+
+    async def save_many(self, cards, batch_size=None, **kwargs):
+        return FakeRepo.save_many(self, cards, batch_size, **kwargs)
+
+
+def test_async_deck_import_against_stub(scryfall_stub):
+    client = ScryfallClient(base_url=scryfall_stub.url, rate_limiter=TokenBucket(1000))
+    repo = FakeAsyncRepo()
+    service = DeckImportService(client, Axis1Mapper(), repo)
+
+    cards = asyncio.run(service.import_deck_async(f"{scryfall_stub.url}/decks/a,b,a"))
+
+    assert [c.card_id for c in cards] == ["a", "b", "a"]
+    assert [c.card_id for c in repo.saved] == ["a", "b"]
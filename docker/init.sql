@@ -6,9 +6,15 @@ CREATE TABLE IF NOT EXISTS axis1_cards (
     layout           TEXT,
     name             TEXT,
     lang             TEXT,
-    axis1_json       JSONB
+    axis1_json       JSONB,
+    content_hash     TEXT,
+    mapper_version   TEXT
 );
 
+-- Databases created before incremental imports
+ALTER TABLE axis1_cards ADD COLUMN IF NOT EXISTS content_hash TEXT;
+ALTER TABLE axis1_cards ADD COLUMN IF NOT EXISTS mapper_version TEXT;
+
 CREATE INDEX IF NOT EXISTS idx_axis1_oracle_id
     ON axis1_cards (oracle_id);
 
@@ -17,3 +23,84 @@ CREATE INDEX IF NOT EXISTS idx_axis1_set_code
 
 CREATE INDEX IF NOT EXISTS idx_axis1_name
     ON axis1_cards (name);
+
+-- Card search (mirrors db/schema.py SEARCH_DDL / TRIGRAM_DDL)
+ALTER TABLE axis1_cards ADD COLUMN IF NOT EXISTS mana_value NUMERIC
+    GENERATED ALWAYS AS ((axis1_json->'characteristics'->>'mana_value')::numeric) STORED;
+ALTER TABLE axis1_cards ADD COLUMN IF NOT EXISTS card_types JSONB
+    GENERATED ALWAYS AS (axis1_json->'characteristics'->'card_types') STORED;
+ALTER TABLE axis1_cards ADD COLUMN IF NOT EXISTS subtypes JSONB
+    GENERATED ALWAYS AS (axis1_json->'characteristics'->'subtypes') STORED;
+ALTER TABLE axis1_cards ADD COLUMN IF NOT EXISTS keywords JSONB
+    GENERATED ALWAYS AS (jsonb_path_query_array(axis1_json, '$.faces[*].keywords[*]')) STORED;
+-- WUBRG bitmask: W=1 U=2 B=4 R=8 G=16
+ALTER TABLE axis1_cards ADD COLUMN IF NOT EXISTS color_identity SMALLINT
+    GENERATED ALWAYS AS (
+        (CASE WHEN axis1_json->'characteristics'->'color_identity' ? 'W' THEN 1 ELSE 0 END)
+      + (CASE WHEN axis1_json->'characteristics'->'color_identity' ? 'U' THEN 2 ELSE 0 END)
+      + (CASE WHEN axis1_json->'characteristics'->'color_identity' ? 'B' THEN 4 ELSE 0 END)
+      + (CASE WHEN axis1_json->'characteristics'->'color_identity' ? 'R' THEN 8 ELSE 0 END)
+      + (CASE WHEN axis1_json->'characteristics'->'color_identity' ? 'G' THEN 16 ELSE 0 END)
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_axis1_mana_value
+    ON axis1_cards (mana_value);
+
+CREATE INDEX IF NOT EXISTS idx_axis1_color_identity
+    ON axis1_cards (color_identity);
+
+CREATE INDEX IF NOT EXISTS idx_axis1_card_types
+    ON axis1_cards USING gin (card_types jsonb_path_ops);
+
+CREATE INDEX IF NOT EXISTS idx_axis1_subtypes
+    ON axis1_cards USING gin (subtypes jsonb_path_ops);
+
+CREATE INDEX IF NOT EXISTS idx_axis1_keywords
+    ON axis1_cards USING gin (keywords jsonb_path_ops);
+
+CREATE INDEX IF NOT EXISTS idx_axis1_sort_name_card_id
+    ON axis1_cards ((coalesce(name, '')), card_id);
+
+CREATE INDEX IF NOT EXISTS idx_axis1_name_prefix
+    ON axis1_cards (lower(name) text_pattern_ops);
+
+CREATE INDEX IF NOT EXISTS idx_axis1_face_name
+    ON axis1_cards ((axis1_json->'faces'->0->>'name'));
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_axis1_name_trgm
+    ON axis1_cards USING gin (lower(name) gin_trgm_ops);
+
+CREATE TABLE IF NOT EXISTS axis2_cards (
+    compile_key     TEXT PRIMARY KEY,
+    parser_version  TEXT NOT NULL,
+    oracle_id       TEXT,
+    name            TEXT,
+    axis2_blob      BYTEA NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_axis2_parser_version
+    ON axis2_cards (parser_version);
+
+CREATE INDEX IF NOT EXISTS idx_axis2_oracle_id
+    ON axis2_cards (oracle_id);
+
+CREATE INDEX IF NOT EXISTS idx_axis2_name
+    ON axis2_cards (name);
+
+CREATE TABLE IF NOT EXISTS import_jobs (
+    id          TEXT PRIMARY KEY,
+    kind        TEXT NOT NULL,
+    status      TEXT NOT NULL,
+    owner       TEXT,
+    progress    INTEGER NOT NULL DEFAULT 0,
+    total       INTEGER,
+    result      JSONB,
+    error       TEXT,
+    created_at  DOUBLE PRECISION NOT NULL,
+    updated_at  DOUBLE PRECISION NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_import_jobs_status
+    ON import_jobs (status);
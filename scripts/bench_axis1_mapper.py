@@ -0,0 +1,76 @@
+"""
+Microbenchmark Axis1Mapper over a Scryfall bulk file.
+
+Loads the cards into memory first so only mapping is timed, then reports
+faces/sec for the oracle-text scan + ability extractors, and the per-card
+cost of Axis1Mapper.map with full Pydantic validation and with the
+trusted construction path, best of N rounds.
+
+Usage:
+    python scripts/bench_axis1_mapper.py --source default-cards.json
+    python scripts/bench_axis1_mapper.py --source default-cards.json --limit 20000 --rounds 5
+"""
+
+import argparse
+import itertools
+import time
+
+from scryfall.bulk import iter_bulk_cards
+from scryfall.mappers.axis1_mapper import (
+    Axis1Mapper,
+    _extract_activated_abilities_from_oracle,
+    _extract_static_type_changers,
+    _extract_triggered_abilities_from_oracle,
+    scan_oracle_text,
+)
+
+
+def oracle_texts(cards):
+    for card in cards:
+        faces = card.get("card_faces") or [card]
+        for face in faces:
+            yield face.get("oracle_text") or ""
+
+
+def bench_extractors(texts):
+    started = time.perf_counter()
+    for text in texts:
+        scan = scan_oracle_text(text)
+        _extract_activated_abilities_from_oracle(scan)
+        _extract_triggered_abilities_from_oracle(scan)
+        _extract_static_type_changers(scan)
+    return time.perf_counter() - started
+
+
+def bench_map(cards, validate):
+    mapper = Axis1Mapper(validate=validate)
+    started = time.perf_counter()
+    for card in cards:
+        mapper.map(card)
+    return time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure Axis1Mapper throughput.")
+    parser.add_argument("--source", required=True, help="Bulk file path or URL.")
+    parser.add_argument("--limit", type=int, help="Only benchmark the first N cards.")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    cards = list(itertools.islice(iter_bulk_cards(args.source), args.limit))
+    texts = list(oracle_texts(cards))
+    print(f"Loaded {len(cards)} cards ({len(texts)} faces)")
+
+    extract = min(bench_extractors(texts) for _ in range(args.rounds))
+    print(f"  scan + extractors: {len(texts) / extract:.0f} faces/sec")
+
+    for label, validate in (("validated", True), ("trusted", False)):
+        mapped = min(bench_map(cards, validate) for _ in range(args.rounds))
+        print(
+            f"  Axis1Mapper.map ({label}): {len(cards) / mapped:.0f} cards/sec, "
+            f"{mapped / len(cards) * 1e6:.1f}us/card"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Tiny load generator for the MTG Engine API.
+
+Fires requests from N concurrent client threads for a fixed duration and
+reports requests/sec and latency percentiles, so the ceiling can be
+compared before and after an API change.
+
+Usage:
+    python scripts/load_test_api.py --url http://127.0.0.1:8000/cache/stats
+    python scripts/load_test_api.py --url http://127.0.0.1:8000/import/deck \
+        --json '{"deck_url": "http://127.0.0.1:9000/deck.json"}' --concurrency 32
+"""
+
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+def worker(args, deadline, latencies, errors, lock):
+    session = requests.Session()
+    payload = json.loads(args.json) if args.json else None
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            if payload is None:
+                resp = session.get(args.url, timeout=args.timeout)
+            else:
+                resp = session.post(args.url, json=payload, timeout=args.timeout)
+            ok = resp.status_code < 400
+        except requests.exceptions.RequestException:
+            ok = False
+        elapsed = time.perf_counter() - started
+        with lock:
+            if ok:
+                latencies.append(elapsed)
+            else:
+                errors.append(elapsed)
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure API requests/sec.")
+    parser.add_argument("--url", required=True)
+    parser.add_argument("--json", help="JSON body; sends POST instead of GET.")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args(argv)
+
+    latencies, errors = [], []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        for _ in range(args.concurrency):
+            pool.submit(worker, args, deadline, latencies, errors, lock)
+
+    print(f"{len(latencies)} ok, {len(errors)} errors in {args.duration:.0f}s "
+          f"with {args.concurrency} clients")
+    print(f"  {len(latencies) / args.duration:.1f} requests/sec")
+    print(
+        f"  latency p50 {percentile(latencies, 50) * 1000:.1f}ms, "
+        f"p99 {percentile(latencies, 99) * 1000:.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""
+Background jobs for long-running imports.
+
+Jobs run on a bounded in-process thread pool. Their status, progress and
+result live in a job store: in memory by default, or in the
+`import_jobs` table so every API worker process can answer /jobs/{id}.
+
+Each job records the process that owns it (JOB_OWNER, hostname:pid by
+default). While a job is unfinished, its owner touches `updated_at`
+every HEARTBEAT_INTERVAL seconds. On startup a process only fails the
+unfinished jobs it owned before a restart, or those whose heartbeat is
+older than STALE_AFTER. Jobs that other live workers are running are
+left alone.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from sqlalchemy import or_
+
+from db.models import ImportJobModel
+
+logger = logging.getLogger(__name__)
+
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+JOB_FIELDS = ("id", "kind", "status", "owner", "progress", "total", "result", "error", "created_at", "updated_at")
+
+HEARTBEAT_INTERVAL = 30.0
+STALE_AFTER = 5 * 60.0
+
+# Finished jobs kept by InMemoryJobStore
+FINISHED_TTL = 60 * 60.0
+MAX_FINISHED = 1000
+
+# Process identity recorded on its jobs; a restarted container keeps its
+# hostname and usually its pid, so it recognizes its own orphaned jobs
+JOB_OWNER = os.getenv("JOB_OWNER") or f"{socket.gethostname()}:{os.getpid()}"
+
+
+class InMemoryJobStore:
+    """
+    Job records in a dict. Finished jobs are dropped after `finished_ttl`
+    seconds, and beyond `max_finished` the oldest go first.
+    """
+
+    def __init__(self, finished_ttl: float = FINISHED_TTL, max_finished: int = MAX_FINISHED):
+        self.finished_ttl = finished_ttl
+        self.max_finished = max_finished
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._finished: "OrderedDict[str, float]" = OrderedDict()  # job id -> finished at
+        self._lock = threading.Lock()
+
+    def create(self, job: Dict[str, Any]):
+        with self._lock:
+            self._evict(time.time())
+            self._jobs[job["id"]] = dict(job)
+
+    def update(self, job_id: str, **fields):
+        now = time.time()
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.update(fields, updated_at=now)
+            if job["status"] in (DONE, FAILED):
+                self._finished[job_id] = now
+                self._evict(now)
+
+    def touch(self, job_ids: Iterable[str]):
+        now = time.time()
+        with self._lock:
+            for job_id in job_ids:
+                if job_id in self._jobs:
+                    self._jobs[job_id]["updated_at"] = now
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def _evict(self, now: float):
+        expired = now - self.finished_ttl
+        while self._finished:
+            job_id, finished_at = next(iter(self._finished.items()))
+            if finished_at > expired and len(self._finished) <= self.max_finished:
+                break
+            self._finished.popitem(last=False)
+            self._jobs.pop(job_id, None)
+
+
+class SqlJobStore:
+    """Job records in `import_jobs`, one short session per call."""
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+
+    def create(self, job: Dict[str, Any]):
+        with self.session_factory() as db:
+            db.add(ImportJobModel(**job))
+            db.commit()
+
+    def update(self, job_id: str, **fields):
+        with self.session_factory() as db:
+            db.query(ImportJobModel).filter_by(id=job_id).update(
+                dict(fields, updated_at=time.time())
+            )
+            db.commit()
+
+    def touch(self, job_ids: Iterable[str]):
+        """Heartbeat for jobs this process is still working on."""
+        job_ids = list(job_ids)
+        if not job_ids:
+            return
+        with self.session_factory() as db:
+            db.query(ImportJobModel).filter(ImportJobModel.id.in_(job_ids)).update(
+                {"updated_at": time.time()}, synchronize_session=False
+            )
+            db.commit()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self.session_factory() as db:
+            row = db.query(ImportJobModel).filter_by(id=job_id).first()
+            return {field: getattr(row, field) for field in JOB_FIELDS} if row else None
+
+    def fail_interrupted(self, owner: str = JOB_OWNER, stale_after: float = STALE_AFTER):
+        """
+        Fail unfinished jobs that will never finish: those `owner` (this
+        process, before a restart) left behind, and those whose owner
+        stopped sending heartbeats.
+        """
+        with self.session_factory() as db:
+            db.query(ImportJobModel).filter(
+                ImportJobModel.status.in_([QUEUED, RUNNING]),
+                or_(
+                    ImportJobModel.owner == owner,
+                    ImportJobModel.updated_at < time.time() - stale_after,
+                ),
+            ).update(
+                {"status": FAILED, "error": "interrupted by restart", "updated_at": time.time()},
+                synchronize_session=False,
+            )
+            db.commit()
+
+
+class JobQueue:
+    """
+    Runs `fn(progress)` on at most `max_workers` threads.
+
+    `progress(done, total)` updates the job record; the function's
+    return value becomes the job result. Unfinished jobs get a heartbeat
+    every `heartbeat_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        store=None,
+        max_workers: int = 4,
+        owner: str = JOB_OWNER,
+        heartbeat_interval: float = HEARTBEAT_INTERVAL,
+    ):
+        self.store = store or InMemoryJobStore()
+        self.owner = owner
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="import-job")
+        self.heartbeat_interval = heartbeat_interval
+        self._active = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._heartbeat = threading.Thread(target=self._beat, name="import-job-heartbeat", daemon=True)
+        self._heartbeat.start()
+
+    def submit(self, kind: str, fn: Callable[[Callable[[int, int], None]], Any]) -> str:
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        self.store.create({
+            "id": job_id,
+            "kind": kind,
+            "status": QUEUED,
+            "owner": self.owner,
+            "progress": 0,
+            "total": None,
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+        })
+        with self._lock:
+            self._active.add(job_id)
+        self.pool.submit(self._run, job_id, fn)
+        return job_id
+
+    def _run(self, job_id: str, fn):
+        def progress(done: int, total: int):
+            self.store.update(job_id, progress=done, total=total)
+
+        try:
+            self.store.update(job_id, status=RUNNING)
+            result = fn(progress)
+        except Exception as e:
+            logger.exception("Job %s failed", job_id)
+            self._record(job_id, status=FAILED, error=f"{type(e).__name__}: {e}")
+        else:
+            self._record(job_id, status=DONE, result=result)
+        finally:
+            with self._lock:
+                self._active.discard(job_id)
+
+    def _record(self, job_id: str, **fields):
+        # Nothing else would see an error raised inside the executor
+        try:
+            self.store.update(job_id, **fields)
+        except Exception:
+            logger.exception("Could not record the outcome of job %s", job_id)
+
+    def _beat(self):
+        while not self._stop.wait(self.heartbeat_interval):
+            with self._lock:
+                active = list(self._active)
+            try:
+                self.store.touch(active)
+            except Exception:
+                logger.exception("Heartbeat failed for jobs %s", ", ".join(active))
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self.store.get(job_id)
+
+    def shutdown(self, wait: bool = True):
+        self._stop.set()
+        self.pool.shutdown(wait=wait)
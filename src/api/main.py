@@ -1,38 +1,159 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
 import uvicorn
-from fastapi import FastAPI, Depends
-from sqlalchemy.orm import Session
+from typing import Optional
+
+from fastapi import FastAPI, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from db.connection import SessionLocal
-from db.repository import Axis1Repository
+from db.connection import AsyncSessionLocal, SessionLocal, async_engine
+from db.repository import (
+    DEFAULT_SEARCH_LIMIT,
+    MAX_SEARCH_LIMIT,
+    Axis1Repository,
+    AsyncAxis1Repository,
+    SearchNotSupported,
+)
+from scryfall.cache import CacheStats, CachingScryfallClient
 from scryfall.client import ScryfallClient
 from scryfall.mappers.axis1_mapper import Axis1Mapper
-from services.deck_import_service import DeckImportService
+from scryfall.services.deck_import_service import DeckImportService
+from .jobs import JobQueue, SqlJobStore
 from .schemas.request_schemas import DeckImportRequest
 
-app = FastAPI(title="MTG Engine API")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Built once per process: the mapper, the pooled + cached Scryfall
+    # client and its counters are shared by every request
+    app.state.mapper = Axis1Mapper()
+    app.state.card_cache_stats = CacheStats()
+    app.state.scryfall = CachingScryfallClient(
+        ScryfallClient(),
+        store_dir=os.getenv("SCRYFALL_CACHE_DIR"),
+        ttl=float(os.getenv("SCRYFALL_CACHE_TTL", 24 * 60 * 60)),
+        stats=app.state.card_cache_stats,
+    )
+
+    # Background imports: bounded worker pool, job records in memory
+    # or (IMPORT_JOB_STORE=db) in the import_jobs table. On startup only
+    # this process's orphaned jobs and jobs without a recent heartbeat
+    # are failed.
+    job_store = None
+    if os.getenv("IMPORT_JOB_STORE", "memory") == "db":
+        job_store = SqlJobStore(SessionLocal)
+        await asyncio.to_thread(job_store.fail_interrupted)
+    app.state.jobs = JobQueue(job_store, max_workers=int(os.getenv("IMPORT_JOB_WORKERS", 4)))
 
-def get_db():
-    db = SessionLocal()
     try:
-        yield db
+        yield
     finally:
-        db.close()
+        app.state.jobs.shutdown(wait=False)
+        app.state.scryfall.close()
+        await async_engine.dispose()
 
 
-@app.post("/import/deck")
-def import_deck(req: DeckImportRequest, db: Session = Depends(get_db)):
-    scry_client = ScryfallClient()
-    mapper = Axis1Mapper()
-    repo = Axis1Repository(db)
-    service = DeckImportService(scry_client, mapper, repo)
+app = FastAPI(title="MTG Engine API", lifespan=lifespan)
+
 
-    result = service.import_deck(req.deck_url)
+async def get_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def _import_response(cards):
     return {
-        "imported_count": len(result),
-        "cards": [c.card_id for c in result]
+        "imported_count": len(cards),
+        "cards": [c.card_id for c in cards]
     }
 
 
+def _run_import_job(state, deck_url: str, progress):
+    # Runs on a job worker thread → plain sync session
+    with SessionLocal() as db:
+        service = DeckImportService(
+            state.scryfall, state.mapper, Axis1Repository(db), stats=state.card_cache_stats
+        )
+        return _import_response(service.import_deck(deck_url, progress=progress))
+
+
+@app.post("/import/deck")
+async def import_deck(req: DeckImportRequest, request: Request, db: AsyncSession = Depends(get_db)):
+    state = request.app.state
+
+    if req.background:
+        job_id = await asyncio.to_thread(
+            state.jobs.submit,
+            "deck_import",
+            lambda progress: _run_import_job(state, req.deck_url, progress),
+        )
+        return JSONResponse(status_code=202, content={"job_id": job_id, "status": "queued"})
+
+    repo = AsyncAxis1Repository(db)
+    service = DeckImportService(state.scryfall, state.mapper, repo, stats=state.card_cache_stats)
+
+    result = await service.import_deck_async(req.deck_url)
+    return _import_response(result)
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str, request: Request):
+    job = await asyncio.to_thread(request.app.state.jobs.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@app.get("/cards/search")
+async def search_cards(
+    name: Optional[str] = Query(None, description="Case-insensitive name prefix"),
+    name_contains: Optional[str] = None,
+    type: Optional[str] = None,
+    subtype: Optional[str] = None,
+    keyword: Optional[str] = None,
+    colors: Optional[str] = Query(None, description="Color identity bound, e.g. 'WU' or 'C'"),
+    mana_value: Optional[float] = None,
+    min_mana_value: Optional[float] = None,
+    max_mana_value: Optional[float] = None,
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    try:
+        return await AsyncAxis1Repository(db).search(
+            name=name,
+            name_contains=name_contains,
+            card_type=type,
+            subtype=subtype,
+            keyword=keyword,
+            colors=colors,
+            mana_value=mana_value,
+            min_mana_value=min_mana_value,
+            max_mana_value=max_mana_value,
+            limit=limit,
+            cursor=cursor,
+        )
+    except SearchNotSupported as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/cards/{card_id}")
+async def get_card(card_id: str, db: AsyncSession = Depends(get_db)):
+    row = await AsyncAxis1Repository(db).get_by_id(card_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail="Card not found")
+    return row.axis1_json
+
+
+@app.get("/cache/stats")
+async def cache_stats(request: Request):
+    return request.app.state.card_cache_stats.as_dict()
+
+
 if __name__ == "__main__":
     uvicorn.run("api.main:app", host="0.0.0.0", port=8000, reload=True)
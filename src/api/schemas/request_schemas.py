@@ -2,3 +2,5 @@ from pydantic import BaseModel
 
 class DeckImportRequest(BaseModel):
     deck_url: str
+    # Enqueue the import and return a job id instead of waiting for it
+    background: bool = False
@@ -3,6 +3,8 @@
 from typing import List, Optional, Dict, Any, Union
 from pydantic import BaseModel, Field
 
+from .vocab import InternedStrList, color_mask, supertype_mask, type_mask
+
 
 class IntrinsicCounter(BaseModel):
     type: str
@@ -77,12 +79,12 @@ class Axis1Face(BaseModel):
     mana_value: Optional[float] = None
 
     # Scryfall uses null for colorless cards → default_factory
-    colors: List[str] = Field(default_factory=list)
-    color_indicator: List[str] = Field(default_factory=list)
+    colors: InternedStrList = Field(default_factory=list)
+    color_indicator: InternedStrList = Field(default_factory=list)
 
-    card_types: List[str] = Field(default_factory=list)
-    supertypes: List[str] = Field(default_factory=list)
-    subtypes: List[str] = Field(default_factory=list)
+    card_types: InternedStrList = Field(default_factory=list)
+    supertypes: InternedStrList = Field(default_factory=list)
+    subtypes: InternedStrList = Field(default_factory=list)
 
     # ⭐ Allow symbolic values: "*", "X", "*+1", etc.
     power: Optional[Union[str, int]] = None
@@ -97,7 +99,7 @@ class Axis1Face(BaseModel):
     printed_text: Optional[str] = None
     flavor_text: Optional[str] = None
 
-    keywords: List[str] = Field(default_factory=list)
+    keywords: InternedStrList = Field(default_factory=list)
     ability_words: List[str] = Field(default_factory=list)
     static_abilities: List[str] = Field(default_factory=list)
 
@@ -114,18 +116,31 @@ class Axis1Face(BaseModel):
     attachment: Optional[AttachmentRules] = None
     face_layout_rules: FaceLayoutRules = Field(default_factory=FaceLayoutRules)
 
+    # Bit encodings (see axis1/vocab.py)
+    @property
+    def color_mask(self) -> int:
+        return color_mask(self.colors)
+
+    @property
+    def type_mask(self) -> int:
+        return type_mask(self.card_types)
+
+    @property
+    def supertype_mask(self) -> int:
+        return supertype_mask(self.supertypes)
+
 
 class Axis1Characteristics(BaseModel):
     mana_cost: Optional[str] = None
     mana_value: Optional[float] = None
 
-    colors: List[str] = Field(default_factory=list)
-    color_identity: List[str] = Field(default_factory=list)
-    color_indicator: List[str] = Field(default_factory=list)
+    colors: InternedStrList = Field(default_factory=list)
+    color_identity: InternedStrList = Field(default_factory=list)
+    color_indicator: InternedStrList = Field(default_factory=list)
 
-    card_types: List[str] = Field(default_factory=list)
-    supertypes: List[str] = Field(default_factory=list)
-    subtypes: List[str] = Field(default_factory=list)
+    card_types: InternedStrList = Field(default_factory=list)
+    supertypes: InternedStrList = Field(default_factory=list)
+    subtypes: InternedStrList = Field(default_factory=list)
 
     # ⭐ Allow symbolic values
     power: Optional[Union[str, int]] = None
@@ -133,6 +148,23 @@ class Axis1Characteristics(BaseModel):
     loyalty: Optional[Union[str, int]] = None
     defense: Optional[Union[str, int]] = None
 
+    # Bit encodings (see axis1/vocab.py)
+    @property
+    def color_mask(self) -> int:
+        return color_mask(self.colors)
+
+    @property
+    def color_identity_mask(self) -> int:
+        return color_mask(self.color_identity)
+
+    @property
+    def type_mask(self) -> int:
+        return type_mask(self.card_types)
+
+    @property
+    def supertype_mask(self) -> int:
+        return supertype_mask(self.supertypes)
+
 class Axis1Metadata(BaseModel):
     rarity: Optional[str] = None
     artist: Optional[str] = None
@@ -0,0 +1,106 @@
+# axis1/vocab.py
+"""
+Shared vocabularies for card characteristics.
+
+Type, subtype, color and keyword strings are interned, so every card
+loaded from Scryfall or the DB points at one shared str per value
+instead of carrying its own copy.
+
+Colors, card types and supertypes also get bit encodings. Masks are
+plain ints (not enum.IntFlag, whose operators run in Python), so rules
+code can test `mask & CardType.CREATURE` instead of scanning lists.
+"""
+
+import sys
+from typing import Annotated, Dict, Iterable, List
+
+from pydantic import AfterValidator
+
+
+def intern_strings(values: Iterable[str]) -> List[str]:
+    """Fresh list of the interned versions of `values`."""
+    return [sys.intern(v) for v in values]
+
+
+# List[str] field whose items are interned on validation
+InternedStrList = Annotated[List[str], AfterValidator(intern_strings)]
+
+
+class Color:
+    """Bit per color, WUBRG order."""
+    W = 1 << 0
+    U = 1 << 1
+    B = 1 << 2
+    R = 1 << 3
+    G = 1 << 4
+
+
+class CardType:
+    """Bit per card type (CR 300.1)."""
+    ARTIFACT = 1 << 0
+    BATTLE = 1 << 1
+    CONSPIRACY = 1 << 2
+    CREATURE = 1 << 3
+    DUNGEON = 1 << 4
+    ENCHANTMENT = 1 << 5
+    INSTANT = 1 << 6
+    KINDRED = 1 << 7
+    LAND = 1 << 8
+    PHENOMENON = 1 << 9
+    PLANE = 1 << 10
+    PLANESWALKER = 1 << 11
+    SCHEME = 1 << 12
+    SORCERY = 1 << 13
+    TRIBAL = 1 << 14
+    VANGUARD = 1 << 15
+
+
+class Supertype:
+    """Bit per supertype (CR 205.4a)."""
+    BASIC = 1 << 0
+    ELITE = 1 << 1
+    HOST = 1 << 2
+    LEGENDARY = 1 << 3
+    ONGOING = 1 << 4
+    SNOW = 1 << 5
+    WORLD = 1 << 6
+
+
+def _bits(namespace, spell=str.title) -> Dict[str, int]:
+    return {
+        sys.intern(spell(name)): bit
+        for name, bit in vars(namespace).items()
+        if name.isupper()
+    }
+
+
+# Printed spelling → bit
+COLOR_BITS = _bits(Color, spell=str.upper)
+CARD_TYPE_BITS = _bits(CardType)
+SUPERTYPE_BITS = _bits(Supertype)
+
+
+def _mask(bits: Dict[str, int], values: Iterable[str]) -> int:
+    mask = 0
+    for value in values or ():
+        mask |= bits.get(value, 0)
+    return mask
+
+
+def color_mask(colors: Iterable[str]) -> int:
+    return _mask(COLOR_BITS, colors)
+
+
+def type_mask(card_types: Iterable[str]) -> int:
+    """Card types in `card_types`; supertypes and unknown words are ignored."""
+    return _mask(CARD_TYPE_BITS, card_types)
+
+
+def supertype_mask(types: Iterable[str]) -> int:
+    """Supertypes in `types` (a card_types list or a supertypes list)."""
+    return _mask(SUPERTYPE_BITS, types)
+
+
+def mask_names(bits: Dict[str, int], mask: int) -> List[str]:
+    """Decode a mask back to names, in bit order."""
+    return [name for name, bit in bits.items() if mask & bit]
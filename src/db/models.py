@@ -1,6 +1,7 @@
 from sqlalchemy import Column, String, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base
-from sqlalchemy import Integer
+from sqlalchemy import Integer, Float, LargeBinary
 
 Base = declarative_base()
 
@@ -14,7 +15,15 @@ class Axis1CardModel(Base):
     layout = Column(String)
     name = Column(String, index=True)
     lang = Column(String)
-    axis1_json = Column(JSON)  # store full Axis1Card dict
+    axis1_json = Column(JSON().with_variant(JSONB(), "postgresql"))  # store full Axis1Card dict
+
+    # Incremental re-import: hash of the raw Scryfall card + mapper that produced axis1_json
+    content_hash = Column(String)
+    mapper_version = Column(String)
+
+    # Postgres also has generated search columns (mana_value, card_types,
+    # subtypes, keywords, color_identity), see db/schema.py. They are not
+    # mapped here so inserts never try to write them.
 
 class Axis2TestCard(Base):
     __tablename__ = "axis2_test_cards"
@@ -22,3 +31,29 @@ class Axis2TestCard(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String, index=True, unique=True)
     axis2_json = Column(JSON, nullable=False)
+
+
+class Axis2CardModel(Base):
+    __tablename__ = "axis2_cards"
+
+    # Precompiled Axis2Card per distinct rules content (see axis2/cache.py)
+    compile_key = Column(String, primary_key=True)
+    parser_version = Column(String, nullable=False, index=True)
+    oracle_id = Column(String, index=True)
+    name = Column(String, index=True)
+    axis2_blob = Column(LargeBinary, nullable=False)  # pickled Axis2Card
+
+
+class ImportJobModel(Base):
+    __tablename__ = "import_jobs"
+
+    id = Column(String, primary_key=True)
+    kind = Column(String, nullable=False)
+    status = Column(String, nullable=False, index=True)  # queued | running | done | failed
+    owner = Column(String)  # JOB_OWNER of the process running it
+    progress = Column(Integer, nullable=False, default=0)
+    total = Column(Integer)
+    result = Column(JSON)
+    error = Column(String)
+    created_at = Column(Float, nullable=False)
+    updated_at = Column(Float, nullable=False)
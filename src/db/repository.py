@@ -1,6 +1,39 @@
+import base64
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from sqlalchemy import bindparam, func, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from axis1.schema import Axis1Card
-from .models import Axis1CardModel, Axis2TestCard
+from .models import Axis1CardModel, Axis2CardModel, Axis2TestCard
+from .schema import COLOR_BITS
+
+
+DEFAULT_BATCH_SIZE = 1000
+# Postgres caps bind parameters per statement (the wire protocol uses int16)
+MAX_BIND_PARAMS = 65535
+DEFAULT_SEARCH_LIMIT = 50
+MAX_SEARCH_LIMIT = 200
+
+
+class SearchNotSupported(Exception):
+    """Card search needs the Postgres search columns (see db/schema.py)."""
+
+
+def _card_row(card: Union[Axis1Card, Dict[str, Any]]) -> Dict[str, Any]:
+    data = card if isinstance(card, dict) else card.dict()
+    return {
+        "card_id": data["card_id"],
+        "oracle_id": data.get("oracle_id"),
+        "set_code": data.get("set"),
+        "collector_number": data.get("collector_number"),
+        "layout": data.get("layout"),
+        "name": data["names"][0] if data.get("names") else None,
+        "lang": data.get("lang"),
+        "axis1_json": data,
+    }
 
 
 class Axis1Repository:
@@ -8,24 +41,327 @@ class Axis1Repository:
         self.db = db
 
     def save(self, card: Axis1Card) -> Axis1CardModel:
-        data = card.dict()
-        model = Axis1CardModel(
-            card_id=data["card_id"],
-            oracle_id=data.get("oracle_id"),
-            set_code=data.get("set"),
-            collector_number=data.get("collector_number"),
-            layout=data.get("layout"),
-            name=data["names"][0] if data.get("names") else None,
-            lang=data.get("lang"),
-            axis1_json=data,
-        )
+        model = Axis1CardModel(**_card_row(card))
         self.db.merge(model)  # upsert-like behavior
         self.db.commit()
         return model
 
+    def save_many(
+        self,
+        cards: Iterable[Union[Axis1Card, Dict[str, Any]]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        content_hashes: Optional[Dict[str, str]] = None,
+        mapper_version: Optional[str] = None,
+    ) -> int:
+        """
+        Bulk upsert cards (Axis1Card objects or their .dict() dumps).
+
+        Each batch is written as multi-row
+        INSERT ... ON CONFLICT (card_id) DO UPDATE statements (split to
+        stay under MAX_BIND_PARAMS) and committed once, instead of a
+        merge + commit round-trip per card.
+        When `content_hashes` (card_id → raw Scryfall hash) is given, the
+        hash is stored for incremental re-imports; `mapper_version` is
+        stored whenever it is given.
+        Returns the number of rows written.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        written = 0
+        batch: Dict[str, Dict[str, Any]] = {}
+
+        for card in cards:
+            row = _card_row(card)
+            if content_hashes is not None:
+                row["content_hash"] = content_hashes.get(row["card_id"])
+            if mapper_version is not None:
+                row["mapper_version"] = mapper_version
+            # A batch may only touch each card_id once (ON CONFLICT restriction);
+            # later rows win, like repeated save() calls would.
+            batch[row["card_id"]] = row
+            if len(batch) >= batch_size:
+                written += self._upsert(list(batch.values()))
+                batch = {}
+
+        if batch:
+            written += self._upsert(list(batch.values()))
+
+        return written
+
+    def _upsert(self, rows: List[Dict[str, Any]]) -> int:
+        return _upsert(self.db, Axis1CardModel, "card_id", rows)
+
     def get_by_id(self, card_id: str) -> Axis1CardModel:
         return self.db.query(Axis1CardModel).filter_by(card_id=card_id).first()
 
+    def get_many(self, card_ids: List[str]) -> Dict[str, Axis1CardModel]:
+        """card_id → row for the ids already stored (one query)."""
+        if not card_ids:
+            return {}
+        rows = self.db.query(Axis1CardModel).filter(Axis1CardModel.card_id.in_(card_ids)).all()
+        return {row.card_id: row for row in rows}
+
+    def get_import_state(self, card_ids: List[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """card_id → (content_hash, mapper_version) for the ids already stored."""
+        if not card_ids:
+            return {}
+        rows = (
+            self.db.query(
+                Axis1CardModel.card_id,
+                Axis1CardModel.content_hash,
+                Axis1CardModel.mapper_version,
+            )
+            .filter(Axis1CardModel.card_id.in_(card_ids))
+            .all()
+        )
+        return {card_id: (content_hash, version) for card_id, content_hash, version in rows}
+
+    def iter_axis1_json(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+        """Stream every stored axis1_json in (name, card_id) order, `batch_size` rows per fetch."""
+        query = (
+            self.db.query(Axis1CardModel.axis1_json)
+            .order_by(func.coalesce(Axis1CardModel.name, ""), Axis1CardModel.card_id)
+            .yield_per(batch_size)
+        )
+        for (data,) in query:
+            yield data
+
+    def search(
+        self,
+        name: Optional[str] = None,
+        name_contains: Optional[str] = None,
+        card_type: Optional[str] = None,
+        subtype: Optional[str] = None,
+        keyword: Optional[str] = None,
+        colors: Optional[str] = None,
+        mana_value: Optional[float] = None,
+        min_mana_value: Optional[float] = None,
+        max_mana_value: Optional[float] = None,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Filter cards on the generated search columns (see db/schema.py).
+
+        `name` is a case-insensitive prefix, `name_contains` a substring
+        (trigram index). `colors` is a color identity such as "UB": cards
+        whose identity fits inside it match, "C" means colorless only.
+        Results are ordered by (name, card_id), cards without a name
+        sorting as "", and paged by keyset: pass the returned
+        `next_cursor` back to get the following page.
+        Postgres only: other databases raise SearchNotSupported.
+        """
+        if self.db.get_bind().dialect.name != "postgresql":
+            raise SearchNotSupported("card search needs the Postgres search columns")
+
+        limit = max(1, min(limit, MAX_SEARCH_LIMIT))
+        clauses, params = [], {"limit": limit + 1}
+
+        if name:
+            clauses.append("lower(name) LIKE :name_prefix")
+            params["name_prefix"] = _like_escape(name.lower()) + "%"
+        if name_contains:
+            clauses.append("lower(name) LIKE :name_substring")
+            params["name_substring"] = "%" + _like_escape(name_contains.lower()) + "%"
+        for column, value in (("card_types", card_type), ("subtypes", subtype), ("keywords", keyword)):
+            if value:
+                clauses.append(f"{column} @> CAST(:{column} AS jsonb)")
+                params[column] = json.dumps([value])
+        if colors is not None:
+            clauses.append("color_identity = ANY(:identities)")
+            params["identities"] = _identity_subsets(colors)
+        if mana_value is not None:
+            clauses.append("mana_value = :mana_value")
+            params["mana_value"] = mana_value
+        if min_mana_value is not None:
+            clauses.append("mana_value >= :min_mana_value")
+            params["min_mana_value"] = min_mana_value
+        if max_mana_value is not None:
+            clauses.append("mana_value <= :max_mana_value")
+            params["max_mana_value"] = max_mana_value
+        if cursor:
+            clauses.append("(coalesce(name, ''), card_id) > (:after_name, :after_id)")
+            params["after_name"], params["after_id"] = _decode_cursor(cursor)
+
+        where = " AND ".join(clauses) or "TRUE"
+        stmt = text(
+            f"SELECT card_id, coalesce(name, '') AS sort_name, axis1_json FROM axis1_cards WHERE {where} "
+            "ORDER BY coalesce(name, ''), card_id LIMIT :limit"
+        )
+        if "identities" in params:
+            stmt = stmt.bindparams(bindparam("identities", type_=postgresql.ARRAY(postgresql.SMALLINT)))
+
+        rows = self.db.execute(stmt, params).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_cursor(rows[-1].sort_name, rows[-1].card_id)
+
+        return {
+            "cards": [row.axis1_json for row in rows],
+            "next_cursor": next_cursor,
+        }
+
+
+def _upsert(db: Session, model, key: str, rows: List[Dict[str, Any]]) -> int:
+    """
+    Multi-row INSERT ... ON CONFLICT (key) DO UPDATE, one commit.
+
+    Each statement carries at most MAX_BIND_PARAMS // len(columns) rows.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        insert = postgresql.insert
+    elif dialect == "sqlite":
+        insert = sqlite.insert
+    else:
+        # No native upsert: fall back to per-row merge, single commit
+        for row in rows:
+            db.merge(model(**row))
+        db.commit()
+        return len(rows)
+
+    per_statement = max(1, MAX_BIND_PARAMS // len(rows[0]))
+    for start in range(0, len(rows), per_statement):
+        stmt = insert(model).values(rows[start:start + per_statement])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[getattr(model, key)],
+            set_={
+                col: stmt.excluded[col]
+                for col in rows[0]
+                if col != key
+            },
+        )
+        db.execute(stmt)
+    db.commit()
+    return len(rows)
+
+
+def _like_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _identity_subsets(colors: str) -> List[int]:
+    """Every color identity mask that fits inside `colors` ("C" = colorless)."""
+    mask = 0
+    for color in colors.upper():
+        if color == "C":
+            continue
+        if color not in COLOR_BITS:
+            raise ValueError(f"unknown color: {color!r}")
+        mask |= COLOR_BITS[color]
+
+    subsets, subset = [], mask
+    while True:
+        subsets.append(subset)
+        if subset == 0:
+            return subsets
+        subset = (subset - 1) & mask
+
+
+def _encode_cursor(name: str, card_id: str) -> str:
+    return base64.urlsafe_b64encode(json.dumps([name, card_id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, str]:
+    try:
+        name, card_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError("invalid cursor") from e
+    return name, card_id
+
+
+class AsyncAxis1Repository:
+    """
+    Axis1Repository for an AsyncSession.
+
+    Each call runs the sync implementation through AsyncSession.run_sync,
+    so queries go over the async driver without duplicating the SQL.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def save_many(self, cards, batch_size: int = DEFAULT_BATCH_SIZE, **kwargs) -> int:
+        return await self.db.run_sync(
+            lambda session: Axis1Repository(session).save_many(cards, batch_size, **kwargs)
+        )
+
+    async def get_by_id(self, card_id: str) -> Axis1CardModel:
+        return await self.db.run_sync(lambda session: Axis1Repository(session).get_by_id(card_id))
+
+    async def get_many(self, card_ids: List[str]) -> Dict[str, Axis1CardModel]:
+        return await self.db.run_sync(lambda session: Axis1Repository(session).get_many(card_ids))
+
+    async def search(self, **filters) -> Dict[str, Any]:
+        return await self.db.run_sync(lambda session: Axis1Repository(session).search(**filters))
+
+
+class Axis2CardRepository:
+    """
+    Precompiled Axis2 cards, keyed by compile key (see axis2/cache.py).
+
+    Blobs are stored as-is; the DB layer never unpickles them.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_blob(self, compile_key: str) -> Optional[bytes]:
+        row = (
+            self.db.query(Axis2CardModel.axis2_blob)
+            .filter(Axis2CardModel.compile_key == compile_key)
+            .first()
+        )
+        return row[0] if row else None
+
+    def get_blobs(self, compile_keys: List[str]) -> Dict[str, bytes]:
+        """compile_key → blob for the keys already stored (one query)."""
+        if not compile_keys:
+            return {}
+        rows = (
+            self.db.query(Axis2CardModel.compile_key, Axis2CardModel.axis2_blob)
+            .filter(Axis2CardModel.compile_key.in_(compile_keys))
+            .all()
+        )
+        return {key: blob for key, blob in rows}
+
+    def existing_keys(self, parser_version: str) -> Set[str]:
+        """Every compile key stored for `parser_version`."""
+        rows = (
+            self.db.query(Axis2CardModel.compile_key)
+            .filter(Axis2CardModel.parser_version == parser_version)
+        )
+        return {key for (key,) in rows}
+
+    def save_many(self, rows: Iterable[Dict[str, Any]], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """Bulk upsert Axis2CardModel rows (dicts of its columns)."""
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        written = 0
+        batch: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            batch[row["compile_key"]] = row
+            if len(batch) >= batch_size:
+                written += _upsert(self.db, Axis2CardModel, "compile_key", list(batch.values()))
+                batch = {}
+        if batch:
+            written += _upsert(self.db, Axis2CardModel, "compile_key", list(batch.values()))
+        return written
+
+    def delete_stale(self, parser_version: str) -> int:
+        """Drop rows compiled by any other parser version."""
+        deleted = (
+            self.db.query(Axis2CardModel)
+            .filter(Axis2CardModel.parser_version != parser_version)
+            .delete(synchronize_session=False)
+        )
+        self.db.commit()
+        return deleted
+
+
 class Axis2TestRepository:
     def __init__(self, session):
         self.session = session
@@ -0,0 +1,91 @@
+"""
+Postgres-only schema additions that create_all() cannot express or apply.
+
+docker/init.sql creates the same objects on a fresh database; call
+ensure_schema() to bring an existing database up to date. Every
+statement is idempotent.
+"""
+
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+# Bit per color in the identity mask (WUBRG order)
+from axis1.vocab import COLOR_BITS
+
+logger = logging.getLogger(__name__)
+
+_IDENTITY_MASK_SQL = " + ".join(
+    f"(CASE WHEN axis1_json->'characteristics'->'color_identity' ? '{color}' THEN {bit} ELSE 0 END)"
+    for color, bit in COLOR_BITS.items()
+)
+
+# Incremental re-import (see scripts/import_all_cards.py)
+IMPORT_DDL = [
+    "ALTER TABLE axis1_cards ADD COLUMN IF NOT EXISTS content_hash TEXT",
+    "ALTER TABLE axis1_cards ADD COLUMN IF NOT EXISTS mapper_version TEXT",
+]
+
+# Background job owners (see api/jobs.py)
+JOB_DDL = [
+    "ALTER TABLE IF EXISTS import_jobs ADD COLUMN IF NOT EXISTS owner TEXT",
+]
+
+# Card search: generated columns pulled out of axis1_json + their indexes
+SEARCH_DDL = [
+    "ALTER TABLE axis1_cards ADD COLUMN IF NOT EXISTS mana_value NUMERIC "
+    "GENERATED ALWAYS AS ((axis1_json->'characteristics'->>'mana_value')::numeric) STORED",
+    "ALTER TABLE axis1_cards ADD COLUMN IF NOT EXISTS card_types JSONB "
+    "GENERATED ALWAYS AS (axis1_json->'characteristics'->'card_types') STORED",
+    "ALTER TABLE axis1_cards ADD COLUMN IF NOT EXISTS subtypes JSONB "
+    "GENERATED ALWAYS AS (axis1_json->'characteristics'->'subtypes') STORED",
+    "ALTER TABLE axis1_cards ADD COLUMN IF NOT EXISTS keywords JSONB "
+    "GENERATED ALWAYS AS (jsonb_path_query_array(axis1_json, '$.faces[*].keywords[*]')) STORED",
+    "ALTER TABLE axis1_cards ADD COLUMN IF NOT EXISTS color_identity SMALLINT "
+    f"GENERATED ALWAYS AS ({_IDENTITY_MASK_SQL}) STORED",
+    "CREATE INDEX IF NOT EXISTS idx_axis1_mana_value ON axis1_cards (mana_value)",
+    "CREATE INDEX IF NOT EXISTS idx_axis1_color_identity ON axis1_cards (color_identity)",
+    "CREATE INDEX IF NOT EXISTS idx_axis1_card_types ON axis1_cards USING gin (card_types jsonb_path_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_axis1_subtypes ON axis1_cards USING gin (subtypes jsonb_path_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_axis1_keywords ON axis1_cards USING gin (keywords jsonb_path_ops)",
+    # Keyset pagination order (NULL names sort as '') + name prefix search
+    "DROP INDEX IF EXISTS idx_axis1_name_card_id",
+    "CREATE INDEX IF NOT EXISTS idx_axis1_sort_name_card_id ON axis1_cards ((coalesce(name, '')), card_id)",
+    "CREATE INDEX IF NOT EXISTS idx_axis1_name_prefix ON axis1_cards (lower(name) text_pattern_ops)",
+    # Lookups by face name (used by the Axis2/Axis3 card tests)
+    "CREATE INDEX IF NOT EXISTS idx_axis1_face_name ON axis1_cards ((axis1_json->'faces'->0->>'name'))",
+]
+
+# Substring name search; needs the pg_trgm contrib extension
+TRIGRAM_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS idx_axis1_name_trgm ON axis1_cards USING gin (lower(name) gin_trgm_ops)",
+]
+
+
+def ensure_schema(engine):
+    if engine.dialect.name != "postgresql":
+        return
+
+    with engine.begin() as conn:
+        # Tables made by create_all() hold plain JSON (init.sql uses JSONB)
+        data_type = conn.execute(text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_name = 'axis1_cards' AND column_name = 'axis1_json'"
+        )).scalar()
+        if data_type == "json":
+            conn.execute(text(
+                "ALTER TABLE axis1_cards ALTER COLUMN axis1_json TYPE JSONB USING axis1_json::jsonb"
+            ))
+
+        for statement in IMPORT_DDL + JOB_DDL + SEARCH_DDL:
+            conn.execute(text(statement))
+
+    try:
+        with engine.begin() as conn:
+            for statement in TRIGRAM_DDL:
+                conn.execute(text(statement))
+    except DBAPIError as e:
+        # Search still works, substring matches just fall back to a scan
+        logger.warning("pg_trgm unavailable, skipping trigram name index: %s", e.orig)
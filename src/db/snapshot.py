@@ -0,0 +1,401 @@
+"""
+Compact columnar snapshot of the Axis1 card pool.
+
+    write_snapshot(axis1 dicts) ──> pool file ──> CardPool.open() (mmap)
+
+Only the filterable characteristics are kept: mana value, colors, color
+identity, card types, subtypes, keywords and power/toughness, plus the
+card id and name. Each one is a flat fixed-width column; vocabularies
+(types, subtypes, keywords, P/T strings) live in small string tables in
+the header and rows store their ids. Colors and color identity are
+WUBRG bitmasks (COLOR_BITS), card types a bitset over the type table.
+
+The loader memory-maps the file and reads columns through memoryviews,
+so the whole pool can be filtered without Postgres or rehydrating
+Axis1Card trees, and only the pages a query touches become resident.
+
+File layout (native little-endian):
+    MAGIC | u32 header length | header JSON | 8-byte aligned columns
+"""
+
+import json
+import math
+import mmap
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from axis1.schema import Axis1Card
+from axis1.vocab import COLOR_BITS, color_mask, mask_names
+
+
+MAGIC = b"AX1POOL\0"
+FORMAT_VERSION = 1
+ALIGN = 8
+
+# Bitset width for card types (supertypes included, as on the type line)
+MAX_CARD_TYPES = 64
+
+# Row value in the power/toughness columns for "no value"
+NO_PT = 0
+
+_HEADER_LEN = struct.Struct("<I")
+
+
+class _StringHeap:
+    """Variable-length strings as one UTF-8 blob plus u32 end offsets."""
+
+    def __init__(self):
+        self.offsets = array("I", [0])
+        self.data = bytearray()
+
+    def append(self, value: Optional[str]):
+        self.data += (value or "").encode("utf-8")
+        self.offsets.append(len(self.data))
+
+
+class _Vocab:
+    """String table assigning ids in first-seen order."""
+
+    def __init__(self, reserved: Iterable[Any] = ()):
+        self.values: List[Any] = list(reserved)
+        self.ids = {value: i for i, value in enumerate(self.values)}
+
+    def id(self, value) -> int:
+        found = self.ids.get(value)
+        if found is None:
+            found = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return found
+
+
+def _pt_number(value: Optional[str]) -> Optional[float]:
+    """Numeric P/T ("3", "-1", "2.5"); None for "*", "1+*", "X", ..."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# ---------------------------------------------------------
+# Export
+# ---------------------------------------------------------
+def write_snapshot(cards: Iterable[Union[Axis1Card, Dict[str, Any]]], path: str) -> int:
+    """
+    Write Axis1 cards (models or their .dict() dumps) to a pool file.
+
+    Characteristics come from the card (front face), keywords from every
+    face, matching the Postgres search columns. Returns the row count.
+    """
+    card_ids, names = _StringHeap(), _StringHeap()
+    mana_values = array("f")
+    colors, identities = array("B"), array("B")
+    card_types = array("Q")
+    subtype_offsets, subtype_ids = array("I", [0]), array("H")
+    keyword_offsets, keyword_ids = array("I", [0]), array("H")
+    powers, toughnesses = array("H"), array("H")
+
+    type_vocab, subtype_vocab, keyword_vocab = _Vocab(), _Vocab(), _Vocab()
+    pt_vocab = _Vocab([None])  # id 0 == NO_PT
+
+    for card in cards:
+        data = card if isinstance(card, dict) else card.dict()
+        chars = data.get("characteristics") or {}
+        faces = data.get("faces") or []
+
+        card_ids.append(data["card_id"])
+        names.append(data["names"][0] if data.get("names") else None)
+
+        mv = chars.get("mana_value")
+        mana_values.append(math.nan if mv is None else mv)
+        colors.append(color_mask(chars.get("colors")))
+        identities.append(color_mask(chars.get("color_identity")))
+
+        type_bits = 0
+        for card_type in chars.get("card_types") or ():
+            type_bits |= 1 << type_vocab.id(card_type)
+        card_types.append(type_bits)
+
+        subtype_ids.extend(subtype_vocab.id(s) for s in chars.get("subtypes") or ())
+        subtype_offsets.append(len(subtype_ids))
+
+        keywords = dict.fromkeys(k for face in faces for k in face.get("keywords") or ())
+        keyword_ids.extend(keyword_vocab.id(k) for k in keywords)
+        keyword_offsets.append(len(keyword_ids))
+
+        powers.append(pt_vocab.id(_pt_str(chars.get("power"))))
+        toughnesses.append(pt_vocab.id(_pt_str(chars.get("toughness"))))
+
+    if len(type_vocab.values) > MAX_CARD_TYPES:
+        raise ValueError(f"more than {MAX_CARD_TYPES} distinct card types")
+    for label, vocab in (("subtypes", subtype_vocab), ("keywords", keyword_vocab), ("P/T values", pt_vocab)):
+        if len(vocab.values) > 0xFFFF:
+            raise ValueError(f"more than 65535 distinct {label}")
+
+    columns = {
+        "card_id_offsets": card_ids.offsets,
+        "card_id_data": array("B", card_ids.data),
+        "name_offsets": names.offsets,
+        "name_data": array("B", names.data),
+        "mana_value": mana_values,
+        "colors": colors,
+        "color_identity": identities,
+        "card_types": card_types,
+        "subtype_offsets": subtype_offsets,
+        "subtypes": subtype_ids,
+        "keyword_offsets": keyword_offsets,
+        "keywords": keyword_ids,
+        "power": powers,
+        "toughness": toughnesses,
+    }
+    tables = {
+        "card_types": type_vocab.values,
+        "subtypes": subtype_vocab.values,
+        "keywords": keyword_vocab.values,
+        "pt": pt_vocab.values,
+    }
+    _write_columns(path, len(mana_values), columns, tables)
+    return len(mana_values)
+
+
+def _pt_str(value) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _write_columns(path: str, rows: int, columns: Dict[str, array], tables: Dict[str, list]):
+    # Offsets are relative to the start of the column area, so the header
+    # can be sized without knowing its own length first.
+    layout, position = {}, 0
+    for name, values in columns.items():
+        layout[name] = {"format": values.typecode, "offset": position, "length": len(values)}
+        position = _aligned(position + len(values) * values.itemsize)
+
+    header = json.dumps({
+        "version": FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "rows": rows,
+        "columns": layout,
+        "tables": tables,
+    }).encode("utf-8")
+
+    with open(path, "wb") as fh:
+        fh.write(MAGIC)
+        fh.write(_HEADER_LEN.pack(len(header)))
+        fh.write(header)
+        fh.write(b"\0" * (_aligned(fh.tell()) - fh.tell()))
+        base = fh.tell()
+        for name, values in columns.items():
+            fh.write(b"\0" * (base + layout[name]["offset"] - fh.tell()))
+            values.tofile(fh)
+
+
+def _aligned(position: int) -> int:
+    return -(-position // ALIGN) * ALIGN
+
+
+# ---------------------------------------------------------
+# Load + query
+# ---------------------------------------------------------
+class CardPool:
+    """
+    Read-only, memory-mapped view of a pool file.
+
+    Rows are addressed by index; `filter` returns the matching indexes
+    and `card_id` / `name` / `row` decode them on demand.
+    """
+
+    def __init__(self, buffer, header: Dict[str, Any], base: int, closer=None):
+        if header["version"] != FORMAT_VERSION:
+            raise ValueError(f"unsupported card pool version {header['version']}")
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"card pool was written on a {header['byteorder']}-endian machine")
+
+        self._buffer = buffer
+        self._closer = closer
+        self.rows = header["rows"]
+
+        view = memoryview(buffer)
+        for name, spec in header["columns"].items():
+            start = base + spec["offset"]
+            size = struct.calcsize(spec["format"]) * spec["length"]
+            setattr(self, f"_{name}", view[start:start + size].cast(spec["format"]))
+
+        tables = header["tables"]
+        self.card_type_table: List[str] = tables["card_types"]
+        self.subtype_table: List[str] = tables["subtypes"]
+        self.keyword_table: List[str] = tables["keywords"]
+        self.pt_table: List[Optional[str]] = tables["pt"]
+        self._type_bits = {t: 1 << i for i, t in enumerate(self.card_type_table)}
+        self._subtype_ids = {s: i for i, s in enumerate(self.subtype_table)}
+        self._keyword_ids = {k: i for i, k in enumerate(self.keyword_table)}
+        self._pt_numbers = [_pt_number(v) for v in self.pt_table]
+
+    @classmethod
+    def open(cls, path: str) -> "CardPool":
+        with open(path, "rb") as fh:
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            header, base = _read_header(mapped)
+            return cls(mapped, header, base, closer=mapped.close)
+        except Exception:
+            mapped.close()
+            raise
+
+    def close(self):
+        # Views into the mmap must be released before it can close
+        for name in list(vars(self)):
+            value = getattr(self, name)
+            if isinstance(value, memoryview):
+                value.release()
+        if self._closer is not None:
+            self._closer()
+            self._closer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.rows
+
+    # -----------------------------------------------------
+    # Row access
+    # -----------------------------------------------------
+    def card_id(self, index: int) -> str:
+        return _heap_str(self._card_id_offsets, self._card_id_data, index)
+
+    def name(self, index: int) -> str:
+        return _heap_str(self._name_offsets, self._name_data, index)
+
+    def mana_value(self, index: int) -> Optional[float]:
+        mv = self._mana_value[index]
+        return None if math.isnan(mv) else mv
+
+    def card_types(self, index: int) -> List[str]:
+        bits = self._card_types[index]
+        return [t for t, bit in self._type_bits.items() if bits & bit]
+
+    def subtypes(self, index: int) -> List[str]:
+        lo, hi = self._subtype_offsets[index], self._subtype_offsets[index + 1]
+        return [self.subtype_table[i] for i in self._subtypes[lo:hi]]
+
+    def keywords(self, index: int) -> List[str]:
+        lo, hi = self._keyword_offsets[index], self._keyword_offsets[index + 1]
+        return [self.keyword_table[i] for i in self._keywords[lo:hi]]
+
+    def row(self, index: int) -> Dict[str, Any]:
+        return {
+            "card_id": self.card_id(index),
+            "name": self.name(index),
+            "mana_value": self.mana_value(index),
+            "colors": mask_names(COLOR_BITS, self._colors[index]),
+            "color_identity": mask_names(COLOR_BITS, self._color_identity[index]),
+            "card_types": self.card_types(index),
+            "subtypes": self.subtypes(index),
+            "keywords": self.keywords(index),
+            "power": self.pt_table[self._power[index]],
+            "toughness": self.pt_table[self._toughness[index]],
+        }
+
+    # -----------------------------------------------------
+    # Filtering
+    # -----------------------------------------------------
+    def filter(
+        self,
+        name: Optional[str] = None,
+        card_type: Optional[str] = None,
+        subtype: Optional[str] = None,
+        keyword: Optional[str] = None,
+        colors: Optional[str] = None,
+        mana_value: Optional[float] = None,
+        min_mana_value: Optional[float] = None,
+        max_mana_value: Optional[float] = None,
+        min_power: Optional[float] = None,
+        max_power: Optional[float] = None,
+        min_toughness: Optional[float] = None,
+        max_toughness: Optional[float] = None,
+    ) -> List[int]:
+        """
+        Indexes of the rows matching every given filter.
+
+        Same meaning as Axis1Repository.search: `name` is a
+        case-insensitive prefix and `colors` a color identity ("UB",
+        "C" = colorless) that a card's identity must fit inside.
+        P/T bounds only match numeric values, so "*" never does.
+        """
+        checks = []
+
+        if card_type is not None:
+            bit = self._type_bits.get(card_type)
+            if bit is None:
+                return []
+            types = self._card_types
+            checks.append(lambda i: types[i] & bit)
+
+        for value, ids, offsets, column in (
+            (subtype, self._subtype_ids, self._subtype_offsets, self._subtypes),
+            (keyword, self._keyword_ids, self._keyword_offsets, self._keywords),
+        ):
+            if value is None:
+                continue
+            wanted = ids.get(value)
+            if wanted is None:
+                return []
+            checks.append(
+                lambda i, wanted=wanted, offsets=offsets, column=column:
+                    wanted in column[offsets[i]:offsets[i + 1]]
+            )
+
+        if colors is not None:
+            colors = colors.upper()
+            for color in colors:
+                if color != "C" and color not in COLOR_BITS:
+                    raise ValueError(f"unknown color: {color!r}")
+            outside = color_mask(COLOR_BITS) & ~color_mask(colors)
+            identities = self._color_identity
+            checks.append(lambda i: not identities[i] & outside)
+
+        mvs = self._mana_value
+        if mana_value is not None:
+            checks.append(lambda i: mvs[i] == mana_value)
+        if min_mana_value is not None:
+            checks.append(lambda i: mvs[i] >= min_mana_value)
+        if max_mana_value is not None:
+            checks.append(lambda i: mvs[i] <= max_mana_value)
+
+        for column, low, high in (
+            (self._power, min_power, max_power),
+            (self._toughness, min_toughness, max_toughness),
+        ):
+            if low is None and high is None:
+                continue
+            # Resolve the bounds against the small P/T table once
+            allowed = frozenset(
+                pt_id for pt_id, number in enumerate(self._pt_numbers)
+                if number is not None
+                and (low is None or number >= low)
+                and (high is None or number <= high)
+            )
+            checks.append(lambda i, column=column, allowed=allowed: column[i] in allowed)
+
+        if name:
+            prefix = name.lower()
+            checks.append(lambda i: self.name(i).lower().startswith(prefix))
+
+        return [i for i in range(self.rows) if all(check(i) for check in checks)]
+
+
+def _read_header(buffer) -> tuple:
+    if buffer[:len(MAGIC)] != MAGIC:
+        raise ValueError("not a card pool file")
+    start = len(MAGIC) + _HEADER_LEN.size
+    (length,) = _HEADER_LEN.unpack_from(buffer, len(MAGIC))
+    header = json.loads(bytes(buffer[start:start + length]))
+    return header, _aligned(start + length)
+
+
+def _heap_str(offsets, data, index: int) -> str:
+    return bytes(data[offsets[index]:offsets[index + 1]]).decode("utf-8")
@@ -1,7 +1,9 @@
+import os
+
 from axis3.engine.game_loop import game_loop
 from axis3.engine.ui.cli import CLI
 from axis3.engine.loader.loader import build_game_state_from_decks
-from axis2.builder import Axis2Builder
+from axis2.cache import CachingAxis2Builder
 from axis1.schema import Axis1Card, Axis1Face, Axis1Characteristics 
 from axis3.rules.events.types import EventType
 from axis3.rules.handlers.cast_handlers import handle_cast_spell
@@ -125,7 +127,15 @@ def load_test_decks():
 
 def main():
     deck1, deck2 = load_test_decks()
-    axis2_builder = Axis2Builder()
+    session_factory = None
+    if os.getenv("AXIS2_PRECOMPILED"):
+        # Serve cards from the axis2_cards table (scripts/compile_axis2_cards.py)
+        from db.connection import SessionLocal
+        session_factory = SessionLocal
+    axis2_builder = CachingAxis2Builder(
+        store_dir=os.getenv("AXIS2_CACHE_DIR"),
+        session_factory=session_factory,
+    )
 
     game_state = build_game_state_from_decks(
         deck1,
@@ -0,0 +1,138 @@
+import hashlib
+import json
+from typing import Any, Dict, Iterable, Iterator
+
+import requests
+
+
+CHUNK_SIZE = 1 << 20  # 1 MiB of text per read
+# A card is a few KiB; an element still undecoded past this is malformed
+MAX_ELEMENT_SIZE = 16 << 20
+TIMEOUT = 30
+
+_WHITESPACE = " \t\r\n"
+
+# Fields Scryfall refreshes daily that never reach Axis1 →
+# excluded so a price tick does not count as a changed card.
+VOLATILE_FIELDS = frozenset({"prices", "edhrec_rank", "penny_rank"})
+
+
+# ---------------------------------------------------------
+# Incremental JSON array parsing
+# ---------------------------------------------------------
+def iter_json_array(chunks: Iterable[str], max_element_size: int = MAX_ELEMENT_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the elements of a top-level JSON array one at a time.
+
+    `chunks` is any iterable of text fragments (file reads, HTTP body
+    chunks, ...). Only the element currently being decoded is held in
+    memory, so the cost is bounded by the largest card, not the file.
+    An element that still does not decode once `max_element_size`
+    characters are buffered raises ValueError with its byte offset.
+    """
+    decoder = json.JSONDecoder()
+    chunks = iter(chunks)
+    buf = ""
+    pos = 0
+    eof = False
+    dropped = 0  # UTF-8 bytes consumed before buf
+
+    def fill() -> bool:
+        nonlocal buf, pos, eof, dropped
+        if eof:
+            return False
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+            return False
+        # Drop everything already consumed before growing the buffer
+        dropped += len(buf[:pos].encode("utf-8"))
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def skip(chars: str) -> None:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in chars:
+                pos += 1
+            if pos < len(buf) or not fill():
+                return
+
+    # Opening bracket
+    skip(_WHITESPACE)
+    if pos >= len(buf) or buf[pos] != "[":
+        raise ValueError("Bulk file is not a JSON array")
+    pos += 1
+
+    while True:
+        skip(_WHITESPACE + ",")
+        if pos >= len(buf):
+            raise ValueError("Unexpected end of bulk file")
+        if buf[pos] == "]":
+            return
+
+        while True:
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if len(buf) - pos > max_element_size:
+                    offset = dropped + len(buf[:pos].encode("utf-8"))
+                    raise ValueError(
+                        f"Malformed bulk file element at byte {offset}: "
+                        f"no complete element within {max_element_size} characters"
+                    ) from None
+                # Element is split across chunks → read more and retry
+                if not fill():
+                    raise
+                continue
+            break
+
+        pos = end
+        yield item
+
+
+# ---------------------------------------------------------
+# Bulk sources (local file or HTTP)
+# ---------------------------------------------------------
+def _iter_file_chunks(path: str, chunk_size: int) -> Iterator[str]:
+    with open(path, "r", encoding="utf-8") as fh:
+        while True:
+            chunk = fh.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _iter_http_chunks(url: str, chunk_size: int) -> Iterator[str]:
+    with requests.get(url, stream=True, timeout=TIMEOUT) as resp:
+        resp.raise_for_status()
+        # Scryfall serves UTF-8 but does not always say so
+        resp.encoding = "utf-8"
+        for chunk in resp.iter_content(chunk_size=chunk_size, decode_unicode=True):
+            if chunk:
+                yield chunk
+
+
+def iter_bulk_cards(source: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Stream card dicts from a Scryfall bulk file.
+
+    `source` is either a local path or an http(s) URL (the Scryfall
+    download URI or a local stand-in server).
+    """
+    if source.startswith(("http://", "https://")):
+        chunks = _iter_http_chunks(source, chunk_size)
+    else:
+        chunks = _iter_file_chunks(source, chunk_size)
+    return iter_json_array(chunks)
+
+
+# ---------------------------------------------------------
+# Content hashing
+# ---------------------------------------------------------
+def card_content_hash(card: Dict[str, Any]) -> str:
+    """Stable SHA-256 of a raw Scryfall card, ignoring VOLATILE_FIELDS."""
+    stable = {k: v for k, v in card.items() if k not in VOLATILE_FIELDS}
+    encoded = json.dumps(stable, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
@@ -0,0 +1,225 @@
+"""
+Read-through cache in front of ScryfallClient.
+
+Lookup order for a card id:
+    1. in-process LRU
+    2. on-disk raw-JSON store (optional)
+    3. Scryfall
+
+Entries older than `ttl` are revalidated: single-card fetches send the
+stored ETag (If-None-Match) and keep the cached JSON on a 304, batch
+fetches simply re-request them through /cards/collection.
+
+The `axis1_cards` tier lives in DeckImportService, which can skip both
+the fetch and the mapping for cards already in Postgres; it reports its
+hits into the same CacheStats.
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional
+
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_TTL = 24 * 60 * 60  # Scryfall bulk data refreshes daily
+
+# Scryfall ids are UUIDs; anything with separators or dots never becomes a path
+_SAFE_CARD_ID = re.compile(r"[A-Za-z0-9][A-Za-z0-9_-]*\Z")
+
+
+class CacheEntry(NamedTuple):
+    card: Dict[str, Any]
+    fetched_at: float
+    etag: Optional[str] = None
+
+
+class CacheStats:
+    """Thread-safe hit/miss counters, exposed by the API."""
+
+    TIERS = ("memory", "disk", "db")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.hits = {tier: 0 for tier in self.TIERS}
+            self.misses = 0
+            self.revalidated = 0
+            self.refetched = 0
+
+    def hit(self, tier: str, count: int = 1):
+        with self._lock:
+            self.hits[tier] += count
+
+    def miss(self, count: int = 1):
+        with self._lock:
+            self.misses += count
+
+    def revalidation(self, modified: bool):
+        with self._lock:
+            if modified:
+                self.refetched += 1
+            else:
+                self.revalidated += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = sum(self.hits.values()) + self.misses
+            return {
+                "hits": dict(self.hits),
+                "misses": self.misses,
+                "revalidated": self.revalidated,
+                "refetched": self.refetched,
+                "hit_rate": sum(self.hits.values()) / lookups if lookups else 0.0,
+            }
+
+
+class DiskCardStore:
+    """
+    One JSON file per card: <root>/<id[:2]>/<id>.json
+
+    Ids that are not plain Scryfall-style ids (e.g. "../x" from a deck
+    file) are never stored or looked up; unreadable files are misses.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, card_id: str) -> str:
+        if not isinstance(card_id, str) or not _SAFE_CARD_ID.match(card_id):
+            raise ValueError(f"unsafe card id: {card_id!r}")
+        return os.path.join(self.root, card_id[:2], f"{card_id}.json")
+
+    def get(self, card_id: str) -> Optional[CacheEntry]:
+        try:
+            with open(self._path(card_id), "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            return CacheEntry(data["card"], data["fetched_at"], data.get("etag"))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, card_id: str, entry: CacheEntry):
+        try:
+            path = self._path(card_id)
+        except ValueError:
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write-then-rename so readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(entry._asdict(), fh)
+        os.replace(tmp, path)
+
+
+class CachingScryfallClient:
+    """Wraps a ScryfallClient; anything not cached is delegated as-is."""
+
+    def __init__(
+        self,
+        client,
+        store_dir: Optional[str] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL,
+        stats: Optional[CacheStats] = None,
+    ):
+        self.client = client
+        self.store = DiskCardStore(store_dir) if store_dir else None
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = stats or CacheStats()
+        self._lru: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        # fetch_deck, search, close, ...
+        return getattr(self.client, name)
+
+    # ---------------------------------------------------------
+    # Tiers
+    # ---------------------------------------------------------
+    def _lookup(self, card_id: str) -> Optional[CacheEntry]:
+        """Cached entry (fresh or not); counts a hit only if it is fresh."""
+        with self._lock:
+            entry = self._lru.get(card_id)
+            if entry is not None:
+                self._lru.move_to_end(card_id)
+                tier = "memory"
+
+        if entry is None and self.store is not None:
+            entry = self.store.get(card_id)
+            if entry is not None:
+                tier = "disk"
+                self._remember(card_id, entry, persist=False)
+
+        if entry is not None and self._fresh(entry):
+            self.stats.hit(tier)
+        return entry
+
+    def _remember(self, card_id: str, entry: CacheEntry, persist: bool = True):
+        with self._lock:
+            self._lru[card_id] = entry
+            self._lru.move_to_end(card_id)
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+        if persist and self.store is not None:
+            self.store.put(card_id, entry)
+
+    def _fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.fetched_at < self.ttl
+
+    # ---------------------------------------------------------
+    # Client API
+    # ---------------------------------------------------------
+    def fetch_card(self, card_id: str) -> Dict[str, Any]:
+        entry = self._lookup(card_id)
+        if entry is not None and self._fresh(entry):
+            return entry.card
+
+        if entry is None:
+            self.stats.miss()
+            card, etag = self.client.fetch_card_if_modified(card_id)
+        else:
+            card, etag = self.client.fetch_card_if_modified(card_id, entry.etag)
+            self.stats.revalidation(modified=card is not None)
+            if card is None:
+                card = entry.card
+
+        self._remember(card_id, CacheEntry(card, time.time(), etag))
+        return card
+
+    def fetch_cards(self, card_ids: List[str]) -> List[Dict[str, Any]]:
+        return self.fetch_collection(card_ids)
+
+    def fetch_collection(self, card_ids: List[str]) -> List[Dict[str, Any]]:
+        found: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        stale = set()
+
+        for card_id in dict.fromkeys(card_ids):
+            entry = self._lookup(card_id)
+            if entry is not None and self._fresh(entry):
+                found[card_id] = entry.card
+            else:
+                if entry is None:
+                    self.stats.miss()
+                else:
+                    stale.add(card_id)
+                missing.append(card_id)
+
+        if missing:
+            now = time.time()
+            for card in self.client.fetch_collection(missing):
+                found[card["id"]] = card
+                self._remember(card["id"], CacheEntry(card, now))
+                # Counted once the refetch actually came back
+                if card["id"] in stale:
+                    self.stats.revalidation(modified=True)
+
+        return [found[card_id] for card_id in card_ids]
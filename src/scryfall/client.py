@@ -1,32 +1,169 @@
+import time
 import requests
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+
+from .rate_limit import TokenBucket
 
 
 class ScryfallClient:
     BASE = "https://api.scryfall.com"
     TIMEOUT = 10
 
+    # Scryfall asks for 50-100ms between requests → ~10 requests/sec,
+    # spaced out rather than sent in bursts
+    REQUESTS_PER_SECOND = 10
+    BURST = 1
+    MAX_WORKERS = 8
+
+    COLLECTION_BATCH_SIZE = 75  # /cards/collection accepts at most 75 identifiers
+
+    MAX_RETRIES = 3
+    BACKOFF = 0.5  # seconds, doubled per attempt
+    MAX_RETRY_AFTER = 30  # seconds; longer Retry-After values are capped
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    HEADERS = {
+        "User-Agent": "mtg-engine/0.1",
+        "Accept": "application/json",
+    }
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        max_workers: Optional[int] = None,
+    ):
+        self.base = (base_url or self.BASE).rstrip("/")
+        self.rate_limiter = rate_limiter or TokenBucket(self.REQUESTS_PER_SECOND, self.BURST)
+        self.max_workers = max_workers or self.MAX_WORKERS
+
+        # One keep-alive session, pooled wide enough for the fetch threads
+        self.session = requests.Session()
+        self.session.headers.update(self.HEADERS)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
     def _get(self, url: str, params: Optional[dict] = None) -> Dict[str, Any]:
-        """Internal GET wrapper with timeout + error handling."""
-        try:
-            resp = requests.get(url, params=params, timeout=self.TIMEOUT)
-            resp.raise_for_status()
-            return resp.json()
-        except requests.exceptions.RequestException as e:
-            raise RuntimeError(f"Scryfall request failed: {e}")
+        """Internal GET wrapper with rate limiting, retries + error handling."""
+        return self._request(lambda: self.session.get(url, params=params, timeout=self.TIMEOUT))
+
+    def _post(self, url: str, payload: dict) -> Dict[str, Any]:
+        """Internal POST (JSON body) wrapper, same policy as _get."""
+        return self._request(lambda: self.session.post(url, json=payload, timeout=self.TIMEOUT))
+
+    def _request(self, send, parse=None):
+        for attempt in range(self.MAX_RETRIES + 1):
+            self.rate_limiter.acquire()
+            delay = self.BACKOFF * (2 ** attempt)
+            try:
+                resp = send()
+                resp.raise_for_status()
+                return parse(resp) if parse else resp.json()
+            except requests.exceptions.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if status not in self.RETRY_STATUSES or attempt == self.MAX_RETRIES:
+                    raise RuntimeError(f"Scryfall request failed: {e}")
+                delay = _retry_after(e.response, delay, self.MAX_RETRY_AFTER)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt == self.MAX_RETRIES:
+                    raise RuntimeError(f"Scryfall request failed: {e}")
+            except requests.exceptions.RequestException as e:
+                raise RuntimeError(f"Scryfall request failed: {e}")
+            time.sleep(delay)
 
     # ---------------------------------------------------------
     # Fetch a single card by Scryfall ID
     # ---------------------------------------------------------
     def fetch_card(self, card_id: str) -> Dict[str, Any]:
-        url = f"{self.BASE}/cards/{card_id}"
+        url = f"{self.base}/cards/{card_id}"
         return self._get(url)
 
+    def fetch_card_if_modified(
+        self, card_id: str, etag: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Conditional fetch for cache revalidation.
+        Returns (card, etag), or (None, etag) if the card is unchanged (304).
+        """
+        url = f"{self.base}/cards/{card_id}"
+        headers = {"If-None-Match": etag} if etag else None
+
+        def parse(resp):
+            if resp.status_code == 304:
+                return None, etag
+            return resp.json(), resp.headers.get("ETag")
+
+        return self._request(
+            lambda: self.session.get(url, headers=headers, timeout=self.TIMEOUT), parse
+        )
+
+    # ---------------------------------------------------------
+    # Fetch many cards concurrently (order preserved)
+    # ---------------------------------------------------------
+    def fetch_cards(self, card_ids: List[str]) -> List[Dict[str, Any]]:
+        if len(card_ids) <= 1:
+            return [self.fetch_card(card_id) for card_id in card_ids]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(card_ids))) as pool:
+            return list(pool.map(self.fetch_card, card_ids))
+
+    # ---------------------------------------------------------
+    # Fetch many cards via /cards/collection (75 ids per request)
+    # ---------------------------------------------------------
+    def fetch_collection(self, card_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch cards by Scryfall ID in batches of up to 75.
+
+        Duplicate ids are requested once; the result list follows
+        `card_ids` order (duplicates included). Raises RuntimeError if
+        Scryfall reports any id as not found.
+        """
+        unique_ids = list(dict.fromkeys(card_ids))
+        batches = [
+            unique_ids[i:i + self.COLLECTION_BATCH_SIZE]
+            for i in range(0, len(unique_ids), self.COLLECTION_BATCH_SIZE)
+        ]
+
+        def fetch_batch(batch: List[str]) -> Dict[str, Any]:
+            payload = {"identifiers": [{"id": card_id} for card_id in batch]}
+            return self._post(f"{self.base}/cards/collection", payload)
+
+        if len(batches) <= 1:
+            responses = [fetch_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as pool:
+                responses = list(pool.map(fetch_batch, batches))
+
+        by_id: Dict[str, Dict[str, Any]] = {}
+        not_found = []
+        for data in responses:
+            for card in data.get("data", []):
+                by_id[card["id"]] = card
+            not_found.extend(data.get("not_found", []))
+
+        missing = [card_id for card_id in unique_ids if card_id not in by_id]
+        if missing or not_found:
+            raise RuntimeError(f"Scryfall cards not found: {missing or not_found}")
+
+        return [by_id[card_id] for card_id in card_ids]
+
     # ---------------------------------------------------------
     # Search Scryfall (handles pagination)
     # ---------------------------------------------------------
     def search(self, query: str) -> List[Dict[str, Any]]:
-        url = f"{self.BASE}/cards/search"
+        url = f"{self.base}/cards/search"
         results = []
         data = self._get(url, params={"q": query})
 
@@ -62,3 +199,14 @@ class ScryfallClient:
 
         # Raw JSON deck
         return self._get(deck_url)
+
+
+def _retry_after(resp, default: float, maximum: float) -> float:
+    """Honor a numeric Retry-After header (sent with 429s), up to `maximum` seconds."""
+    try:
+        value = float(resp.headers.get("Retry-After", default))
+    except (AttributeError, TypeError, ValueError):
+        return default
+    if not value >= 0:  # negative or NaN
+        return default
+    return min(value, maximum)
@@ -1,6 +1,111 @@
+import copy
+import hashlib
 import re
 import unicodedata
+from functools import partial
+from pathlib import Path
+from typing import NamedTuple, Tuple
+
+from pydantic import BaseModel
+
+import axis1.schema
 from axis1.schema import Axis1Card, Axis1Face, Axis1Characteristics, Axis1Metadata, Axis1ActivatedAbility, Axis1TriggeredAbility
+from axis1.vocab import intern_strings
+
+
+def _source_fingerprint(*paths) -> str:
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+# Changes whenever the mapper or the Axis1 schema changes, so stored rows
+# mapped by an older version are re-mapped on the next import.
+MAPPER_VERSION = _source_fingerprint(__file__, axis1.schema.__file__)
+
+
+# ------------------------------------------------------------
+# Model construction
+# ------------------------------------------------------------
+
+_object_setattr = object.__setattr__
+
+_MISSING = object()
+
+# model → (defaults template in declaration order, [(field, default maker)],
+#          required fields, field names)
+_CONSTRUCT_PLANS = {}
+
+
+def _default_maker(value):
+    """Callable returning a fresh copy of a mutable field default."""
+    if isinstance(value, BaseModel) and not value.model_fields_set:
+        return partial(construct_model, type(value))
+    if isinstance(value, (list, dict, set)) and not value:
+        return type(value)
+    return partial(copy.deepcopy, value)
+
+
+def _construct_plan(model):
+    plan = _CONSTRUCT_PLANS.get(model)
+    if plan is None:
+        template, makers, required = {}, [], []
+        for name, field in model.model_fields.items():
+            factory = field.default_factory
+            template[name] = _MISSING
+            if field.is_required():
+                required.append(name)
+            elif factory is not None:
+                if isinstance(factory, type) and issubclass(factory, BaseModel):
+                    factory = partial(construct_model, factory)
+                makers.append((name, factory))
+            elif isinstance(field.default, (BaseModel, list, dict, set)):
+                makers.append((name, _default_maker(field.default)))
+            else:
+                template[name] = field.default
+        plan = _CONSTRUCT_PLANS[model] = (template, makers, required, model.model_fields.keys())
+    return plan
+
+
+def construct_model(model, **fields):
+    """
+    Trusted fast path: the mapper built `fields` itself with the right
+    types, so skip Pydantic validation.
+
+    Like `model.model_construct`, but the per-model default plan is worked
+    out once and nested model defaults (FaceLayoutRules & co.) are built
+    the same way instead of deep-copied, which is most of a face's cost.
+    Unknown fields are dropped. Containers are adopted as-is, so the
+    mapper copies anything it takes from the Scryfall dict or shares
+    between models.
+    """
+    template, makers, required, names = _construct_plan(model)
+    if fields.keys() - names:
+        fields = {k: v for k, v in fields.items() if k in names}
+
+    # Copying the template keeps declaration order, which model_dump follows
+    values = template.copy()
+    values.update(fields)
+    for name, make in makers:
+        if name not in fields:
+            values[name] = make()
+    for name in required:
+        if name not in fields:
+            del values[name]
+
+    obj = model.__new__(model)
+    _object_setattr(obj, "__dict__", values)
+    _object_setattr(obj, "__pydantic_fields_set__", set(fields))
+    _object_setattr(obj, "__pydantic_extra__", None)
+    _object_setattr(obj, "__pydantic_private__", None)
+    return obj
+
+
+def validate_model(model, **fields):
+    """Fully validated construction, for input the mapper did not produce."""
+    return model(**fields)
+
 
 # ------------------------------------------------------------
 # Activated ability parsing from oracle text
@@ -17,30 +122,91 @@ def strip_reminder_text(line: str) -> str:
     return REMINDER_TEXT_RE.sub("", line).strip()
 
 
-# Matches "COST: EFFECT"
-# Example:
-#   "{T}: Add {U}."
-#   "{2}{W}{U}, {T}, Sacrifice this land: Draw a card."
-
-ACTIVATED_ABILITY_LINE_RE = re.compile(
-    r"^\s*(?P<costs>[^:]+?)\s*:\s*(?P<effect>.+)$"
+def normalize_oracle_line(line: str) -> str:
+    """Normalize Unicode punctuation and whitespace in one oracle line."""
+    return (
+        line.replace("：", ":")      # fullwidth colon → ASCII colon
+            .replace("\u2028", " ") # line separator → space
+            .replace("\u00A0", " ") # non-breaking space → space
+            .replace("\u200B", "")  # zero-width space → remove
+    )
+
+
+# One pattern for every activated-ability shape, tried in priority order:
+#   "+1: ..."                          planeswalker loyalty ability
+#   "Equip {2}"                        equip
+#   "{2}{W}{U}, {T}, Sacrifice ...: "  generic "COST: EFFECT"
+ACTIVATED_LINE_RE = re.compile(
+    r"^(?:"
+    r"\s*(?P<loyalty>[+\-]?\d+)\s*:\s*(?P<loyalty_effect>.+)$"
+    r"|(?i:equip)\s+(?P<equip_cost>\{[^}]+\})"
+    r"|\s*(?P<costs>[^:]+?)\s*:\s*(?P<effect>.+)$"
+    r")"
 )
 
-PLANESWALKER_ABILITY_RE = re.compile(
-    r"^\s*(?P<loyalty>[+\-]?\d+)\s*:\s*(?P<effect>.+)$"
-)
+# Last group of each ACTIVATED_LINE_RE branch → line kind
+ACTIVATED_LINE_KINDS = {
+    "loyalty_effect": "loyalty",
+    "equip_cost": "equip",
+    "effect": "activated",
+}
 
 MANA_SYMBOL_RE = re.compile(r"\{[^}]+\}")
 
-def _extract_static_type_changers(oracle_text: str):
+
+# ------------------------------------------------------------
+# Single-pass oracle text scanner
+# ------------------------------------------------------------
+
+class OracleScan(NamedTuple):
+    activated: Tuple[Tuple[str, str, re.Match], ...]  # (kind, line, match)
+    triggers: Tuple[str, ...]                         # trigger lines
+    lowered: str                                      # whole raw text, lower-cased once
+
+
+EMPTY_SCAN = OracleScan((), (), "")
+
+
+def scan_oracle_text(oracle_text: str) -> OracleScan:
+    """
+    Tokenize one face's oracle text in a single pass.
+
+    Each line is stripped of reminder text and normalized once, then
+    classified as loyalty / equip / activated and/or trigger with the
+    precompiled patterns above. A trigger line containing a colon lands
+    in both buckets, as it did when each extractor split the text itself.
+    """
+    if not oracle_text:
+        return EMPTY_SCAN
+
+    activated = []
+    triggers = []
+    for raw_line in oracle_text.split("\n"):
+        line = normalize_oracle_line(strip_reminder_text(raw_line.strip()))
+        if not line:
+            continue
+
+        # Only lines with a colon or a leading "Equip" can be activated
+        if ":" in line or line[:5].lower() == "equip":
+            m = ACTIVATED_LINE_RE.match(line)
+            if m:
+                activated.append((ACTIVATED_LINE_KINDS[m.lastgroup], line, m))
+
+        if TRIGGER_START_RE.match(line):
+            triggers.append(line)
+
+    return OracleScan(tuple(activated), tuple(triggers), oracle_text.lower())
+
+
+def _extract_static_type_changers(scan: OracleScan):
     """
     Detect static abilities that change types in all zones or on the battlefield.
     Produces Axis1-style static effect dicts that map cleanly into the Axis2 StaticEffect schema.
     """
-    if not oracle_text:
+    t = scan.lowered
+    if not t:
         return []
 
-    t = oracle_text.lower()
     effects = []
 
     # ------------------------------------------------------------
@@ -140,37 +306,22 @@ def _parse_cost_metadata(cost_text: str) -> dict:
     }
 
 
-def _extract_activated_abilities_from_oracle(oracle_text: str) -> list:
-    if not oracle_text:
-        return []
-
+def _extract_activated_abilities_from_oracle(scan: OracleScan, build=construct_model) -> list:
     abilities = []
 
-    for raw_line in oracle_text.split("\n"):
-        line = strip_reminder_text(raw_line.strip())
-        # Normalize Unicode punctuation and whitespace
-        line = (
-            line.replace("：", ":")      # fullwidth colon → ASCII colon
-                .replace("\u2028", " ") # line separator → space
-                .replace("\u00A0", " ") # non-breaking space → space
-                .replace("\u200B", "")  # zero-width space → remove
-        )
-
-        if not line:
-            continue
-
+    for kind, line, m in scan.activated:
         # ------------------------------------------------------------
         # 1. Planeswalker loyalty abilities
         # ------------------------------------------------------------
-        m = PLANESWALKER_ABILITY_RE.match(line)
-        if m:
+        if kind == "loyalty":
             loyalty_raw = m.group("loyalty").strip()
-            effect_text = m.group("effect").strip()
+            effect_text = m.group("loyalty_effect").strip()
 
             # Normalize unicode minus
             loyalty_cost = int(loyalty_raw.replace("−", "-"))
 
-            ability = Axis1ActivatedAbility(
+            ability = build(
+                Axis1ActivatedAbility,
                 raw=line,
                 cost=loyalty_raw,
                 effect=effect_text,
@@ -180,11 +331,11 @@ def _extract_activated_abilities_from_oracle(oracle_text: str) -> list:
             abilities.append(ability)
             continue
 
-        m = re.match(r"equip\s+(?P<cost>\{[^}]+\})", line, re.IGNORECASE)
-        if m:
-            cost_text = m.group("cost")
+        if kind == "equip":
+            cost_text = m.group("equip_cost")
             abilities.append(
-                Axis1ActivatedAbility(
+                build(
+                    Axis1ActivatedAbility,
                     raw=line,
                     cost=cost_text,
                     effect="Attach this to target creature you control.",
@@ -197,10 +348,6 @@ def _extract_activated_abilities_from_oracle(oracle_text: str) -> list:
         # ------------------------------------------------------------
         # 2. Normal activated abilities
         # ------------------------------------------------------------
-        m = ACTIVATED_ABILITY_LINE_RE.match(line)
-        if not m:
-            continue
-
         cost_text = m.group("costs").strip()
         effect_text = m.group("effect").strip()
 
@@ -214,7 +361,8 @@ def _extract_activated_abilities_from_oracle(oracle_text: str) -> list:
                 "metadata": _parse_cost_metadata(part)
             })
 
-        ability = Axis1ActivatedAbility(
+        ability = build(
+            Axis1ActivatedAbility,
             raw=line,
             cost=cost_text,
             cost_parts=parsed_costs,
@@ -241,6 +389,10 @@ TRIGGER_STARTERS = (
     "at the beginning of combat ",
 )
 
+TRIGGER_START_RE = re.compile(
+    "|".join(re.escape(prefix) for prefix in TRIGGER_STARTERS), re.IGNORECASE
+)
+
 def _extract_event_hint(trigger_condition: str) -> str:
     """
     Convert a trigger condition into a normalized event hint.
@@ -298,7 +450,7 @@ def _extract_event_hint(trigger_condition: str) -> str:
     return "generic_trigger"
 
 
-def _extract_triggered_abilities_from_oracle(oracle_text: str) -> list:
+def _extract_triggered_abilities_from_oracle(scan: OracleScan, build=construct_model) -> list:
     """
     Parse triggered abilities from oracle text.
     Trigger lines start with:
@@ -307,31 +459,9 @@ def _extract_triggered_abilities_from_oracle(oracle_text: str) -> list:
         - "At the beginning of ..."
     """
 
-    if not oracle_text:
-        return []
-
     abilities = []
-    lines = oracle_text.split("\n")
-
-    for raw_line in lines:
-        line = strip_reminder_text(raw_line.strip())
-        # Normalize Unicode punctuation and whitespace
-        line = (
-            line.replace("：", ":")      # fullwidth colon → ASCII colon
-                .replace("\u2028", " ") # line separator → space
-                .replace("\u00A0", " ") # non-breaking space → space
-                .replace("\u200B", "")  # zero-width space → remove
-        )
-
-        if not line:
-            continue
-
-        lower = line.lower()
-
-        # Check if this line starts a triggered ability
-        if not any(lower.startswith(prefix) for prefix in TRIGGER_STARTERS): 
-            continue
 
+    for line in scan.triggers:
         # Split into condition + effect
         # Example:
         #   "Whenever this creature deals combat damage to a player, that player reveals their hand."
@@ -345,7 +475,8 @@ def _extract_triggered_abilities_from_oracle(oracle_text: str) -> list:
             effect = ""
 
         event_hint = _extract_event_hint(condition)
-        ability = Axis1TriggeredAbility(
+        ability = build(
+            Axis1TriggeredAbility,
             raw=line,
             condition=condition,
             effect=effect,
@@ -355,8 +486,23 @@ def _extract_triggered_abilities_from_oracle(oracle_text: str) -> list:
 
     return abilities
 
+def _mana_value(cmc):
+    # Scryfall sends floats, but fixtures and old dumps may carry ints
+    return float(cmc) if cmc is not None else None
+
+
 class Axis1Mapper:
+    def __init__(self, validate: bool = False):
+        """
+        Mapper output is built from trusted Scryfall data, so models are
+        constructed without validation by default. Pass validate=True to
+        run full Pydantic validation on every model (debugging, tests).
+        """
+        self.validate = validate
+        self.build = validate_model if validate else construct_model
+
     def map(self, scry: dict) -> Axis1Card:
+        build = self.build
 
         # ------------------------------------------------------------
         # 1. Handle multi-face cards (modal_dfc, transform, split, adventure)
@@ -367,21 +513,23 @@ class Axis1Mapper:
                 type_line = f.get("type_line", "")
                 if "—" in type_line:
                     types_part, subtypes_part = [p.strip() for p in type_line.split("—", 1)]
-                    card_types = types_part.split()
-                    subtypes = subtypes_part.split()
+                    card_types = intern_strings(types_part.split())
+                    subtypes = intern_strings(subtypes_part.split())
                 else:
-                    card_types = type_line.split()
+                    card_types = intern_strings(type_line.split())
                     subtypes = []
 
                 oracle_text = f.get("oracle_text")
+                scan = scan_oracle_text(oracle_text or "")
 
-                face = Axis1Face(
+                face = build(
+                    Axis1Face,
                     face_id=f"face_{idx}",
                     name=f.get("name"),
                     mana_cost=f.get("mana_cost"),
-                    mana_value=f.get("cmc", scry.get("cmc")),
-                    colors=f.get("colors", []),
-                    color_indicator=f.get("color_indicator") or [],
+                    mana_value=_mana_value(f.get("cmc", scry.get("cmc"))),
+                    colors=intern_strings(f.get("colors") or []),
+                    color_indicator=intern_strings(f.get("color_indicator") or []),
                     card_types=card_types,
                     supertypes=[t for t in card_types if t in ["Legendary", "Basic", "Snow", "World", "Ongoing"]],
                     subtypes=subtypes,
@@ -390,10 +538,10 @@ class Axis1Mapper:
                     loyalty=f.get("loyalty"),
                     defense=f.get("defense"),
                     oracle_text=oracle_text,
-                    keywords=f.get("keywords", []),
-                    activated_abilities=_extract_activated_abilities_from_oracle(oracle_text or ""),
-                    triggered_abilities=_extract_triggered_abilities_from_oracle(oracle_text or ""),
-                    static_effects=_extract_static_type_changers(oracle_text or ""),
+                    keywords=intern_strings(f.get("keywords") or []),
+                    activated_abilities=_extract_activated_abilities_from_oracle(scan, build),
+                    triggered_abilities=_extract_triggered_abilities_from_oracle(scan, build),
+                    static_effects=_extract_static_type_changers(scan),
                 )
                 faces.append(face)
 
@@ -409,21 +557,23 @@ class Axis1Mapper:
             type_line = scry.get("type_line", "")
             if "—" in type_line:
                 types_part, subtypes_part = [p.strip() for p in type_line.split("—", 1)]
-                card_types = types_part.split()
-                subtypes = subtypes_part.split()
+                card_types = intern_strings(types_part.split())
+                subtypes = intern_strings(subtypes_part.split())
             else:
-                card_types = type_line.split()
+                card_types = intern_strings(type_line.split())
                 subtypes = []
 
             oracle_text = scry.get("oracle_text")
+            scan = scan_oracle_text(oracle_text or "")
 
-            face = Axis1Face(
+            face = build(
+                Axis1Face,
                 face_id="front",
                 name=scry["name"],
                 mana_cost=scry.get("mana_cost"),
-                mana_value=scry.get("cmc"),
-                colors=scry.get("colors", []),
-                color_indicator=scry.get("color_indicator") or [],
+                mana_value=_mana_value(scry.get("cmc")),
+                colors=intern_strings(scry.get("colors") or []),
+                color_indicator=intern_strings(scry.get("color_indicator") or []),
                 card_types=card_types,
                 supertypes=[t for t in card_types if t in ["Legendary", "Basic", "Snow", "World", "Ongoing"]],
                 subtypes=subtypes,
@@ -432,25 +582,26 @@ class Axis1Mapper:
                 loyalty=scry.get("loyalty"),
                 defense=scry.get("defense"),
                 oracle_text=oracle_text,
-                keywords=scry.get("keywords", []),
-                activated_abilities=_extract_activated_abilities_from_oracle(oracle_text or ""),
-                triggered_abilities=_extract_triggered_abilities_from_oracle(oracle_text or ""),
-                static_effects=_extract_static_type_changers(oracle_text or ""),
+                keywords=intern_strings(scry.get("keywords") or []),
+                activated_abilities=_extract_activated_abilities_from_oracle(scan, build),
+                triggered_abilities=_extract_triggered_abilities_from_oracle(scan, build),
+                static_effects=_extract_static_type_changers(scan),
             )
             faces = [face]
 
         # ------------------------------------------------------------
         # 3. Characteristics (based on front face)
         # ------------------------------------------------------------
-        characteristics = Axis1Characteristics(
+        characteristics = build(
+            Axis1Characteristics,
             mana_cost=faces[0].mana_cost,
             mana_value=faces[0].mana_value,
-            colors=faces[0].colors,
-            color_identity=scry.get("color_identity", []),
-            color_indicator=faces[0].color_indicator,
-            card_types=faces[0].card_types,
-            supertypes=faces[0].supertypes,
-            subtypes=faces[0].subtypes,
+            colors=list(faces[0].colors),
+            color_identity=intern_strings(scry.get("color_identity") or []),
+            color_indicator=list(faces[0].color_indicator),
+            card_types=list(faces[0].card_types),
+            supertypes=list(faces[0].supertypes),
+            subtypes=list(faces[0].subtypes),
             power=faces[0].power,
             toughness=faces[0].toughness,
             loyalty=faces[0].loyalty,
@@ -460,21 +611,23 @@ class Axis1Mapper:
         # ------------------------------------------------------------
         # 4. Metadata
         # ------------------------------------------------------------
-        metadata = Axis1Metadata(
+        metadata = build(
+            Axis1Metadata,
             rarity=scry.get("rarity"),
             artist=scry.get("artist"),
             illustration_id=scry.get("illustration_id"),
             frame=scry.get("frame"),
             border_color=scry.get("border_color"),
             watermark=scry.get("watermark"),
-            legalities=scry.get("legalities") or {},
-            image_uris=scry.get("image_uris") or {},
+            legalities=dict(scry.get("legalities") or {}),
+            image_uris=dict(scry.get("image_uris") or {}),
         )
 
         # ------------------------------------------------------------
         # 5. Build Axis1Card
         # ------------------------------------------------------------
-        axis1 = Axis1Card(
+        axis1 = build(
+            Axis1Card,
             card_id=scry["id"],
             oracle_id=scry.get("oracle_id"),
             scryfall_id=scry.get("id"),
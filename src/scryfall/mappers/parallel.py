@@ -0,0 +1,165 @@
+"""
+Process-pool mapping stage for bulk imports.
+
+    reader thread ──(bounded chunk queue)──> process pool ──(in-order window)──> caller
+
+Cards are grouped into chunks so each inter-process round-trip carries
+a useful amount of work. Results are yielded in input order no matter
+which worker finishes first.
+
+Workers return `Axis1Card.dict()` dumps rather than model instances:
+pickling a Pydantic tree costs about as much as mapping the card, while
+a plain dict crosses the process boundary almost for free and is what
+`Axis1Repository.save_many` writes anyway.
+"""
+
+import multiprocessing
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .axis1_mapper import Axis1Mapper
+
+
+DEFAULT_CHUNK_SIZE = 250
+
+_DONE = object()
+
+
+class MapResult(NamedTuple):
+    card_id: Optional[str]
+    data: Optional[Dict[str, Any]]  # Axis1Card.dict()
+    error: Optional[str]
+
+
+# ---------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------
+_worker_mapper: Optional[Axis1Mapper] = None
+
+
+def _init_worker():
+    global _worker_mapper
+    _worker_mapper = Axis1Mapper()
+
+
+def _map_chunk(chunk: List[Dict[str, Any]], mapper: Optional[Axis1Mapper] = None) -> List[MapResult]:
+    mapper = mapper or _worker_mapper
+    results = []
+    for card_json in chunk:
+        card_id = card_json.get("id")
+        try:
+            results.append(MapResult(card_id, mapper.map(card_json).dict(), None))
+        except Exception as e:
+            results.append(MapResult(card_id, None, f"{type(e).__name__}: {e}"))
+    return results
+
+
+# ---------------------------------------------------------
+# Pipeline (shared with axis2/parallel.py)
+# ---------------------------------------------------------
+def _read_chunks(items: Iterable[Any], chunk_size: int, out: "queue.Queue", stop: threading.Event):
+    try:
+        chunk = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                out.put(chunk)
+                chunk = []
+            if stop.is_set():
+                return
+        if chunk:
+            out.put(chunk)
+    except BaseException as e:  # surfaced in the consumer thread
+        out.put(e)
+    finally:
+        out.put(_DONE)
+
+
+def map_chunks_ordered(
+    items: Iterable[Any],
+    fn: Callable[[List[Any]], List[Any]],
+    workers: int,
+    chunk_size: int,
+    max_pending: Optional[int] = None,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Tuple[Any, ...] = (),
+) -> Iterator[Any]:
+    """
+    Run `fn` on `chunk_size` chunks of `items` in a pool of `workers`
+    processes and yield every chunk's results in input order.
+
+    At most `max_pending` chunks are read ahead and at most `max_pending`
+    chunks are in flight in the pool. `fn` and `initializer` must be
+    picklable (module-level) functions.
+    """
+    max_pending = max_pending or workers * 2
+    chunks: "queue.Queue" = queue.Queue(maxsize=max_pending)
+    stop = threading.Event()
+    reader = threading.Thread(
+        target=_read_chunks, args=(items, chunk_size, chunks, stop), daemon=True
+    )
+
+    # spawn: the reader thread (and e.g. a DB cursor) exist before workers start
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=ctx, initializer=initializer, initargs=initargs
+    ) as pool:
+        reader.start()
+        pending = deque()
+        exhausted = False
+
+        try:
+            while True:
+                while not exhausted and len(pending) < max_pending:
+                    item = chunks.get()
+                    if item is _DONE:
+                        exhausted = True
+                    elif isinstance(item, BaseException):
+                        raise item
+                    else:
+                        pending.append(pool.submit(fn, item))
+
+                if not pending:
+                    break
+
+                yield from pending.popleft().result()
+        finally:
+            stop.set()
+            for future in pending:
+                future.cancel()
+            # Unblock the reader if it is waiting on a full queue
+            while reader.is_alive():
+                try:
+                    chunks.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+
+
+def map_cards_parallel(
+    cards: Iterable[Dict[str, Any]],
+    workers: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_pending: Optional[int] = None,
+) -> Iterator[MapResult]:
+    """
+    Map Scryfall card dicts to Axis1Card dumps across `workers` processes.
+
+    At most `max_pending` chunks are read ahead and at most `max_pending`
+    chunks are in flight in the pool, so memory stays bounded regardless
+    of the input size. With workers=1 everything runs in-process.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+
+    if workers == 1:
+        mapper = Axis1Mapper()
+        for card_json in cards:
+            yield from _map_chunk([card_json], mapper)
+        return
+
+    yield from map_chunks_ordered(
+        cards, _map_chunk, workers, chunk_size, max_pending, initializer=_init_worker
+    )
@@ -1,23 +1,99 @@
-from typing import List
+import asyncio
+from typing import Any, Callable, Dict, List, Optional
+
 from axis1.schema import Axis1Card
+from scryfall.mappers.axis1_mapper import MAPPER_VERSION
 
 
 class DeckImportService:
-    def __init__(self, scryfall_client, mapper, repo):
+    def __init__(self, scryfall_client, mapper, repo, stats=None):
         self.scryfall = scryfall_client
         self.mapper = mapper
         self.repo = repo
+        # Optional scryfall.cache.CacheStats; axis1_cards hits count as "db"
+        self.stats = stats
+
+    def import_deck(
+        self,
+        deck_url: str,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> List[Axis1Card]:
+        """
+        `progress(done, total)` is called as distinct cards are resolved
+        (used by background import jobs).
+        """
+        progress = progress or _no_progress
 
-    def import_deck(self, deck_url: str) -> List[Axis1Card]:
         # For now, assume deck_url returns a JSON with an "entries" list,
         # each entry having a "card_id" or "scryfall_id".
         deck_json = self.scryfall.fetch_deck(deck_url)
-        cards: List[Axis1Card] = []
+        entry_ids = self._entry_ids(deck_json)
+        unique_ids = list(dict.fromkeys(entry_ids))
+        progress(0, len(unique_ids))
+
+        # Cards already in axis1_cards (mapped by this mapper version) need
+        # neither a fetch nor a re-map
+        mapped = self._from_rows(self.repo.get_many(unique_ids))
+        progress(len(mapped), len(unique_ids))
+
+        # One /cards/collection request per 75 distinct remaining entries
+        to_fetch = [card_id for card_id in unique_ids if card_id not in mapped]
+        new_cards = self._map_new(self.scryfall.fetch_collection(to_fetch), mapped)
+
+        # One bulk upsert for the new cards instead of a commit per card
+        if new_cards:
+            self.repo.save_many(new_cards, mapper_version=MAPPER_VERSION)
+        progress(len(unique_ids), len(unique_ids))
+
+        return [mapped[card_id] for card_id in entry_ids]
+
+    async def import_deck_async(self, deck_url: str) -> List[Axis1Card]:
+        """
+        Same pipeline for an AsyncAxis1Repository. Blocking HTTP calls and
+        CPU-bound mapping run in worker threads, DB calls are awaited.
+        """
+        deck_json = await asyncio.to_thread(self.scryfall.fetch_deck, deck_url)
+        entry_ids = self._entry_ids(deck_json)
+        unique_ids = list(dict.fromkeys(entry_ids))
 
-        for entry in deck_json.get("entries", []):
-            card_json = self.scryfall.fetch_card(entry["id"])
+        mapped = self._from_rows(await self.repo.get_many(unique_ids))
+
+        to_fetch = [card_id for card_id in unique_ids if card_id not in mapped]
+        fetched = await asyncio.to_thread(self.scryfall.fetch_collection, to_fetch)
+        new_cards = await asyncio.to_thread(self._map_new, fetched, mapped)
+
+        if new_cards:
+            await self.repo.save_many(new_cards, mapper_version=MAPPER_VERSION)
+
+        return [mapped[card_id] for card_id in entry_ids]
+
+    # ---------------------------------------------------------
+    # Pipeline steps shared by the sync and async paths
+    # ---------------------------------------------------------
+    @staticmethod
+    def _entry_ids(deck_json: Dict[str, Any]) -> List[str]:
+        return [entry["id"] for entry in deck_json.get("entries", [])]
+
+    def _from_rows(self, rows: Dict[str, Any]) -> Dict[str, Axis1Card]:
+        # Rows written by another mapper version fall through to the
+        # cache/network tier and are re-mapped
+        mapped = {
+            card_id: Axis1Card(**row.axis1_json)
+            for card_id, row in rows.items()
+            if row.mapper_version == MAPPER_VERSION
+        }
+        if self.stats is not None and mapped:
+            self.stats.hit("db", len(mapped))
+        return mapped
+
+    def _map_new(self, card_jsons: List[Dict[str, Any]], mapped: Dict[str, Axis1Card]) -> List[Axis1Card]:
+        new_cards = []
+        for card_json in card_jsons:
             axis1 = self.mapper.map(card_json)
-            self.repo.save(axis1)
-            cards.append(axis1)
+            mapped[axis1.card_id] = axis1
+            new_cards.append(axis1)
+        return new_cards
+
 
-        return cards
+def _no_progress(done: int, total: int):
+    pass